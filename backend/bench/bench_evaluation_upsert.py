@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+동시 심사위원의 평가 제출 처리량 벤치마크 (SELECT 후 INSERT/UPDATE vs 단일 UPSERT)
+
+사용법:
+    python bench/bench_evaluation_upsert.py [--judges 8] [--aideas 200] [--rounds 2] [--batch 50]
+
+임시 SQLite DB에 aidea와 심사위원을 만든 뒤, 심사위원마다 스레드 하나가 모든 aidea를 평가합니다.
+rounds가 2 이상이면 두 번째부터는 기존 평가를 덮어쓰는 경로를 탑니다.
+    select_then_write : 기존 방식 (SELECT → INSERT 또는 UPDATE → 집계 보정 → commit → refresh)
+    upsert            : crud.create_evaluation (INSERT ... ON CONFLICT DO UPDATE ... RETURNING)
+    batch             : crud.create_evaluations_batch (--batch 건씩 한 트랜잭션, 커밋 한 번)
+각 방식의 처리량, 제출당 SQL 문 수, 실패 수, 최종 집계 정합성을 출력합니다.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import event, func
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+def legacy_create_evaluation(db, models, aidea_id, judge_id, innovation, feasibility, effectiveness):
+    """변경 전 crud.create_evaluation과 같은 순서로 실행합니다. (집계는 한 번의 UPSERT로 보정)"""
+    Evaluation, Summary = models.Evaluation, models.AideaScoreSummary
+    total = innovation + feasibility + effectiveness
+    existing = db.query(Evaluation).filter(Evaluation.aidea_id == aidea_id, Evaluation.judge_id == judge_id).first()
+    if existing:
+        delta = (0, innovation - existing.innovation_score, feasibility - existing.feasibility_score,
+                 effectiveness - existing.effectiveness_score, total - existing.total_score)
+        existing.innovation_score, existing.feasibility_score = innovation, feasibility
+        existing.effectiveness_score, existing.total_score = effectiveness, total
+        evaluation = existing
+    else:
+        evaluation = Evaluation(aidea_id=aidea_id, judge_id=judge_id, innovation_score=innovation,
+                                feasibility_score=feasibility, effectiveness_score=effectiveness, total_score=total)
+        db.add(evaluation)
+        delta = (1, innovation, feasibility, effectiveness, total)
+    db.flush()
+    summary = db.get(Summary, aidea_id)
+    if summary is None:
+        summary = Summary(aidea_id=aidea_id, evaluation_count=0, innovation_sum=0, feasibility_sum=0,
+                          effectiveness_sum=0, total_sum=0)
+        db.add(summary)
+    summary.evaluation_count += delta[0]
+    summary.innovation_sum += delta[1]
+    summary.feasibility_sum += delta[2]
+    summary.effectiveness_sum += delta[3]
+    summary.total_sum += delta[4]
+    db.commit()
+    db.refresh(evaluation)
+    return evaluation
+
+def submit_batch(db, schemas, crud, chunk):
+    items = [
+        schemas.EvaluationCreate(aidea_id=aidea_id, judge_id=judge_id, innovation_score=innovation,
+                                 feasibility_score=feasibility, effectiveness_score=effectiveness)
+        for aidea_id, judge_id, innovation, feasibility, effectiveness in chunk
+    ]
+    results = crud.create_evaluations_batch(db, items)
+    if any(error for _, error in results):
+        raise RuntimeError("batch item failed")
+
+def run(database, models, submit, judges, aideas, rounds, batch_size=None):
+    db = database.SessionLocal()
+    db.query(models.Evaluation).delete()
+    db.query(models.AideaScoreSummary).delete()
+    db.commit()
+    db.close()
+
+    statements = [0]
+    commits = [0]
+    lock = threading.Lock()
+
+    def count(*_):
+        with lock:
+            statements[0] += 1
+
+    def count_commit(*_):
+        with lock:
+            commits[0] += 1
+
+    failures = [0]
+
+    def worker(judge_id):
+        db = database.SessionLocal()
+        try:
+            for round_no in range(rounds):
+                items = [(aidea_id, judge_id, 6 * ((aidea_id + judge_id + round_no) % 5 + 1), 6, 8) for aidea_id in aideas]
+                if batch_size:
+                    for start in range(0, len(items), batch_size):
+                        chunk = items[start:start + batch_size]
+                        try:
+                            submit(db, chunk)
+                        except Exception:
+                            db.rollback()
+                            failures[0] += len(chunk)
+                    continue
+                for args in items:
+                    try:
+                        submit(db, *args)
+                    except Exception:
+                        db.rollback()
+                        failures[0] += 1
+        finally:
+            db.close()
+
+    event.listen(database.engine, "before_cursor_execute", count)
+    event.listen(database.engine, "commit", count_commit)
+    threads = [threading.Thread(target=worker, args=(judge_id,)) for judge_id in judges]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    event.remove(database.engine, "before_cursor_execute", count)
+    event.remove(database.engine, "commit", count_commit)
+
+    submissions = len(judges) * len(aideas) * rounds
+    db = database.SessionLocal()
+    import crud
+    consistent = not crud.verify_score_summaries(db)
+    rows = db.query(func.count(models.Evaluation.id)).scalar()
+    db.close()
+    return {
+        "submissions": submissions,
+        "seconds": round(elapsed, 3),
+        "submissions_per_sec": round(submissions / elapsed, 1),
+        "statements_per_submission": round(statements[0] / submissions, 2),
+        "commits": commits[0],
+        "failures": failures[0],
+        "evaluation_rows": rows,
+        "summary_consistent": consistent,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--judges", type=int, default=8)
+    parser.add_argument("--aideas", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--batch", type=int, default=50, help="batch 방식의 한 번에 제출하는 평가 수")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_evaluation_upsert_")
+    os.environ["DATABASE_PATH"] = os.path.join(workdir, "bench.db")
+
+    import database
+    import models
+    import crud
+    import schemas
+
+    models.Base.metadata.create_all(bind=database.engine)
+    db = database.SessionLocal()
+    for i in range(args.aideas):
+        account = models.Account(knox_id=f"user{i}", hashed_password="x", team_name=f"팀{i}")
+        account.aideas = [models.Aidea(project=f"프로젝트{i}")]
+        db.add(account)
+    judges = [models.Judge(judge_id=f"judge{i}", hashed_password="x", name=f"심사위원{i}") for i in range(args.judges)]
+    db.add_all(judges)
+    db.commit()
+    aidea_ids = [a.id for a in db.query(models.Aidea.id).all()]
+    judge_ids = [j.id for j in judges]
+    db.close()
+
+    results = {
+        "select_then_write": run(
+            database, models,
+            lambda db, *a: legacy_create_evaluation(db, models, *a),
+            judge_ids, aidea_ids, args.rounds,
+        ),
+        "upsert": run(database, models, crud.create_evaluation, judge_ids, aidea_ids, args.rounds),
+        "batch": run(
+            database, models,
+            lambda db, chunk: submit_batch(db, schemas, crud, chunk),
+            judge_ids, aidea_ids, args.rounds, batch_size=args.batch,
+        ),
+    }
+    print(json.dumps({"judges": args.judges, "aideas": args.aideas, "rounds": args.rounds, "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+실시간 알림 허브(/api/events) 비용 벤치마크
+
+사용법:
+    python bench/bench_events.py [--clients 500] [--events 2000] [--idle 5]
+
+구독자 clients개가 프레임을 읽는 상태에서 다음을 측정해 JSON으로 출력합니다.
+    fan_out : 다른 스레드에서 이벤트 하나를 발행해 모든 구독자 버퍼에 넣기까지 걸린 시간
+    idle    : 이벤트 없이 idle초 동안 기다릴 때 프로세스 CPU 사용 시간 (heartbeat 주석만 전송)
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from events import EventHub
+
+async def run(clients: int, n_events: int, idle: float, heartbeat: float) -> dict:
+    hub = EventHub(client_buffer=n_events + 1, max_clients=clients)
+    received = [0] * clients
+    done = asyncio.Event()
+
+    async def consume(index, subscription):
+        async for frame in subscription.frames(heartbeat=heartbeat):
+            if not frame.startswith(b":"):
+                received[index] += frame.count(b"\nevent: ")  # 여러 이벤트가 묶여 올 수 있음
+                if index == 0 and received[0] == n_events:
+                    done.set()
+
+    tasks = [asyncio.create_task(consume(i, hub.subscribe())) for i in range(clients)]
+    await asyncio.sleep(0.1)
+
+    # 유휴 비용
+    cpu_start = time.process_time()
+    await asyncio.sleep(idle)
+    idle_cpu = time.process_time() - cpu_start
+
+    # 발행 → 전 구독자 전달
+    start = time.perf_counter()
+    publisher = threading.Thread(
+        target=lambda: [hub.publish([{"type": "evaluation.created", "aidea_id": i, "judge_id": 1}]) for i in range(n_events)]
+    )
+    publisher.start()
+    await done.wait()
+    while sum(received) < clients * n_events:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    publisher.join()
+
+    hub.close()
+    await asyncio.gather(*tasks)
+    return {
+        "clients": clients,
+        "events": n_events,
+        "deliveries": sum(received),
+        "fan_out_us_per_event": round(elapsed / n_events * 1e6, 1),
+        "delivery_us": round(elapsed / (clients * n_events) * 1e6, 3),
+        "idle_seconds": idle,
+        "idle_cpu_ms": round(idle_cpu * 1000, 2),
+        "idle_cpu_pct": round(idle_cpu / idle * 100, 3),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--idle", type=float, default=5.0)
+    parser.add_argument("--heartbeat", type=float, default=15.0)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.clients, args.events, args.idle, args.heartbeat)), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+/api/projects, /api/admin/accounts의 전송 바이트와 지연 시간 벤치마크 (ETag/압축 전후 비교)
+
+사용법:
+    python bench/bench_http_cache.py [--projects 500] [--requests 50]
+
+임시 SQLite DB에 긴 텍스트를 가진 프로젝트를 생성한 뒤, 같은 엔드포인트를 다음 방식으로 호출합니다.
+    identity : 압축/재검증 없음 (기존 동작과 같은 전송량)
+    gzip, br : Accept-Encoding 협상
+    304      : 이전 응답의 ETag로 If-None-Match 재검증
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+def seed(db_module, models, n_projects: int):
+    long_text = "사용자 시나리오와 워크플로우를 상세히 설명하는 긴 텍스트입니다. " * 40
+    db = db_module.SessionLocal()
+    for i in range(n_projects):
+        account = models.Account(knox_id=f"user{i}", hashed_password="x", name=f"사용자{i}", team_name=f"팀{i}")
+        account.team_members = [models.TeamMember(name=f"팀원{i}-{j}", knox_id=f"member{i}-{j}") for j in range(3)]
+        account.aideas = [models.Aidea(
+            project=f"프로젝트{i}", target_user=long_text, problem=long_text, solution=long_text,
+            data_sources=long_text, scenario=long_text, workflow=long_text, benefit=long_text,
+        )]
+        db.add(account)
+    db.commit()
+    db.close()
+
+def measure(client, url: str, headers: dict, n_requests: int):
+    latencies, wire_bytes, status = [], 0, None
+    for _ in range(n_requests):
+        start = time.perf_counter()
+        with client.stream("GET", url, headers=headers) as response:
+            raw = b"".join(response.iter_raw())
+        latencies.append((time.perf_counter() - start) * 1000)
+        wire_bytes, status = len(raw), response.status_code
+    latencies.sort()
+    return {
+        "status": status,
+        "bytes_on_wire": wire_bytes,
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 2),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_http_cache_")
+    os.environ["DATABASE_PATH"] = os.path.join(workdir, "bench.db")
+
+    from fastapi.testclient import TestClient
+    import database
+    import models
+    import main as app_module
+
+    models.Base.metadata.create_all(bind=database.engine)
+    seed(database, models, args.projects)
+
+    client = TestClient(app_module.app)
+    admin_token = app_module.create_access_token(data={"sub": app_module.ADMIN_USERNAME})
+    results = {}
+    for url, auth in (("/api/projects?judge_id=1", {}), ("/api/admin/accounts", {"Authorization": f"Bearer {admin_token}"})):
+        etag = client.get(url, headers={**auth, "Accept-Encoding": "identity"}).headers["etag"]
+        modes = {
+            "identity": {"Accept-Encoding": "identity"},
+            "gzip": {"Accept-Encoding": "gzip"},
+            "br": {"Accept-Encoding": "br"},
+            "304": {"Accept-Encoding": "gzip, br", "If-None-Match": etag},
+        }
+        results[url] = {name: measure(client, url, {**auth, **headers}, args.requests) for name, headers in modes.items()}
+
+    print(json.dumps({"projects": args.projects, "requests": args.requests, "results": results}, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+심사위원 일괄 등록 벤치마크 (한 명씩 해시/커밋 vs 병렬 해시 + 단일 트랜잭션)
+
+사용법:
+    python bench/bench_judge_import.py [--judges 64] [--workers N]
+
+임시 SQLite DB에 같은 심사위원 목록을 두 방식으로 등록합니다.
+    serial : 기존 방식 (crud.create_judge를 한 명씩 호출 → 직렬 bcrypt + 심사위원마다 commit)
+    bulk   : create_judge.import_judges (코어 수만큼 병렬 bcrypt + INSERT ... RETURNING 한 문장 + commit 한 번)
+각 방식의 소요 시간, 초당 등록 수, 실행된 SQL 문 수, commit 수를 출력합니다.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import event
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+def measure(database, models, register):
+    db = database.SessionLocal()
+    db.query(models.Judge).delete()
+    db.commit()
+
+    counts = {"statements": 0, "commits": 0}
+
+    def count_statement(*_):
+        counts["statements"] += 1
+
+    def count_commit(*_):
+        counts["commits"] += 1
+
+    event.listen(database.engine, "before_cursor_execute", count_statement)
+    event.listen(database.engine, "commit", count_commit)
+    start = time.perf_counter()
+    created = register(db)
+    elapsed = time.perf_counter() - start
+    event.remove(database.engine, "before_cursor_execute", count_statement)
+    event.remove(database.engine, "commit", count_commit)
+    db.close()
+    return {
+        "created": created,
+        "seconds": round(elapsed, 3),
+        "judges_per_sec": round(created / elapsed, 1),
+        **counts,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--judges", type=int, default=64)
+    parser.add_argument("--workers", type=int, help="병렬 해시 프로세스 수 (기본: 코어 수)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_judge_import_")
+    os.environ["DATABASE_PATH"] = os.path.join(workdir, "bench.db")
+
+    import database
+    import migrate
+    import models
+    import crud
+    import create_judge
+    from hashing import _available_cores
+
+    migrate.ensure_schema(database.engine)
+    rows = [
+        {"row": i, "judge_id": f"judge{i}", "password": f"password{i}", "name": f"심사위원{i}"}
+        for i in range(1, args.judges + 1)
+    ]
+
+    def serial(db):
+        for row in rows:
+            crud.create_judge(db, row["judge_id"], row["password"], row["name"])
+        return len(rows)
+
+    def bulk(db):
+        created, errors = create_judge.import_judges(db, rows, workers=args.workers)
+        assert not errors
+        return len(created)
+
+    print(json.dumps({
+        "judges": args.judges,
+        "workers": args.workers or _available_cores(),
+        "results": {
+            "serial": measure(database, models, serial),
+            "bulk": measure(database, models, bulk),
+        },
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
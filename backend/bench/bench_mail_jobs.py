@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+단체 메일 작업 벤치마크 (outbox 생성 + 속도 제한 발송)
+
+사용법:
+    python bench/bench_mail_jobs.py [--accounts 3000] [--members 2] [--rate 100] [--concurrency 4]
+
+임시 SQLite DB에 계정 accounts개(팀원 members명씩)를 만들고, 전체 대상 단체 메일 작업을
+로컬 대역 메일 서버로 보내기까지를 측정해 JSON으로 출력합니다.
+    expand_seconds : 템플릿을 채워 outbox에 모두 넣기까지 걸린 시간 (워커 실행 중 측정)
+    total_seconds  : 작업 생성부터 모든 메일 발송 완료까지 걸린 시간
+    max_rate_1s    : 메일 서버가 받은 1초 구간별 최대 요청 수 (rate 이하인지 확인)
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from crud import create_mail_job, get_mail_job, mail_job_progress
+from mailer import Mailer
+from models import Base, Account, TeamMember, Aidea
+
+arrivals = []
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        arrivals.append(time.monotonic())
+        payload = b'{"result":"ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+def seed(session_factory, accounts: int, members: int):
+    db = session_factory()
+    for i in range(accounts):
+        db.add(Account(
+            knox_id=f"user{i}", hashed_password="x", name=f"참가자{i}", team_name=f"팀{i}",
+            team_members=[TeamMember(name=f"팀원{i}-{j}", knox_id=f"member{i}x{j}") for j in range(members)],
+            aideas=[Aidea(project=f"프로젝트{i}")],
+        ))
+    db.commit()
+    db.close()
+
+async def run(session_factory, url: str, rate: float, concurrency: int, accounts: int) -> dict:
+    mailer = Mailer(url=url, session_factory=session_factory, concurrency=concurrency, rate=rate, poll_interval=0.2)
+    db = session_factory()
+    start = time.monotonic()
+    job = create_mail_job(db, "bench", "all", "[AIdea] {team_name} 안내", "{name}님, {project} ({members}) 제출 현황 안내")
+    await mailer.start()
+    mailer.notify()
+    expand_seconds = None
+    try:
+        while True:
+            await asyncio.sleep(0.2)
+            db.expire_all()
+            job = get_mail_job(db, job.id)
+            if expand_seconds is None and job.status == "queued":
+                expand_seconds = time.monotonic() - start
+            progress = mail_job_progress(db, [job.id])[job.id]
+            if job.status == "queued" and progress.get("sent", 0) + progress.get("failed", 0) == accounts:
+                break
+        total_seconds = time.monotonic() - start
+    finally:
+        await mailer.stop()
+        db.close()
+    per_second = Counter(int(t - arrivals[0]) for t in arrivals)
+    return {
+        "accounts": accounts,
+        "rate_limit": rate,
+        "concurrency": concurrency,
+        "expand_seconds": round(expand_seconds, 3),
+        "total_seconds": round(total_seconds, 2),
+        "sent": progress.get("sent", 0),
+        "messages_per_second": round(accounts / total_seconds, 1),
+        "max_rate_1s": max(per_second.values()),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--accounts", type=int, default=3000)
+    parser.add_argument("--members", type=int, default=2)
+    parser.add_argument("--rate", type=float, default=100.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        seed(session_factory, args.accounts, args.members)
+        try:
+            result = asyncio.run(run(session_factory, f"http://127.0.0.1:{server.server_port}/knox_api",
+                                     args.rate, args.concurrency, args.accounts))
+        finally:
+            server.shutdown()
+            server.server_close()
+            engine.dispose()
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+메일 발송 연결 재사용 벤치마크
+
+사용법:
+    python bench/bench_mailer.py [--messages 300] [--concurrency 4]
+
+로컬 대역 메일 서버(keep-alive)로 messages건을 보내며 두 방식을 비교해 JSON으로 출력합니다.
+    per_request : 메일마다 httpx.AsyncClient를 새로 만듦 (이전 /api/send-email 방식, 매번 TCP 연결)
+    pooled      : Mailer처럼 연결 풀을 가진 클라이언트 하나를 공유
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+connections = set()
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        connections.add(self.client_address)
+        payload = b'{"result":"ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+PAYLOAD = {"recipients": ["user@samsung.com"], "subject": "등록 완료", "contents": "내용" * 200}
+
+async def per_request(url: str, messages: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(i):
+        async with semaphore:
+            async with httpx.AsyncClient(timeout=30) as client:
+                (await client.post(url, json=PAYLOAD)).raise_for_status()
+
+    await asyncio.gather(*(send(i) for i in range(messages)))
+
+async def pooled(url: str, messages: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        async def send(i):
+            async with semaphore:
+                (await client.post(url, json=PAYLOAD)).raise_for_status()
+
+        await asyncio.gather(*(send(i) for i in range(messages)))
+
+def measure(scenario, url: str, messages: int, concurrency: int) -> dict:
+    connections.clear()
+    start = time.perf_counter()
+    asyncio.run(scenario(url, messages, concurrency))
+    elapsed = time.perf_counter() - start
+    return {
+        "seconds": round(elapsed, 3),
+        "ms_per_message": round(elapsed / messages * 1000, 3),
+        "messages_per_second": round(messages / elapsed, 1),
+        "tcp_connections": len(connections),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/knox_api"
+    try:
+        result = {
+            "messages": args.messages,
+            "concurrency": args.concurrency,
+            "per_request": measure(per_request, url, args.messages, args.concurrency),
+            "pooled": measure(pooled, url, args.messages, args.concurrency),
+        }
+    finally:
+        server.shutdown()
+        server.server_close()
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
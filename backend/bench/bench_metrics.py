@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+메트릭 계측 비용 벤치마크
+
+사용법:
+    python bench/bench_metrics.py [--requests 50000] [--queries 50000] [--repeat 5]
+
+다음 세 가지를 계측 있음/없음으로 비교해 호출 1회당 추가 비용(µs)을 출력합니다.
+    request : 아무것도 하지 않는 ASGI 엔드포인트를 직접 호출 (MetricsMiddleware 유무)
+              (네트워크/FastAPI 라우팅을 빼고 미들웨어 자체 비용만 측정)
+    query   : 인메모리 SQLite에서 `SELECT 1` 실행 (instrument_engine 이벤트 유무)
+    render  : 라우트 40개 분량의 메트릭을 Prometheus 텍스트로 만드는 /api/metrics 1회 비용
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+def best_of(repeat, func):
+    """repeat번 측정해 가장 빠른 값과 중앙값(초)을 반환합니다."""
+    samples = [func() for _ in range(repeat)]
+    return min(samples), statistics.median(samples)
+
+async def endpoint(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+class FakeApp:
+    """라우트 템플릿 조회용 (scope["app"].routes)"""
+
+    class Route:
+        path = "/api/projects"
+        endpoint = staticmethod(endpoint)
+
+    routes = [Route()]
+
+def bench_requests(metrics, n, repeat):
+    middleware = metrics.MetricsMiddleware(endpoint)
+    app = FakeApp()
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    def run(target):
+        async def loop():
+            for _ in range(n):
+                scope = {"type": "http", "method": "GET", "path": "/api/projects", "app": app, "endpoint": endpoint}
+                await target(scope, receive, send)
+        start = time.perf_counter()
+        asyncio.run(loop())
+        return time.perf_counter() - start
+
+    plain = best_of(repeat, lambda: run(endpoint))
+    measured = best_of(repeat, lambda: run(middleware))
+    return summarize(plain, measured, n)
+
+def bench_queries(metrics, n, repeat):
+    from sqlalchemy import create_engine
+
+    def make(instrumented):
+        engine = create_engine("sqlite://")
+        if instrumented:
+            metrics.instrument_engine(engine, "bench")
+        return engine
+
+    def run(engine):
+        with engine.connect() as conn:
+            start = time.perf_counter()
+            for _ in range(n):
+                conn.exec_driver_sql("SELECT 1").fetchall()
+            return time.perf_counter() - start
+
+    plain_engine, measured_engine = make(False), make(True)
+    plain = best_of(repeat, lambda: run(plain_engine))
+    measured = best_of(repeat, lambda: run(measured_engine))
+    return summarize(plain, measured, n)
+
+def bench_render(metrics, repeat):
+    for i in range(40):
+        for status in ("200", "304", "404"):
+            metrics.HTTP_REQUESTS.inc("GET", f"/api/route{i}", status)
+        metrics.HTTP_LATENCY.observe(0.01, "GET", f"/api/route{i}")
+        metrics.HTTP_DB_QUERIES.observe(3, "GET", f"/api/route{i}")
+        metrics.HTTP_DB_SECONDS.observe(0.002, "GET", f"/api/route{i}")
+
+    def run():
+        start = time.perf_counter()
+        body = metrics.render()
+        run.size = len(body)
+        return time.perf_counter() - start
+
+    best, median = best_of(repeat, run)
+    return {"render_ms": round(best * 1000, 3), "render_median_ms": round(median * 1000, 3), "bytes": run.size}
+
+def summarize(plain, measured, n):
+    per_call = lambda seconds: round(seconds / n * 1e6, 3)
+    return {
+        "calls": n,
+        "plain_us": per_call(plain[0]),
+        "instrumented_us": per_call(measured[0]),
+        "overhead_us": per_call(measured[0] - plain[0]),
+        "overhead_median_us": per_call(measured[1] - plain[1]),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    import metrics
+
+    results = {
+        "request": bench_requests(metrics, args.requests, args.repeat),
+        "query": bench_queries(metrics, args.queries, args.repeat),
+        "render": bench_render(metrics, args.repeat),
+    }
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
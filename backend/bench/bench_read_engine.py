@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+조회 전용 엔진 벤치마크 (쓰기 엔진 공유 vs 조회 전용 엔진)
+
+사용법:
+    python bench/bench_read_engine.py [--accounts 2000] [--readers 4] [--seconds 3]
+
+임시 SQLite DB에 팀원/aidea가 있는 계정을 만든 뒤, 백그라운드 writer 스레드가 계속 평가를 덮어쓰는 동안
+reader 스레드들이 관리자 계정 목록(crud.list_accounts, 50건 페이지)을 반복 조회합니다.
+    shared    : 기존 방식 (SessionLocal, 쓰기와 같은 엔진/풀/PRAGMA)
+    read_only : ReadSessionLocal (query_only + cache_size + mmap_size + temp_store=MEMORY)
+각 방식의 초당 조회 수와 조회 지연 시간(p50/p99), 같은 시간 동안의 쓰기 수를 출력합니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+def run(database, crud, session_factory, readers, seconds, aidea_ids, judge_id):
+    stop = threading.Event()
+    latencies, writes = [], [0]
+    lock = threading.Lock()
+
+    def writer():
+        db = database.SessionLocal()
+        i = 0
+        while not stop.is_set():
+            crud.create_evaluation(db, aidea_ids[i % len(aidea_ids)], judge_id, 6 * (i % 5 + 1), 6, 8)
+            writes[0] += 1
+            i += 1
+        db.close()
+
+    def reader():
+        local = []
+        while not stop.is_set():
+            db = session_factory()
+            start = time.perf_counter()
+            crud.list_accounts(db, limit=50, sort="-created_at")
+            local.append(time.perf_counter() - start)
+            db.close()
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    ordered = sorted(latencies)
+    return {
+        "reads_per_sec": round(len(latencies) / seconds, 1),
+        "read_p50_ms": round(statistics.median(ordered) * 1000, 2),
+        "read_p99_ms": round(ordered[int(len(ordered) * 0.99)] * 1000, 2),
+        "writes": writes[0],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--accounts", type=int, default=2000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=3)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_read_engine_")
+    os.environ["DATABASE_PATH"] = os.path.join(workdir, "bench.db")
+
+    import database
+    import migrate
+    import models
+    import crud
+
+    migrate.ensure_schema(database.engine)
+    db = database.SessionLocal()
+    for i in range(args.accounts):
+        account = models.Account(knox_id=f"user{i}", hashed_password="x", name=f"리더{i}", team_name=f"팀{i}")
+        account.team_members = [models.TeamMember(name=f"팀원{j}", knox_id=f"m{i}_{j}") for j in range(3)]
+        account.aideas = [models.Aidea(project=f"프로젝트{i}", problem="문제 " * 100, solution="해결 " * 100)]
+        db.add(account)
+    judge = models.Judge(judge_id="judge", hashed_password="x", name="심사위원")
+    db.add(judge)
+    db.commit()
+    aidea_ids = [aidea_id for (aidea_id,) in db.query(models.Aidea.id)]
+    judge_id = judge.id
+    db.close()
+
+    results = {}
+    for name, factory in (("shared", database.SessionLocal), ("read_only", database.ReadSessionLocal)):
+        results[name] = run(database, crud, factory, args.readers, args.seconds, aidea_ids, judge_id)
+    print(json.dumps({"accounts": args.accounts, "readers": args.readers, "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
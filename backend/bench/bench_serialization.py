@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+/api/projects 직렬화 경로 마이크로벤치마크 (DB 없이 ORM 유사 객체 사용)
+
+사용법:
+    python bench/bench_serialization.py [--sizes 1000 10000] [--repeat 3]
+
+before : 행마다 model_validate → ProjectWithAccount 생성 → FastAPI의 response_model 재검증
+         (model_dump 후 다시 검증) → jsonable_encoder → json.dumps
+after  : TypeAdapter로 목록 전체를 한 번 검증 → dump_json으로 바로 바이트 생성
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from schemas import AccountResponse, AideaResponse, ProjectWithAccount, TeamMemberResponse
+
+def make_accounts(n: int):
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    text = "문제 정의와 해결 방법을 설명하는 텍스트 " * 20
+    accounts = []
+    for i in range(n):
+        members = [SimpleNamespace(id=i * 10 + j, name=f"팀원{j}", knox_id=f"member{i}-{j}", created_at=now) for j in range(3)]
+        aidea = SimpleNamespace(
+            id=i, account_id=i, project=f"프로젝트{i}", target_user=text, problem=text, solution=text,
+            data_sources=text, scenario=text, workflow=text, created_at=now, updated_at=None,
+        )
+        accounts.append(SimpleNamespace(
+            id=i, knox_id=f"user{i}", name=f"사용자{i}", team_name=f"팀{i}", department="개발",
+            created_at=now, updated_at=None, team_members=members, aideas=[aidea],
+        ))
+    return accounts
+
+project_list_adapter = TypeAdapter(List[ProjectWithAccount])
+
+def before(accounts, evaluated_ids) -> bytes:
+    project_list = []
+    for account in accounts:
+        aidea = account.aideas[0]
+        project_list.append(ProjectWithAccount(
+            account=AccountResponse.model_validate(account),
+            team_members=[TeamMemberResponse.model_validate(m) for m in account.team_members],
+            aidea=AideaResponse.model_validate(aidea),
+            is_evaluated=aidea.id in evaluated_ids,
+        ))
+    # FastAPI serialize_response: 모델을 dict로 덤프한 뒤 response_model로 다시 검증하고 인코딩
+    revalidated = project_list_adapter.validate_python([p.model_dump() for p in project_list])
+    return json.dumps(jsonable_encoder(revalidated), ensure_ascii=False, separators=(",", ":")).encode()
+
+def after(accounts, evaluated_ids) -> bytes:
+    rows = [
+        {
+            "account": account,
+            "team_members": account.team_members,
+            "aidea": account.aideas[0],
+            "is_evaluated": account.aideas[0].id in evaluated_ids,
+        }
+        for account in accounts
+    ]
+    return project_list_adapter.dump_json(project_list_adapter.validate_python(rows, from_attributes=True))
+
+def timed(func, *args, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = func(*args)
+        samples.append(time.perf_counter() - start)
+    return round(statistics.median(samples) * 1000, 1), len(body)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = []
+    for n in args.sizes:
+        accounts = make_accounts(n)
+        evaluated_ids = set(range(0, n, 2))
+        assert json.loads(before(accounts[:5], evaluated_ids)) == json.loads(after(accounts[:5], evaluated_ids))
+        before_ms, before_bytes = timed(before, accounts, evaluated_ids, repeat=args.repeat)
+        after_ms, after_bytes = timed(after, accounts, evaluated_ids, repeat=args.repeat)
+        results.append({
+            "projects": n,
+            "before_ms": before_ms,
+            "after_ms": after_ms,
+            "speedup": round(before_ms / after_ms, 2),
+            "before_bytes": before_bytes,
+            "after_bytes": after_bytes,
+        })
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+앱 모듈 import 시간과 시작 시 스키마 확인 비용 벤치마크
+
+사용법:
+    python bench/bench_startup.py [--runs 5] [--checks 200]
+
+임시 SQLite DB를 최신 스키마로 마이그레이션한 뒤 다음을 측정합니다.
+    import_main       : 새 프로세스에서 `import main`에 걸리는 시간 (import 시점에 DB 작업 없음)
+    startup           : 새 프로세스에서 import + lifespan 시작(ensure_schema)까지의 시간
+    ensure_schema     : 최신 DB에서 버전 확인 1회 (alembic_version 조회 한 번)
+    create_all        : 기존 방식처럼 매 시작마다 create_all로 스키마를 반영(reflection)하는 비용
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+IMPORT_SNIPPET = "import time; t = time.perf_counter(); import main; print(time.perf_counter() - t)"
+STARTUP_SNIPPET = """
+import asyncio, sys, time
+t = time.perf_counter()
+import main
+async def start():
+    async with main.lifespan(main.app):
+        pass
+asyncio.run(start())
+print(time.perf_counter() - t)
+print(int("alembic" in sys.modules))
+"""
+
+def run_python(snippet: str, env: dict):
+    output = subprocess.run(
+        [sys.executable, "-c", snippet], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    ).stdout.split()
+    return output
+
+def summarize(samples):
+    return {"median_ms": round(statistics.median(samples) * 1000, 2), "min_ms": round(min(samples) * 1000, 2)}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="프로세스 측정 반복 횟수")
+    parser.add_argument("--checks", type=int, default=200, help="프로세스 내 스키마 확인 반복 횟수")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_startup_")
+    env = {**os.environ, "DATABASE_PATH": os.path.join(workdir, "bench.db"), "ENVIRONMENT": "production"}
+    os.environ.update(env)
+
+    import database
+    import migrate
+    import models
+
+    migrate.ensure_schema(database.engine)
+
+    import_samples = [float(run_python(IMPORT_SNIPPET, env)[0]) for _ in range(args.runs)]
+    startup_samples, alembic_imported = [], False
+    for _ in range(args.runs):
+        elapsed, imported = run_python(STARTUP_SNIPPET, env)
+        startup_samples.append(float(elapsed))
+        alembic_imported = alembic_imported or imported == "1"
+
+    check_samples = []
+    for _ in range(args.checks):
+        start = time.perf_counter()
+        migrate.ensure_schema(database.engine)
+        check_samples.append(time.perf_counter() - start)
+
+    create_all_samples = []
+    for _ in range(args.checks):
+        start = time.perf_counter()
+        models.Base.metadata.create_all(bind=database.engine)
+        create_all_samples.append(time.perf_counter() - start)
+
+    print(json.dumps({
+        "import_main": summarize(import_samples),
+        "startup": {**summarize(startup_samples), "alembic_imported": alembic_imported},
+        "ensure_schema": summarize(check_samples),
+        "create_all": summarize(create_all_samples),
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
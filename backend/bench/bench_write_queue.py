@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+마감 직전 등록 폭주 벤치마크 (세션별 직접 커밋 vs 그룹 커밋 쓰기 대기열)
+
+사용법:
+    python bench/bench_write_queue.py [--clients 500] [--members 3]
+
+임시 SQLite 파일 DB에 계정을 clients개 만든 뒤, 클라이언트마다 스레드 하나가 동시에
+crud.update_account_registration(팀원 + aidea 등록)을 한 번씩 호출합니다.
+    direct : 기존 방식 (클라이언트마다 SessionLocal 세션에서 바로 커밋, busy timeout 30초)
+    queue  : write_queue.WriteQueue (writer 스레드 하나가 쌓인 작업을 한 트랜잭션으로 묶어 커밋)
+각 방식의 처리량, 지연 시간 분포(p50/p95/p99/max), 실패 수와 오류 종류, 커밋 수를 출력합니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+def payloads(schemas, account_ids, members):
+    return [
+        schemas.AccountRegister(
+            id=account_id, knox_id=f"user{account_id}", name=f"리더{account_id}", team_name=f"팀{account_id}",
+            team_members=[schemas.TeamMemberCreate(name=f"팀원{i}", knox_id=f"m{account_id}_{i}") for i in range(members)],
+            project=f"프로젝트{account_id}", problem="문제 " * 50, solution="해결 " * 50,
+        )
+        for account_id in account_ids
+    ]
+
+def reset(database, models):
+    db = database.SessionLocal()
+    db.query(models.TeamMember).delete()
+    db.query(models.Aidea).delete()
+    db.commit()
+    db.close()
+
+def burst(engine, submit, requests):
+    """모든 클라이언트를 동시에 출발시키고 요청별 지연 시간과 오류를 모읍니다."""
+    barrier = threading.Barrier(len(requests))
+    latencies, errors = [], Counter()
+    lock = threading.Lock()
+    commits = [0]
+
+    def count_commit(*_):
+        with lock:
+            commits[0] += 1
+
+    def client(payload):
+        barrier.wait()
+        start = time.perf_counter()
+        try:
+            submit(payload)
+            elapsed, error = time.perf_counter() - start, None
+        except Exception as e:
+            elapsed, error = time.perf_counter() - start, type(e).__name__ + (": database is locked" if "locked" in str(e) else "")
+        with lock:
+            latencies.append(elapsed)
+            if error:
+                errors[error] += 1
+
+    event.listen(engine, "commit", count_commit)
+    threads = [threading.Thread(target=client, args=(payload,)) for payload in requests]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    event.remove(engine, "commit", count_commit)
+
+    ms = lambda seconds: round(seconds * 1000, 1)
+    return {
+        "requests": len(requests),
+        "seconds": round(elapsed, 3),
+        "ok_per_sec": round((len(requests) - sum(errors.values())) / elapsed, 1),
+        "latency_ms": {
+            "p50": ms(statistics.median(latencies)),
+            "p95": ms(percentile(latencies, 0.95)),
+            "p99": ms(percentile(latencies, 0.99)),
+            "max": ms(max(latencies)),
+        },
+        "failures": sum(errors.values()),
+        "errors": dict(errors),
+        "commits": commits[0],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--members", type=int, default=3, help="요청당 팀원 수")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_write_queue_")
+    os.environ["DATABASE_PATH"] = os.path.join(workdir, "bench.db")
+    threading.stack_size(512 * 1024)
+
+    import database
+    import migrate
+    import models
+    import schemas
+    import crud
+    from write_queue import WriteQueue, create_writer_engine
+
+    migrate.ensure_schema(database.engine)
+    db = database.SessionLocal()
+    db.add_all([models.Account(id=i, knox_id=f"user{i}", hashed_password="x") for i in range(1, args.clients + 1)])
+    db.commit()
+    db.close()
+    requests = payloads(schemas, range(1, args.clients + 1), args.members)
+
+    # 엔진 풀 크기가 동시 클라이언트 수보다 작으면 풀 대기가 섞이므로 직접 방식은 충분히 크게 잡음
+    direct_engine = create_engine(
+        database.SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False, "timeout": 30},
+        pool_size=args.clients, max_overflow=0,
+    )
+    event.listen(direct_engine, "connect", database._set_sqlite_pragma)
+    DirectSession = sessionmaker(bind=direct_engine, autoflush=False, expire_on_commit=False)
+
+    def direct(payload):
+        session = DirectSession()
+        try:
+            crud.update_account_registration(session, payload)
+        finally:
+            session.close()
+
+    reset(database, models)
+    results = {"direct": burst(direct_engine, direct, requests)}
+
+    reset(database, models)
+    writer_engine = create_writer_engine(database.SQLALCHEMY_DATABASE_URL)
+    queue = WriteQueue(engine=writer_engine, max_pending=args.clients * 2)
+    queue.start()
+    results["queue"] = burst(
+        writer_engine,
+        lambda payload: queue.submit(lambda session: crud.update_account_registration(session, payload).id).result(),
+        requests,
+    )
+    results["queue"]["queue_stats"] = queue.stats()
+    queue.stop()
+
+    print(json.dumps({"clients": args.clients, "members": args.members, "results": results}, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
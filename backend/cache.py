@@ -0,0 +1,110 @@
+"""
+프로세스 내 응답 캐시와 데이터 버전
+
+crud의 쓰기 경로가 커밋될 때마다 데이터 버전(단조 증가 정수)을 올리고,
+캐시 항목은 저장 당시의 버전과 현재 버전이 같을 때만 유효합니다.
+캐시에는 직렬화된 응답 바이트를 저장하므로 히트 시 DB 조회와 Pydantic 검증/직렬화를 모두 건너뜁니다.
+
+버전은 프로세스 단위라 다른 워커/서버의 쓰기(또는 읽기 복제본에 늦게 반영된 쓰기)는 감지하지 못하므로,
+캐시 항목은 RESPONSE_CACHE_TTL초가 지나면 버전과 관계없이 만료됩니다. (다른 곳의 쓰기는 최대 TTL만큼 늦게 보임)
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional
+
+_data_version = 0
+_version_lock = threading.Lock()
+
+def current_data_version() -> int:
+    return _data_version
+
+def bump_data_version() -> int:
+    """데이터가 변경되었음을 알리고 새 버전을 반환합니다."""
+    global _data_version
+    with _version_lock:
+        _data_version += 1
+        return _data_version
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    version: int
+    etag: Optional[str] = None
+    stored_at: float = 0.0
+
+class ResponseCache:
+    """직렬화된 응답 바이트를 메모리 상한 내에서 LRU로 보관하는 캐시"""
+
+    def __init__(self, max_bytes: int, ttl: float = 0.0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl  # 0 이하면 만료 없음 (버전으로만 무효화)
+        self.clock = time.monotonic
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0, "expirations": 0}
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """현재 데이터 버전과 일치하고 TTL이 지나지 않은 항목을 반환합니다. 오래된 항목은 제거합니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            if entry.version != _data_version:
+                self._stats["invalidations"] += 1
+            elif self.ttl > 0 and self.clock() - entry.stored_at >= self.ttl:
+                self._stats["expirations"] += 1
+            else:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry
+            self._remove(key)
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key: Hashable, body: bytes, version: int, etag: Optional[str] = None):
+        """
+        응답 바이트를 저장합니다.
+        version은 DB를 읽기 전에 얻은 데이터 버전이어야 합니다. 읽는 도중 쓰기가 있었다면
+        저장된 항목은 다음 조회 때 바로 무효화됩니다.
+        """
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CachedResponse(body, version, etag, self.clock())
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats["evictions"] += 1
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._size -= len(entry.body)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_ratio": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl,
+                "data_version": _data_version,
+            }
+
+response_cache = ResponseCache(
+    max_bytes=int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    ttl=float(os.getenv("RESPONSE_CACHE_TTL", "5")),
+)
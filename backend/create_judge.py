@@ -1,62 +1,100 @@
 #!/usr/bin/env python3
 """
 심사위원 계정을 생성하는 스크립트
-사용법: python create_judge.py
+사용법:
+    python create_judge.py                            # 샘플 심사위원 생성
+    python create_judge.py --file judges.csv          # CSV(헤더: judge_id,password,name) 일괄 등록
+    python create_judge.py --file judges.json         # JSON(배열 또는 {"judges": [...]}) 일괄 등록
+    python create_judge.py --file judges.csv --workers 4
+
+비밀번호는 코어 수만큼 병렬로 해시하고, 모든 행을 한 트랜잭션으로 등록합니다.
+필수값 누락이나 중복 ID 같은 행 단위 오류는 출력만 하고 나머지 행은 계속 등록합니다.
 """
 
-from sqlalchemy.orm import Session
-from database import get_db, engine
-from models import Base
-from crud import create_judge
+import argparse
 import sys
 
-def create_sample_judges():
-    """샘플 심사위원 계정들을 생성합니다."""
-    
-    # 데이터베이스 테이블 생성
-    Base.metadata.create_all(bind=engine)
-    
-    # 데이터베이스 세션 생성
-    db = next(get_db())
-    
+from database import SessionLocal, engine
+from migrate import ensure_schema
+from crud import existing_judge_ids, create_judges_bulk
+from hashing import hash_passwords
+from judge_import import detect_format, parse_judges, validate_judges, row_error
+
+# 샘플 심사위원 데이터
+SAMPLE_JUDGES = [
+    {
+        "judge_id": "admin",
+        "password": "1",
+        "name": "관리자"
+    },
+]
+
+def import_judges(db, rows, workers=None):
+    """
+    심사위원 행 목록을 검증하고 병렬로 해시한 뒤 한 트랜잭션으로 등록합니다.
+
+    Returns:
+        (생성된 심사위원 목록, 행 단위 오류 목록)
+    """
+    valid, errors = validate_judges(rows)
+    existing = existing_judge_ids(db, [row["judge_id"] for row in valid])
+    errors += [row_error(row, "이미 존재하는 심사위원 ID입니다.") for row in valid if row["judge_id"] in existing]
+    valid = [row for row in valid if row["judge_id"] not in existing]
+
+    hashes = hash_passwords([row["password"] for row in valid], max_workers=workers) if valid else []
+    created, insert_errors = create_judges_bulk(
+        db, [{**row, "hashed_password": hashed} for row, hashed in zip(valid, hashes)]
+    )
+    return created, sorted(errors + insert_errors, key=lambda error: error["row"])
+
+def load_rows(path):
+    with open(path, "rb") as f:
+        return parse_judges(f.read(), detect_format(path))
+
+def main():
+    parser = argparse.ArgumentParser(description="심사위원 계정 생성")
+    parser.add_argument("--file", help="등록할 심사위원 CSV/JSON 파일 (없으면 샘플 심사위원 생성)")
+    parser.add_argument("--workers", type=int, help="해시에 사용할 프로세스 수 (기본: 코어 수)")
+    args = parser.parse_args()
+
+    # 데이터베이스 스키마 확인 (필요하면 마이그레이션)
+    ensure_schema(engine)
+
+    try:
+        if args.file:
+            rows = load_rows(args.file)
+        else:
+            rows = [{"row": index, **judge} for index, judge in enumerate(SAMPLE_JUDGES, start=1)]
+    except (OSError, ValueError) as e:
+        print(f"❌ 파일을 읽을 수 없습니다: {e}")
+        sys.exit(1)
+
+    print(f"심사위원 계정 {len(rows)}건을 생성합니다...")
+
+    db = SessionLocal()
     try:
-        # 샘플 심사위원 데이터
-        judges_data = [
-            {
-                "judge_id": "admin",
-                "password": "1",
-                "name": "관리자"
-            },
-        ]
-        
-        print("심사위원 계정을 생성합니다...")
-        
-        for judge_data in judges_data:
-            try:
-                judge = create_judge(
-                    db=db,
-                    judge_id=judge_data["judge_id"],
-                    password=judge_data["password"],
-                    name=judge_data["name"]
-                )
-                print(f"✅ 심사위원 계정 생성 완료: {judge.name} ({judge.judge_id})")
-            except Exception as e:
-                print(f"❌ 심사위원 계정 생성 실패: {judge_data['judge_id']} - {e}")
-        
-        print("\n심사위원 계정 생성이 완료되었습니다.")
+        created, errors = import_judges(db, rows, workers=args.workers)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    for judge in created:
+        print(f"✅ 심사위원 계정 생성 완료: {judge.name} ({judge.judge_id})")
+    for error in errors:
+        print(f"❌ {error['row']}행 심사위원 계정 생성 실패: {error['judge_id']} - {error['error']}")
+
+    print(f"\n생성 {len(created)}건, 실패 {len(errors)}건")
+    if not args.file and created:
         print("\n생성된 계정 정보:")
         print("=" * 50)
-        for judge_data in judges_data:
+        for judge_data in SAMPLE_JUDGES:
             print(f"ID: {judge_data['judge_id']}")
             print(f"비밀번호: {judge_data['password']}")
             print(f"이름: {judge_data['name']}")
             print("-" * 30)
-            
-    except Exception as e:
-        print(f"❌ 오류 발생: {e}")
-        sys.exit(1)
-    finally:
-        db.close()
+    sys.exit(1 if errors else 0)
 
 if __name__ == "__main__":
-    create_sample_judges()
+    main()
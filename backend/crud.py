@@ -1,8 +1,61 @@
-from sqlalchemy.orm import Session
+from datetime import datetime
+from fractions import Fraction
+from string import Formatter
+from typing import List, Optional
+from sqlalchemy.orm import Session, selectinload, joinedload, load_only
+from sqlalchemy import bindparam, event, exists, func, insert, select, text, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 from passlib.hash import bcrypt
-from models import Account, TeamMember, Aidea, Judge, Evaluation
-from schemas import AccountRegister, TeamMemberCreate, AideaCreate, AideaUpdate
+from sqlalchemy.dialects import postgresql, sqlite
+from models import Account, TeamMember, Aidea, Judge, Evaluation, AideaScoreSummary, EmailOutbox, MailJob
+from schemas import AccountRegister, TeamMemberCreate, AideaCreate, AideaUpdate, EvaluationCreate
+from pagination import parse_sort, paginate
+from cache import bump_data_version
+from events import queue_event, publish_pending, discard_pending
+from judge_import import row_error
+
+# 관리자 목록에서 keyset 정렬에 사용할 수 있는 컬럼 (NULL이 없는 컬럼만)
+ACCOUNT_SORT_COLUMNS = {"id": Account.id, "created_at": Account.created_at}
+EVALUATION_SORT_COLUMNS = {"id": Evaluation.id, "created_at": Evaluation.created_at, "total_score": Evaluation.total_score}
+JUDGE_SORT_COLUMNS = {"id": Judge.id, "created_at": Judge.created_at}
+
+# 순위 산정 기준 (평균 점수 = 합계 / 평가 수)
+RANKING_CRITERIA = {
+    "total": AideaScoreSummary.total_sum,
+    "innovation": AideaScoreSummary.innovation_sum,
+    "feasibility": AideaScoreSummary.feasibility_sum,
+    "effectiveness": AideaScoreSummary.effectiveness_sum,
+}
+DEFAULT_TIEBREAK = ["effectiveness", "feasibility", "innovation"]
+
+def _mark_changed(db: Session):
+    """이 세션의 트랜잭션이 커밋되면 데이터 버전을 올리도록 표시합니다. (응답 캐시 무효화)"""
+    db.info["data_changed"] = True
+
+@event.listens_for(Session, "after_commit")
+def _bump_version_after_commit(session: Session):
+    # 실제 커밋이 끝난 뒤에만 버전을 올려, 커밋 전 데이터가 새 버전으로 캐시되지 않도록 함
+    version = bump_data_version() if session.info.pop("data_changed", False) else None
+    # 실시간 알림도 커밋된 변경만 발행 (/api/events)
+    publish_pending(session, version)
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_change_mark(session: Session, previous_transaction):
+    # SAVEPOINT 롤백(쓰기 대기열에서 작업 하나만 되돌림)은 같은 배치의 다른 작업 표시를 지우지 않음
+    if previous_transaction.nested:
+        return
+    session.info.pop("data_changed", None)
+    discard_pending(session)
+
+def _insert(db: Session, model):
+    """ON CONFLICT를 지원하는 DB별 INSERT 구문을 반환합니다."""
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(model)
+
+def _count(query, id_column) -> int:
+    """필터가 적용된 쿼리의 전체 행 수를 COUNT 쿼리로 계산합니다."""
+    return query.order_by(None).with_entities(func.count(id_column)).scalar()
 
 # Account CRUD
 def get_account_by_knox_id(db: Session, knox_id: str):
@@ -11,12 +64,23 @@ def get_account_by_knox_id(db: Session, knox_id: str):
 def get_account_by_id(db: Session, account_id: int):
     return db.query(Account).filter(Account.id == account_id).first()
 
-def create_or_update_account(db: Session, knox_id: str, password: str):
-    hashed = bcrypt.hash(password)
+class AccountExistsError(Exception):
+    """동시에 같은 knox_id로 계정이 먼저 생성되었을 때 발생합니다. (verify_existing=False면 호출자가 비밀번호를 확인)"""
+
+    def __init__(self, knox_id: str):
+        super().__init__("이미 존재하는 계정입니다.")
+        self.knox_id = knox_id
+
+def create_or_update_account(db: Session, knox_id: str, password: str, hashed_password: Optional[str] = None,
+                             verify_existing: bool = True):
+    # 호출자가 해시를 미리 계산했다면(HashingService) 그대로 사용
+    # verify_existing=False면 동시 생성된 계정의 bcrypt 검증을 쓰기 작업 안에서 하지 않고 AccountExistsError로 넘김
+    hashed = hashed_password or bcrypt.hash(password)
     account = get_account_by_knox_id(db, knox_id)
     if account:
         account.hashed_password = hashed
         db.add(account)
+        _mark_changed(db)
         db.commit()
         db.refresh(account)
         return account
@@ -24,6 +88,7 @@ def create_or_update_account(db: Session, knox_id: str, password: str):
     try:
         account = Account(knox_id=knox_id, hashed_password=hashed)
         db.add(account)
+        _mark_changed(db)
         db.commit()
         db.refresh(account)
         return account
@@ -32,6 +97,8 @@ def create_or_update_account(db: Session, knox_id: str, password: str):
         db.rollback()
         account = get_account_by_knox_id(db, knox_id)
         if account:
+            if not verify_existing:
+                raise AccountExistsError(knox_id)
             if account.verify_password(password):
                 return account
             else:
@@ -66,69 +133,38 @@ def update_account_registration(db: Session, registration_data: AccountRegister)
         if len(set(knox_ids)) != len(knox_ids):
             raise ValueError("동일한 Knox ID인 팀원이 2명이상 존재하여 중복됩니다.")
         
-        # 계정 기본 정보 업데이트
-        account.name = registration_data.name.strip()
-        account.team_name = registration_data.team_name.strip()
-        
-        # 부서 정보 처리: 새로운 값이 있으면 업데이트, 없으면 기존 값 유지
-        if hasattr(registration_data, 'department') and registration_data.department is not None:
-            if registration_data.department.strip():
-                account.department = registration_data.department.strip()
-            # 빈 문자열이면 기존 값 유지 (변경하지 않음)
-        # department가 없으면 기존 값 유지 (변경하지 않음)
-        
-        db.add(account)
-        
-        existing_members = db.query(TeamMember).filter(TeamMember.account_id == account.id).all()
-        for member in existing_members:
-            db.delete(member)
-
         for i, member_data in enumerate(registration_data.team_members):
             if not member_data.name or not member_data.name.strip():
                 raise ValueError(f"팀원 {i+1}의 이름은 필수입니다.")
             if not member_data.knox_id or not member_data.knox_id.strip():
                 raise ValueError(f"팀원 {i+1}의 knox_id는 필수입니다.")
-            
-            team_member = TeamMember(
-                account_id=account.id,
-                name=member_data.name.strip(),
-                knox_id=member_data.knox_id.strip()
-            )
-            db.add(team_member)
-        
-        # 기존 Aidea 업데이트 또는 새로 생성
-        existing_aidea = db.query(Aidea).filter(Aidea.account_id == account.id).first()
+
+        # 기존 값과 비교해 바뀐 부분만 반영 (변경 없는 재제출은 쓰기 없음)
+        changed = _assign_changed(account, {
+            "name": registration_data.name.strip(),
+            "team_name": registration_data.team_name.strip(),
+        })
         
-        if existing_aidea:
-            # 기존 Aidea가 있으면 업데이트
-            if registration_data.project and registration_data.project.strip():
-                existing_aidea.project = registration_data.project.strip()
-                existing_aidea.target_user = registration_data.target_user
-                existing_aidea.problem = registration_data.problem
-                existing_aidea.solution = registration_data.solution
-                existing_aidea.data_sources = registration_data.data_sources
-                existing_aidea.scenario = registration_data.scenario
-                existing_aidea.workflow = registration_data.workflow
-                existing_aidea.benefit = registration_data.benefit  # 기대효과 필드 추가
-            else:
-                # project가 비어있으면 기존 Aidea 삭제
-                db.delete(existing_aidea)
-        else:
-            # 기존 Aidea가 없으면 새로 생성
-            if registration_data.project and registration_data.project.strip():
-                aidea = Aidea(
-                    account_id=account.id,
-                    project=registration_data.project.strip(),
-                    target_user=registration_data.target_user,
-                    problem=registration_data.problem,
-                    solution=registration_data.solution,
-                    data_sources=registration_data.data_sources,
-                    scenario=registration_data.scenario,
-                    workflow=registration_data.workflow,
-                    benefit=registration_data.benefit  # 기대효과 필드 추가
-                )
-                db.add(aidea)
+        # 부서 정보 처리: 새로운 값이 있으면 업데이트, 없으면 기존 값 유지
+        if registration_data.department is not None and registration_data.department.strip():
+            changed |= _assign_changed(account, {"department": registration_data.department.strip()})
+        # 빈 문자열이거나 department가 없으면 기존 값 유지 (변경하지 않음)
 
+        changed |= _sync_team_members(account, registration_data.team_members)
+        previous_aidea_id = account.aideas[0].id if account.aideas else None
+        aidea_changed = _sync_aidea(account, registration_data)
+
+        if not (changed or aidea_changed):
+            # 읽기만 한 트랜잭션을 닫음 (WAL에 기록되는 내용 없음)
+            db.commit()
+            return account
+
+        _mark_changed(db)
+        db.flush()  # 새로 제출된 Aidea의 id를 이벤트에 담기 위해 (커밋에서 어차피 실행될 flush)
+        if changed:
+            queue_event(db, "team.updated", account_id=account.id)
+        if aidea_changed:
+            _queue_aidea_event(db, account, previous_aidea_id)
         db.commit()
         db.refresh(account)
         return account
@@ -145,6 +181,62 @@ def update_account_registration(db: Session, registration_data: AccountRegister)
         db.rollback()
         raise Exception(f"팀원 정보 업데이트 중 오류가 발생했습니다: {str(e)}")
 
+def _assign_changed(obj, values: dict) -> bool:
+    """값이 다른 속성만 대입하고, 하나라도 바뀌었는지 반환합니다."""
+    changed = False
+    for key, value in values.items():
+        if getattr(obj, key) != value:
+            setattr(obj, key, value)
+            changed = True
+    return changed
+
+def _sync_team_members(account: Account, members: List[TeamMemberCreate]) -> bool:
+    """
+    팀원 목록을 knox_id 기준으로 비교해 추가/이름 변경/삭제만 반영합니다.
+    삭제는 delete-orphan cascade로, 추가는 flush 시 한 번의 다중 INSERT로 처리됩니다.
+    """
+    wanted = {m.knox_id.strip(): m.name.strip() for m in members}
+    changed = False
+    for member in list(account.team_members):
+        if member.knox_id not in wanted:
+            account.team_members.remove(member)
+            changed = True
+        else:
+            changed |= _assign_changed(member, {"name": wanted.pop(member.knox_id)})
+    if wanted:
+        account.team_members.extend(TeamMember(name=name, knox_id=knox_id) for knox_id, name in wanted.items())
+        changed = True
+    return changed
+
+AIDEA_REGISTRATION_FIELDS = ["target_user", "problem", "solution", "data_sources", "scenario", "workflow", "benefit"]
+
+def _sync_aidea(account: Account, registration_data: AccountRegister) -> bool:
+    """계정의 Aidea를 제출 내용과 비교해 바뀐 컬럼만 갱신하거나, 생성/삭제합니다."""
+    existing_aidea = account.aideas[0] if account.aideas else None
+    project = registration_data.project.strip() if registration_data.project else ""
+
+    if not project:
+        # project가 비어있으면 기존 Aidea 삭제
+        if existing_aidea is None:
+            return False
+        account.aideas.remove(existing_aidea)
+        return True
+
+    values = {"project": project, **{f: getattr(registration_data, f) for f in AIDEA_REGISTRATION_FIELDS}}
+    if existing_aidea is None:
+        account.aideas.append(Aidea(**values))
+        return True
+    return _assign_changed(existing_aidea, values)
+
+def _queue_aidea_event(db: Session, account: Account, previous_aidea_id: Optional[int]):
+    """등록 화면 제출로 Aidea가 생성/수정/삭제된 경우 알림 이벤트를 쌓습니다."""
+    if not account.aideas:
+        queue_event(db, "aidea.deleted", aidea_id=previous_aidea_id, account_id=account.id)
+    elif previous_aidea_id is None:
+        queue_event(db, "aidea.submitted", aidea_id=account.aideas[0].id, account_id=account.id)
+    else:
+        queue_event(db, "aidea.updated", aidea_id=previous_aidea_id, account_id=account.id)
+
 # Aidea CRUD
 def create_aidea(db: Session, account_id: int, aidea_data: AideaCreate):
     aidea = Aidea(
@@ -159,6 +251,9 @@ def create_aidea(db: Session, account_id: int, aidea_data: AideaCreate):
         benefit=aidea_data.benefit  # 기대효과 필드 추가
     )
     db.add(aidea)
+    _mark_changed(db)
+    db.flush()
+    queue_event(db, "aidea.submitted", aidea_id=aidea.id, account_id=account_id)
     db.commit()
     db.refresh(aidea)
     return aidea
@@ -178,6 +273,8 @@ def update_aidea(db: Session, aidea_id: int, aidea_data: AideaUpdate):
     for field, value in update_data.items():
         setattr(aidea, field, value)
     
+    _mark_changed(db)
+    queue_event(db, "aidea.updated", aidea_id=aidea.id, account_id=aidea.account_id)
     db.commit()
     db.refresh(aidea)
     return aidea
@@ -188,9 +285,110 @@ def delete_aidea(db: Session, aidea_id: int):
         return False
     
     db.delete(aidea)
+    _mark_changed(db)
+    queue_event(db, "aidea.deleted", aidea_id=aidea.id, account_id=aidea.account_id)
     db.commit()
     return True
 
+class VersionConflictError(Exception):
+    """요청한 버전과 저장된 버전이 다를 때 발생합니다. (다른 곳에서 먼저 저장됨)"""
+
+    def __init__(self, current_version: Optional[int]):
+        super().__init__(f"다른 곳에서 먼저 저장되었습니다. (현재 버전: {current_version})")
+        self.current_version = current_version
+
+def _save_versioned(db: Session, obj, changes: dict, expected_version: Optional[int], event: Optional[tuple] = None):
+    """
+    낙관적 잠금으로 바뀐 필드만 저장합니다.
+    expected_version이 주어지면 저장된 버전과 비교하고, UPDATE 문에도 version 조건이 붙어(version_id_col)
+    확인 후 커밋 사이에 다른 요청이 저장한 경우도 충돌로 처리합니다.
+    event((종류, 필드) 튜플)는 실제로 바뀐 값이 있을 때만 알림으로 발행합니다.
+    """
+    if expected_version is not None and obj.version != expected_version:
+        raise VersionConflictError(obj.version)
+    if not _assign_changed(obj, changes):
+        # 변경 없음: 쓰기 없이 현재 버전 반환
+        db.commit()
+        return obj
+    try:
+        _mark_changed(db)
+        if event is not None:
+            queue_event(db, event[0], **event[1])
+        db.commit()
+    except StaleDataError:
+        db.rollback()
+        raise VersionConflictError(None)
+    return obj
+
+def patch_aidea(db: Session, aidea_id: int, account_knox_id: str, changes: dict, expected_version: Optional[int] = None):
+    """
+    Aidea의 일부 필드만 수정합니다. (자동 저장용)
+    바뀐 필드만 로드/갱신하므로 다른 긴 텍스트 컬럼은 읽거나 다시 쓰지 않습니다.
+
+    Returns:
+        수정된 Aidea, 없으면 None
+    Raises:
+        PermissionError: account_knox_id가 Aidea 소유 계정과 다른 경우
+        VersionConflictError: expected_version이 저장된 버전과 다른 경우
+    """
+    if "project" in changes and not (changes["project"] or "").strip():
+        raise ValueError("프로젝트 이름은 비울 수 없습니다.")
+    aidea = (
+        db.query(Aidea)
+        .options(
+            load_only(Aidea.id, Aidea.account_id, Aidea.version, *[getattr(Aidea, f) for f in changes]),
+            joinedload(Aidea.account).load_only(Account.id, Account.knox_id),
+        )
+        .filter(Aidea.id == aidea_id)
+        .first()
+    )
+    if not aidea:
+        return None
+    if aidea.account.knox_id != account_knox_id:
+        raise PermissionError("요청의 knox_id가 Aidea 소유 계정과 일치하지 않습니다.")
+    if "project" in changes:
+        changes = {**changes, "project": changes["project"].strip()}
+    event = ("aidea.updated", {"aidea_id": aidea.id, "account_id": aidea.account_id})
+    return _save_versioned(db, aidea, changes, expected_version, event)
+
+def patch_team_member(db: Session, member_id: int, account_knox_id: str, changes: dict, expected_version: Optional[int] = None):
+    """
+    팀원 한 명의 이름/Knox ID만 수정합니다.
+
+    Returns:
+        수정된 TeamMember, 없으면 None
+    Raises:
+        PermissionError: account_knox_id가 팀원 소유 계정과 다른 경우
+        VersionConflictError: expected_version이 저장된 버전과 다른 경우
+    """
+    member = (
+        db.query(TeamMember)
+        .options(joinedload(TeamMember.account).load_only(Account.id, Account.knox_id))
+        .filter(TeamMember.id == member_id)
+        .first()
+    )
+    if not member:
+        return None
+    if member.account.knox_id != account_knox_id:
+        raise PermissionError("요청의 knox_id가 팀원 소유 계정과 일치하지 않습니다.")
+
+    changes = dict(changes)
+    for field, label in (("name", "이름"), ("knox_id", "knox_id")):
+        if field in changes:
+            if not (changes[field] or "").strip():
+                raise ValueError(f"팀원의 {label}은(는) 필수입니다.")
+            changes[field] = changes[field].strip()
+    new_knox_id = changes.get("knox_id")
+    if new_knox_id and new_knox_id != member.knox_id:
+        if new_knox_id == account_knox_id:
+            raise ValueError("본인 Knox ID와 동일한 팀원을 추가할 수 없습니다.")
+        duplicate = db.query(TeamMember.id).filter(
+            TeamMember.account_id == member.account_id, TeamMember.knox_id == new_knox_id
+        ).first()
+        if duplicate:
+            raise ValueError("동일한 Knox ID인 팀원이 2명이상 존재하여 중복됩니다.")
+    return _save_versioned(db, member, changes, expected_version, ("team.updated", {"account_id": member.account_id}))
+
 # 관리자용 CRUD 함수들
 def get_all_accounts(db: Session):
     """모든 계정을 조회합니다."""
@@ -200,15 +398,42 @@ def get_all_aideas(db: Session):
     """모든 Aidea를 계정 정보와 함께 조회합니다."""
     return db.query(Aidea).join(Account).all()
 
-# 마이그레이션 스크립트 (migrate.py)
-from sqlalchemy import text
-from database import engine
+def list_accounts(
+    db: Session,
+    department: Optional[str] = None,
+    team_name: Optional[str] = None,
+    has_aidea: Optional[bool] = None,
+    sort: str = "id",
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+):
+    """
+    계정 목록을 필터/정렬/커서 페이지네이션하여 조회합니다.
+    fields를 지정하면 해당 컬럼만 로드합니다. (account_field_rows로 변환)
+
+    Returns:
+        (계정 목록, 전체 개수, 다음 페이지 커서)
+    """
+    sort_column, descending = parse_sort(sort, ACCOUNT_SORT_COLUMNS)
+    query = db.query(Account)
+    if department:
+        query = query.filter(Account.department == department)
+    if team_name:
+        query = query.filter(Account.team_name.contains(team_name))
+    if has_aidea is True:
+        query = query.filter(Account.aideas.any())
+    elif has_aidea is False:
+        query = query.filter(~Account.aideas.any())
 
-def add_benefit_column():
-    with engine.connect() as conn:
-        conn.execute(text("ALTER TABLE aideas ADD COLUMN benefit TEXT"))
-        conn.commit()
-        print("benefit 컬럼이 성공적으로 추가되었습니다.")
+    total = _count(query, Account.id)
+    if fields:
+        # 커서를 만들 때 정렬 컬럼 값이 필요하므로 함께 로드
+        query = query.options(*_field_options(fields, sort_column))
+    else:
+        query = query.options(selectinload(Account.team_members), selectinload(Account.aideas))
+    accounts, next_cursor = paginate(query, sort_column, Account.id, descending, cursor, limit)
+    return accounts, total, next_cursor
 
 # Judge CRUD
 def get_judge_by_judge_id(db: Session, judge_id: str):
@@ -217,18 +442,57 @@ def get_judge_by_judge_id(db: Session, judge_id: str):
 def get_judge_by_id(db: Session, judge_id: int):
     return db.query(Judge).filter(Judge.id == judge_id).first()
 
-def create_judge(db: Session, judge_id: str, password: str, name: str):
-    hashed = bcrypt.hash(password)
+def create_judge(db: Session, judge_id: str, password: str, name: str, hashed_password: Optional[str] = None):
+    hashed = hashed_password or bcrypt.hash(password)
     judge = Judge(
         judge_id=judge_id,
         hashed_password=hashed,
         name=name
     )
     db.add(judge)
+    _mark_changed(db)
     db.commit()
     db.refresh(judge)
     return judge
 
+def existing_judge_ids(db: Session, judge_ids: List[str]) -> set:
+    """주어진 judge_id 중 이미 등록된 것들을 한 번의 쿼리로 조회합니다."""
+    if not judge_ids:
+        return set()
+    return set(db.scalars(select(Judge.judge_id).where(Judge.judge_id.in_(judge_ids))))
+
+def create_judges_bulk(db: Session, rows: List[dict]):
+    """
+    비밀번호 해시가 끝난 심사위원 행들(row, judge_id, name, hashed_password)을 한 트랜잭션으로 추가합니다.
+    이미 등록된 judge_id는 행 단위 오류로 돌려주고 나머지 행은 그대로 등록합니다.
+    INSERT ... RETURNING 한 문장으로 모든 행을 넣고 생성된 심사위원을 돌려받습니다.
+
+    Returns:
+        (생성된 심사위원 목록, 행 단위 오류 목록)
+    """
+    # 확인과 INSERT 사이에 다른 요청이 같은 ID를 등록하면 한 번 더 걸러내고 재시도
+    for attempt in range(2):
+        existing = existing_judge_ids(db, [row["judge_id"] for row in rows])
+        errors = [row_error(row, "이미 존재하는 심사위원 ID입니다.") for row in rows if row["judge_id"] in existing]
+        new_rows = [row for row in rows if row["judge_id"] not in existing]
+        if not new_rows:
+            db.rollback()
+            return [], errors
+        try:
+            inserted = {judge.judge_id: judge for judge in db.scalars(
+                insert(Judge).returning(Judge),
+                [{"judge_id": row["judge_id"], "name": row["name"], "hashed_password": row["hashed_password"]}
+                 for row in new_rows],
+            )}
+            _mark_changed(db)
+            db.commit()
+            # RETURNING 순서는 보장되지 않으므로(행 단위 정렬을 요구하면 SQLite는 한 행씩 INSERT) 입력 순서로 정렬
+            return [inserted[row["judge_id"]] for row in new_rows], errors
+        except IntegrityError:
+            db.rollback()
+            if attempt:
+                raise
+
 def verify_judge_login(db: Session, judge_id: str, password: str):
     judge = get_judge_by_judge_id(db, judge_id)
     if not judge:
@@ -241,6 +505,19 @@ def get_all_judges(db: Session):
     """모든 심사위원을 조회합니다."""
     return db.query(Judge).all()
 
+def list_judges(db: Session, sort: str = "id", cursor: Optional[str] = None, limit: Optional[int] = None):
+    """
+    심사위원 목록을 정렬/커서 페이지네이션하여 조회합니다.
+
+    Returns:
+        (심사위원 목록, 전체 개수, 다음 페이지 커서)
+    """
+    sort_column, descending = parse_sort(sort, JUDGE_SORT_COLUMNS)
+    query = db.query(Judge)
+    total = _count(query, Judge.id)
+    judges, next_cursor = paginate(query, sort_column, Judge.id, descending, cursor, limit)
+    return judges, total, next_cursor
+
 def get_all_projects_with_accounts(db: Session):
     """제출된 모든 Aidea 프로젝트와 계정 정보를 함께 가져옵니다."""
     return db.query(Account).outerjoin(Aidea).all()
@@ -249,64 +526,655 @@ def get_projects_with_aideas_only(db: Session):
     """Aidea가 있는 Account만 가져옵니다."""
     return db.query(Account).join(Aidea).all()
 
+def get_project_listing(db: Session, fields: Optional[List[str]] = None):
+    """
+    Aidea가 있는 Account를 팀원/Aidea와 함께 한 번에 가져옵니다.
+    selectinload로 관계를 미리 로드하므로 계정 수와 무관하게 쿼리 수가 일정합니다.
+    fields를 지정하면 해당 컬럼만 로드합니다. (account_field_rows로 변환)
+    """
+    if fields:
+        # 평가 여부 표시에 aidea id가 필요하므로 Aidea는 항상 로드
+        options = _field_options(fields, with_aidea=True)
+    else:
+        options = [selectinload(Account.team_members), selectinload(Account.aideas)]
+    return (
+        db.query(Account)
+        .filter(Account.aideas.any())
+        .options(*options)
+        .order_by(Account.id)
+        .all()
+    )
+
+# 목록 필드 선택(?view=summary / ?fields=)에 쓸 수 있는 필드
+# 계정 컬럼과 계정의 첫 번째 Aidea 컬럼을 한 행으로 펼칩니다.
+ACCOUNT_FIELD_COLUMNS = {
+    "account_id": Account.id,
+    "knox_id": Account.knox_id,
+    "name": Account.name,
+    "team_name": Account.team_name,
+    "department": Account.department,
+    "created_at": Account.created_at,
+    "updated_at": Account.updated_at,
+    "aidea_id": Aidea.id,
+    "project": Aidea.project,
+    "target_user": Aidea.target_user,
+    "problem": Aidea.problem,
+    "solution": Aidea.solution,
+    "data_sources": Aidea.data_sources,
+    "scenario": Aidea.scenario,
+    "workflow": Aidea.workflow,
+    "benefit": Aidea.benefit,
+}
+
+# 목록 화면에 필요한 최소 필드 (긴 텍스트 제외)
+SUMMARY_FIELDS = ["account_id", "knox_id", "team_name", "department", "aidea_id", "project"]
+
+def resolve_fields(view: Optional[str], fields: Optional[str]) -> Optional[List[str]]:
+    """
+    view/fields 파라미터를 검증하여 선택한 필드 목록을 반환합니다.
+    fields가 view보다 우선하며, 전체 응답(view=full)이면 None을 반환합니다.
+    """
+    if fields is not None:
+        selected = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in selected if f not in ACCOUNT_FIELD_COLUMNS]
+        if unknown or not selected:
+            raise ValueError(f"지원하지 않는 필드입니다: {', '.join(unknown)} (가능: {', '.join(ACCOUNT_FIELD_COLUMNS)})")
+        return list(dict.fromkeys(selected))
+    if view in (None, "full"):
+        return None
+    if view == "summary":
+        return list(SUMMARY_FIELDS)
+    raise ValueError(f"지원하지 않는 view입니다: {view} (가능: full, summary)")
+
+def _field_options(fields: List[str], *extra_account_columns, with_aidea: bool = False):
+    """선택한 필드의 컬럼만 로드하도록 load_only 옵션을 만듭니다. (나머지 컬럼은 SELECT하지 않음)"""
+    columns = [ACCOUNT_FIELD_COLUMNS[f] for f in fields]
+    account_columns = [c for c in columns if c.class_ is Account]
+    aidea_columns = [c for c in columns if c.class_ is Aidea]
+    options = [load_only(Account.id, *account_columns, *extra_account_columns)]
+    if aidea_columns or with_aidea:
+        options.append(selectinload(Account.aideas).load_only(Aidea.id, Aidea.account_id, *aidea_columns))
+    return options
+
+def account_field_rows(accounts: List[Account], fields: List[str], evaluated_ids: Optional[set] = None) -> List[dict]:
+    """
+    load_only로 가져온 계정을 선택한 필드만 담은 dict 목록으로 변환합니다.
+    evaluated_ids가 주어지면 is_evaluated를 함께 넣습니다.
+    """
+    columns = [(f, ACCOUNT_FIELD_COLUMNS[f]) for f in fields]
+    needs_aidea = evaluated_ids is not None or any(c.class_ is Aidea for _, c in columns)
+    rows = []
+    for account in accounts:
+        aidea = account.aideas[0] if needs_aidea and account.aideas else None
+        row = {}
+        for name, column in columns:
+            owner = account if column.class_ is Account else aidea
+            row[name] = getattr(owner, column.key) if owner is not None else None
+        if evaluated_ids is not None:
+            row["is_evaluated"] = aidea is not None and aidea.id in evaluated_ids
+        rows.append(row)
+    return rows
+
 # Evaluation CRUD
+# 평가 항목별 배점 (점수, 단위, 이름): 단위의 1~5배만 허용
+EVALUATION_RUBRIC = (
+    ("innovation_score", 6, "아이디어 혁신성"),
+    ("feasibility_score", 6, "기술 실현 가능성"),
+    ("effectiveness_score", 8, "업무 효과성"),
+)
+
+def rubric_error(evaluation: EvaluationCreate) -> Optional[str]:
+    """배점 기준에 맞지 않는 첫 항목의 오류 메시지를 반환합니다. (모두 맞으면 None)"""
+    for field, unit, label in EVALUATION_RUBRIC:
+        score = getattr(evaluation, field)
+        if not (unit <= score <= unit * 5 and score % unit == 0):
+            choices = ", ".join(str(unit * i) for i in range(1, 6))
+            return f"{label} 점수는 {choices} 중 하나여야 합니다."
+    return None
+
 def create_evaluation(db: Session, aidea_id: int, judge_id: int, innovation_score: int, feasibility_score: int, effectiveness_score: int):
-    """평가를 생성합니다."""
-    total_score = innovation_score + feasibility_score + effectiveness_score
-    
-    # 이미 같은 심사위원이 같은 aidea를 평가했는지 확인
-    existing_evaluation = db.query(Evaluation).filter(
-        Evaluation.aidea_id == aidea_id,
-        Evaluation.judge_id == judge_id
-    ).first()
-    
-    if existing_evaluation:
-        existing_evaluation.innovation_score = innovation_score
-        existing_evaluation.feasibility_score = feasibility_score
-        existing_evaluation.effectiveness_score = effectiveness_score
-        existing_evaluation.total_score = total_score
-        db.commit()
-        db.refresh(existing_evaluation)
-        return existing_evaluation
-    else:
-        evaluation = Evaluation(
-            aidea_id=aidea_id,
-            judge_id=judge_id,
-            innovation_score=innovation_score,
-            feasibility_score=feasibility_score,
-            effectiveness_score=effectiveness_score,
-            total_score=total_score
-        )
-        db.add(evaluation)
+    """
+    평가를 생성합니다. 같은 심사위원이 이미 평가했다면 점수를 덮어씁니다.
+    """
+    try:
+        evaluation = _upsert_evaluation(db, aidea_id, judge_id, innovation_score, feasibility_score, effectiveness_score)
+        # 응답에 심사위원 정보가 필요하므로 커밋 전에 로드 (expire_on_commit=False라 커밋 후 재조회 없음)
+        evaluation.judge
+        _mark_changed(db)
+        _queue_evaluation_event(db, evaluation)
         db.commit()
-        db.refresh(evaluation)
         return evaluation
+    except Exception:
+        db.rollback()
+        raise
+
+def create_evaluations_batch(db: Session, items: List[EvaluationCreate]) -> List[tuple]:
+    """
+    여러 평가를 한 트랜잭션으로 저장합니다. (커밋 한 번)
+    배점 오류나 존재하지 않는 aidea/심사위원은 해당 항목만 오류로 돌려주고 나머지는 저장합니다.
+    같은 (aidea, 심사위원)이 여러 번 있으면 뒤의 점수가 남고, 점수 집계는 aidea마다 한 번만 다시 계산합니다.
+
+    Returns:
+        items와 같은 순서의 (평가 또는 None, 오류 메시지 또는 None) 목록
+    """
+    results: List[tuple] = [(None, rubric_error(item)) for item in items]
+    # FK 위반으로 트랜잭션 전체가 실패하지 않도록 존재 여부를 미리 한 번씩 조회
+    aidea_ids = set(db.scalars(select(Aidea.id).where(Aidea.id.in_({item.aidea_id for item in items}))))
+    judges = {judge.id: judge for judge in db.scalars(select(Judge).where(Judge.id.in_({item.judge_id for item in items})))}
+    for index, item in enumerate(items):
+        if results[index][1] is None and item.aidea_id not in aidea_ids:
+            results[index] = (None, "해당 아이디어를 찾을 수 없습니다.")
+        elif results[index][1] is None and item.judge_id not in judges:
+            results[index] = (None, "해당 심사위원을 찾을 수 없습니다.")
+
+    valid = [index for index, (_, error) in enumerate(results) if error is None]
+    if not valid:
+        db.rollback()
+        return results
+
+    try:
+        touched = sorted({items[index].aidea_id for index in valid})
+        if db.get_bind().dialect.name == "postgresql":
+            # 동시 배치끼리 교착되지 않도록 aidea 행을 id 순서로 잠금
+            db.execute(select(Aidea.id).where(Aidea.id.in_(touched)).order_by(Aidea.id).with_for_update())
+        for index in valid:
+            item = items[index]
+            evaluation = _upsert_evaluation(
+                db, item.aidea_id, item.judge_id, item.innovation_score, item.feasibility_score,
+                item.effectiveness_score, refresh_summary=False,
+            )
+            results[index] = (evaluation, None)
+            _queue_evaluation_event(db, evaluation)
+        _refresh_score_summaries(db, touched)
+        _mark_changed(db)
+        db.commit()
+        return results
+    except Exception:
+        db.rollback()
+        raise
+
+# 평가 저장/집계 UPSERT 문 (SQLite 3.35+와 PostgreSQL 공통 문법)
+# 방언별 insert().on_conflict_do_update()는 SQLAlchemy 컴파일 캐시를 쓰지 못해 호출마다 다시 컴파일되므로
+# (제출 1건당 SQL 실행보다 컴파일이 더 오래 걸림) 미리 만든 text 문을 재사용합니다.
+_UPSERT_EVALUATION = text("""
+    INSERT INTO evaluations (aidea_id, judge_id, innovation_score, feasibility_score, effectiveness_score, total_score)
+    VALUES (:aidea_id, :judge_id, :innovation_score, :feasibility_score, :effectiveness_score, :total_score)
+    ON CONFLICT (aidea_id, judge_id) DO UPDATE SET
+        innovation_score = excluded.innovation_score,
+        feasibility_score = excluded.feasibility_score,
+        effectiveness_score = excluded.effectiveness_score,
+        total_score = excluded.total_score,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING id, aidea_id, judge_id, innovation_score, feasibility_score, effectiveness_score, total_score, created_at, updated_at
+""").columns(*Evaluation.__table__.c)
+
+_REFRESH_SCORE_SUMMARY = text("""
+    INSERT INTO aidea_score_summary
+        (aidea_id, evaluation_count, innovation_sum, feasibility_sum, effectiveness_sum, total_sum, updated_at)
+    SELECT aidea_id, count(id), sum(innovation_score), sum(feasibility_score), sum(effectiveness_score), sum(total_score),
+           CURRENT_TIMESTAMP
+    FROM evaluations WHERE aidea_id IN :aidea_ids GROUP BY aidea_id
+    ON CONFLICT (aidea_id) DO UPDATE SET
+        evaluation_count = excluded.evaluation_count,
+        innovation_sum = excluded.innovation_sum,
+        feasibility_sum = excluded.feasibility_sum,
+        effectiveness_sum = excluded.effectiveness_sum,
+        total_sum = excluded.total_sum,
+        updated_at = excluded.updated_at
+""").bindparams(bindparam("aidea_ids", expanding=True))
+
+def _upsert_evaluation(db: Session, aidea_id: int, judge_id: int, innovation_score: int, feasibility_score: int,
+                       effectiveness_score: int, refresh_summary: bool = True) -> Evaluation:
+    """
+    (aidea_id, judge_id) 유니크 제약을 이용한 INSERT ... ON CONFLICT DO UPDATE ... RETURNING 한 번으로
+    평가를 저장하고, 해당 aidea의 점수 집계를 다시 계산합니다. (커밋은 호출자가 수행)
+    SELECT 후 INSERT/UPDATE하던 방식과 달리 동시 제출에도 중복 행이 생기지 않습니다.
+    refresh_summary=False면 잠금과 집계는 호출자가 맡습니다. (배치 저장)
+    """
+    if refresh_summary and db.get_bind().dialect.name == "postgresql":
+        # READ COMMITTED에서 집계가 동시 트랜잭션의 평가를 빠뜨리지 않도록 aidea 단위로 직렬화
+        db.execute(select(Aidea.id).where(Aidea.id == aidea_id).with_for_update())
+
+    params = {
+        "aidea_id": aidea_id,
+        "judge_id": judge_id,
+        "innovation_score": innovation_score,
+        "feasibility_score": feasibility_score,
+        "effectiveness_score": effectiveness_score,
+        "total_score": innovation_score + feasibility_score + effectiveness_score,
+    }
+    evaluation = db.scalars(
+        select(Evaluation).from_statement(_UPSERT_EVALUATION), params,
+        execution_options={"populate_existing": True},
+    ).one()
+    if refresh_summary:
+        _refresh_score_summary(db, aidea_id)
+    return evaluation
+
+def _queue_evaluation_event(db: Session, evaluation: Evaluation):
+    # ON CONFLICT DO UPDATE로 덮어쓴 경우에만 updated_at이 채워짐
+    event_type = "evaluation.created" if evaluation.updated_at is None else "evaluation.updated"
+    queue_event(db, event_type, id=evaluation.id, aidea_id=evaluation.aidea_id, judge_id=evaluation.judge_id)
+
+def _refresh_score_summary(db: Session, aidea_id: int):
+    """
+    한 aidea의 평가를 다시 집계하여 aidea_score_summary에 UPSERT합니다. (커밋은 호출자가 수행)
+    (aidea_id, judge_id) 인덱스로 해당 aidea의 평가만 읽으므로 평가 수와 무관하게 빠르고,
+    덮어쓰기 전 점수를 몰라도 항상 정확한 값이 됩니다.
+    """
+    _refresh_score_summaries(db, [aidea_id])
+
+def _refresh_score_summaries(db: Session, aidea_ids: List[int]):
+    """여러 aidea의 집계를 문장 하나로 다시 계산합니다. (배치 저장에서 aidea마다 실행하던 N번의 UPSERT를 대체)"""
+    db.execute(_REFRESH_SCORE_SUMMARY, {"aidea_ids": list(aidea_ids)})
+
+# 점수 집계 / 순위
+def get_rankings(db: Session, tiebreak: Optional[List[str]] = None, limit: Optional[int] = None):
+    """
+    aidea_score_summary에서 평균 총점 순위를 계산합니다.
+    평균 총점이 같으면 tiebreak 순서(기본: 업무 효과성 → 기술 실현 가능성 → 혁신성)의 평균으로 비교하며,
+    모든 기준이 같으면 같은 순위를 부여합니다. (1, 1, 3 ...)
+    """
+    tiebreak = DEFAULT_TIEBREAK if tiebreak is None else tiebreak
+    unknown = [c for c in tiebreak if c not in RANKING_CRITERIA or c == "total"]
+    if unknown:
+        raise ValueError(f"지원하지 않는 동점 처리 기준입니다: {', '.join(unknown)} (가능: innovation, feasibility, effectiveness)")
+    keys = ["total"] + list(dict.fromkeys(tiebreak))
+
+    count = AideaScoreSummary.evaluation_count
+    query = (
+        db.query(AideaScoreSummary, Aidea.project, Account.id, Account.team_name, Account.department)
+        .join(Aidea, AideaScoreSummary.aidea_id == Aidea.id)
+        .join(Account, Aidea.account_id == Account.id)
+        .filter(count > 0)
+        .order_by(*[(RANKING_CRITERIA[k] * 1.0 / count).desc() for k in keys], AideaScoreSummary.aidea_id)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+
+    rankings = []
+    previous_key = None
+    for position, (summary, project, account_id, team_name, department) in enumerate(query, 1):
+        averages = {k: Fraction(getattr(summary, f"{k}_sum"), summary.evaluation_count) for k in RANKING_CRITERIA}
+        # 부동소수 오차 없이 동점을 판단하기 위해 분수로 비교
+        rank_key = tuple(averages[k] for k in keys)
+        if rank_key == previous_key:
+            rank = rankings[-1]["rank"]
+            rankings[-1]["tied"] = True
+        else:
+            rank = position
+        rankings.append({
+            "rank": rank,
+            "tied": rank_key == previous_key,
+            "aidea_id": summary.aidea_id,
+            "project": project,
+            "account_id": account_id,
+            "team_name": team_name,
+            "department": department,
+            "evaluation_count": summary.evaluation_count,
+            "total_sum": summary.total_sum,
+            **{f"{k}_avg": round(float(v), 4) for k, v in averages.items()},
+        })
+        previous_key = rank_key
+    return rankings
+
+def compute_score_summaries(db: Session) -> dict:
+    """evaluations 전체를 다시 집계합니다. {aidea_id: (평가 수, 혁신성, 실현 가능성, 효과성, 총점 합계)}"""
+    rows = db.query(
+        Evaluation.aidea_id,
+        func.count(Evaluation.id),
+        func.sum(Evaluation.innovation_score),
+        func.sum(Evaluation.feasibility_score),
+        func.sum(Evaluation.effectiveness_score),
+        func.sum(Evaluation.total_score),
+    ).group_by(Evaluation.aidea_id).all()
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+def verify_score_summaries(db: Session) -> List[dict]:
+    """
+    aidea_score_summary가 전체 재집계 결과와 일치하는지 확인합니다.
+    불일치 항목 목록을 반환합니다. (비어 있으면 일치)
+    """
+    expected = compute_score_summaries(db)
+    actual = {
+        s.aidea_id: (s.evaluation_count, s.innovation_sum, s.feasibility_sum, s.effectiveness_sum, s.total_sum)
+        for s in db.query(AideaScoreSummary).all()
+    }
+    empty = (0, 0, 0, 0, 0)
+    mismatches = []
+    for aidea_id in sorted(set(expected) | set(actual)):
+        want = expected.get(aidea_id, empty)
+        got = actual.get(aidea_id, empty)
+        if want != got:
+            mismatches.append({"aidea_id": aidea_id, "expected": want, "actual": got})
+    return mismatches
+
+def rebuild_score_summaries(db: Session) -> int:
+    """aidea_score_summary를 전체 재집계 결과로 다시 만듭니다. 생성된 행 수를 반환합니다."""
+    try:
+        expected = compute_score_summaries(db)
+        db.query(AideaScoreSummary).delete()
+        db.add_all([
+            AideaScoreSummary(
+                aidea_id=aidea_id,
+                evaluation_count=count,
+                innovation_sum=innovation,
+                feasibility_sum=feasibility,
+                effectiveness_sum=effectiveness,
+                total_sum=total,
+            )
+            for aidea_id, (count, innovation, feasibility, effectiveness, total) in expected.items()
+        ])
+        _mark_changed(db)
+        db.commit()
+        return len(expected)
+    except Exception:
+        db.rollback()
+        raise
 
 def get_evaluations_by_aidea(db: Session, aidea_id: int):
     """특정 aidea의 모든 평가를 가져옵니다."""
-    return db.query(Evaluation).filter(Evaluation.aidea_id == aidea_id).all()
+    return db.query(Evaluation).options(joinedload(Evaluation.judge)).filter(Evaluation.aidea_id == aidea_id).all()
 
 def get_evaluations_by_account(db: Session, account_id: int):
     """특정 계정의 모든 평가를 가져옵니다. (aidea를 통해)"""
-    return db.query(Evaluation).join(Aidea).filter(Aidea.account_id == account_id).all()
+    return (
+        db.query(Evaluation)
+        .options(joinedload(Evaluation.judge))
+        .join(Aidea)
+        .filter(Aidea.account_id == account_id)
+        .all()
+    )
 
 def get_evaluation_by_judge_and_aidea(db: Session, judge_id: int, aidea_id: int):
     """특정 심사위원이 특정 aidea에 대해 한 평가를 가져옵니다."""
-    return db.query(Evaluation).filter(
+    return db.query(Evaluation).options(joinedload(Evaluation.judge)).filter(
         Evaluation.judge_id == judge_id,
         Evaluation.aidea_id == aidea_id
     ).first()
 
+def get_evaluated_aidea_ids(db: Session, judge_id: int) -> set:
+    """특정 심사위원이 평가한 aidea id 집합을 한 번의 쿼리로 가져옵니다."""
+    rows = db.query(Evaluation.aidea_id).filter(Evaluation.judge_id == judge_id).all()
+    return {aidea_id for (aidea_id,) in rows}
+
 def get_evaluation_by_judge_and_account(db: Session, judge_id: int, account_id: int):
     """특정 심사위원이 특정 계정에 대해 한 평가를 가져옵니다. (aidea를 통해)"""
-    return db.query(Evaluation).join(Aidea).filter(
+    return db.query(Evaluation).options(joinedload(Evaluation.judge)).join(Aidea).filter(
         Evaluation.judge_id == judge_id,
         Aidea.account_id == account_id
     ).first()
 
 def get_all_evaluations(db: Session):
-    """모든 평가를 가져옵니다."""
-    return db.query(Evaluation).all()
+    """모든 평가를 심사위원 정보와 함께 가져옵니다."""
+    return db.query(Evaluation).options(joinedload(Evaluation.judge)).all()
 
-if __name__ == "__main__":
-    add_benefit_column()
+def list_evaluations(
+    db: Session,
+    judge_id: Optional[int] = None,
+    aidea_id: Optional[int] = None,
+    min_score: Optional[int] = None,
+    max_score: Optional[int] = None,
+    sort: str = "id",
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+):
+    """
+    평가 목록을 필터(심사위원, aidea, 총점 범위)/정렬/커서 페이지네이션하여 조회합니다.
+
+    Returns:
+        (평가 목록, 전체 개수, 다음 페이지 커서)
+    """
+    sort_column, descending = parse_sort(sort, EVALUATION_SORT_COLUMNS)
+    query = db.query(Evaluation)
+    if judge_id is not None:
+        query = query.filter(Evaluation.judge_id == judge_id)
+    if aidea_id is not None:
+        query = query.filter(Evaluation.aidea_id == aidea_id)
+    if min_score is not None:
+        query = query.filter(Evaluation.total_score >= min_score)
+    if max_score is not None:
+        query = query.filter(Evaluation.total_score <= max_score)
+
+    total = _count(query, Evaluation.id)
+    query = query.options(joinedload(Evaluation.judge))
+    evaluations, next_cursor = paginate(query, sort_column, Evaluation.id, descending, cursor, limit)
+    return evaluations, total, next_cursor
+
+# 메일 발송 대기열 (실제 발송은 mailer.Mailer)
+def enqueue_email(db: Session, message_id: str, recipients: List[str], subject: str, contents: str):
+    """
+    메일을 outbox에 넣습니다. 같은 message_id가 이미 있으면 새로 넣지 않고 기존 메일을 돌려줍니다.
+
+    Returns:
+        (EmailOutbox, 새로 넣었는지 여부)
+    """
+    statement = _insert(db, EmailOutbox).values(
+        message_id=message_id, recipients=recipients, subject=subject, contents=contents,
+        status="pending", attempts=0, next_attempt_at=datetime.utcnow(),
+    ).on_conflict_do_nothing(index_elements=["message_id"])
+    created = db.execute(statement).rowcount == 1
+    email = get_email_by_message_id(db, message_id)
+    db.commit()
+    return email, created
+
+def get_email_by_message_id(db: Session, message_id: str):
+    return db.query(EmailOutbox).filter(EmailOutbox.message_id == message_id).first()
+
+# 단체 메일 대상 (계정 기준, 계정 본인과 팀원 모두에게 발송)
+MAIL_JOB_AUDIENCES = {
+    "all": None,
+    "submitted": exists().where(Aidea.account_id == Account.id),
+    "not_submitted": ~exists().where(Aidea.account_id == Account.id),
+    "ranked": exists().where(
+        Aidea.account_id == Account.id,
+        AideaScoreSummary.aidea_id == Aidea.id,
+        AideaScoreSummary.evaluation_count > 0,
+    ),
+}
+# 단체 메일 템플릿에서 쓸 수 있는 항목 ({name} 형식, 심사 결과가 없으면 rank 등은 빈 값)
+MAIL_TEMPLATE_FIELDS = (
+    "knox_id", "name", "team_name", "department", "project", "members",
+    "rank", "total_avg", "evaluation_count",
+)
+_RANKING_FIELDS = {"rank", "total_avg", "evaluation_count"}
+
+def _template_fields(template: str) -> set:
+    return {field for _, field, _, _ in Formatter().parse(template) if field is not None}
+
+def template_error(template: str) -> Optional[str]:
+    """단체 메일 템플릿의 오류 메시지를 반환합니다. (문제가 없으면 None)"""
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError as e:
+        return f"템플릿 형식이 올바르지 않습니다: {e}"
+    for _, field, format_spec, conversion in parsed:
+        if field is None:
+            continue
+        if field not in MAIL_TEMPLATE_FIELDS:
+            return f"지원하지 않는 템플릿 항목입니다: {{{field}}} (가능: {', '.join(MAIL_TEMPLATE_FIELDS)})"
+        if format_spec or conversion:
+            return f"템플릿 항목에는 서식을 지정할 수 없습니다: {{{field}}}"
+    return None
+
+def _audience_query(db: Session, audience: str):
+    if audience not in MAIL_JOB_AUDIENCES:
+        raise ValueError(f"지원하지 않는 메일 대상입니다: {audience} (가능: {', '.join(MAIL_JOB_AUDIENCES)})")
+    query = db.query(Account)
+    condition = MAIL_JOB_AUDIENCES[audience]
+    return query if condition is None else query.filter(condition)
+
+def mail_rankings(db: Session, subject: str, contents: str) -> Optional[dict]:
+    """
+    템플릿이 순위 항목을 쓰면 계정별 순위 {"계정 id": {rank, total_avg, evaluation_count}}를 반환합니다. (안 쓰면 None)
+    단체 메일 작업은 만들 때 한 번 계산해 저장하므로(MailJob.rankings), batch 사이에 평가가 들어와도 순위가 바뀌지 않습니다.
+    """
+    if not _RANKING_FIELDS & (_template_fields(subject) | _template_fields(contents)):
+        return None
+    rankings = {}
+    for ranking in get_rankings(db):
+        rankings.setdefault(str(ranking["account_id"]), {field: ranking[field] for field in _RANKING_FIELDS})
+    return rankings
+
+def render_mail_batch(db: Session, accounts: List[Account], subject: str, contents: str, domain: str,
+                      rankings: Optional[dict] = None) -> List[dict]:
+    """
+    계정 목록에 템플릿을 채운 메일 목록을 만듭니다. (계정마다 {account_id, recipients, subject, contents})
+    rankings(mail_rankings 결과)가 없고 템플릿이 순위 항목을 쓰면 지금 순위를 계산합니다.
+    """
+    if rankings is None:
+        rankings = mail_rankings(db, subject, contents) or {}
+
+    messages = []
+    for account in accounts:
+        knox_ids = [account.knox_id] + [member.knox_id for member in account.team_members]
+        ranking = rankings.get(str(account.id), {})
+        fields = {
+            "knox_id": account.knox_id,
+            "name": account.name or "",
+            "team_name": account.team_name or "",
+            "department": account.department or "",
+            "project": account.aideas[0].project if account.aideas else "",
+            "members": ", ".join(member.name for member in account.team_members),
+            "rank": ranking.get("rank", ""),
+            "total_avg": ranking.get("total_avg", ""),
+            "evaluation_count": ranking.get("evaluation_count", ""),
+        }
+        messages.append({
+            "account_id": account.id,
+            "recipients": list(dict.fromkeys(f"{knox_id.strip()}@{domain}" for knox_id in knox_ids if knox_id.strip())),
+            "subject": subject.format_map(fields),
+            "contents": contents.format_map(fields),
+        })
+    return messages
+
+def _mail_job_accounts(db: Session, audience: str, after_id: int, limit: int) -> List[Account]:
+    return (
+        _audience_query(db, audience)
+        .filter(Account.id > after_id)
+        .options(
+            load_only(Account.id, Account.knox_id, Account.name, Account.team_name, Account.department),
+            selectinload(Account.team_members).load_only(TeamMember.name, TeamMember.knox_id),
+            selectinload(Account.aideas).load_only(Aidea.project),
+        )
+        .order_by(Account.id)
+        .limit(limit)
+        .all()
+    )
+
+def preview_mail_job(db: Session, audience: str, subject: str, contents: str, domain: str) -> dict:
+    """단체 메일 대상 수와 첫 대상에게 갈 메일을 반환합니다. (dry run)"""
+    count = _count(_audience_query(db, audience), Account.id)
+    first = _mail_job_accounts(db, audience, 0, 1)
+    sample = render_mail_batch(db, first, subject, contents, domain)[0] if first else None
+    if sample:
+        sample.pop("account_id")
+    return {"audience": audience, "recipient_count": count, "sample": sample}
+
+def create_mail_job(db: Session, name: str, audience: str, subject: str, contents: str) -> MailJob:
+    """단체 메일 작업을 만듭니다. 대상별 메일은 mailer가 batch 단위로 outbox에 넣습니다. (expand_mail_job)"""
+    _audience_query(db, audience)  # 대상 검증
+    job = MailJob(name=name, audience=audience, subject_template=subject, contents_template=contents,
+                  status="expanding", last_account_id=0, total=0, rankings=mail_rankings(db, subject, contents))
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+def expand_mail_job(db: Session, batch_size: int, domain: str) -> bool:
+    """
+    outbox 생성 중인 가장 오래된 단체 메일 작업에서 다음 batch_size개 계정의 메일을 outbox에 넣습니다.
+    메일과 진행 위치(last_account_id)를 한 트랜잭션으로 커밋하므로 중간에 프로세스가 죽어도 이어서 진행하며,
+    message_id가 "job-{작업 id}-{계정 id}"라 같은 계정에 두 번 넣지 않습니다.
+    메일을 넣기 전에 작업 행을 status='expanding' 조건으로 먼저 UPDATE해 쓰기 잠금을 잡으므로,
+    그 사이 취소된 작업에는 메일을 넣지 않고, 이후의 취소는 이 트랜잭션이 끝난 뒤 넣은 메일까지 취소합니다.
+    (SQLite에서는 with_for_update가 무시되므로 이 UPDATE가 취소와의 경합을 막음)
+
+    Returns:
+        아직 outbox 생성이 남은 작업이 있는지 여부
+    """
+    query = select(MailJob).where(MailJob.status == "expanding").order_by(MailJob.id).limit(1)
+    if db.get_bind().dialect.name == "postgresql":
+        # 여러 워커가 같은 작업을 동시에 진행하지 않도록 (다른 워커는 다음 작업으로)
+        query = query.with_for_update(skip_locked=True)
+    job = db.execute(query).scalar_one_or_none()
+    if job is None:
+        db.rollback()
+        return False
+
+    accounts = _mail_job_accounts(db, job.audience, job.last_account_id, batch_size)
+    rankings = job.rankings
+    if rankings is None:
+        # 순위 스냅샷 없이 만들어진 작업(0007 이전)은 첫 batch에서 계산해 저장
+        rankings = mail_rankings(db, job.subject_template, job.contents_template)
+    progress = {"last_account_id": accounts[-1].id if accounts else job.last_account_id}
+    if job.rankings is None and rankings is not None:
+        progress["rankings"] = rankings
+    if len(accounts) < batch_size:
+        progress.update(status="queued", expanded_at=datetime.utcnow())
+    claimed = db.execute(
+        update(MailJob)
+        .where(MailJob.id == job.id, MailJob.status == "expanding")
+        .values(**progress)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not claimed:
+        # 조회 후 취소됨 (다른 작업이 남았는지 다시 확인하도록 True)
+        db.rollback()
+        return True
+
+    if accounts:
+        now = datetime.utcnow()
+        messages = render_mail_batch(db, accounts, job.subject_template, job.contents_template, domain, rankings)
+        rows = [
+            {
+                "message_id": f"job-{job.id}-{message['account_id']}", "recipients": message["recipients"],
+                "subject": message["subject"], "contents": message["contents"],
+                "status": "pending", "attempts": 0, "next_attempt_at": now, "job_id": job.id,
+            }
+            for message in messages if message["recipients"]
+        ]
+        if rows:
+            inserted = db.execute(
+                _insert(db, EmailOutbox).values(rows).on_conflict_do_nothing(index_elements=["message_id"])
+            ).rowcount
+            db.execute(
+                update(MailJob).where(MailJob.id == job.id).values(total=MailJob.total + inserted)
+                .execution_options(synchronize_session=False)
+            )
+    db.commit()
+    return True
+
+def cancel_mail_job(db: Session, job_id: int) -> Optional[MailJob]:
+    """단체 메일 작업을 취소합니다. 아직 보내지 않은(pending) 메일은 cancelled로 바뀌고, 발송 중인 메일은 그대로 끝납니다."""
+    job = db.query(MailJob).filter(MailJob.id == job_id).with_for_update().first()
+    if job is None:
+        return None
+    job.status = "cancelled"
+    db.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.job_id == job_id, EmailOutbox.status == "pending")
+        .values(status="cancelled")
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return job
+
+def get_mail_job(db: Session, job_id: int) -> Optional[MailJob]:
+    return db.query(MailJob).filter(MailJob.id == job_id).first()
+
+def list_mail_jobs(db: Session) -> List[MailJob]:
+    return db.query(MailJob).order_by(MailJob.id.desc()).all()
+
+def mail_job_progress(db: Session, job_ids: List[int]) -> dict:
+    """작업별 메일 상태 개수를 한 번에 집계합니다. {job_id: {status: 개수}}"""
+    progress = {job_id: {} for job_id in job_ids}
+    if job_ids:
+        rows = (
+            db.query(EmailOutbox.job_id, EmailOutbox.status, func.count(EmailOutbox.id))
+            .filter(EmailOutbox.job_id.in_(job_ids))
+            .group_by(EmailOutbox.job_id, EmailOutbox.status)
+        )
+        for job_id, status, count in rows:
+            progress[job_id][status] = count
+    return progress
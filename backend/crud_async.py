@@ -0,0 +1,62 @@
+"""
+crud 함수들의 awaitable 버전
+
+각 함수는 AsyncSession.run_sync로 동기 crud 함수를 그대로 실행합니다.
+SQL I/O와 SQLite busy 대기는 aiosqlite 스레드에서 일어나므로 이벤트 루프가 막히지 않습니다.
+반환된 ORM 객체를 세션 밖에서 직렬화할 때는 필요한 관계가 미리 로드되어 있어야 합니다.
+(lazy load는 비동기 세션에서 MissingGreenlet 오류를 일으킴)
+"""
+import functools
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import crud
+
+def _awaitable(func):
+    """동기 crud 함수를 AsyncSession을 받는 코루틴 함수로 감쌉니다."""
+    @functools.wraps(func)
+    async def wrapper(db: AsyncSession, *args, **kwargs):
+        return await db.run_sync(func, *args, **kwargs)
+    return wrapper
+
+# Account
+get_account_by_knox_id = _awaitable(crud.get_account_by_knox_id)
+get_account_by_id = _awaitable(crud.get_account_by_id)
+create_or_update_account = _awaitable(crud.create_or_update_account)
+update_account_registration = _awaitable(crud.update_account_registration)
+
+# Aidea
+create_aidea = _awaitable(crud.create_aidea)
+get_aidea_by_id = _awaitable(crud.get_aidea_by_id)
+get_aideas_by_account = _awaitable(crud.get_aideas_by_account)
+update_aidea = _awaitable(crud.update_aidea)
+delete_aidea = _awaitable(crud.delete_aidea)
+get_all_accounts = _awaitable(crud.get_all_accounts)
+get_all_aideas = _awaitable(crud.get_all_aideas)
+get_project_listing = _awaitable(crud.get_project_listing)
+list_accounts = _awaitable(crud.list_accounts)
+
+# Judge
+get_judge_by_judge_id = _awaitable(crud.get_judge_by_judge_id)
+get_judge_by_id = _awaitable(crud.get_judge_by_id)
+create_judge = _awaitable(crud.create_judge)
+get_all_judges = _awaitable(crud.get_all_judges)
+existing_judge_ids = _awaitable(crud.existing_judge_ids)
+list_judges = _awaitable(crud.list_judges)
+
+# Evaluation
+create_evaluation = _awaitable(crud.create_evaluation)
+get_evaluations_by_aidea = _awaitable(crud.get_evaluations_by_aidea)
+get_evaluations_by_account = _awaitable(crud.get_evaluations_by_account)
+get_evaluation_by_judge_and_aidea = _awaitable(crud.get_evaluation_by_judge_and_aidea)
+get_evaluated_aidea_ids = _awaitable(crud.get_evaluated_aidea_ids)
+get_evaluation_by_judge_and_account = _awaitable(crud.get_evaluation_by_judge_and_account)
+get_all_evaluations = _awaitable(crud.get_all_evaluations)
+list_evaluations = _awaitable(crud.list_evaluations)
+get_rankings = _awaitable(crud.get_rankings)
+
+# Email
+get_email_by_message_id = _awaitable(crud.get_email_by_message_id)
+get_mail_job = _awaitable(crud.get_mail_job)
+list_mail_jobs = _awaitable(crud.list_mail_jobs)
+mail_job_progress = _awaitable(crud.mail_job_progress)
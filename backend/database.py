@@ -1,46 +1,212 @@
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 import os
-from typing import Generator
+import threading
+import time
+from typing import Generator, AsyncGenerator
 from dotenv import load_dotenv
 
 load_dotenv()
 
+import metrics
+import profiler
+
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development").lower()
 if ENVIRONMENT not in ["development", "production"]:
     raise ValueError(f"Invalid ENVIRONMENT value: {ENVIRONMENT}. Must be 'development' or 'production'")
 
-default_path = "/app/data/ssai_aidea_prod.db" if ENVIRONMENT == "production" else "./ssai_aidea_dev.db"
-DB_PATH = os.path.abspath(os.getenv("DATABASE_PATH", default_path))
+def async_url(url: str) -> str:
+    """동기 DB URL을 같은 DB의 비동기 드라이버 URL로 바꿉니다. (sqlite → aiosqlite, postgresql → asyncpg)"""
+    parsed = make_url(url)
+    driver = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}[parsed.get_backend_name()]
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
 
-dirpath = os.path.dirname(DB_PATH)
-if dirpath:
-    os.makedirs(dirpath, exist_ok=True)
+# DATABASE_URL이 있으면 그 DB(예: postgresql://user:pw@host:5432/aidea)를, 없으면 DATABASE_PATH의 SQLite 파일을 사용
+DATABASE_URL = os.getenv("DATABASE_URL")
+if DATABASE_URL:
+    SQLALCHEMY_DATABASE_URL = DATABASE_URL
+else:
+    default_path = "/app/data/ssai_aidea_prod.db" if ENVIRONMENT == "production" else "./ssai_aidea_dev.db"
+    DB_PATH = os.path.abspath(os.getenv("DATABASE_PATH", default_path))
 
+    dirpath = os.path.dirname(DB_PATH)
+    if dirpath:
+        os.makedirs(dirpath, exist_ok=True)
 
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
+    SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False, "timeout": 30},
-)
+# 조회 전용 엔진이 접속할 DB (PostgreSQL 읽기 복제본 등, 없으면 같은 DB)
+READ_DATABASE_URL = os.getenv("DATABASE_READ_URL") or SQLALCHEMY_DATABASE_URL
+# 비동기 엔진 URL (쓰기 가능한 엔진은 기본 DB, 조회 전용 엔진은 조회용 DB를 따름)
+ASYNC_SQLALCHEMY_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or async_url(SQLALCHEMY_DATABASE_URL)
+ASYNC_READ_DATABASE_URL = os.getenv("ASYNC_DATABASE_READ_URL") or async_url(READ_DATABASE_URL)
+IS_SQLITE = make_url(SQLALCHEMY_DATABASE_URL).get_backend_name() == "sqlite"
 
-if engine.url.get_backend_name() == "sqlite":
-    @event.listens_for(engine, "connect")
-    def _set_sqlite_pragma(dbapi_connection, _):
-        """SQLite 연결 시 PRAGMA 설정을 적용합니다."""
+class _TimedPoolMixin:
+    """커넥션 체크아웃 대기 시간과 대기 중인 요청 수를 집계하는 풀 (pool_stats에서 사용)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self._wait = {"checkouts": 0, "waiting": 0, "timeouts": 0, "wait_total": 0.0, "wait_max": 0.0}
+
+    def _do_get(self):
+        with self._wait_lock:
+            self._wait["waiting"] += 1
+        start = time.perf_counter()
         try:
-            cur = dbapi_connection.cursor()
-            cur.execute("PRAGMA foreign_keys=ON")     # FK 제약조건 강제
-            cur.execute("PRAGMA journal_mode=WAL")    # WAL 모드로 동시성/안전성 개선
-            cur.execute("PRAGMA synchronous=NORMAL")  # 내구성↔성능 균형(기본 FULL보다 빠름)
-            cur.close()
-        except Exception as e:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._wait_lock:
+                self._wait["timeouts"] += 1
             raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._wait_lock:
+                self._wait["waiting"] -= 1
+                self._wait["checkouts"] += 1
+                self._wait["wait_total"] += elapsed
+                self._wait["wait_max"] = max(self._wait["wait_max"], elapsed)
+
+    def wait_stats(self) -> dict:
+        with self._wait_lock:
+            wait = dict(self._wait)
+        checkouts = wait["checkouts"]
+        return {
+            "checkouts": checkouts,
+            "waiting": wait["waiting"],
+            "timeouts": wait["timeouts"],
+            "wait_avg_ms": round(wait["wait_total"] / checkouts * 1000, 3) if checkouts else 0.0,
+            "wait_max_ms": round(wait["wait_max"] * 1000, 3),
+        }
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+def _pool_options(is_sqlite: bool) -> dict:
+    """
+    환경 변수로 조정하는 커넥션 풀 설정
+    PostgreSQL은 끊긴 연결 감지(pre-ping)와 주기적 재연결(recycle)을 켜고, SQLite는 크기만 적용합니다.
+    """
+    options = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5" if is_sqlite else "10")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10" if is_sqlite else "20")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    }
+    if not is_sqlite:
+        options["pool_pre_ping"] = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+        options["pool_recycle"] = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    return options
+
+def _create_engine(url: str, read_only: bool = False):
+    is_sqlite = make_url(url).get_backend_name() == "sqlite"
+    if is_sqlite:
+        connect_args = {"check_same_thread": False, "timeout": 30}
+    else:
+        connect_args = {"connect_timeout": int(os.getenv("DB_CONNECT_TIMEOUT", "10"))}
+        if read_only:
+            # SQLite의 query_only에 해당: 이 연결의 모든 트랜잭션을 읽기 전용으로 시작
+            connect_args["options"] = "-c default_transaction_read_only=on"
+    return create_engine(url, connect_args=connect_args, poolclass=TimedQueuePool, **_pool_options(is_sqlite))
+
+def _create_async_engine(url: str, read_only: bool = False):
+    is_sqlite = make_url(url).get_backend_name() == "sqlite"
+    if is_sqlite:
+        connect_args = {"timeout": 30}
+    else:
+        connect_args = {"timeout": int(os.getenv("DB_CONNECT_TIMEOUT", "10"))}
+        if read_only:
+            connect_args["server_settings"] = {"default_transaction_read_only": "on"}
+    return create_async_engine(url, connect_args=connect_args, poolclass=TimedAsyncQueuePool, **_pool_options(is_sqlite))
+
+engine = _create_engine(SQLALCHEMY_DATABASE_URL)
+
+# 조회 전용 엔진: GET 엔드포인트가 쓰기 연결과 풀을 나눠 쓰도록 분리 (WAL에서 읽기는 쓰기 트랜잭션을 기다리지 않음)
+read_engine = _create_engine(READ_DATABASE_URL, read_only=True)
+
+# 비동기 엔진: aiosqlite가 별도 스레드에서 I/O와 busy 대기를 수행하므로 이벤트 루프가 막히지 않음
+# async_engine은 crud_async의 쓰기 함수도 사용하는 일반 엔진(get_async_db),
+# async_read_engine은 GET 엔드포인트용 조회 전용 엔진(get_async_read_db, SQLite query_only / PostgreSQL read only)
+async_engine = _create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL)
+async_read_engine = _create_async_engine(ASYNC_READ_DATABASE_URL, read_only=True)
+
+# 조회 연결별 페이지 캐시(KiB)와 메모리 맵 크기(byte)
+READ_CACHE_KB = int(os.getenv("SQLITE_READ_CACHE_KB", "16384"))
+READ_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+
+def _set_sqlite_pragma(dbapi_connection, _):
+    """SQLite 연결 시 PRAGMA 설정을 적용합니다."""
+    try:
+        cur = dbapi_connection.cursor()
+        cur.execute("PRAGMA foreign_keys=ON")     # FK 제약조건 강제
+        cur.execute("PRAGMA journal_mode=WAL")    # WAL 모드로 동시성/안전성 개선
+        cur.execute("PRAGMA synchronous=NORMAL")  # 내구성↔성능 균형(기본 FULL보다 빠름)
+        cur.close()
+    except Exception as e:
+        raise
+
+def _set_sqlite_read_pragma(dbapi_connection, _):
+    """
+    조회 전용 연결의 PRAGMA를 적용합니다.
+    mode=ro로 열면 -shm 파일을 만들 수 없어 쓰기 연결이 없는 순간 WAL DB를 열지 못하므로,
+    일반 연결에 query_only를 걸어 쓰기를 막습니다.
+    """
+    cur = dbapi_connection.cursor()
+    cur.execute("PRAGMA query_only=ON")                      # 실수로 쓰기 시도 시 오류
+    cur.execute(f"PRAGMA cache_size=-{READ_CACHE_KB}")       # 연결별 페이지 캐시 확대
+    cur.execute(f"PRAGMA mmap_size={READ_MMAP_SIZE}")        # 메모리 맵 읽기로 read() 시스템 콜 감소
+    cur.execute("PRAGMA temp_store=MEMORY")                  # 정렬/그룹용 임시 테이블을 메모리에
+    cur.close()
+
+# PRAGMA는 SQLite 엔진에만 적용
+if engine.url.get_backend_name() == "sqlite":
+    event.listen(engine, "connect", _set_sqlite_pragma)
+if async_engine.url.get_backend_name() == "sqlite":
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragma)
+for _engine in (read_engine, async_read_engine.sync_engine):
+    if _engine.url.get_backend_name() == "sqlite":
+        event.listen(_engine, "connect", _set_sqlite_read_pragma)
+
+# 쿼리 수/시간, SQLite busy 오류 메트릭 (/api/metrics)
+if metrics.METRICS_ENABLED:
+    for _name, _engine in (("write", engine), ("read", read_engine), ("async", async_engine.sync_engine),
+                          ("async_read", async_read_engine.sync_engine)):
+        metrics.instrument_engine(_engine, _name)
+
+# 요청별 쿼리 지문/N+1 감지와 느린 쿼리 로그 (개발/진단용, 기본 꺼짐)
+if profiler.QUERY_PROFILER_ENABLED:
+    profiler.configure_slow_query_log()
+    for _name, _engine in (("write", engine), ("read", read_engine), ("async", async_engine.sync_engine),
+                          ("async_read", async_read_engine.sync_engine)):
+        profiler.attach_profiler(_engine, _name)
+
+def pool_stats() -> dict:
+    """엔진별 커넥션 풀 현황 (크기, 사용 중/유휴/오버플로 연결 수, 체크아웃 대기 시간(새 연결 생성 포함))"""
+    stats = {}
+    for name, pool in (("write", engine.pool), ("read", read_engine.pool), ("async", async_engine.sync_engine.pool),
+                       ("async_read", async_read_engine.sync_engine.pool)):
+        stats[name] = {
+            "size": pool.size(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            **(pool.wait_stats() if isinstance(pool, _TimedPoolMixin) else {}),
+        }
+    return stats
 
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
+ReadSessionLocal = sessionmaker(bind=read_engine, autocommit=False, autoflush=False, expire_on_commit=False)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(bind=async_read_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 def get_db() -> Generator[Session, None, None]:
@@ -52,4 +218,33 @@ def get_db() -> Generator[Session, None, None]:
         db.rollback()
         raise
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    조회 전용 데이터베이스 세션을 생성합니다. (GET 엔드포인트용, 쓰기는 get_db 사용)
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    비동기 데이터베이스 세션을 생성하고 관리합니다.
+    crud_async의 awaitable 함수들과 함께 사용합니다.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    조회 전용 비동기 데이터베이스 세션을 생성합니다. (GET 엔드포인트용, 쓰기는 get_async_db 사용)
+    """
+    async with AsyncReadSessionLocal() as db:
+        yield db
@@ -0,0 +1,238 @@
+"""
+실시간 변경 알림 허브 (Server-Sent Events, GET /api/events)
+
+심사/관리 화면이 /api/projects, /api/admin/evaluations를 주기적으로 다시 불러오는 대신
+변경 이벤트(평가 저장, Aidea 제출/수정)를 받아 필요한 항목만 갱신할 수 있도록 합니다.
+
+- crud의 쓰기 함수가 세션에 이벤트를 쌓아 두고(queue_event), 트랜잭션이 실제로 커밋된 뒤에만 발행합니다.
+  (롤백되거나 쓰기 대기열에서 실패한 작업의 이벤트는 버림)
+- 이벤트는 발행할 때 한 번만 SSE 프레임으로 직렬화해 모든 구독자가 같은 bytes를 공유합니다.
+- 구독자마다 크기가 정해진 버퍼를 두고, 버퍼가 가득 찬(느린) 구독자는 연결을 끊습니다.
+  EventSource는 자동으로 다시 연결하며 Last-Event-ID 이후 이벤트를 최근 기록에서 이어 받고,
+  기록 범위를 벗어났으면 reset 이벤트를 받아 목록을 한 번 다시 불러옵니다.
+- 유휴 연결은 EVENTS_HEARTBEAT초마다 주석 한 줄만 보내므로 연결 수백 개도 거의 비용이 없습니다.
+이벤트에는 id와 종류만 담기므로(점수 등 본문 없음) 인증 없이 구독할 수 있습니다.
+"""
+import asyncio
+import os
+import threading
+from collections import deque
+from typing import Iterable, List, Optional
+
+import orjson
+from sqlalchemy.orm import Session
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+# 구독자 하나가 쌓아 둘 수 있는 이벤트 수 (넘으면 느린 구독자로 보고 연결을 끊음)
+EVENTS_CLIENT_BUFFER = _env_int("EVENTS_CLIENT_BUFFER", 256)
+# 동시에 구독할 수 있는 연결 수
+EVENTS_MAX_CLIENTS = _env_int("EVENTS_MAX_CLIENTS", 1000)
+# 재연결 시 이어 보내기 위해 보관하는 최근 이벤트 수
+EVENTS_HISTORY = _env_int("EVENTS_HISTORY", 1024)
+# 유휴 연결 유지용 주석 전송 간격(초)
+EVENTS_HEARTBEAT = float(os.getenv("EVENTS_HEARTBEAT", "15"))
+
+HEARTBEAT_FRAME = b": ping\n\n"
+RESET_FRAME = b"event: reset\ndata: {}\n\n"
+
+class EventHubBusyError(Exception):
+    """구독자 수가 EVENTS_MAX_CLIENTS에 도달했을 때 발생합니다."""
+
+class Subscription:
+    """구독자 하나의 이벤트 버퍼"""
+
+    def __init__(self, hub: "EventHub", prefixes: Optional[tuple], maxsize: int):
+        self.hub = hub
+        self.prefixes = prefixes
+        self.queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(maxsize=maxsize)
+        self.dropped = False
+        # 구독 시점의 마지막 이벤트 id (이후 이벤트만 이 구독자에게 전달됨)
+        self.start_id = 0
+
+    def wants(self, event_type: str) -> bool:
+        return self.prefixes is None or event_type.startswith(self.prefixes)
+
+    def offer(self, frame: bytes) -> None:
+        if self.dropped:
+            return
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            # 느린 구독자: 밀린 이벤트를 버리고 연결을 끊음 (재연결 후 Last-Event-ID로 이어 받음)
+            self.hub._counters["dropped_clients"] += 1
+            self.end()
+
+    def end(self) -> None:
+        """남은 이벤트를 버리고 스트림 종료 신호를 넣습니다."""
+        self.dropped = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def frames(self, heartbeat: float = EVENTS_HEARTBEAT):
+        """
+        SSE로 보낼 bytes를 돌려줍니다. 유휴 시간에는 heartbeat 주석을 보냅니다.
+        몰려 들어온 이벤트는 한 번 깨어날 때 이미 쌓인 것까지 묶어서 보냅니다. (구독자당 wakeup/send 횟수 감소)
+        """
+        while True:
+            try:
+                frame = await asyncio.wait_for(self.queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield HEARTBEAT_FRAME
+                continue
+            frames = []
+            while frame is not None:
+                frames.append(frame)
+                if self.queue.empty():
+                    break
+                frame = self.queue.get_nowait()
+            if frames:
+                yield b"".join(frames)
+            if frame is None:
+                return
+
+class EventHub:
+    """
+    프로세스 안의 이벤트 브로드캐스트 허브
+
+    publish는 어느 스레드에서나 호출할 수 있고(스레드풀의 커밋, 쓰기 대기열 스레드),
+    구독자 버퍼에 넣는 작업은 구독자가 있는 이벤트 루프에서 실행합니다.
+    """
+
+    def __init__(self, client_buffer: int = EVENTS_CLIENT_BUFFER, max_clients: int = EVENTS_MAX_CLIENTS,
+                 history: int = EVENTS_HISTORY):
+        self.client_buffer = client_buffer
+        self.max_clients = max_clients
+        self._subscribers: set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._seq = 0
+        # (id, 종류, 프레임) - 재연결한 구독자에게 이어 보낼 최근 이벤트
+        self._history: deque = deque(maxlen=history)
+        self._counters = {"published": 0, "dropped_clients": 0, "rejected": 0}
+
+    def subscribe(self, types: Optional[Iterable[str]] = None, last_event_id: Optional[str] = None) -> Subscription:
+        """
+        구독을 시작합니다. (이벤트 루프 안에서 호출)
+        types로 종류 접두사(예: "evaluation")를 거를 수 있고, last_event_id가 있으면 그 뒤 이벤트부터 보냅니다.
+        """
+        if len(self._subscribers) >= self.max_clients:
+            self._counters["rejected"] += 1
+            raise EventHubBusyError("실시간 알림 연결이 너무 많습니다. 잠시 후 다시 시도해주세요.")
+        prefixes = tuple(types) if types else None
+        subscription = Subscription(self, prefixes, self.client_buffer)
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._subscribers.add(subscription)
+            subscription.start_id = self._seq
+            if last_event_id is not None:
+                self._replay(subscription, last_event_id)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def _replay(self, subscription: Subscription, last_event_id: str) -> None:
+        try:
+            last = int(last_event_id)
+        except ValueError:
+            last = -1
+        oldest = self._history[0][0] if self._history else self._seq + 1
+        if last > self._seq or last < oldest - 1:
+            # 서버가 재시작됐거나 기록 범위를 벗어남: 목록 전체를 다시 불러오도록 알림
+            subscription.offer(RESET_FRAME)
+            return
+        for event_id, event_type, frame in self._history:
+            if event_id > last and subscription.wants(event_type):
+                subscription.offer(frame)
+
+    def publish(self, events: List[dict]) -> None:
+        """이벤트 목록을 발행합니다. 구독자가 없으면 기록만 남깁니다."""
+        if not events:
+            return
+        with self._lock:
+            records = []
+            for event in events:
+                self._seq += 1
+                frame = b"id: %d\nevent: %s\ndata: %s\n\n" % (
+                    self._seq, event["type"].encode(), orjson.dumps(event),
+                )
+                records.append((self._seq, event["type"], frame))
+            self._history.extend(records)
+            self._counters["published"] += len(records)
+            loop = self._loop if self._subscribers else None
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._fan_out(records)
+        else:
+            loop.call_soon_threadsafe(self._fan_out, records)
+
+    def _fan_out(self, records: list) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for event_id, event_type, frame in records:
+            for subscription in subscribers:
+                # 구독 전에 발행된 이벤트(구독 직전에 예약된 전달, 재연결 시 이미 이어 보낸 이벤트)는 건너뜀
+                if event_id > subscription.start_id and subscription.wants(event_type):
+                    subscription.offer(frame)
+
+    def close(self) -> None:
+        """모든 구독을 끝냅니다. (서버 종료 시 스트리밍 응답이 종료를 막지 않도록)"""
+        with self._lock:
+            subscribers, self._subscribers = list(self._subscribers), set()
+            loop = self._loop
+
+        def _close():
+            for subscription in subscribers:
+                if not subscription.dropped:
+                    subscription.end()
+
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            _close()
+        else:
+            loop.call_soon_threadsafe(_close)
+
+    def stats(self) -> dict:
+        return {**self._counters, "clients": len(self._subscribers), "last_event_id": self._seq}
+
+hub = EventHub()
+
+# 세션 단위로 커밋 후 발행할 이벤트 (crud가 쌓고, 커밋/롤백 이벤트에서 처리)
+def queue_event(db: Session, event_type: str, **fields) -> None:
+    db.info.setdefault("pending_events", []).append({"type": event_type, **fields})
+
+def pending_event_count(db: Session) -> int:
+    return len(db.info.get("pending_events", ()))
+
+def discard_events_since(db: Session, mark: int) -> None:
+    """mark 이후 쌓인 이벤트를 버립니다. (쓰기 대기열에서 SAVEPOINT로 되돌린 작업)"""
+    pending = db.info.get("pending_events")
+    if pending is not None:
+        del pending[mark:]
+
+def publish_pending(db: Session, version: Optional[int] = None) -> None:
+    pending = db.info.pop("pending_events", None)
+    if not pending:
+        return
+    if version is not None:
+        for event in pending:
+            event["version"] = version
+    hub.publish(pending)
+
+def discard_pending(db: Session) -> None:
+    db.info.pop("pending_events", None)
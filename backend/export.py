@@ -0,0 +1,277 @@
+"""
+관리자용 데이터 내보내기 (CSV / NDJSON / XLSX 스트리밍)
+
+ORM 객체 그래프를 메모리에 올리지 않고, 필요한 컬럼만 SELECT한 뒤
+yield_per로 일정 개수씩 읽어 바로 응답 스트림에 씁니다.
+테이블 크기와 무관하게 서버 메모리 사용량이 일정합니다.
+"""
+import csv
+import io
+import json
+import re
+import zipfile
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+from xml.sax.saxutils import escape
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import Account, TeamMember, Aidea, Judge, Evaluation
+
+# 한 번에 DB에서 가져올 행 수
+YIELD_PER = 500
+
+# 엔티티별 내보낼 수 있는 컬럼 (순서 = 기본 출력 순서)
+EXPORT_COLUMNS: Dict[str, Dict[str, object]] = {
+    "accounts": {
+        "id": Account.id,
+        "knox_id": Account.knox_id,
+        "name": Account.name,
+        "team_name": Account.team_name,
+        "department": Account.department,
+        "created_at": Account.created_at,
+        "updated_at": Account.updated_at,
+    },
+    "team_members": {
+        "id": TeamMember.id,
+        "account_id": TeamMember.account_id,
+        "team_name": Account.team_name,
+        "name": TeamMember.name,
+        "knox_id": TeamMember.knox_id,
+        "created_at": TeamMember.created_at,
+    },
+    "aideas": {
+        "id": Aidea.id,
+        "account_id": Aidea.account_id,
+        "knox_id": Account.knox_id,
+        "team_name": Account.team_name,
+        "department": Account.department,
+        "project": Aidea.project,
+        "target_user": Aidea.target_user,
+        "problem": Aidea.problem,
+        "solution": Aidea.solution,
+        "data_sources": Aidea.data_sources,
+        "scenario": Aidea.scenario,
+        "workflow": Aidea.workflow,
+        "benefit": Aidea.benefit,
+        "created_at": Aidea.created_at,
+        "updated_at": Aidea.updated_at,
+    },
+    "evaluations": {
+        "id": Evaluation.id,
+        "aidea_id": Evaluation.aidea_id,
+        "judge_id": Evaluation.judge_id,
+        "innovation_score": Evaluation.innovation_score,
+        "feasibility_score": Evaluation.feasibility_score,
+        "effectiveness_score": Evaluation.effectiveness_score,
+        "total_score": Evaluation.total_score,
+        "created_at": Evaluation.created_at,
+        "updated_at": Evaluation.updated_at,
+    },
+    # 평가 1건당 1행: 팀/프로젝트/심사위원 정보를 함께 펼친 형식
+    "evaluation_details": {
+        "evaluation_id": Evaluation.id,
+        "aidea_id": Aidea.id,
+        "project": Aidea.project,
+        "account_id": Account.id,
+        "knox_id": Account.knox_id,
+        "team_name": Account.team_name,
+        "department": Account.department,
+        "judge_id": Judge.judge_id,
+        "judge_name": Judge.name,
+        "innovation_score": Evaluation.innovation_score,
+        "feasibility_score": Evaluation.feasibility_score,
+        "effectiveness_score": Evaluation.effectiveness_score,
+        "total_score": Evaluation.total_score,
+        "created_at": Evaluation.created_at,
+        "updated_at": Evaluation.updated_at,
+    },
+}
+
+# 엔티티별 기준 테이블과 조인 (select_from 순서)
+def _apply_joins(entity: str, stmt):
+    if entity == "team_members":
+        return stmt.select_from(TeamMember).join(Account, TeamMember.account_id == Account.id).order_by(TeamMember.id)
+    if entity == "aideas":
+        return stmt.select_from(Aidea).join(Account, Aidea.account_id == Account.id).order_by(Aidea.id)
+    if entity == "evaluation_details":
+        return (
+            stmt.select_from(Evaluation)
+            .join(Aidea, Evaluation.aidea_id == Aidea.id)
+            .join(Account, Aidea.account_id == Account.id)
+            .join(Judge, Evaluation.judge_id == Judge.id)
+            .order_by(Evaluation.id)
+        )
+    model = {"accounts": Account, "evaluations": Evaluation}[entity]
+    return stmt.select_from(model).order_by(model.id)
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+def resolve_columns(entity: str, columns: Optional[str]) -> List[str]:
+    """
+    요청한 컬럼 목록(쉼표 구분)을 검증합니다. 지정하지 않으면 전체 컬럼을 사용합니다.
+    """
+    if entity not in EXPORT_COLUMNS:
+        raise ValueError(f"지원하지 않는 내보내기 대상입니다: {entity} (가능: {', '.join(EXPORT_COLUMNS)})")
+    available = EXPORT_COLUMNS[entity]
+    if not columns:
+        return list(available)
+    selected = [c.strip() for c in columns.split(",") if c.strip()]
+    unknown = [c for c in selected if c not in available]
+    if unknown or not selected:
+        raise ValueError(f"지원하지 않는 컬럼입니다: {', '.join(unknown)} (가능: {', '.join(available)})")
+    return selected
+
+def iter_rows(db: Session, entity: str, columns: List[str]) -> Iterator[tuple]:
+    """선택한 컬럼만 SELECT하여 yield_per 단위로 행을 가져옵니다."""
+    available = EXPORT_COLUMNS[entity]
+    stmt = _apply_joins(entity, select(*[available[c] for c in columns]))
+    result = db.execute(stmt.execution_options(yield_per=YIELD_PER))
+    try:
+        for partition in result.partitions():
+            yield from partition
+    finally:
+        result.close()
+
+def _format_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def stream_csv(rows: Iterator[tuple], columns: List[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # Excel에서 한글이 깨지지 않도록 UTF-8 BOM을 붙임
+    buffer.write("\ufeff")
+    writer.writerow(columns)
+    for i, row in enumerate(rows, 1):
+        writer.writerow([_format_value(v) for v in row])
+        if i % YIELD_PER == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def stream_ndjson(rows: Iterator[tuple], columns: List[str]) -> Iterator[str]:
+    lines = []
+    for row in rows:
+        record = {c: _format_value(v) for c, v in zip(columns, row)}
+        lines.append(json.dumps(record, ensure_ascii=False))
+        if len(lines) >= YIELD_PER:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+# --- XLSX ---
+# XLSX는 zip 안의 XML 파일들입니다. 공유 문자열 테이블 없이 inline 문자열을 쓰면
+# 행을 읽는 즉시 시트 XML로 흘려보낼 수 있어 파일 전체를 메모리에 만들 필요가 없습니다.
+
+_XLSX_STATIC_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="export" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+# XML 1.0에서 허용되지 않는 제어 문자
+_ILLEGAL_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+def _xlsx_cell(value) -> str:
+    if value is None:
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f"<c><v>{value}</v></c>"
+    text = _ILLEGAL_XML_CHARS.sub("", str(_format_value(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+
+def _xlsx_row(values) -> str:
+    return "<row>" + "".join(_xlsx_cell(v) for v in values) + "</row>"
+
+class _ChunkSink(io.RawIOBase):
+    """zipfile이 쓰는 바이트를 모아 두었다가 스트림으로 내보내는 쓰기 전용 버퍼"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def stream_xlsx(rows: Iterator[tuple], columns: List[str]) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_STATIC_PARTS.items():
+            archive.writestr(name, content)
+        with archive.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            sheet.write(_xlsx_row(columns).encode())
+            for i, row in enumerate(rows, 1):
+                sheet.write(_xlsx_row(row).encode())
+                if i % YIELD_PER == 0:
+                    yield sink.drain()
+            sheet.write(b"</sheetData></worksheet>")
+    yield sink.drain()
+
+def stream_export(db: Session, entity: str, columns: List[str], export_format: str):
+    """형식에 맞는 스트리밍 제너레이터를 반환합니다."""
+    writers = {"csv": stream_csv, "ndjson": stream_ndjson, "xlsx": stream_xlsx}
+    if export_format not in writers:
+        raise ValueError(f"지원하지 않는 형식입니다: {export_format} (가능: {', '.join(EXPORT_FORMATS)})")
+    return writers[export_format](iter_rows(db, entity, columns), columns)
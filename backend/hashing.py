@@ -0,0 +1,157 @@
+"""
+bcrypt 해시/검증을 이벤트 루프 밖의 프로세스 풀에서 실행하는 서비스
+
+bcrypt는 호출당 수백 ms의 CPU를 사용하므로 async 핸들러에서 직접 호출하면
+그 동안 다른 모든 요청이 멈춥니다. 이 모듈은 코어 수에 맞춘 프로세스 풀로
+작업을 넘기고, 대기열이 가득 차면 즉시 HashingBusyError를 발생시킵니다.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from passlib.hash import bcrypt
+
+from metrics import BCRYPT_SECONDS
+
+def _available_cores() -> int:
+    """현재 프로세스가 사용할 수 있는 CPU 코어 수를 반환합니다."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def _hash(password: str) -> str:
+    return bcrypt.hash(password)
+
+def _verify(password: str, hashed_password: str) -> bool:
+    return bcrypt.verify(password, hashed_password)
+
+def _hash_batch(passwords: List[str]) -> List[str]:
+    return [bcrypt.hash(password) for password in passwords]
+
+def _split(items: List[str], parts: int) -> List[List[str]]:
+    """순서를 유지한 채 items를 최대 parts개의 연속 구간으로 나눕니다."""
+    parts = max(1, min(parts, len(items)))
+    size, extra = divmod(len(items), parts)
+    chunks, start = [], 0
+    for i in range(parts):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+def hash_passwords(passwords: List[str], max_workers: Optional[int] = None) -> List[str]:
+    """
+    이벤트 루프가 없는 곳(CLI 등)에서 여러 비밀번호를 코어 수만큼 병렬로 해시합니다.
+    결과는 입력과 같은 순서입니다.
+    """
+    workers = min(max_workers or _available_cores(), len(passwords))
+    if workers <= 1:
+        return _hash_batch(passwords)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [hashed for chunk in executor.map(_hash_batch, _split(passwords, workers)) for hashed in chunk]
+
+class HashingBusyError(Exception):
+    """해시 대기열이 가득 차서 요청을 받을 수 없을 때 발생합니다."""
+
+class HashingService:
+    """bcrypt 작업을 프로세스 풀에서 실행하고 대기열 길이와 지연 시간을 집계합니다."""
+
+    def __init__(self, max_workers: Optional[int] = None, max_queue: Optional[int] = None):
+        self.max_workers = max_workers or _available_cores()
+        # 대기열 상한: 워커 하나당 bcrypt 약 250ms 기준으로 수 초 이내에 처리 가능한 양
+        self.max_queue = max_queue or self.max_workers * 16
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._counters = {
+            "hash_count": 0,
+            "verify_count": 0,
+            "rejected_count": 0,
+            "error_count": 0,
+            "max_queue_depth": 0,
+        }
+        self._latency_total = {"hash": 0.0, "verify": 0.0}
+        self._latency_max = {"hash": 0.0, "verify": 0.0}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # 프로세스 풀은 첫 사용 시점에 생성 (import 시점 비용 제거)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def _run(self, op: str, func, *args, units: int = 1):
+        if self._pending >= self.max_queue:
+            self._counters["rejected_count"] += 1
+            raise HashingBusyError("인증 요청이 많아 잠시 후 다시 시도해주세요.")
+
+        self._pending += 1
+        self._counters["max_queue_depth"] = max(self._counters["max_queue_depth"], self._pending)
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        except Exception:
+            self._counters["error_count"] += 1
+            raise
+        finally:
+            self._pending -= 1
+            elapsed = time.perf_counter() - start
+            self._counters[f"{op}_count"] += units
+            self._latency_total[op] += elapsed
+            self._latency_max[op] = max(self._latency_max[op], elapsed)
+            BCRYPT_SECONDS.observe(elapsed, op if units == 1 else f"{op}_batch")
+
+    async def hash(self, password: str) -> str:
+        """비밀번호를 bcrypt로 해시합니다."""
+        return await self._run("hash", _hash, password)
+
+    async def hash_many(self, passwords: List[str]) -> List[str]:
+        """
+        여러 비밀번호를 워커 수만큼 나눠 병렬로 해시합니다. (결과는 입력과 같은 순서)
+        대기열은 나눈 묶음 하나당 한 칸을 사용하며, 자리가 모자라면 아무 작업도 넘기지 않고 거절합니다.
+        """
+        if not passwords:
+            return []
+        chunks = _split(passwords, self.max_workers)
+        if self._pending + len(chunks) > self.max_queue:
+            self._counters["rejected_count"] += 1
+            raise HashingBusyError("인증 요청이 많아 잠시 후 다시 시도해주세요.")
+        results = await asyncio.gather(*(self._run("hash", _hash_batch, chunk, units=len(chunk)) for chunk in chunks))
+        return [hashed for chunk in results for hashed in chunk]
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """비밀번호가 bcrypt 해시와 일치하는지 검증합니다."""
+        return await self._run("verify", _verify, password, hashed_password)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._pending
+
+    def stats(self) -> dict:
+        """대기열 길이, 처리 건수, 평균/최대 지연 시간(ms)을 반환합니다."""
+        result = dict(self._counters)
+        result["workers"] = self.max_workers
+        result["max_queue"] = self.max_queue
+        result["queue_depth"] = self._pending
+        for op in ("hash", "verify"):
+            count = self._counters[f"{op}_count"]
+            result[f"{op}_latency_avg_ms"] = round(self._latency_total[op] / count * 1000, 3) if count else 0.0
+            result[f"{op}_latency_max_ms"] = round(self._latency_max[op] * 1000, 3)
+        return result
+
+    def shutdown(self):
+        """프로세스 풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+hasher = HashingService(
+    max_workers=_env_int("HASH_WORKERS"),
+    max_queue=_env_int("HASH_MAX_QUEUE"),
+)
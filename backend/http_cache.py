@@ -0,0 +1,166 @@
+"""
+JSON 응답용 ETag / If-None-Match 처리와 gzip·brotli 압축 미들웨어
+
+- 모든 200 JSON 응답에 강한 ETag를 붙입니다. (엔드포인트가 이미 ETag를 정했다면 그대로 사용)
+- GET 요청의 If-None-Match가 일치하면 본문 없이 304를 반환합니다.
+- 일정 크기 이상의 JSON은 Accept-Encoding에 따라 brotli 또는 gzip으로 압축합니다.
+  같은 본문을 반복해서 압축하지 않도록 (ETag, 인코딩)별 압축 결과를 소량 보관합니다.
+스트리밍 응답(CSV/XLSX 내보내기 등)과 JSON이 아닌 응답은 그대로 통과시킵니다.
+"""
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 사용
+    brotli = None
+
+def make_etag(body: bytes) -> str:
+    """본문 내용으로 강한 ETag를 만듭니다."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match는 약한 비교: W/ 접두사와 인코딩 접미사(-gzip, -br)를 무시
+    if if_none_match.strip() == "*":
+        return True
+    base = etag.strip('"')
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        candidate = candidate.strip('"')
+        for suffix in ("-gzip", "-br"):
+            if candidate.endswith(suffix):
+                candidate = candidate[: -len(suffix)]
+        if candidate == base:
+            return True
+    return False
+
+def _choose_encoding(accept_encoding: str) -> Optional[str]:
+    accepted = {}
+    for item in accept_encoding.split(","):
+        parts = item.strip().split(";")
+        name = parts[0].strip().lower()
+        quality = 1.0
+        for param in parts[1:]:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            accepted[name] = quality
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+class _CompressedCache:
+    """(ETag, 인코딩)별 압축 결과를 보관하는 작은 LRU"""
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: tuple, value: bytes):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+class ETagCompressionMiddleware:
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self._compressed = _CompressedCache()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        method = scope["method"]
+        start_message = None
+        body_parts = []
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] != 200
+                    or method == "HEAD"
+                    or not headers.get("content-type", "").startswith("application/json")
+                    or "content-encoding" in headers
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            await self._send_buffered(start_message, b"".join(body_parts), request_headers, method, send)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _send_buffered(self, start_message, body: bytes, request_headers: Headers, method: str, send):
+        headers = MutableHeaders(raw=list(start_message["headers"]))
+        etag = headers.get("etag") or make_etag(body)
+        headers["ETag"] = etag
+        headers.append("Vary", "Accept-Encoding")
+
+        if method == "GET" and _etag_matches(request_headers.get("if-none-match", ""), etag):
+            del headers["content-length"]
+            del headers["content-type"]
+            await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        encoding = _choose_encoding(request_headers.get("accept-encoding", "")) if len(body) >= self.minimum_size else None
+        if encoding:
+            body = self._compress(body, etag, encoding)
+            headers["Content-Encoding"] = encoding
+            # 인코딩별로 다른 표현이므로 강한 ETag도 구분
+            headers["ETag"] = etag[:-1] + f'-{encoding}"'
+
+        headers["Content-Length"] = str(len(body))
+        await send({"type": "http.response.start", "status": start_message["status"], "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
+
+    def _compress(self, body: bytes, etag: str, encoding: str) -> bytes:
+        key = (etag, encoding)
+        compressed = self._compressed.get(key)
+        if compressed is None:
+            if encoding == "br":
+                compressed = brotli.compress(body, quality=self.brotli_quality)
+            else:
+                compressed = gzip.compress(body, compresslevel=self.gzip_level)
+            self._compressed.set(key, compressed)
+        return compressed
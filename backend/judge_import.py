@@ -0,0 +1,92 @@
+"""
+심사위원 일괄 등록용 CSV / JSON 파싱 및 행 검증
+
+CLI(create_judge.py)와 관리자 API(/api/admin/judges/bulk)가 같은 규칙을 사용합니다.
+파일 형식 자체가 잘못된 경우에만 ValueError를 발생시키고,
+행 단위 문제(필수값 누락, 파일 내 중복 등)는 오류 목록으로 돌려주어 나머지 행은 계속 처리합니다.
+"""
+import csv
+import io
+import json
+from typing import Dict, List, Optional, Tuple
+
+JUDGE_FIELDS = ("judge_id", "password", "name")
+JUDGE_IMPORT_FORMATS = ("csv", "json")
+
+FIELD_LABELS = {"judge_id": "심사위원 ID", "password": "비밀번호", "name": "심사위원 이름"}
+
+def detect_format(filename: Optional[str] = None, content_type: Optional[str] = None) -> str:
+    """파일 이름 확장자 또는 Content-Type으로 형식(csv/json)을 판별합니다."""
+    if filename:
+        extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+        if extension in JUDGE_IMPORT_FORMATS:
+            return extension
+    if content_type:
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        if media_type.endswith("json"):
+            return "json"
+        if media_type in ("text/csv", "application/csv", "text/plain"):
+            return "csv"
+    raise ValueError("지원하지 않는 파일 형식입니다. (csv, json)")
+
+def _normalize(value) -> str:
+    return "" if value is None else str(value).strip()
+
+def parse_judges(content, format: str) -> List[Dict]:
+    """
+    CSV(헤더: judge_id,password,name) 또는 JSON(배열 또는 {"judges": [...]})을 행 목록으로 변환합니다.
+    각 행에는 파일 내 위치(row, 1부터)가 함께 담깁니다.
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 필수 컬럼이 없는 경우
+    """
+    if isinstance(content, bytes):
+        try:
+            content = content.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise ValueError("파일은 UTF-8로 인코딩되어야 합니다.")
+
+    if format == "csv":
+        reader = csv.DictReader(io.StringIO(content))
+        missing = [field for field in JUDGE_FIELDS if field not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"CSV 헤더에 필수 컬럼이 없습니다: {', '.join(missing)}")
+        records = list(reader)
+    elif format == "json":
+        try:
+            records = json.loads(content) if isinstance(content, str) else content
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON 형식이 올바르지 않습니다: {e.msg}")
+        if isinstance(records, dict):
+            records = records.get("judges")
+        if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+            raise ValueError('JSON은 심사위원 객체의 배열 또는 {"judges": [...]} 형태여야 합니다.')
+    else:
+        raise ValueError(f"지원하지 않는 형식입니다: {format}")
+
+    return [
+        {"row": index, **{field: _normalize(record.get(field)) for field in JUDGE_FIELDS}}
+        for index, record in enumerate(records, start=1)
+    ]
+
+def row_error(row: Dict, error: str) -> Dict:
+    return {"row": row["row"], "judge_id": row.get("judge_id") or None, "error": error}
+
+def validate_judges(rows: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    필수값 누락과 파일 내 judge_id 중복을 검사합니다. (중복은 처음 나온 행만 유효)
+
+    Returns:
+        (유효한 행 목록, 행 단위 오류 목록)
+    """
+    valid, errors, seen = [], [], set()
+    for row in rows:
+        missing = [FIELD_LABELS[field] for field in JUDGE_FIELDS if not row[field]]
+        if missing:
+            errors.append(row_error(row, f"{', '.join(missing)}은(는) 필수입니다."))
+        elif row["judge_id"] in seen:
+            errors.append(row_error(row, "파일 안에서 중복된 심사위원 ID입니다."))
+        else:
+            seen.add(row["judge_id"])
+            valid.append(row)
+    return valid, errors
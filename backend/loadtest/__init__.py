@@ -0,0 +1,11 @@
+"""
+부하 테스트 도구 (asyncio + httpx)
+
+실행 중인 서버(기본: 로컬 uvicorn)에 참가자/심사위원/관리자 시나리오를 동시에 흘려보내고
+경로별 처리량, 지연 시간(p50/p95/p99), 오류율을 JSON으로 출력합니다.
+사용법은 `python -m loadtest --help`를 참고하세요.
+"""
+from loadtest.recorder import Recorder
+from loadtest.runner import LoadConfig, run_load, compare_reports
+
+__all__ = ["Recorder", "LoadConfig", "run_load", "compare_reports"]
@@ -0,0 +1,104 @@
+"""
+부하 테스트 실행
+
+사용법 (backend 디렉터리에서):
+    # 임시 DB로 로컬 uvicorn을 띄워 전체 시나리오 실행
+    python -m loadtest --spawn --participants 2000 --judges 20 --admins 2 --output before.json
+
+    # 이미 떠 있는 서버에 대회 오픈(참가자 도착을 60초에 걸쳐 분산)만 실행
+    python -m loadtest --base-url http://127.0.0.1:8000 --scenarios participant --ramp-seconds 60
+
+    # 이전 실행 결과와 비교
+    WRITE_QUEUE=true python -m loadtest --spawn --output after.json --baseline before.json
+
+시나리오:
+    participant : POST /api/login → POST /api/register (마감 직전 몰림은 --ramp-seconds 0)
+    judge       : POST /api/judge/login → GET /api/projects?judge_id= 반복 조회 + POST /api/evaluations
+    admin       : POST /api/admin/login → GET /api/admin/export/{entity} 반복
+결과는 경로별 처리량, p50/p95/p99 지연 시간, 오류율을 담은 JSON으로 출력합니다.
+"""
+import argparse
+import asyncio
+import json
+import signal
+import sys
+
+from loadtest.runner import LoadConfig, LocalServer, compare_reports, run_load
+from loadtest.scenarios import SCENARIOS
+
+def parse_args(argv=None) -> argparse.Namespace:
+    defaults = LoadConfig()
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", default=defaults.base_url, help="대상 서버 주소")
+    target.add_argument("--spawn", action="store_true", help="임시 SQLite DB로 로컬 uvicorn을 띄워서 실행")
+    parser.add_argument("--server-workers", type=int, default=1, help="--spawn 시 uvicorn 워커 수")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="쉼표 구분 (participant,judge,admin)")
+    parser.add_argument("--participants", type=int, default=defaults.participants)
+    parser.add_argument("--judges", type=int, default=defaults.judges)
+    parser.add_argument("--admins", type=int, default=defaults.admins)
+    parser.add_argument("--concurrency", type=int, default=defaults.concurrency, help="동시에 진행 중인 참가자 수 상한")
+    parser.add_argument("--ramp-seconds", type=float, default=defaults.ramp_seconds, help="참가자 도착을 퍼뜨리는 시간")
+    parser.add_argument("--think-ms", type=float, default=defaults.think_ms, help="로그인과 등록 사이 평균 대기 시간")
+    parser.add_argument("--members", type=int, default=defaults.members, help="등록 시 팀원 수")
+    parser.add_argument("--judge-rounds", type=int, default=defaults.judge_rounds)
+    parser.add_argument("--evaluations-per-round", type=int, default=defaults.evaluations_per_round)
+    parser.add_argument("--admin-rounds", type=int, default=defaults.admin_rounds)
+    parser.add_argument("--poll-interval", type=float, default=defaults.poll_interval, help="심사위원/관리자 반복 간격(초)")
+    parser.add_argument("--export-format", default=defaults.export_format, choices=["csv", "ndjson", "xlsx"])
+    parser.add_argument("--timeout", type=float, default=defaults.timeout, help="요청 타임아웃(초)")
+    parser.add_argument("--busy-retries", type=int, default=defaults.busy_retries, help="503 응답 시 재시도 횟수")
+    parser.add_argument("--prefix", default=defaults.prefix, help="생성할 계정 ID 접두사")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", help="보고서를 저장할 JSON 파일 (생략 시 표준 출력)")
+    parser.add_argument("--baseline", help="비교할 이전 보고서 JSON 파일")
+    return parser.parse_args(argv)
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    config = LoadConfig(
+        base_url=args.base_url,
+        scenarios=[name.strip() for name in args.scenarios.split(",") if name.strip()],
+        participants=args.participants,
+        judges=args.judges,
+        admins=args.admins,
+        concurrency=args.concurrency,
+        ramp_seconds=args.ramp_seconds,
+        think_ms=args.think_ms,
+        members=args.members,
+        judge_rounds=args.judge_rounds,
+        evaluations_per_round=args.evaluations_per_round,
+        admin_rounds=args.admin_rounds,
+        poll_interval=args.poll_interval,
+        export_format=args.export_format,
+        timeout=args.timeout,
+        busy_retries=args.busy_retries,
+        prefix=args.prefix,
+        seed=args.seed,
+    )
+
+    if args.spawn:
+        # 중간에 종료(SIGTERM)되어도 띄운 uvicorn을 정리하도록 SystemExit로 바꿈
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(1))
+        with LocalServer(workers=args.server_workers) as server:
+            config.base_url = server.base_url
+            report = asyncio.run(run_load(config))
+        report["server"] = {"spawned": True, "workers": args.server_workers}
+    else:
+        report = asyncio.run(run_load(config))
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["comparison"] = compare_reports(json.load(f), report)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    print(output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+요청 결과 수집과 경로별 통계 계산
+"""
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+def percentile(ordered: List[float], q: float) -> float:
+    """정렬된 표본에서 q 분위 값을 반환합니다. (nearest-rank)"""
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+def summarize_latencies(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    ms = lambda seconds: round(seconds * 1000, 2)
+    return {
+        "p50": ms(percentile(ordered, 0.50)),
+        "p95": ms(percentile(ordered, 0.95)),
+        "p99": ms(percentile(ordered, 0.99)),
+        "max": ms(ordered[-1]),
+        "mean": ms(sum(ordered) / len(ordered)),
+    }
+
+class Recorder:
+    """
+    경로(라우트 템플릿)별 요청 지연 시간과 응답 상태를 모읍니다.
+    4xx/5xx 응답과 연결 오류·타임아웃은 오류로 셉니다. (304는 정상)
+    """
+
+    def __init__(self):
+        self._samples: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+    def record(self, route: str, seconds: float, outcome) -> None:
+        self._samples[route].append((seconds, str(outcome)))
+
+    async def request(self, client: httpx.AsyncClient, method: str, route: str, url: str = None, **kwargs) -> Optional[httpx.Response]:
+        """
+        요청을 보내고 결과를 route 이름으로 기록합니다.
+        url을 생략하면 route를 그대로 사용합니다. 연결 오류면 None을 반환합니다.
+        """
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url or route.split(" ", 1)[1], **kwargs)
+        except httpx.HTTPError as e:
+            self.record(route, time.perf_counter() - start, type(e).__name__)
+            return None
+        self.record(route, time.perf_counter() - start, response.status_code)
+        return response
+
+    def finish(self) -> None:
+        self.finished = time.perf_counter()
+
+    @staticmethod
+    def _is_error(outcome: str) -> bool:
+        return not outcome.isdigit() or int(outcome) >= 400
+
+    def report(self) -> dict:
+        """전체 및 경로별 처리량, 지연 시간 분포, 오류율을 계산합니다."""
+        seconds = (self.finished or time.perf_counter()) - self.started
+        routes, errors = {}, Counter()
+        total = failed = 0
+        for route, samples in sorted(self._samples.items()):
+            outcomes = Counter(outcome for _, outcome in samples)
+            route_errors = sum(count for outcome, count in outcomes.items() if self._is_error(outcome))
+            routes[route] = {
+                "requests": len(samples),
+                "throughput_rps": round(len(samples) / seconds, 2),
+                "latency_ms": summarize_latencies([latency for latency, _ in samples]),
+                "errors": route_errors,
+                "error_rate": round(route_errors / len(samples), 4),
+                "statuses": dict(sorted(outcomes.items())),
+            }
+            errors.update({f"{route} {outcome}": count for outcome, count in outcomes.items() if self._is_error(outcome)})
+            total += len(samples)
+            failed += route_errors
+
+        return {
+            "duration_s": round(seconds, 3),
+            "requests": total,
+            "throughput_rps": round(total / seconds, 2) if seconds else 0.0,
+            "errors": failed,
+            "error_rate": round(failed / total, 4) if total else 0.0,
+            "routes": routes,
+            "error_breakdown": dict(errors.most_common()),
+        }
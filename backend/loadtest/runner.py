@@ -0,0 +1,173 @@
+"""
+부하 실행기: 가상 사용자 스케줄링, 로컬 uvicorn 실행, 보고서 비교
+"""
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+import httpx
+
+from loadtest.recorder import Recorder
+from loadtest.scenarios import SCENARIOS, ensure_judges
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@dataclass
+class LoadConfig:
+    base_url: str = "http://127.0.0.1:8000"
+    scenarios: List[str] = field(default_factory=lambda: list(SCENARIOS))
+    participants: int = 1000
+    judges: int = 20
+    admins: int = 2
+    # 동시에 진행 중인 참가자 수 상한 (HTTP 연결 수 상한이기도 함)
+    concurrency: int = 200
+    # 참가자 도착을 퍼뜨리는 시간 (0이면 마감 직전처럼 한꺼번에 몰림)
+    ramp_seconds: float = 0.0
+    think_ms: float = 0.0
+    members: int = 3
+    judge_rounds: int = 5
+    evaluations_per_round: int = 5
+    admin_rounds: int = 2
+    poll_interval: float = 1.0
+    export_entities: List[str] = field(default_factory=lambda: ["evaluations", "accounts"])
+    export_format: str = "csv"
+    timeout: float = 60.0
+    # 503 응답 시 Retry-After를 지켜 다시 시도하는 횟수
+    busy_retries: int = 3
+    seed: Optional[int] = None
+    # 같은 서버에 여러 번 실행할 때 계정이 겹치지 않도록 붙이는 접두사
+    prefix: str = "lt_"
+    password: str = "loadtest-pw"
+    admin_username: str = os.getenv("ADMIN_USERNAME", "admin")
+    admin_password: str = os.getenv("ADMIN_PASSWORD", "admin123")
+
+async def _participants(client, recorder, config) -> None:
+    limit = asyncio.Semaphore(config.concurrency)
+    interval = config.ramp_seconds / config.participants if config.participants else 0
+
+    async def arrive(index: int):
+        await asyncio.sleep(index * interval)
+        async with limit:
+            await SCENARIOS["participant"](client, recorder, config, index)
+
+    await asyncio.gather(*(arrive(i) for i in range(config.participants)))
+
+async def run_load(config: LoadConfig, transport: Optional[httpx.AsyncBaseTransport] = None) -> dict:
+    """
+    선택한 시나리오를 동시에 실행하고 보고서(dict)를 반환합니다.
+    transport를 주면 네트워크 대신 그 transport로 요청합니다. (테스트에서 httpx.ASGITransport 사용)
+    """
+    if config.seed is not None:
+        random.seed(config.seed)
+    unknown = set(config.scenarios) - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+
+    limits = httpx.Limits(max_connections=config.concurrency + config.judges + config.admins)
+    async with httpx.AsyncClient(
+        base_url=config.base_url, transport=transport, limits=limits, timeout=config.timeout
+    ) as client:
+        if "judge" in config.scenarios:
+            await ensure_judges(client, config)
+
+        recorder = Recorder()
+        tasks = []
+        if "participant" in config.scenarios:
+            tasks.append(_participants(client, recorder, config))
+        if "judge" in config.scenarios:
+            tasks += [SCENARIOS["judge"](client, recorder, config, i) for i in range(config.judges)]
+        if "admin" in config.scenarios:
+            tasks += [SCENARIOS["admin"](client, recorder, config, i) for i in range(config.admins)]
+        await asyncio.gather(*tasks)
+        recorder.finish()
+
+    return {
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "config": {key: value for key, value in asdict(config).items() if "password" not in key},
+        **recorder.report(),
+    }
+
+def compare_reports(baseline: dict, current: dict) -> dict:
+    """
+    두 보고서의 처리량/지연 시간/오류율 차이를 계산합니다.
+    (양수 = current가 더 큼, 경로는 양쪽에 모두 있는 것만 비교)
+    """
+    def delta(old, new):
+        return {"baseline": old, "current": new, "change_pct": round((new - old) / old * 100, 1) if old else None}
+
+    routes = {}
+    for route in sorted(set(baseline["routes"]) & set(current["routes"])):
+        old, new = baseline["routes"][route], current["routes"][route]
+        routes[route] = {
+            "throughput_rps": delta(old["throughput_rps"], new["throughput_rps"]),
+            **{f"{key}_ms": delta(old["latency_ms"][key], new["latency_ms"][key]) for key in ("p50", "p95", "p99")},
+            "error_rate": delta(old["error_rate"], new["error_rate"]),
+        }
+    return {
+        "throughput_rps": delta(baseline["throughput_rps"], current["throughput_rps"]),
+        "error_rate": delta(baseline["error_rate"], current["error_rate"]),
+        "routes": routes,
+    }
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+class LocalServer:
+    """
+    임시 SQLite DB로 uvicorn을 띄우고 /api/health가 응답할 때까지 기다립니다.
+    환경 변수(WRITE_QUEUE, DB_POOL_SIZE 등)는 현재 프로세스 값을 그대로 물려받습니다.
+    서류제출 마감일은 테스트 중 등록이 거절되지 않도록 먼 미래로 설정합니다.
+    """
+
+    def __init__(self, workers: int = 1, port: Optional[int] = None, database_path: Optional[str] = None):
+        self.port = port or _free_port()
+        self.workers = workers
+        self.database_path = database_path or os.path.join(tempfile.mkdtemp(prefix="loadtest_"), "loadtest.db")
+        self.process: Optional[subprocess.Popen] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "LocalServer":
+        env = {
+            "ENVIRONMENT": "production",
+            "REGISTRATION_DEADLINE": "2999-12-31T23:59:59",
+            **os.environ,
+            "DATABASE_PATH": self.database_path,
+        }
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(self.port),
+             "--workers", str(self.workers), "--log-level", "warning", "--no-access-log"],
+            cwd=BACKEND_DIR, env=env,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"uvicorn이 종료되었습니다. (exit code {self.process.returncode})")
+            try:
+                if httpx.get(f"{self.base_url}/api/health", timeout=1).status_code == 200:
+                    return self
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        self.__exit__()
+        raise RuntimeError("uvicorn이 30초 안에 시작되지 않았습니다.")
+
+    def __exit__(self, *exc) -> None:
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
@@ -0,0 +1,139 @@
+"""
+부하 테스트 시나리오
+
+- participant : 대회 오픈/마감 직전처럼 참가자가 로그인(최초 로그인 시 계정 생성) 후 팀원·아이디어를 등록
+- judge       : 심사위원이 로그인 후 /api/projects?judge_id= 를 주기적으로 조회하며(If-None-Match 사용)
+                아직 평가하지 않은 aidea에 평가를 제출
+- admin       : 관리자가 로그인 후 평가/계정 데이터를 내보내기
+각 시나리오는 가상 사용자 한 명의 흐름이며, 요청 결과는 모두 Recorder에 경로별로 기록됩니다.
+"""
+import asyncio
+import random
+
+import httpx
+
+from loadtest.recorder import Recorder
+
+# 배점 기준(crud.EVALUATION_RUBRIC)에 맞는 점수 단위
+SCORE_UNITS = {"innovation_score": 6, "feasibility_score": 6, "effectiveness_score": 8}
+
+def judge_id_for(config, index: int) -> str:
+    return f"{config.prefix}judge{index}"
+
+def registration_payload(account_id: int, knox_id: str, index: int, members: int) -> dict:
+    return {
+        "id": account_id,
+        "knox_id": knox_id,
+        "name": f"참가자{index}",
+        "team_name": f"부하테스트팀{index}",
+        "department": "부하테스트",
+        "team_members": [{"name": f"팀원{index}_{i}", "knox_id": f"{knox_id}_m{i}"} for i in range(members)],
+        "project": f"부하 테스트 프로젝트 {index}",
+        "target_user": "사내 개발자",
+        "problem": "반복 업무에 시간이 많이 듭니다. " * 10,
+        "solution": "AI 에이전트로 반복 업무를 자동화합니다. " * 10,
+        "data_sources": "사내 위키",
+        "scenario": "사용자가 요청하면 에이전트가 처리합니다. " * 5,
+        "workflow": "요청 → 분석 → 실행 → 보고",
+    }
+
+async def send(client: httpx.AsyncClient, recorder: Recorder, config, method: str, route: str, url: str = None, **kwargs):
+    """
+    요청을 보내고, 503(해시/쓰기 대기열 포화)이면 Retry-After만큼 기다렸다 busy_retries번까지 다시 시도합니다.
+    사용자가 "다시 시도"를 누르는 것과 같으며, 모든 시도가 각각 기록됩니다.
+    """
+    for attempt in range(config.busy_retries + 1):
+        response = await recorder.request(client, method, route, url, **kwargs)
+        if response is None or response.status_code != 503 or attempt == config.busy_retries:
+            return response
+        await asyncio.sleep(float(response.headers.get("retry-after", 1)) * random.uniform(1, 2))
+
+async def think(config) -> None:
+    """사용자 사이 간격(think time)을 흉내 냅니다."""
+    if config.think_ms:
+        await asyncio.sleep(random.uniform(0.5, 1.5) * config.think_ms / 1000)
+
+async def participant(client: httpx.AsyncClient, recorder: Recorder, config, index: int) -> None:
+    knox_id = f"{config.prefix}user{index}"
+    response = await send(
+        client, recorder, config, "POST", "POST /api/login", json={"knox_id": knox_id, "password": config.password}
+    )
+    if response is None or response.status_code != 200:
+        return
+    await think(config)
+    await send(
+        client, recorder, config, "POST", "POST /api/register",
+        json=registration_payload(response.json()["id"], knox_id, index, config.members),
+    )
+
+async def judge(client: httpx.AsyncClient, recorder: Recorder, config, index: int) -> None:
+    response = await send(
+        client, recorder, config, "POST", "POST /api/judge/login",
+        json={"judge_id": judge_id_for(config, index), "password": config.password},
+    )
+    if response is None or response.status_code != 200:
+        return
+    judge_id = response.json()["id"]
+
+    etag, pending, evaluated = None, [], set()
+    for _ in range(config.judge_rounds):
+        response = await send(
+            client, recorder, config, "GET", "GET /api/projects", params={"judge_id": judge_id},
+            headers={"If-None-Match": etag} if etag else {},
+        )
+        if response is not None and response.status_code == 200:
+            etag = response.headers.get("etag")
+            pending = [project["aidea"]["id"] for project in response.json() if not project["is_evaluated"]]
+        pending = [aidea_id for aidea_id in pending if aidea_id not in evaluated]
+
+        for aidea_id in random.sample(pending, min(len(pending), config.evaluations_per_round)):
+            scores = {field: unit * random.randint(1, 5) for field, unit in SCORE_UNITS.items()}
+            response = await send(
+                client, recorder, config, "POST", "POST /api/evaluations",
+                json={"aidea_id": aidea_id, "judge_id": judge_id, **scores},
+            )
+            if response is not None and response.status_code == 200:
+                evaluated.add(aidea_id)
+        await asyncio.sleep(config.poll_interval)
+
+async def admin(client: httpx.AsyncClient, recorder: Recorder, config, index: int) -> None:
+    response = await send(
+        client, recorder, config, "POST", "POST /api/admin/login",
+        json={"username": config.admin_username, "password": config.admin_password},
+    )
+    if response is None or response.status_code != 200:
+        return
+    headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+    for _ in range(config.admin_rounds):
+        for entity in config.export_entities:
+            await send(
+                client, recorder, config, "GET", "GET /api/admin/export/{entity}", f"/api/admin/export/{entity}",
+                params={"format": config.export_format}, headers=headers,
+            )
+        await asyncio.sleep(config.poll_interval)
+
+async def ensure_judges(client: httpx.AsyncClient, config) -> None:
+    """
+    심사위원 시나리오용 계정을 관리자 일괄 등록 API로 만듭니다.
+    (이미 있는 ID는 행 단위 오류로 돌아오므로 같은 서버에 다시 실행해도 됩니다)
+    측정 전 준비 단계라 Recorder에 기록하지 않습니다.
+    """
+    if not config.judges:
+        return
+    response = await client.post(
+        "/api/admin/login", json={"username": config.admin_username, "password": config.admin_password}
+    )
+    response.raise_for_status()
+    response = await client.post(
+        "/api/admin/judges/bulk",
+        json=[
+            {"judge_id": judge_id_for(config, i), "password": config.password, "name": f"부하테스트 심사위원{i}"}
+            for i in range(config.judges)
+        ],
+        headers={"Authorization": f"Bearer {response.json()['token']}"},
+        timeout=None,
+    )
+    response.raise_for_status()
+
+SCENARIOS = {"participant": participant, "judge": judge, "admin": admin}
@@ -0,0 +1,348 @@
+"""
+메일 발송 워커 (email_outbox → Knox 메일 서버)
+
+/api/send-email은 메일을 outbox 테이블에 넣고 바로 응답하며, 실제 발송은 이 워커가 백그라운드에서 처리합니다.
+- 모든 발송이 keep-alive 연결 풀을 가진 httpx.AsyncClient 하나를 공유합니다. (메일마다 TCP 연결을 새로 맺지 않음)
+- 동시에 보내는 메일 수는 MAIL_CONCURRENCY로 제한합니다.
+- 연결 오류/타임아웃/5xx/429는 지수 백오프(Retry-After가 있으면 그 이상)로 MAIL_MAX_ATTEMPTS번까지 다시 시도하고,
+  그 밖의 4xx는 바로 failed로 남깁니다.
+- 발송할 메일을 꺼낼 때 status=sending과 점유 만료 시각(next_attempt_at)을 함께 기록하므로,
+  발송 중에 프로세스가 죽어도 MAIL_LEASE_SECONDS 뒤에 다시 발송합니다.
+  (이 경우 같은 메일이 두 번 전달될 수 있어 요청 헤더 Idempotency-Key에 message_id를 담아 보냄)
+  최대 시도 횟수를 다 쓴 채 점유가 만료된 메일은 다시 보내지 않고 failed로 남깁니다.
+- 메일 서버로 보내는 요청은 초당 MAIL_RATE_PER_SECOND건으로 제한합니다. (단체 메일이 메일 서버에 몰리지 않도록)
+- 관리자 단체 메일 작업(mail_jobs)은 이 워커가 MAIL_JOB_BATCH개 계정씩 템플릿을 채워 outbox에 넣고
+  (crud.expand_mail_job, 진행 위치를 커밋하므로 재시작 후 이어서 진행), 개별 메일은 단체 메일보다 먼저 보냅니다.
+
+MAIL_WORKER=false면 앱 시작 시 워커를 띄우지 않습니다. (outbox에는 계속 쌓임)
+"""
+import asyncio
+import logging
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from typing import Callable, List, Optional
+
+import httpx
+from sqlalchemy import select, update
+
+import metrics
+from crud import expand_mail_job
+from models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+MAIL_API_URL = os.getenv("MAIL_API_URL", "http://10.229.19.169:1111/knox_api")
+MAIL_WORKER_ENABLED = os.getenv("MAIL_WORKER", "true").lower() == "true"
+MAIL_CONCURRENCY = _env_int("MAIL_CONCURRENCY", 4)
+MAIL_MAX_ATTEMPTS = _env_int("MAIL_MAX_ATTEMPTS", 5)
+# n번째 실패 후 대기 시간: MAIL_BACKOFF_SECONDS * 2^(n-1) (최대 MAIL_BACKOFF_MAX_SECONDS, 50~100% 무작위)
+MAIL_BACKOFF_SECONDS = _env_float("MAIL_BACKOFF_SECONDS", 2.0)
+MAIL_BACKOFF_MAX_SECONDS = _env_float("MAIL_BACKOFF_MAX_SECONDS", 300.0)
+MAIL_TIMEOUT = _env_float("MAIL_TIMEOUT", 10.0)
+MAIL_POLL_INTERVAL = _env_float("MAIL_POLL_INTERVAL", 2.0)
+MAIL_LEASE_SECONDS = _env_float("MAIL_LEASE_SECONDS", 120.0)
+# 메일 서버로 보내는 초당 요청 수 (0이면 제한 없음)
+MAIL_RATE_PER_SECOND = _env_float("MAIL_RATE_PER_SECOND", 10.0)
+# 단체 메일 작업에서 한 번에 outbox로 넣는 계정 수
+MAIL_JOB_BATCH = _env_int("MAIL_JOB_BATCH", 500)
+# 단체 메일 받는 사람 주소: {knox_id}@MAIL_DOMAIN
+MAIL_DOMAIN = os.getenv("MAIL_DOMAIN", "samsung.com")
+
+RETRYABLE_STATUS = {408, 429}
+# 발송 결과 저장(DB) 실패 시 다시 시도하는 횟수와 첫 대기 시간 (저장하지 못하면 점유 만료 후 같은 메일이 다시 발송됨)
+RECORD_ATTEMPTS = 3
+RECORD_RETRY_SECONDS = 0.5
+
+def _retry_after_seconds(value: Optional[str], now: datetime) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 초로 바꿉니다."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is not None:
+        when = when.replace(tzinfo=None) - (when.utcoffset() or timedelta())
+    return max((when - now).total_seconds(), 0.0)
+
+class RateLimiter:
+    """
+    초당 rate건으로 제한하는 토큰 버킷 (최대 1초 분량까지 몰아서 허용)
+    이벤트 루프 하나에서만 쓰므로 잠금 없이, 토큰을 미리 차감하고 모자란 만큼 기다립니다.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+class Mailer:
+    """outbox의 메일을 꺼내 메일 서버로 보내는 백그라운드 워커"""
+
+    def __init__(self, url: str = MAIL_API_URL, session_factory: Optional[Callable] = None,
+                 concurrency: int = MAIL_CONCURRENCY, max_attempts: int = MAIL_MAX_ATTEMPTS,
+                 backoff: float = MAIL_BACKOFF_SECONDS, backoff_max: float = MAIL_BACKOFF_MAX_SECONDS,
+                 timeout: float = MAIL_TIMEOUT, poll_interval: float = MAIL_POLL_INTERVAL,
+                 lease: float = MAIL_LEASE_SECONDS, rate: float = MAIL_RATE_PER_SECOND,
+                 job_batch: int = MAIL_JOB_BATCH, domain: str = MAIL_DOMAIN):
+        self.url = url
+        self._session_factory = session_factory
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.job_batch = job_batch
+        self.domain = domain
+        self._limiter = RateLimiter(rate)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._inflight: set = set()
+        self._counters = {"sent": 0, "retried": 0, "failed": 0}
+
+    @property
+    def session_factory(self):
+        if self._session_factory is None:
+            from database import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory
+
+    async def open(self):
+        """메일 서버와의 연결 풀을 만듭니다."""
+        if self._client is None:
+            limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+            self._client = httpx.AsyncClient(limits=limits, timeout=self.timeout)
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def start(self):
+        """백그라운드 발송 루프를 시작합니다. (앱 lifespan에서 호출)"""
+        if self._task is not None:
+            return
+        await self.open()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="mailer")
+
+    async def stop(self):
+        """발송 루프를 멈추고 보내는 중인 메일을 timeout까지 기다린 뒤 연결 풀을 닫습니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._inflight:
+            # 끝나지 못한 메일은 sending으로 남아 점유 만료 후 다시 발송됨
+            await asyncio.wait(self._inflight, timeout=self.timeout)
+        await self.close()
+        self._wakeup = None
+
+    def notify(self):
+        """새 메일이 들어왔음을 알려 poll 간격을 기다리지 않고 바로 꺼내도록 합니다."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def stats(self) -> dict:
+        return {**self._counters, "in_flight": len(self._inflight), "running": self._task is not None}
+
+    async def _db(self, func, *args):
+        """DB 작업을 스레드풀에서 실행합니다. (이벤트 루프를 막지 않도록)"""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _run(self):
+        # 단체 메일 작업은 시작할 때(재시작 후 이어서 진행)와 알림/poll 후에만 확인 (메일마다 조회하지 않음)
+        expanding = True
+        while True:
+            if expanding:
+                try:
+                    expanding = await self._db(self._expand_jobs)
+                except Exception as e:
+                    logger.error(f"단체 메일 outbox 생성 오류: {e}")
+                    expanding = False
+
+            free = self.concurrency - len(self._inflight)
+            if free > 0:
+                try:
+                    claimed = await self._db(self._claim, free, datetime.utcnow())
+                except Exception as e:
+                    logger.error(f"메일 대기열 조회 오류: {e}")
+                    claimed = []
+                for message in claimed:
+                    self._spawn(message)
+
+            if len(self._inflight) >= self.concurrency:
+                # 동시 발송 수가 찼으면 하나가 끝나는 대로 다음 메일을 꺼냄
+                await asyncio.wait(self._inflight, return_when=asyncio.FIRST_COMPLETED)
+                continue
+            if expanding:
+                continue
+            # 지금 보낼 메일이 없음: 새 메일 알림이나 poll 간격(재시도 예정 메일)까지 대기
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            expanding = True
+
+    def _spawn(self, message: dict) -> asyncio.Task:
+        task = asyncio.create_task(self._deliver(message))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+        return task
+
+    async def run_once(self, now: Optional[datetime] = None) -> int:
+        """지금 보낼 수 있는 메일을 최대 concurrency개 꺼내 보내고, 보낸(시도한) 개수를 반환합니다."""
+        await self.open()
+        await self._db(self._expand_jobs)
+        claimed = await self._db(self._claim, self.concurrency, now or datetime.utcnow())
+        await asyncio.gather(*(self._deliver(message, now) for message in claimed))
+        return len(claimed)
+
+    def _expand_jobs(self) -> bool:
+        """단체 메일 작업 하나의 다음 batch를 outbox에 넣고, 남은 작업이 있는지 반환합니다."""
+        db = self.session_factory()
+        try:
+            return expand_mail_job(db, self.job_batch, self.domain)
+        finally:
+            db.close()
+
+    def _claim(self, limit: int, now: datetime) -> List[dict]:
+        """
+        보낼 차례인 메일(pending, 또는 점유가 만료된 sending)을 limit개까지 sending으로 바꾸고 반환합니다.
+        UPDATE 한 문장으로 꺼내므로 여러 워커가 같은 메일을 동시에 가져가지 않습니다.
+        """
+        db = self.session_factory()
+        try:
+            # 최대 시도 횟수를 다 쓴 채 점유가 만료된 메일(발송 중 프로세스 종료)은 다시 보내지 않고 failed로 정리
+            db.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.status == "sending", EmailOutbox.attempts >= self.max_attempts,
+                       EmailOutbox.next_attempt_at <= now)
+                .values(status="failed", last_error="발송 결과를 확인하지 못한 채 최대 시도 횟수를 초과했습니다.")
+                .execution_options(synchronize_session=False)
+            )
+            due = (
+                select(EmailOutbox.id)
+                .where(EmailOutbox.status.in_(("pending", "sending")), EmailOutbox.next_attempt_at <= now,
+                       EmailOutbox.attempts < self.max_attempts)
+                # 개별 메일(등록 완료 안내 등)이 수천 건의 단체 메일 뒤에서 기다리지 않도록 먼저 보냄
+                .order_by(EmailOutbox.job_id.isnot(None), EmailOutbox.next_attempt_at)
+                .limit(limit)
+            )
+            if db.get_bind().dialect.name == "postgresql":
+                due = due.with_for_update(skip_locked=True)
+            rows = db.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.id.in_(due.scalar_subquery()), EmailOutbox.status.in_(("pending", "sending")),
+                       EmailOutbox.attempts < self.max_attempts)
+                .values(status="sending", attempts=EmailOutbox.attempts + 1,
+                        next_attempt_at=now + timedelta(seconds=self.lease))
+                .returning(EmailOutbox.id, EmailOutbox.message_id, EmailOutbox.recipients,
+                           EmailOutbox.subject, EmailOutbox.contents, EmailOutbox.attempts)
+                .execution_options(synchronize_session=False)
+            ).mappings().all()
+            db.commit()
+            return [dict(row) for row in rows]
+        finally:
+            db.close()
+
+    def _finish(self, message_id: int, values: dict) -> None:
+        db = self.session_factory()
+        try:
+            db.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.id == message_id, EmailOutbox.status == "sending")
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    async def _record(self, message: dict, values: dict) -> bool:
+        """
+        발송 결과를 저장합니다. DB 오류는 RECORD_ATTEMPTS번까지 다시 시도하고, 끝내 실패하면 로그만 남깁니다.
+        (발송 task의 예외가 처리되지 않은 채 사라지지 않도록, 이 경우 메일은 sending으로 남아 점유 만료 후 다시 처리됨)
+        """
+        for attempt in range(1, RECORD_ATTEMPTS + 1):
+            try:
+                await self._db(self._finish, message["id"], values)
+                return True
+            except Exception as e:
+                if attempt == RECORD_ATTEMPTS:
+                    logger.error(f"메일 발송 결과 저장 실패 ({message['message_id']}, {values['status']}): {e}")
+                    return False
+                logger.warning(f"메일 발송 결과 저장 재시도 ({message['message_id']}, {attempt}회 실패): {e}")
+                await asyncio.sleep(RECORD_RETRY_SECONDS * 2 ** (attempt - 1))
+
+    def _backoff_seconds(self, attempts: int) -> float:
+        delay = min(self.backoff * 2 ** (attempts - 1), self.backoff_max)
+        return delay * (0.5 + random.random() / 2)
+
+    async def _deliver(self, message: dict, now: Optional[datetime] = None):
+        payload = {"recipients": message["recipients"], "subject": message["subject"], "contents": message["contents"]}
+        retry_after = None
+        await self._limiter.acquire()
+        try:
+            response = await self._client.post(
+                self.url, json=payload, headers={"Idempotency-Key": message["message_id"]}
+            )
+        except httpx.HTTPError as e:
+            error, retryable = f"{type(e).__name__}: {e}", True
+        else:
+            if response.is_success:
+                await self._record(message, {"status": "sent", "sent_at": datetime.utcnow(), "last_error": None})
+                self._counters["sent"] += 1
+                metrics.MAIL_DELIVERIES.inc("sent")
+                return
+            error = f"HTTP {response.status_code}: {response.text[:500]}"
+            retryable = response.status_code >= 500 or response.status_code in RETRYABLE_STATUS
+            retry_after = response.headers.get("retry-after")
+
+        now = now or datetime.utcnow()
+        if retryable and message["attempts"] < self.max_attempts:
+            delay = max(self._backoff_seconds(message["attempts"]), _retry_after_seconds(retry_after, now) or 0)
+            values = {"status": "pending", "next_attempt_at": now + timedelta(seconds=delay), "last_error": error}
+            outcome = "retried"
+        else:
+            values = {"status": "failed", "last_error": error}
+            outcome = "failed"
+            logger.error(f"메일 발송 실패 ({message['message_id']}, {message['attempts']}회 시도): {error}")
+        await self._record(message, values)
+        self._counters[outcome] += 1
+        metrics.MAIL_DELIVERIES.inc(outcome)
+
+mailer = Mailer()
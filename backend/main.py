@@ -1,31 +1,52 @@
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse, ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from typing import List, Optional
+from typing import Awaitable, Callable, Hashable, List, Optional, TypeVar
+from contextlib import asynccontextmanager
 from pathlib import Path
 import os
+import uuid
 import uvicorn
 import logging
-import httpx  # HTTP 클라이언트 라이브러리
 import jwt
 from datetime import datetime, timedelta
 
-from database import get_db, engine
-from models import Base
+from database import get_db, get_read_db, get_async_db, get_async_read_db, engine, pool_stats
+from hashing import hasher, HashingBusyError
+from write_queue import write_queue, WriteQueueBusyError, WRITE_QUEUE_ENABLED
+from migrate import ensure_schema
 from schemas import (
-    AccountLogin, AccountResponse, AccountRegister, AdminLogin, AdminResponse, AccountListResponse, JudgeCreate, JudgeLogin, JudgeResponse, JudgeListResponse, ProjectWithAccount, AideaResponse, TeamMemberResponse,
-    EvaluationCreate, EvaluationResponse, AccountWithEvaluations
+    AccountLogin, AccountResponse, AccountRegister, AdminLogin, AdminResponse, AccountListResponse, JudgeCreate, JudgeLogin, JudgeResponse, JudgeListResponse, JudgeBulkResult, ProjectWithAccount, AideaResponse, AideaDetailResponse, TeamMemberResponse,
+    AideaPatch, TeamMemberPatch, VersionedResponse,
+    EvaluationCreate, EvaluationResponse, EvaluationBatchResponse, AccountWithEvaluations, RankingListResponse,
+    EmailRequest, EmailStatusResponse, MailJobCreate, MailJobPreview, MailJobResponse
 )
 from crud import (
-    create_or_update_account, get_account_by_knox_id, update_account_registration,
-    get_all_accounts, get_all_aideas, verify_judge_login,get_all_projects_with_accounts,
-    create_evaluation, get_evaluations_by_account, get_judge_by_id, get_evaluation_by_judge_and_account,
-    get_evaluation_by_judge_and_aidea, get_all_evaluations, create_judge, get_all_judges, get_judge_by_judge_id
+    create_or_update_account, AccountExistsError, get_account_by_knox_id, update_account_registration,
+    resolve_fields, account_field_rows,
+    create_evaluation, create_evaluations_batch, rubric_error, get_judge_by_id, create_judge, get_all_judges,
+    create_judges_bulk,
+    patch_aidea, patch_team_member, VersionConflictError,
+    enqueue_email,
+    template_error, preview_mail_job, create_mail_job, cancel_mail_job, mail_job_progress
 )
+import crud_async
+from export import EXPORT_FORMATS, resolve_columns, stream_export
+from judge_import import detect_format, parse_judges, validate_judges, row_error
+from cache import response_cache, current_data_version
+from http_cache import ETagCompressionMiddleware, make_etag
+import metrics
+import profiler
+from events import hub as event_hub, EventHubBusyError
+from mailer import mailer, MAIL_WORKER_ENABLED, MAIL_DOMAIN
+from pydantic import TypeAdapter
+import orjson
 
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development").lower()
 if ENVIRONMENT == "development":
@@ -34,9 +55,6 @@ else:
     logging.basicConfig(level=logging.CRITICAL + 1)
 logger = logging.getLogger(__name__)
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
-
 # JWT 설정
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
@@ -76,27 +94,78 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+# 서류제출 마감일 (REGISTRATION_DEADLINE=2025-12-31T23:59:59 형식으로 변경 가능)
+REGISTRATION_DEADLINE = datetime.fromisoformat(os.getenv("REGISTRATION_DEADLINE", "2025-12-31T23:59:59"))
+
 # 서류제출 기간 체크 함수
 def _check_registration_period():
     """
     서류제출 기간을 체크합니다.
     기간이 지났으면 HTTPException을 발생시킵니다.
     """
-    # 서류제출 마감일 설정 (예: 2024년 12월 31일 23:59:59)
-    registration_deadline = datetime(2025, 12, 31, 23, 59, 59)
-    
     current_time = datetime.now()
     
-    if current_time > registration_deadline:
+    if current_time > REGISTRATION_DEADLINE:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="서류제출 기간이 종료되었습니다."
         )
 
+# 해시/쓰기 대기열 포화 시 503 응답
+def _service_busy(error: Exception) -> HTTPException:
+    if isinstance(error, WriteQueueBusyError):
+        reason = "write_queue"
+    elif isinstance(error, EventHubBusyError):
+        reason = "events"
+    else:
+        reason = "hashing"
+    metrics.SERVICE_BUSY.inc(reason)
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": "1"},
+    )
+
+T = TypeVar("T")
+
+async def _run_write(db: Session, op: Callable[[Session], T]) -> T:
+    """
+    쓰기 작업(세션을 받는 함수)을 실행합니다.
+    WRITE_QUEUE=true면 그룹 커밋 대기열에서 다른 요청과 묶어 커밋하고, 아니면 요청 세션으로 스레드풀에서 실행합니다.
+    (SQLite 쓰기 락을 busy timeout까지 기다리는 동안에도 이벤트 루프가 막히지 않도록)
+    대기열의 세션은 커밋 후 닫히므로 op 안에서 응답 모델까지 만들어 반환합니다.
+    """
+    if WRITE_QUEUE_ENABLED:
+        return await write_queue.run(op)
+    return await run_in_threadpool(op, db)
+
+# 시작 시 스키마가 최신이 아니면 자동으로 마이그레이션 (끄면 migrate.py를 따로 실행해야 시작 가능)
+AUTO_MIGRATE = os.getenv("AUTO_MIGRATE", "true").lower() == "true"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 최신 스키마면 alembic_version 조회 한 번으로 끝남
+    ensure_schema(engine, auto_upgrade=AUTO_MIGRATE)
+    if MAIL_WORKER_ENABLED:
+        await mailer.start()
+    yield
+    event_hub.close()
+    await mailer.stop()
+    write_queue.stop()
+    hasher.shutdown()
+
 app = FastAPI(
     title="슬슬 AIdea Agent API",
     description="사내 개발자 경진대회 컨퍼런스 API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# JSON 응답 ETag(304) 및 gzip/brotli 압축
+app.add_middleware(
+    ETagCompressionMiddleware,
+    minimum_size=int(os.getenv("COMPRESS_MIN_SIZE", "1024")),
 )
 
 # CORS 설정
@@ -108,6 +177,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 수/지연 시간/DB 쿼리 메트릭 (가장 바깥에서 압축·CORS 처리까지 포함해 측정)
+if metrics.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
+
+# 요청별 SQL 프로파일 (Server-Timing 헤더, N+1 경고). QUERY_PROFILER=true일 때만
+if profiler.QUERY_PROFILER_ENABLED:
+    app.add_middleware(profiler.QueryProfilerMiddleware)
+
 @app.get("/api")
 async def api_root():
     return {"message": "슬슬 AIdea Agnet 경진대회에 오신 것을 환영합니다!"}
@@ -116,8 +193,17 @@ async def api_root():
 async def health_check():
     return {"status": "healthy", "service": "슬슬 AIdea Agent 경진대회 API"}
 
+def _find_account(session: Session, knox_id: str):
+    """로그인용 계정 조회: (저장된 해시, 응답 모델)을 반환합니다. (비동기 세션에서 lazy load가 없도록 run_sync 안에서 변환)"""
+    account = get_account_by_knox_id(session, knox_id)
+    return account and (account.hashed_password, AccountResponse.model_validate(account))
+
 @app.post("/api/login", response_model=AccountResponse)
-async def login_or_register_account(payload: AccountLogin, db: Session = Depends(get_db)):
+async def login_or_register_account(
+    payload: AccountLogin,
+    db: Session = Depends(get_db),
+    lookup_db: AsyncSession = Depends(get_async_db),
+):
     """
     로그인 또는 회원가입을 처리합니다.
     동시성 문제를 방지하기 위해 안전한 트랜잭션 처리를 사용합니다.
@@ -129,10 +215,14 @@ async def login_or_register_account(payload: AccountLogin, db: Session = Depends
                 detail="패스워드는 필수입니다."
             )
         
-        account = get_account_by_knox_id(db, payload.knox_id)
+        # 조회는 비동기 세션으로 (SQLite I/O와 busy 대기가 이벤트 루프를 막지 않도록)
+        found = await lookup_db.run_sync(_find_account, payload.knox_id)
+        # bcrypt를 기다리는 동안 커넥션을 잡고 있지 않도록 조회 트랜잭션을 먼저 끝냄
+        await lookup_db.commit()
 
-        if account:
-            if account.verify_password(payload.password):
+        if found:
+            hashed, account = found
+            if await hasher.verify(payload.password, hashed):
                 logger.info(f"로그인 성공: {payload.knox_id}")
                 return account
             raise HTTPException(
@@ -140,10 +230,29 @@ async def login_or_register_account(payload: AccountLogin, db: Session = Depends
                 detail="패스워드가 다릅니다."
             )
             
-        account = create_or_update_account(db, knox_id=payload.knox_id, password=payload.password)
+        hashed_password = await hasher.hash(payload.password)
+        try:
+            account = await _run_write(db, lambda session: AccountResponse.model_validate(create_or_update_account(
+                session, knox_id=payload.knox_id, password=payload.password, hashed_password=hashed_password,
+                verify_existing=False,
+            )))
+        except AccountExistsError:
+            # 동시에 같은 knox_id로 먼저 생성됨: 쓰기 작업 밖에서 저장된 해시로 비밀번호 확인
+            found = await lookup_db.run_sync(_find_account, payload.knox_id)
+            await lookup_db.commit()
+            if found and await hasher.verify(payload.password, found[0]):
+                return found[1]
+            raise ValueError("이미 존재하는 계정입니다. 비밀번호가 다릅니다.")
         logger.info(f"새 계정 생성: {payload.knox_id}")
         return account
         
+    except HTTPException:
+        raise
+    except HashingBusyError as e:
+        logger.warning(f"해시 대기열 포화로 로그인 거절: {payload.knox_id}")
+        raise _service_busy(e)
+    except WriteQueueBusyError as e:
+        raise _service_busy(e)
     except ValueError as e:
         logger.warning(f"계정 생성 시 비밀번호 불일치: {e}")
         raise HTTPException(
@@ -179,13 +288,17 @@ async def register_account(payload: AccountRegister, db: Session = Depends(get_d
         # 서류제출 기간 체크
         _check_registration_period()
         
-        account = update_account_registration(db, payload)
+        account = await _run_write(
+            db, lambda session: AccountResponse.model_validate(update_account_registration(session, payload))
+        )
         logger.info(f"계정 정보 등록 완료: knox_id={payload.knox_id}")
         return account
         
     except HTTPException:
         # 서류제출 기간 관련 에러는 그대로 전달
         raise
+    except WriteQueueBusyError as e:
+        raise _service_busy(e)
     except ValueError as e:
         logger.warning(f"ValueError: knox_id={payload.knox_id} - {e}")
         raise HTTPException(
@@ -212,7 +325,7 @@ async def register_account(payload: AccountRegister, db: Session = Depends(get_d
         )
 
 @app.post("/api/judge/login", response_model=JudgeResponse)
-async def judge_login(payload: JudgeLogin, db: Session = Depends(get_db)):
+async def judge_login(payload: JudgeLogin, db: AsyncSession = Depends(get_async_db)):
     """
     심사위원 로그인을 처리합니다.
     """
@@ -223,7 +336,10 @@ async def judge_login(payload: JudgeLogin, db: Session = Depends(get_db)):
                 detail="비밀번호는 필수입니다."
             )
         
-        judge = verify_judge_login(db, payload.judge_id, payload.password)
+        judge = await crud_async.get_judge_by_judge_id(db, payload.judge_id)
+        await db.commit()  # 해시 검증 전에 커넥션 반환 (로그인 API와 동일)
+        if judge and not await hasher.verify(payload.password, judge.hashed_password):
+            judge = None
         
         if not judge:
             raise HTTPException(
@@ -236,6 +352,9 @@ async def judge_login(payload: JudgeLogin, db: Session = Depends(get_db)):
         
     except HTTPException:
         raise
+    except HashingBusyError as e:
+        logger.warning(f"해시 대기열 포화로 심사위원 로그인 거절: {payload.judge_id}")
+        raise _service_busy(e)
     except Exception as e:
         logger.error(f"심사위원 로그인 오류: {e}")
         raise HTTPException(
@@ -243,43 +362,77 @@ async def judge_login(payload: JudgeLogin, db: Session = Depends(get_db)):
             detail="서버 오류가 발생했습니다."
         )
 
+# 목록 응답은 TypeAdapter로 한 번에 검증하고 바로 바이트로 직렬화합니다.
+# (엔드포인트가 Response를 직접 반환하므로 response_model 재검증/jsonable_encoder 단계를 건너뜀)
+_project_list_adapter = TypeAdapter(List[ProjectWithAccount])
+_evaluation_list_adapter = TypeAdapter(List[EvaluationResponse])
+_account_list_adapter = TypeAdapter(AccountListResponse)
+_judge_list_adapter = TypeAdapter(JudgeListResponse)
+
+def _dump_json(adapter: TypeAdapter, value) -> bytes:
+    """ORM 객체가 섞인 값을 한 번에 검증하고 JSON 바이트로 직렬화합니다."""
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+def _json_response(adapter: TypeAdapter, value, headers: Optional[dict] = None) -> Response:
+    return Response(content=_dump_json(adapter, value), media_type="application/json", headers=headers)
+
+async def _cached_json_response(key: Hashable, build: Callable[[], Awaitable[bytes]]) -> Response:
+    """
+    응답 캐시에 있으면 저장된 바이트를 그대로 반환하고, 없으면 build()로 만들어 저장합니다.
+    쓰기가 커밋되면 데이터 버전이 올라가 캐시가 자동으로 무효화됩니다. (다른 워커의 쓰기는 RESPONSE_CACHE_TTL 후 반영)
+    """
+    cached = response_cache.get(key)
+    if cached is not None:
+        return Response(
+            content=cached.body, media_type="application/json",
+            headers={"X-Cache": "HIT", "ETag": cached.etag}
+        )
+    # DB를 읽기 전의 버전으로 저장해야, 읽는 도중 커밋된 쓰기가 캐시를 확실히 무효화함
+    version = current_data_version()
+    body = await build()
+    # ETag를 저장 시점에 한 번만 계산해 두면 미들웨어가 매 요청마다 본문을 해시하지 않음
+    etag = make_etag(body)
+    response_cache.set(key, body, version, etag)
+    return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS", "ETag": etag})
+
 @app.get("/api/projects", response_model=List[ProjectWithAccount])
-async def get_projects(judge_id: int = None, db: Session = Depends(get_db)):
+async def get_projects(
+    judge_id: int = None,
+    view: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db)
+):
     """
     제출된 모든 프로젝트 목록을 가져옵니다.
     judge_id가 제공되면 해당 심사위원의 평가 여부를 포함합니다.
+    view=summary 또는 fields(쉼표 구분)를 지정하면 선택한 필드만 담은 평평한 행을 반환합니다.
+    (긴 텍스트는 /api/aideas/{aidea_id}로 따로 조회)
     """
     try:
-        projects = get_all_projects_with_accounts(db)
-        
-        project_list = []
-        for account in projects:
-            # Aidea가 있는 경우에만 프로젝트 목록에 추가
-            if account.aideas:
-                team_members_response = [
-                    TeamMemberResponse.model_validate(member) 
-                    for member in account.team_members
-                ]
-                
-                account_response = AccountResponse.model_validate(account)
-                aidea = account.aideas[0]
-                aidea_response = AideaResponse.model_validate(aidea)
-
-                # 평가 여부 확인
-                is_evaluated = False
-                if judge_id:
-                    existing_evaluation = get_evaluation_by_judge_and_aidea(db, judge_id, aidea.id)
-                    is_evaluated = existing_evaluation is not None
-
-                project_item = ProjectWithAccount(
-                    account=account_response,
-                    team_members=team_members_response,
-                    aidea=aidea_response,
-                    is_evaluated=is_evaluated
-                )
-                project_list.append(project_item)
-        
-        return project_list
+        selected_fields = resolve_fields(view, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def build() -> bytes:
+        accounts = await crud_async.get_project_listing(db, fields=selected_fields)
+        evaluated_ids = await crud_async.get_evaluated_aidea_ids(db, judge_id) if judge_id else set()
+        if selected_fields:
+            return orjson.dumps(account_field_rows(accounts, selected_fields, evaluated_ids))
+
+        rows = [
+            {
+                "account": account,
+                "team_members": account.team_members,
+                "aidea": account.aideas[0],
+                "is_evaluated": account.aideas[0].id in evaluated_ids,
+            }
+            for account in accounts
+        ]
+        return _dump_json(_project_list_adapter, rows)
+
+    try:
+        cache_key = ("projects", judge_id or None, tuple(selected_fields) if selected_fields else None)
+        return await _cached_json_response(cache_key, build)
         
     except Exception as e:
         logger.error(f"프로젝트 목록 조회 오류: {e}")
@@ -288,6 +441,137 @@ async def get_projects(judge_id: int = None, db: Session = Depends(get_db)):
             detail="서버 오류가 발생했습니다."
         )
 
+@app.get("/api/aideas/{aidea_id}", response_model=AideaDetailResponse)
+async def get_aidea_detail(aidea_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    """
+    Aidea 한 건의 전체 내용(긴 텍스트 포함)을 가져옵니다.
+    """
+    async def build() -> bytes:
+        aidea = await crud_async.get_aidea_by_id(db, aidea_id)
+        if not aidea:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="해당 Aidea를 찾을 수 없습니다."
+            )
+        return AideaDetailResponse.model_validate(aidea).model_dump_json().encode()
+
+    try:
+        return await _cached_json_response(("aidea", aidea_id), build)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Aidea 상세 조회 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Aidea 상세 조회 중 오류가 발생했습니다."
+        )
+
+EVENT_TYPE_PREFIXES = ("evaluation", "aidea", "team")
+
+@app.get("/api/events")
+async def stream_events(request: Request, types: Optional[str] = None, last_event_id: Optional[str] = None):
+    """
+    평가 저장, Aidea 제출/수정 등 변경 알림을 Server-Sent Events로 보냅니다.
+    types(쉼표 구분: evaluation, aidea, team)로 받을 종류를 고를 수 있고,
+    재연결 시 Last-Event-ID 헤더(또는 last_event_id)로 놓친 이벤트를 이어 받습니다.
+    이벤트에는 id만 담기므로 화면은 해당 항목만 다시 조회하면 됩니다.
+    """
+    selected = [t.strip() for t in types.split(",") if t.strip()] if types else None
+    if selected and any(t not in EVENT_TYPE_PREFIXES for t in selected):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"types는 {', '.join(EVENT_TYPE_PREFIXES)} 중에서 선택해야 합니다."
+        )
+    try:
+        subscription = event_hub.subscribe(selected, request.headers.get("last-event-id") or last_event_id)
+    except EventHubBusyError as e:
+        raise _service_busy(e)
+
+    async def stream():
+        try:
+            # 연결 직후 현재 위치를 알려 두면 이후 재연결에서 Last-Event-ID로 이어 받을 수 있음
+            ready = orjson.dumps({"version": current_data_version()})
+            yield b"retry: 3000\nid: %d\nevent: ready\ndata: %s\n\n" % (subscription.start_id, ready)
+            async for frame in subscription.frames():
+                yield frame
+        finally:
+            event_hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+def _patch_error(error: Exception) -> HTTPException:
+    """부분 수정 오류를 HTTP 응답으로 변환합니다."""
+    if isinstance(error, VersionConflictError):
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(error), "current_version": error.current_version},
+        )
+    if isinstance(error, PermissionError):
+        return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(error))
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+
+@app.patch("/api/aideas/{aidea_id}", response_model=VersionedResponse)
+async def patch_aidea_endpoint(aidea_id: int, payload: AideaPatch, db: Session = Depends(get_db)):
+    """
+    Aidea의 일부 필드만 저장합니다. (자동 저장용)
+    보낸 필드만 반영하며, version을 함께 보내면 그 사이 다른 곳에서 저장된 경우 409를 반환합니다.
+    응답은 새 버전만 포함합니다.
+    """
+    _check_registration_period()
+    changes = payload.model_dump(exclude_unset=True, exclude={"account_knox_id", "version"})
+
+    def save(session: Session):
+        aidea = patch_aidea(session, aidea_id, payload.account_knox_id, changes, payload.version)
+        return aidea and VersionedResponse.model_validate(aidea)
+
+    try:
+        aidea = await _run_write(db, save)
+    except (VersionConflictError, PermissionError, ValueError) as e:
+        raise _patch_error(e)
+    except WriteQueueBusyError as e:
+        raise _service_busy(e)
+    except SQLAlchemyError as e:
+        logger.error(f"Aidea 부분 저장 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Aidea 저장 중 오류가 발생했습니다."
+        )
+    if not aidea:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 Aidea를 찾을 수 없습니다.")
+    return aidea
+
+@app.patch("/api/team-members/{member_id}", response_model=VersionedResponse)
+async def patch_team_member_endpoint(member_id: int, payload: TeamMemberPatch, db: Session = Depends(get_db)):
+    """
+    팀원 한 명의 이름/Knox ID만 저장합니다. version 처리는 Aidea PATCH와 같습니다.
+    """
+    _check_registration_period()
+    changes = payload.model_dump(exclude_unset=True, exclude={"account_knox_id", "version"})
+
+    def save(session: Session):
+        member = patch_team_member(session, member_id, payload.account_knox_id, changes, payload.version)
+        return member and VersionedResponse.model_validate(member)
+
+    try:
+        member = await _run_write(db, save)
+    except (VersionConflictError, PermissionError, ValueError) as e:
+        raise _patch_error(e)
+    except WriteQueueBusyError as e:
+        raise _service_busy(e)
+    except SQLAlchemyError as e:
+        logger.error(f"팀원 부분 저장 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="팀원 정보 저장 중 오류가 발생했습니다."
+        )
+    if not member:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 팀원을 찾을 수 없습니다.")
+    return member
+
 @app.post("/api/evaluations", response_model=EvaluationResponse)
 async def submit_evaluation(evaluation_data: EvaluationCreate, db: Session = Depends(get_db)):
     """
@@ -298,42 +582,27 @@ async def submit_evaluation(evaluation_data: EvaluationCreate, db: Session = Dep
         aidea_id = evaluation_data.aidea_id
         
         # 점수 유효성 검사
-        if not (6 <= evaluation_data.innovation_score <= 30 and 
-                evaluation_data.innovation_score % 6 == 0):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="아이디어 혁신성 점수는 6, 12, 18, 24, 30 중 하나여야 합니다."
-            )
-        
-        if not (6 <= evaluation_data.feasibility_score <= 30 and 
-                evaluation_data.feasibility_score % 6 == 0):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="기술 실현 가능성 점수는 6, 12, 18, 24, 30 중 하나여야 합니다."
-            )
-        
-        if not (8 <= evaluation_data.effectiveness_score <= 40 and 
-                evaluation_data.effectiveness_score % 8 == 0):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="업무 효과성 점수는 8, 16, 24, 32, 40 중 하나여야 합니다."
-            )
+        error = rubric_error(evaluation_data)
+        if error:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
         
         # 평가 생성
-        evaluation = create_evaluation(
-            db=db,
+        evaluation = await _run_write(db, lambda session: EvaluationResponse.model_validate(create_evaluation(
+            db=session,
             aidea_id=aidea_id,
             judge_id=judge_id,
             innovation_score=evaluation_data.innovation_score,
             feasibility_score=evaluation_data.feasibility_score,
             effectiveness_score=evaluation_data.effectiveness_score
-        )
+        )))
         
         logger.info(f"평가 제출 완료: aidea_id={aidea_id}, judge_id={judge_id}, total_score={evaluation.total_score}")
         return evaluation
         
     except HTTPException:
         raise
+    except WriteQueueBusyError as e:
+        raise _service_busy(e)
     except Exception as e:
         logger.error(f"평가 제출 오류: {e}")
         raise HTTPException(
@@ -341,14 +610,58 @@ async def submit_evaluation(evaluation_data: EvaluationCreate, db: Session = Dep
             detail="평가 제출 중 오류가 발생했습니다."
         )
 
+# 한 번에 제출할 수 있는 최대 평가 수
+MAX_EVALUATION_BATCH = int(os.getenv("MAX_EVALUATION_BATCH", "500"))
+
+@app.post("/api/evaluations/batch", response_model=EvaluationBatchResponse)
+async def submit_evaluations_batch(evaluations: List[EvaluationCreate], db: Session = Depends(get_db)):
+    """
+    여러 평가를 한 번에 제출합니다. 모든 항목을 한 트랜잭션으로 저장하고 항목별 결과를 돌려줍니다.
+    배점 오류나 존재하지 않는 aidea/심사위원은 해당 항목만 실패로 처리합니다.
+    """
+    if not evaluations:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="제출할 평가가 없습니다.")
+    if len(evaluations) > MAX_EVALUATION_BATCH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {MAX_EVALUATION_BATCH}건까지 제출할 수 있습니다."
+        )
+    def save(session: Session):
+        return [
+            (EvaluationResponse.model_validate(evaluation) if evaluation is not None else None, error)
+            for evaluation, error in create_evaluations_batch(session, evaluations)
+        ]
+
+    try:
+        results = await _run_write(db, save)
+    except WriteQueueBusyError as e:
+        raise _service_busy(e)
+    except Exception as e:
+        logger.error(f"평가 일괄 제출 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="평가 제출 중 오류가 발생했습니다."
+        )
+
+    saved = sum(1 for evaluation, _ in results if evaluation is not None)
+    logger.info(f"평가 일괄 제출 완료: {saved}건 저장, {len(results) - saved}건 실패")
+    return {
+        "results": [
+            {"index": index, "evaluation": evaluation, "error": error}
+            for index, (evaluation, error) in enumerate(results)
+        ],
+        "saved": saved,
+        "failed": len(results) - saved,
+    }
+
 @app.get("/api/evaluations/{account_id}", response_model=List[EvaluationResponse])
-async def get_evaluations(account_id: int, db: Session = Depends(get_db)):
+async def get_evaluations(account_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """
     특정 계정의 모든 평가를 가져옵니다.
     """
     try:
-        evaluations = get_evaluations_by_account(db, account_id)
-        return evaluations
+        evaluations = await crud_async.get_evaluations_by_account(db, account_id)
+        return _json_response(_evaluation_list_adapter, evaluations)
     except Exception as e:
         logger.error(f"평가 조회 오류: {e}")
         raise HTTPException(
@@ -357,12 +670,12 @@ async def get_evaluations(account_id: int, db: Session = Depends(get_db)):
         )
 
 @app.get("/api/evaluations/{account_id}/judge/{judge_id}", response_model=EvaluationResponse)
-async def get_evaluation_by_judge(account_id: int, judge_id: int, db: Session = Depends(get_db)):
+async def get_evaluation_by_judge(account_id: int, judge_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """
     특정 심사위원이 특정 계정에 대해 한 평가를 가져옵니다.
     """
     try:
-        evaluation = get_evaluation_by_judge_and_account(db, judge_id, account_id)
+        evaluation = await crud_async.get_evaluation_by_judge_and_account(db, judge_id, account_id)
         if not evaluation:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -379,18 +692,21 @@ async def get_evaluation_by_judge(account_id: int, judge_id: int, db: Session =
         )
 
 @app.get("/api/evaluations/aidea/{aidea_id}/judge/{judge_id}", response_model=EvaluationResponse)
-async def get_evaluation_by_judge_and_aidea_endpoint(aidea_id: int, judge_id: int, db: Session = Depends(get_db)):
+async def get_evaluation_by_judge_and_aidea_endpoint(aidea_id: int, judge_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """
     특정 심사위원이 특정 aidea에 대해 한 평가를 가져옵니다.
     """
-    try:
-        evaluation = get_evaluation_by_judge_and_aidea(db, judge_id, aidea_id)
+    async def build() -> bytes:
+        evaluation = await crud_async.get_evaluation_by_judge_and_aidea(db, judge_id, aidea_id)
         if not evaluation:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="해당 심사위원의 평가를 찾을 수 없습니다."
             )
-        return evaluation
+        return EvaluationResponse.model_validate(evaluation).model_dump_json().encode()
+
+    try:
+        return await _cached_json_response(("evaluation", aidea_id, judge_id), build)
     except HTTPException:
         raise
     except Exception as e:
@@ -400,32 +716,47 @@ async def get_evaluation_by_judge_and_aidea_endpoint(aidea_id: int, judge_id: in
             detail="심사위원 aidea 평가 조회 중 오류가 발생했습니다."
         )
 
-@app.post("/api/send-email")
-async def send_email(email_data: dict):
+@app.post("/api/send-email", response_model=EmailStatusResponse, status_code=status.HTTP_202_ACCEPTED)
+async def send_email(email_data: EmailRequest, request: Request, db: Session = Depends(get_db)):
     """
-    Knox email server로 메일 발송 요청을 프록시합니다.
+    메일을 발송 대기열(outbox)에 넣고 바로 응답합니다. 실제 발송과 재시도는 mailer가 백그라운드에서 처리합니다.
+    같은 message_id(또는 Idempotency-Key 헤더)로 다시 요청하면 새로 발송하지 않고 기존 메일의 상태를 돌려줍니다.
+    발송 결과는 GET /api/send-email/{message_id}로 확인합니다.
     """
+    recipients = [r.strip() for r in email_data.recipients if r and r.strip()]
+    if not recipients:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="받는 사람은 한 명 이상이어야 합니다.")
+    if not email_data.subject.strip():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="메일 제목은 필수입니다.")
+    message_id = email_data.message_id or request.headers.get("idempotency-key") or uuid.uuid4().hex
+
+    def enqueue(session: Session):
+        email, created = enqueue_email(session, message_id, recipients, email_data.subject, email_data.contents)
+        return EmailStatusResponse.model_validate(email), created
+
     try:
-        # Knox email server로 요청 전달
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "http://10.229.19.169:1111/knox_api",
-                json=email_data,
-                headers={"Content-Type": "application/json"},
-                timeout=30.0
-            )
-            
-            if response.status_code == 200:
-                return {"message": "메일 발송 성공", "data": response.json()}
-            else:
-                return {"message": "메일 발송 실패", "error": response.text}
-                
-    except Exception as e:
-        logger.error(f"메일 발송 오류: {e}")
+        email, created = await _run_write(db, enqueue)
+    except WriteQueueBusyError as e:
+        raise _service_busy(e)
+    except SQLAlchemyError as e:
+        logger.error(f"메일 대기열 저장 오류: {e}")
         raise HTTPException(
-            status_code=500,
-            detail=f"메일 발송 중 오류가 발생했습니다: {str(e)}"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="메일 발송 요청 중 오류가 발생했습니다."
         )
+    if created:
+        mailer.notify()
+    return email
+
+@app.get("/api/send-email/{message_id}", response_model=EmailStatusResponse)
+async def get_email_status(message_id: str, db: AsyncSession = Depends(get_async_read_db)):
+    """
+    메일 발송 상태(pending/sending/sent/failed)를 조회합니다.
+    """
+    email = await crud_async.get_email_by_message_id(db, message_id)
+    if not email:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 메일을 찾을 수 없습니다.")
+    return email
 
 # 관리자 API 엔드포인트들
 @app.post("/api/admin/login", response_model=AdminResponse)
@@ -442,18 +773,45 @@ async def admin_login(admin_data: AdminLogin):
     access_token = create_access_token(data={"sub": admin_data.username})
     return AdminResponse(message="로그인 성공", token=access_token)
 
+# 관리자 목록 공통 페이지네이션 파라미터
+MAX_PAGE_SIZE = 1000
+
+def _bad_list_request(error: ValueError) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+
 @app.get("/api/admin/accounts", response_model=AccountListResponse)
 async def get_all_accounts_admin(
-    db: Session = Depends(get_db),
+    department: Optional[str] = None,
+    team_name: Optional[str] = None,
+    has_aidea: Optional[bool] = None,
+    sort: str = "id",
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    view: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db),
     _: str = Depends(verify_token)
 ):
     """
-    등록된 모든 계정을 조회합니다. (관리자 전용)
+    등록된 계정을 조회합니다. (관리자 전용)
+    limit을 지정하면 next_cursor로 다음 페이지를 이어서 조회할 수 있습니다.
+    sort는 id, created_at 중 하나이며 앞에 "-"를 붙이면 내림차순입니다.
+    view=summary 또는 fields(쉼표 구분)를 지정하면 선택한 필드만 담은 평평한 행을 반환합니다.
     """
     try:
-        accounts = get_all_accounts(db)
-        total = len(accounts)
-        return AccountListResponse(accounts=accounts, total=total)
+        selected_fields = resolve_fields(view, fields)
+        accounts, total, next_cursor = await crud_async.list_accounts(
+            db, department=department, team_name=team_name, has_aidea=has_aidea,
+            sort=sort, cursor=cursor, limit=limit, fields=selected_fields
+        )
+        if selected_fields:
+            rows = account_field_rows(accounts, selected_fields)
+            return ORJSONResponse({"accounts": rows, "total": total, "next_cursor": next_cursor})
+        return _json_response(
+            _account_list_adapter, {"accounts": accounts, "total": total, "next_cursor": next_cursor}
+        )
+    except ValueError as e:
+        raise _bad_list_request(e)
     except Exception as e:
         logger.error(f"계정 조회 오류: {e}")
         raise HTTPException(
@@ -463,18 +821,34 @@ async def get_all_accounts_admin(
 
 @app.get("/api/admin/aideas", response_model=AccountListResponse)
 async def get_all_aideas_admin(
-    db: Session = Depends(get_db),
+    department: Optional[str] = None,
+    team_name: Optional[str] = None,
+    sort: str = "id",
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    view: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db),
     _: str = Depends(verify_token)
 ):
     """
-    등록된 모든 Aidea를 조회합니다. (관리자 전용)
+    Aidea를 제출한 계정을 조회합니다. (관리자 전용)
+    view/fields는 /api/admin/accounts와 같습니다.
     """
     try:
-        accounts = get_all_accounts(db)
-        # Aidea가 있는 계정만 필터링
-        accounts_with_aideas = [account for account in accounts if account.aideas]
-        total = len(accounts_with_aideas)
-        return AccountListResponse(accounts=accounts_with_aideas, total=total)
+        selected_fields = resolve_fields(view, fields)
+        accounts, total, next_cursor = await crud_async.list_accounts(
+            db, department=department, team_name=team_name, has_aidea=True,
+            sort=sort, cursor=cursor, limit=limit, fields=selected_fields
+        )
+        if selected_fields:
+            rows = account_field_rows(accounts, selected_fields)
+            return ORJSONResponse({"accounts": rows, "total": total, "next_cursor": next_cursor})
+        return _json_response(
+            _account_list_adapter, {"accounts": accounts, "total": total, "next_cursor": next_cursor}
+        )
+    except ValueError as e:
+        raise _bad_list_request(e)
     except Exception as e:
         logger.error(f"Aidea 조회 오류: {e}")
         raise HTTPException(
@@ -484,15 +858,33 @@ async def get_all_aideas_admin(
 
 @app.get("/api/admin/evaluations", response_model=List[EvaluationResponse])
 async def get_all_evaluations_admin(
-    db: Session = Depends(get_db),
+    judge_id: Optional[int] = None,
+    aidea_id: Optional[int] = None,
+    min_score: Optional[int] = None,
+    max_score: Optional[int] = None,
+    sort: str = "id",
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_read_db),
     _: str = Depends(verify_token)
 ):
     """
-    모든 심사 결과를 조회합니다. (관리자 전용)
+    심사 결과를 조회합니다. (관리자 전용)
+    응답 본문은 평가 목록이며, 전체 개수와 다음 페이지 커서는
+    X-Total-Count / X-Next-Cursor 헤더로 전달합니다.
+    sort는 id, created_at, total_score 중 하나입니다.
     """
     try:
-        evaluations = get_all_evaluations(db)
-        return evaluations
+        evaluations, total, next_cursor = await crud_async.list_evaluations(
+            db, judge_id=judge_id, aidea_id=aidea_id, min_score=min_score, max_score=max_score,
+            sort=sort, cursor=cursor, limit=limit
+        )
+        headers = {"X-Total-Count": str(total)}
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        return _json_response(_evaluation_list_adapter, evaluations, headers=headers)
+    except ValueError as e:
+        raise _bad_list_request(e)
     except Exception as e:
         logger.error(f"심사 결과 조회 오류: {e}")
         raise HTTPException(
@@ -502,16 +894,22 @@ async def get_all_evaluations_admin(
 
 @app.get("/api/admin/judges", response_model=JudgeListResponse)
 async def get_all_judges_admin(
-    db: Session = Depends(get_db),
+    sort: str = "id",
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_read_db),
     _: str = Depends(verify_token)
 ):
     """
-    모든 심사위원을 조회합니다. (관리자 전용)
+    심사위원을 조회합니다. (관리자 전용)
     """
     try:
-        judges = get_all_judges(db)
-        total = len(judges)
-        return JudgeListResponse(judges=judges, total=total)
+        judges, total, next_cursor = await crud_async.list_judges(db, sort=sort, cursor=cursor, limit=limit)
+        return _json_response(
+            _judge_list_adapter, {"judges": judges, "total": total, "next_cursor": next_cursor}
+        )
+    except ValueError as e:
+        raise _bad_list_request(e)
     except Exception as e:
         logger.error(f"심사위원 조회 오류: {e}")
         raise HTTPException(
@@ -519,10 +917,61 @@ async def get_all_judges_admin(
             detail="심사위원 조회 중 오류가 발생했습니다."
         )
 
+@app.get("/api/admin/rankings", response_model=RankingListResponse)
+async def get_rankings_admin(
+    tiebreak: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_read_db),
+    _: str = Depends(verify_token)
+):
+    """
+    평균 총점 기준 순위를 조회합니다. (관리자 전용)
+    tiebreak: 평균 총점이 같을 때 비교할 항목 순서 (쉼표 구분, 기본: effectiveness,feasibility,innovation)
+    """
+    try:
+        criteria = [c.strip() for c in tiebreak.split(",") if c.strip()] if tiebreak is not None else None
+        rankings = await crud_async.get_rankings(db, tiebreak=criteria, limit=limit)
+        return RankingListResponse(rankings=rankings, total=len(rankings))
+    except ValueError as e:
+        raise _bad_list_request(e)
+    except Exception as e:
+        logger.error(f"순위 조회 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="순위 조회 중 오류가 발생했습니다."
+        )
+
+@app.get("/api/admin/export/{entity}")
+async def export_admin(
+    entity: str,
+    format: str = "csv",
+    columns: Optional[str] = None,
+    db: Session = Depends(get_read_db),
+    _: str = Depends(verify_token)
+):
+    """
+    데이터를 CSV / NDJSON / XLSX 파일로 스트리밍 내보냅니다. (관리자 전용)
+    entity: accounts, team_members, aideas, evaluations, evaluation_details(평가 1건당 1행, 팀/프로젝트 포함)
+    columns: 내보낼 컬럼 (쉼표 구분, 생략 시 전체)
+    """
+    try:
+        selected_columns = resolve_columns(entity, columns)
+        body = stream_export(db, entity, selected_columns, format)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    filename = f"{entity}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{format}"
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
 @app.post("/api/admin/judges", response_model=JudgeResponse)
 async def create_judge_admin(
     judge_data: JudgeCreate,
     db: Session = Depends(get_db),
+    lookup_db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_token)
 ):
     """
@@ -547,25 +996,31 @@ async def create_judge_admin(
             )
         
         # 중복 확인
-        existing_judge = get_judge_by_judge_id(db, judge_data.judge_id)
+        existing_judge = await crud_async.get_judge_by_judge_id(lookup_db, judge_data.judge_id)
+        # bcrypt를 기다리는 동안 커넥션을 잡고 있지 않도록 조회 트랜잭션을 먼저 끝냄 (로그인 API와 동일)
+        await lookup_db.commit()
         if existing_judge:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="이미 존재하는 심사위원 ID입니다."
             )
         
-        judge = create_judge(
-            db=db,
+        hashed_password = await hasher.hash(judge_data.password.strip())
+        judge = await _run_write(db, lambda session: JudgeResponse.model_validate(create_judge(
+            db=session,
             judge_id=judge_data.judge_id.strip(),
             password=judge_data.password.strip(),
-            name=judge_data.name.strip()
-        )
+            name=judge_data.name.strip(),
+            hashed_password=hashed_password
+        )))
         
         logger.info(f"심사위원 생성 완료: {judge.name} ({judge.judge_id})")
         return judge
         
     except HTTPException:
         raise
+    except (HashingBusyError, WriteQueueBusyError) as e:
+        raise _service_busy(e)
     except Exception as e:
         logger.error(f"심사위원 생성 오류: {e}")
         raise HTTPException(
@@ -573,16 +1028,203 @@ async def create_judge_admin(
             detail="심사위원 생성 중 오류가 발생했습니다."
         )
 
-BUILD_DIR = (Path(__file__).parent / "../frontend/build").resolve()
-if not BUILD_DIR.exists():
-    raise RuntimeError(f"React build not found: {BUILD_DIR}\nRun `npm run build` in /frontend")
+# 한 번에 일괄 등록할 수 있는 최대 심사위원 수 (해시 작업량 상한)
+MAX_BULK_JUDGES = int(os.getenv("MAX_BULK_JUDGES", "1000"))
+
+async def _read_judge_rows(request: Request) -> List[dict]:
+    """요청 본문(JSON / CSV / multipart 파일)에서 심사위원 행 목록을 읽습니다."""
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise ValueError("업로드할 파일(file)이 필요합니다.")
+        return parse_judges(await upload.read(), detect_format(upload.filename, upload.content_type))
+    return parse_judges(await request.body(), detect_format(content_type=content_type or "application/json"))
+
+@app.post("/api/admin/judges/bulk", response_model=JudgeBulkResult)
+async def create_judges_bulk_admin(
+    request: Request,
+    db: Session = Depends(get_db),
+    lookup_db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(verify_token)
+):
+    """
+    CSV/JSON으로 여러 심사위원을 한 번에 생성합니다. (관리자 전용)
+    본문은 JSON 배열, {"judges": [...]}, text/csv, 또는 multipart 파일(file) 업로드를 받습니다.
+    필수값 누락, 중복 ID 같은 행 단위 오류는 errors로 돌려주고 나머지 행은 한 트랜잭션으로 등록합니다.
+    """
+    try:
+        rows = await _read_judge_rows(request)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if len(rows) > MAX_BULK_JUDGES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {MAX_BULK_JUDGES}명까지 등록할 수 있습니다."
+        )
+
+    valid, errors = validate_judges(rows)
+    # 이미 등록된 ID는 해시 전에 걸러 불필요한 bcrypt 작업을 줄임
+    existing = await crud_async.existing_judge_ids(lookup_db, [row["judge_id"] for row in valid])
+    errors += [row_error(row, "이미 존재하는 심사위원 ID입니다.") for row in valid if row["judge_id"] in existing]
+    valid = [row for row in valid if row["judge_id"] not in existing]
+    await lookup_db.commit()  # 해시하는 동안 커넥션을 잡고 있지 않도록 조회 트랜잭션을 먼저 끝냄
+
+    try:
+        hashes = await hasher.hash_many([row["password"] for row in valid])
+        new_rows = [{**row, "hashed_password": hashed} for row, hashed in zip(valid, hashes)]
+
+        def save(session):
+            judges, insert_errors = create_judges_bulk(session, new_rows)
+            return [JudgeResponse.model_validate(judge) for judge in judges], insert_errors
+
+        created, insert_errors = await _run_write(db, save)
+    except (HashingBusyError, WriteQueueBusyError) as e:
+        raise _service_busy(e)
+    except SQLAlchemyError as e:
+        logger.error(f"심사위원 일괄 생성 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="심사위원 일괄 생성 중 오류가 발생했습니다."
+        )
 
-# CRA 정적 리소스(/static/*) 서빙
-app.mount("/static", StaticFiles(directory=BUILD_DIR / "static"), name="static")
+    errors = sorted(errors + insert_errors, key=lambda error: error["row"])
+    logger.info(f"심사위원 일괄 생성 완료: {len(created)}명 생성, {len(errors)}건 오류")
+    return {"created": created, "errors": errors, "total": len(rows)}
+
+def _mail_job_response(job, progress: dict) -> MailJobResponse:
+    response = MailJobResponse.model_validate(job)
+    response.progress = progress
+    response.done = job.status != "expanding" and not (progress.get("pending") or progress.get("sending"))
+    return response
+
+@app.post("/api/admin/mail-jobs", status_code=status.HTTP_202_ACCEPTED)
+async def create_mail_job_admin(
+    job_data: MailJobCreate,
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_token)
+):
+    """
+    대상 팀 전체에게 보내는 단체 메일 작업을 만듭니다. (관리자 전용)
+    대상(audience)은 서버에서 고르며, 계정 본인과 팀원 Knox ID로 보냅니다.
+    템플릿을 채운 메일은 mailer가 batch 단위로 outbox에 넣고 초당 발송 수를 제한해 보냅니다.
+    dry_run이면 대상 수와 첫 메일 미리보기만 반환합니다. 진행 현황은 GET /api/admin/mail-jobs/{id}로 확인합니다.
+    """
+    if not job_data.name.strip():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="작업 이름은 필수입니다.")
+    if not job_data.subject.strip():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="메일 제목은 필수입니다.")
+    error = template_error(job_data.subject) or template_error(job_data.contents)
+    if error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
-@app.get("/{full_path:path}", include_in_schema=False)
-async def spa(full_path: str):
-    return FileResponse(BUILD_DIR / "index.html")
+    try:
+        if job_data.dry_run:
+            preview = await run_in_threadpool(
+                preview_mail_job, db, job_data.audience, job_data.subject, job_data.contents, MAIL_DOMAIN
+            )
+            return ORJSONResponse(MailJobPreview(**preview).model_dump(), status_code=status.HTTP_200_OK)
+        job = await _run_write(db, lambda session: _mail_job_response(create_mail_job(
+            session, job_data.name.strip(), job_data.audience, job_data.subject, job_data.contents
+        ), {}))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except WriteQueueBusyError as e:
+        raise _service_busy(e)
+    except SQLAlchemyError as e:
+        logger.error(f"단체 메일 작업 생성 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="단체 메일 작업 생성 중 오류가 발생했습니다."
+        )
+    logger.info(f"단체 메일 작업 생성: {job.name} (id={job.id}, 대상={job.audience})")
+    mailer.notify()
+    return job
+
+@app.get("/api/admin/mail-jobs", response_model=List[MailJobResponse])
+async def list_mail_jobs_admin(db: AsyncSession = Depends(get_async_read_db), _: str = Depends(verify_token)):
+    """
+    단체 메일 작업 목록과 작업별 발송 현황을 조회합니다. (관리자 전용)
+    """
+    jobs = await crud_async.list_mail_jobs(db)
+    progress = await crud_async.mail_job_progress(db, [job.id for job in jobs])
+    return [_mail_job_response(job, progress[job.id]) for job in jobs]
+
+@app.get("/api/admin/mail-jobs/{job_id}", response_model=MailJobResponse)
+async def get_mail_job_admin(job_id: int, db: AsyncSession = Depends(get_async_read_db), _: str = Depends(verify_token)):
+    """
+    단체 메일 작업의 발송 현황(상태별 메일 수)을 조회합니다. (관리자 전용)
+    """
+    job = await crud_async.get_mail_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 단체 메일 작업을 찾을 수 없습니다.")
+    return _mail_job_response(job, (await crud_async.mail_job_progress(db, [job.id]))[job.id])
+
+@app.post("/api/admin/mail-jobs/{job_id}/cancel", response_model=MailJobResponse)
+async def cancel_mail_job_admin(job_id: int, db: Session = Depends(get_db), _: str = Depends(verify_token)):
+    """
+    단체 메일 작업을 취소합니다. 아직 보내지 않은 메일은 보내지 않습니다. (관리자 전용)
+    """
+    def cancel(session: Session):
+        job = cancel_mail_job(session, job_id)
+        return job and _mail_job_response(job, mail_job_progress(session, [job.id])[job.id])
+
+    try:
+        job = await _run_write(db, cancel)
+    except WriteQueueBusyError as e:
+        raise _service_busy(e)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 단체 메일 작업을 찾을 수 없습니다.")
+    logger.info(f"단체 메일 작업 취소: {job.name} (id={job.id})")
+    return job
+
+@app.get("/api/admin/stats")
+async def get_stats_admin(_: str = Depends(verify_token)):
+    """
+    서버 내부 처리 현황(해시 대기열 등)을 조회합니다. (관리자 전용)
+    """
+    return {
+        "hashing": hasher.stats(),
+        "response_cache": response_cache.stats(),
+        "write_queue": {"enabled": WRITE_QUEUE_ENABLED, **write_queue.stats()},
+        "db_pools": pool_stats(),
+        "events": event_hub.stats(),
+        "mailer": mailer.stats(),
+    }
+
+# 설정하면 /api/metrics 조회 시 Authorization: Bearer <METRICS_TOKEN> 필요
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+@app.get("/api/metrics", include_in_schema=False)
+async def get_metrics(request: Request):
+    """
+    Prometheus 텍스트 형식 메트릭을 반환합니다.
+    """
+    if METRICS_TOKEN and request.headers.get("authorization") != f"Bearer {METRICS_TOKEN}":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="메트릭 토큰이 필요합니다.")
+
+    # 대기열/풀 상태는 조회 시점 값으로 갱신
+    metrics.HASH_QUEUE_DEPTH.set(hasher.queue_depth)
+    metrics.WRITE_QUEUE_PENDING.set(write_queue.pending)
+    metrics.EVENT_CLIENTS.set(event_hub.stats()["clients"])
+    for name, pool in pool_stats().items():
+        metrics.DB_POOL_IN_USE.set(pool["in_use"], name)
+        metrics.DB_POOL_WAITING.set(pool.get("waiting", 0), name)
+    return Response(content=metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+BUILD_DIR = (Path(__file__).parent / "../frontend/build").resolve()
+if (BUILD_DIR / "index.html").exists():
+    # CRA 정적 리소스(/static/*) 서빙
+    app.mount("/static", StaticFiles(directory=BUILD_DIR / "static"), name="static")
+
+    @app.get("/{full_path:path}", include_in_schema=False)
+    async def spa(full_path: str):
+        return FileResponse(BUILD_DIR / "index.html")
+else:
+    # API만 개발/테스트할 때는 프론트엔드 빌드 없이도 시작
+    logger.warning(f"React build not found: {BUILD_DIR} (API만 제공합니다. /frontend에서 `npm run build`를 실행하세요)")
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # /api/events 스트림이 열려 있어도 종료가 무한정 기다리지 않도록
+    uvicorn.run(app, host="0.0.0.0", port=8000, timeout_graceful_shutdown=5)
\ No newline at end of file
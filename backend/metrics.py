@@ -0,0 +1,241 @@
+"""
+Prometheus 텍스트 형식 메트릭 (/api/metrics)
+
+외부 라이브러리 없이 카운터/게이지/히스토그램을 메모리에 모아 두고 요청 시 텍스트로 내보냅니다.
+- MetricsMiddleware : 경로(라우트 템플릿)별 요청 수, 상태 코드, 지연 시간, 처리 중인 요청 수,
+                      요청 하나가 실행한 DB 쿼리 수와 DB 시간
+- instrument_engine : SQLAlchemy 엔진 이벤트로 쿼리 수/시간과 SQLite busy(locked) 오류 집계
+- BCRYPT_SECONDS    : hashing.HashingService가 해시/검증마다 기록
+- SERVICE_BUSY      : 대기열 포화로 503을 돌려준 횟수
+요청당 계측 비용은 수 µs 수준입니다. (bench/bench_metrics.py)
+METRICS_ENABLED=false면 미들웨어와 엔진 이벤트를 붙이지 않습니다.
+"""
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+# 요청 지연 시간(초) 버킷
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 요청당 DB 쿼리 수 버킷
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+# bcrypt 작업 시간(초) 버킷 (대기열 대기 포함)
+BCRYPT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}" for labels, value in items
+        ]
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨별 [버킷별 개수(누적 아님, 마지막은 +Inf), 합계, 개수]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def count(self, *labels: str) -> int:
+        state = self._values.get(labels)
+        return state[2] if state else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, ([*state[0]], state[1], state[2])) for labels, state in self._values.items())
+        lines = self._header()
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += bucket_count
+                le = 'le="+Inf"' if bound == "+Inf" else f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+REGISTRY: List[_Metric] = []
+
+HTTP_REQUESTS = Counter("http_requests_total", "처리한 HTTP 요청 수", ("method", "route", "status"))
+HTTP_LATENCY = Histogram("http_request_duration_seconds", "HTTP 요청 처리 시간(초)", ("method", "route"))
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수")
+HTTP_DB_QUERIES = Histogram(
+    "http_request_db_queries", "요청 하나가 실행한 DB 쿼리 수", ("method", "route"), buckets=QUERY_COUNT_BUCKETS
+)
+HTTP_DB_SECONDS = Histogram("http_request_db_seconds", "요청 하나의 DB 쿼리 실행 시간 합계(초)", ("method", "route"))
+DB_QUERIES = Counter("db_queries_total", "엔진별 실행한 DB 쿼리 수", ("engine",))
+DB_SECONDS = Counter("db_query_seconds_total", "엔진별 DB 쿼리 실행 시간 합계(초)", ("engine",))
+DB_ERRORS = Counter("db_errors_total", "엔진별 DB 오류 수", ("engine",))
+SQLITE_BUSY = Counter(
+    "sqlite_busy_errors_total", "busy timeout을 넘겨 'database is locked/busy'로 실패한 SQLite 쿼리 수", ("engine",)
+)
+BCRYPT_SECONDS = Histogram(
+    "bcrypt_duration_seconds", "bcrypt 작업 시간(초, 프로세스 풀 대기 포함)", ("op",), buckets=BCRYPT_BUCKETS
+)
+MAIL_DELIVERIES = Counter("mail_deliveries_total", "메일 발송 시도 결과 (sent/retried/failed)", ("outcome",))
+SERVICE_BUSY = Counter("service_busy_total", "대기열 포화로 503을 돌려준 횟수", ("reason",))
+HASH_QUEUE_DEPTH = Gauge("bcrypt_queue_depth", "bcrypt 대기열에 있는 작업 수")
+WRITE_QUEUE_PENDING = Gauge("write_queue_pending", "쓰기 대기열에 있는 작업 수")
+EVENT_CLIENTS = Gauge("event_stream_clients", "/api/events 실시간 알림 구독 연결 수")
+DB_POOL_IN_USE = Gauge("db_pool_connections_in_use", "엔진별 사용 중인 커넥션 수", ("engine",))
+DB_POOL_WAITING = Gauge("db_pool_waiting", "엔진별 커넥션을 기다리는 요청 수", ("engine",))
+
+def render() -> str:
+    """등록된 모든 메트릭을 Prometheus 텍스트 형식으로 만듭니다."""
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+# 현재 요청의 [DB 쿼리 수, DB 시간]. 요청 밖(쓰기 대기열 스레드 등)에서는 None
+_request_db: ContextVar[Optional[list]] = ContextVar("request_db", default=None)
+
+def instrument_engine(engine, name: str) -> None:
+    """엔진의 쿼리 수/시간, 오류, SQLite busy 오류를 집계합니다. (비동기 엔진은 sync_engine을 넘김)"""
+    is_sqlite = engine.url.get_backend_name() == "sqlite"
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_metrics_start", None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        DB_QUERIES.inc(name)
+        DB_SECONDS.inc(name, amount=elapsed)
+        stats = _request_db.get()
+        if stats is not None:
+            stats[0] += 1
+            stats[1] += elapsed
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        DB_ERRORS.inc(name)
+        message = str(exception_context.original_exception).lower()
+        if is_sqlite and ("database is locked" in message or "database is busy" in message):
+            SQLITE_BUSY.inc(name)
+
+class MetricsMiddleware:
+    """
+    요청 수/상태 코드/지연 시간과 요청당 DB 쿼리 수·시간을 라우트 템플릿(/api/aideas/{aidea_id})별로 기록합니다.
+    라우트에 매칭되지 않은 요청(404, 정적 파일)은 route="unmatched"로 모아 라벨 수가 늘지 않게 합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._route_paths: Dict[object, str] = {}
+
+    def _route(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            routes: Iterable = getattr(scope.get("app"), "routes", ())
+            path = next((route.path for route in routes if getattr(route, "endpoint", None) is endpoint), "unmatched")
+            self._route_paths[endpoint] = path
+        return path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        stats = [0, 0.0]
+        token = _request_db.set(stats)
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec()
+            _request_db.reset(token)
+            method, route = scope["method"], self._route(scope)
+            HTTP_REQUESTS.inc(method, route, str(status))
+            HTTP_LATENCY.observe(elapsed, method, route)
+            HTTP_DB_QUERIES.observe(stats[0], method, route)
+            HTTP_DB_SECONDS.observe(stats[1], method, route)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+DB 스키마 버전 확인 및 마이그레이션 (alembic)
+사용법:
+    python migrate.py          # 최신 버전(head)까지 마이그레이션
+    python migrate.py --check  # 현재 버전만 확인 (최신이 아니면 종료 코드 1)
+
+스키마 변경은 migrations/versions에 revision을 추가하고 SCHEMA_HEAD를 새 revision으로 바꿉니다.
+앱 시작 시에는 ensure_schema가 alembic_version 테이블을 한 번 조회해 SCHEMA_HEAD와 비교하므로,
+최신 DB에서는 스키마 반영(reflection)이나 alembic import 없이 바로 시작합니다.
+여러 워커가 동시에 시작해도 마이그레이션은 잠금을 잡은 한 프로세스만 수행합니다.
+"""
+import argparse
+import contextlib
+import logging
+import os
+import sys
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from database import engine as default_engine
+
+try:
+    import fcntl
+except ImportError:  # Windows: 파일 잠금 없이 진행 (단일 프로세스 개발 환경)
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# migrations/versions의 최신 revision (test_migrations에서 alembic head와 일치하는지 확인)
+SCHEMA_HEAD = "0007"
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# PostgreSQL advisory lock 키 (임의의 고정값)
+_PG_LOCK_KEY = 0x5A1DEA
+
+class SchemaOutdatedError(RuntimeError):
+    """DB 스키마가 최신이 아닌데 자동 마이그레이션이 꺼져 있을 때 발생합니다."""
+
+def current_revision(engine: Engine) -> Optional[str]:
+    """alembic_version에 기록된 현재 revision을 반환합니다. (버전 테이블이 없으면 None)"""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+    except (OperationalError, ProgrammingError):
+        return None
+
+def _alembic_config():
+    from alembic.config import Config
+
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    return config
+
+def upgrade(engine: Engine, revision: str = "head"):
+    """지정한 revision까지 마이그레이션합니다."""
+    from alembic import command
+
+    config = _alembic_config()
+    with engine.begin() as conn:
+        config.attributes["connection"] = conn
+        command.upgrade(config, revision)
+
+@contextlib.contextmanager
+def _migration_lock(engine: Engine):
+    """
+    프로세스 간 마이그레이션 잠금
+    SQLite는 DB 파일 옆의 잠금 파일(flock), PostgreSQL은 advisory lock을 사용합니다.
+    """
+    if engine.dialect.name == "postgresql":
+        with engine.connect() as conn:
+            conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _PG_LOCK_KEY})
+            try:
+                yield
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _PG_LOCK_KEY})
+        return
+
+    database = engine.url.database
+    if fcntl is None or not database or database == ":memory:":
+        yield
+        return
+    with open(f"{database}.migrate.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def ensure_schema(engine: Engine, auto_upgrade: bool = True) -> str:
+    """
+    DB 스키마가 SCHEMA_HEAD인지 확인하고, 아니면 잠금을 잡은 뒤 마이그레이션합니다.
+
+    Raises:
+        SchemaOutdatedError: 스키마가 최신이 아니고 auto_upgrade가 False인 경우
+    """
+    revision = current_revision(engine)
+    if revision == SCHEMA_HEAD:
+        return revision
+    if not auto_upgrade:
+        raise SchemaOutdatedError(
+            f"DB 스키마가 최신이 아닙니다: 현재 {revision}, 필요 {SCHEMA_HEAD} (python migrate.py로 마이그레이션하세요)"
+        )
+
+    with _migration_lock(engine):
+        # 잠금을 기다리는 동안 다른 워커가 이미 마이그레이션했을 수 있음
+        revision = current_revision(engine)
+        if revision != SCHEMA_HEAD:
+            logger.info(f"DB 마이그레이션: {revision} → {SCHEMA_HEAD}")
+            upgrade(engine)
+    return SCHEMA_HEAD
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 스키마 마이그레이션")
+    parser.add_argument("--check", action="store_true", help="현재 버전만 확인 (최신이 아니면 종료 코드 1)")
+    args = parser.parse_args()
+
+    revision = current_revision(default_engine)
+    if args.check:
+        print(f"현재 스키마 버전: {revision} (최신: {SCHEMA_HEAD})")
+        sys.exit(0 if revision == SCHEMA_HEAD else 1)
+
+    ensure_schema(default_engine)
+    print(f"✅ 스키마 버전: {SCHEMA_HEAD}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Alembic 실행 환경
+
+migrate.upgrade()처럼 호출자가 연결을 넘기면(config.attributes["connection"]) 그 연결에서 실행하고,
+`alembic upgrade head` 명령으로 실행하면 database 모듈의 엔진을 사용합니다.
+"""
+from alembic import context
+
+from models import Base
+
+config = context.config
+target_metadata = Base.metadata
+
+def run_migrations(connection):
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite는 ALTER TABLE이 제한적이므로 테이블 재생성 방식(batch)으로 변경
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_offline():
+    from database import SQLALCHEMY_DATABASE_URL
+
+    context.configure(url=SQLALCHEMY_DATABASE_URL, target_metadata=target_metadata, literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online():
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_migrations(connection)
+        return
+
+    from database import engine
+
+    with engine.connect() as connection:
+        run_migrations(connection)
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,99 @@
+"""baseline: 계정/팀원/Aidea/심사위원/평가 테이블
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-09-01
+
+alembic 도입 전 create_all로 만든 DB도 그대로 올릴 수 있도록, 이미 있는 테이블은 건너뛰고
+crud.add_benefit_column으로 수동 추가하던 aideas.benefit 컬럼은 없을 때만 추가합니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def _timestamps(updated=True):
+    columns = [sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now())]
+    if updated:
+        columns.append(sa.Column("updated_at", sa.DateTime(timezone=True)))
+    return columns
+
+def upgrade():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "accounts" not in existing:
+        op.create_table(
+            "accounts",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("knox_id", sa.String, nullable=False),
+            sa.Column("hashed_password", sa.String, nullable=False),
+            sa.Column("name", sa.String),
+            sa.Column("team_name", sa.String),
+            sa.Column("department", sa.String),
+            *_timestamps(),
+        )
+        op.create_index("ix_accounts_id", "accounts", ["id"])
+        op.create_index("ix_accounts_knox_id", "accounts", ["knox_id"], unique=True)
+
+    if "team_members" not in existing:
+        op.create_table(
+            "team_members",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("account_id", sa.Integer, sa.ForeignKey("accounts.id"), nullable=False),
+            sa.Column("name", sa.String, nullable=False),
+            sa.Column("knox_id", sa.String, nullable=False),
+            *_timestamps(updated=False),
+        )
+        op.create_index("ix_team_members_id", "team_members", ["id"])
+
+    if "aideas" not in existing:
+        op.create_table(
+            "aideas",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("account_id", sa.Integer, sa.ForeignKey("accounts.id"), nullable=False),
+            sa.Column("project", sa.String, nullable=False),
+            sa.Column("target_user", sa.Text),
+            sa.Column("problem", sa.Text),
+            sa.Column("solution", sa.Text),
+            sa.Column("data_sources", sa.Text),
+            sa.Column("scenario", sa.Text),
+            sa.Column("workflow", sa.Text),
+            sa.Column("benefit", sa.Text),
+            *_timestamps(),
+        )
+        op.create_index("ix_aideas_id", "aideas", ["id"])
+    elif "benefit" not in {c["name"] for c in sa.inspect(op.get_bind()).get_columns("aideas")}:
+        op.add_column("aideas", sa.Column("benefit", sa.Text))
+
+    if "judges" not in existing:
+        op.create_table(
+            "judges",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("judge_id", sa.String, nullable=False),
+            sa.Column("hashed_password", sa.String, nullable=False),
+            sa.Column("name", sa.String, nullable=False),
+            *_timestamps(),
+        )
+        op.create_index("ix_judges_id", "judges", ["id"])
+        op.create_index("ix_judges_judge_id", "judges", ["judge_id"], unique=True)
+
+    if "evaluations" not in existing:
+        op.create_table(
+            "evaluations",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("aidea_id", sa.Integer, sa.ForeignKey("aideas.id"), nullable=False),
+            sa.Column("judge_id", sa.Integer, sa.ForeignKey("judges.id"), nullable=False),
+            sa.Column("innovation_score", sa.Integer, nullable=False),
+            sa.Column("feasibility_score", sa.Integer, nullable=False),
+            sa.Column("effectiveness_score", sa.Integer, nullable=False),
+            sa.Column("total_score", sa.Integer, nullable=False),
+            *_timestamps(),
+        )
+        op.create_index("ix_evaluations_id", "evaluations", ["id"])
+
+def downgrade():
+    for table in ("evaluations", "judges", "aideas", "team_members", "accounts"):
+        op.drop_table(table)
@@ -0,0 +1,38 @@
+"""aidea별 평가 점수 집계 테이블
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-09-15
+
+테이블이 없을 때만 만들고, 새로 만든 경우 기존 평가로 집계를 채웁니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if "aidea_score_summary" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "aidea_score_summary",
+        sa.Column("aidea_id", sa.Integer, sa.ForeignKey("aideas.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("evaluation_count", sa.Integer, nullable=False),
+        sa.Column("innovation_sum", sa.Integer, nullable=False),
+        sa.Column("feasibility_sum", sa.Integer, nullable=False),
+        sa.Column("effectiveness_sum", sa.Integer, nullable=False),
+        sa.Column("total_sum", sa.Integer, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.execute(
+        "INSERT INTO aidea_score_summary "
+        "(aidea_id, evaluation_count, innovation_sum, feasibility_sum, effectiveness_sum, total_sum) "
+        "SELECT aidea_id, count(id), sum(innovation_score), sum(feasibility_score), sum(effectiveness_score), sum(total_score) "
+        "FROM evaluations GROUP BY aidea_id"
+    )
+
+def downgrade():
+    op.drop_table("aidea_score_summary")
@@ -0,0 +1,60 @@
+"""외래 키 조회 인덱스와 평가 (aidea_id, judge_id) 유니크 제약
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-10-01
+
+유니크 제약을 만들기 전에 같은 (aidea_id, judge_id)의 중복 평가는 가장 최근 행(id가 가장 큰 행)만 남기고
+삭제하며, 삭제가 있었다면 점수 집계를 다시 계산합니다. 이미 있는 인덱스/제약은 건너뜁니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_team_members_account_id", "team_members", ["account_id"]),
+    ("ix_aideas_account_id", "aideas", ["account_id"]),
+    ("ix_evaluations_judge_id", "evaluations", ["judge_id"]),
+]
+
+def _has_unique(inspector, table, columns):
+    if any(c["column_names"] == columns for c in inspector.get_unique_constraints(table)):
+        return True
+    return any(i["unique"] and i["column_names"] == columns for i in inspector.get_indexes(table))
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for name, table, columns in INDEXES:
+        if not any(i["column_names"] == columns for i in inspector.get_indexes(table)):
+            op.create_index(name, table, columns)
+
+    if _has_unique(inspector, "evaluations", ["aidea_id", "judge_id"]):
+        return
+
+    removed = bind.execute(sa.text(
+        "DELETE FROM evaluations WHERE id NOT IN "
+        "(SELECT max(id) FROM evaluations GROUP BY aidea_id, judge_id)"
+    )).rowcount
+    if removed:
+        op.execute("DELETE FROM aidea_score_summary")
+        op.execute(
+            "INSERT INTO aidea_score_summary "
+            "(aidea_id, evaluation_count, innovation_sum, feasibility_sum, effectiveness_sum, total_sum) "
+            "SELECT aidea_id, count(id), sum(innovation_score), sum(feasibility_score), sum(effectiveness_score), sum(total_score) "
+            "FROM evaluations GROUP BY aidea_id"
+        )
+    # SQLite는 제약 추가를 지원하지 않으므로 batch 모드가 테이블을 다시 만들어 적용
+    with op.batch_alter_table("evaluations") as batch:
+        batch.create_unique_constraint("uq_evaluations_aidea_judge", ["aidea_id", "judge_id"])
+
+def downgrade():
+    with op.batch_alter_table("evaluations") as batch:
+        batch.drop_constraint("uq_evaluations_aidea_judge", type_="unique")
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,28 @@
+"""Aidea/팀원 낙관적 잠금 버전 컬럼
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-10-10
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+TABLES = ("aideas", "team_members")
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    for table in TABLES:
+        if "version" in {c["name"] for c in inspector.get_columns(table)}:
+            continue
+        with op.batch_alter_table(table) as batch:
+            batch.add_column(sa.Column("version", sa.Integer, nullable=False, server_default="1"))
+
+def downgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column("version")
@@ -0,0 +1,35 @@
+"""메일 발송 대기열(outbox) 테이블
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-10-20
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if "email_outbox" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("message_id", sa.String, nullable=False, unique=True),
+        sa.Column("recipients", sa.JSON, nullable=False),
+        sa.Column("subject", sa.String, nullable=False),
+        sa.Column("contents", sa.Text, nullable=False),
+        sa.Column("status", sa.String, nullable=False),
+        sa.Column("attempts", sa.Integer, nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_error", sa.Text, nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_email_outbox_status_next_attempt", "email_outbox", ["status", "next_attempt_at"])
+
+def downgrade():
+    op.drop_table("email_outbox")
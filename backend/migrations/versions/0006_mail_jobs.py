@@ -0,0 +1,43 @@
+"""관리자 단체 메일 작업 테이블, outbox의 작업 id 컬럼
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-10-24
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if "mail_jobs" not in inspector.get_table_names():
+        op.create_table(
+            "mail_jobs",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("name", sa.String, nullable=False),
+            sa.Column("audience", sa.String, nullable=False),
+            sa.Column("subject_template", sa.String, nullable=False),
+            sa.Column("contents_template", sa.Text, nullable=False),
+            sa.Column("status", sa.String, nullable=False),
+            sa.Column("last_account_id", sa.Integer, nullable=False),
+            sa.Column("total", sa.Integer, nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("expanded_at", sa.DateTime(timezone=True), nullable=True),
+        )
+    if "job_id" in {c["name"] for c in inspector.get_columns("email_outbox")}:
+        return
+    with op.batch_alter_table("email_outbox") as batch:
+        batch.add_column(sa.Column("job_id", sa.Integer, nullable=True))
+        batch.create_foreign_key("fk_email_outbox_job_id", "mail_jobs", ["job_id"], ["id"])
+        batch.create_index("ix_email_outbox_job_status", ["job_id", "status"])
+
+def downgrade():
+    with op.batch_alter_table("email_outbox") as batch:
+        batch.drop_index("ix_email_outbox_job_status")
+        batch.drop_constraint("fk_email_outbox_job_id", type_="foreignkey")
+        batch.drop_column("job_id")
+    op.drop_table("mail_jobs")
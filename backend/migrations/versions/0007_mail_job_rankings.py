@@ -0,0 +1,23 @@
+"""단체 메일 작업의 순위 스냅샷 컬럼
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-10-27
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if "rankings" in {c["name"] for c in sa.inspect(op.get_bind()).get_columns("mail_jobs")}:
+        return
+    with op.batch_alter_table("mail_jobs") as batch:
+        batch.add_column(sa.Column("rankings", sa.JSON, nullable=True))
+
+def downgrade():
+    with op.batch_alter_table("mail_jobs") as batch:
+        batch.drop_column("rankings")
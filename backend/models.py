@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index, JSON, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from passlib.hash import bcrypt
@@ -26,18 +26,21 @@ class TeamMember(Base):
     __tablename__ = "team_members"
 
     id = Column(Integer, primary_key=True, index=True)
-    account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)  # Foreign key linking team member to their Account
+    account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False, index=True)  # Foreign key linking team member to their Account
     name = Column(String, nullable=False)  # 팀원 이름
     knox_id = Column(String, nullable=False)  # 팀원 Knox ID
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    version = Column(Integer, nullable=False, server_default="1")  # 낙관적 잠금 버전 (수정할 때마다 증가)
 
     account = relationship("Account", back_populates="team_members")
 
+    __mapper_args__ = {"version_id_col": version}
+
 class Aidea(Base):
     __tablename__ = "aideas"
 
     id = Column(Integer, primary_key=True, index=True)
-    account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
+    account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False, index=True)
     project = Column(String, nullable=False)  # 프로젝트 이름
     target_user = Column(Text, nullable=True)  # 주 사용자
     problem = Column(Text, nullable=True)  # 문제 정의
@@ -48,9 +51,13 @@ class Aidea(Base):
     benefit = Column(Text, nullable=True)  # 기대효과
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    version = Column(Integer, nullable=False, server_default="1")  # 낙관적 잠금 버전 (수정할 때마다 증가)
 
     account = relationship("Account", back_populates="aideas")
     evaluations = relationship("Evaluation", back_populates="aidea", cascade="all, delete-orphan")
+    score_summary = relationship("AideaScoreSummary", back_populates="aidea", uselist=False, cascade="all, delete-orphan")
+
+    __mapper_args__ = {"version_id_col": version}
 
 class Judge(Base):
     __tablename__ = "judges"
@@ -69,6 +76,11 @@ class Judge(Base):
 
 class Evaluation(Base):
     __tablename__ = "evaluations"
+    __table_args__ = (
+        # 심사위원은 aidea당 하나의 평가만 가짐 (aidea_id로 시작하는 조회에도 사용)
+        UniqueConstraint("aidea_id", "judge_id", name="uq_evaluations_aidea_judge"),
+        Index("ix_evaluations_judge_id", "judge_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     aidea_id = Column(Integer, ForeignKey("aideas.id"), nullable=False)
@@ -82,3 +94,60 @@ class Evaluation(Base):
 
     aidea = relationship("Aidea", back_populates="evaluations")
     judge = relationship("Judge", back_populates="evaluations")
+
+class AideaScoreSummary(Base):
+    """aidea별 평가 점수 합계/개수 (crud.create_evaluation에서 같은 트랜잭션으로 갱신)"""
+    __tablename__ = "aidea_score_summary"
+
+    aidea_id = Column(Integer, ForeignKey("aideas.id", ondelete="CASCADE"), primary_key=True)
+    evaluation_count = Column(Integer, nullable=False, default=0)  # 평가 수
+    innovation_sum = Column(Integer, nullable=False, default=0)  # 아이디어 혁신성 점수 합계
+    feasibility_sum = Column(Integer, nullable=False, default=0)  # 기술 실현 가능성 점수 합계
+    effectiveness_sum = Column(Integer, nullable=False, default=0)  # 업무 효과성 점수 합계
+    total_sum = Column(Integer, nullable=False, default=0)  # 총점 합계
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    aidea = relationship("Aidea", back_populates="score_summary")
+
+class MailJob(Base):
+    """
+    관리자 단체 메일 작업 (심사 결과 안내, 미제출 팀 알림 등)
+    mailer가 대상 계정을 id 순으로 batch씩 읽어 템플릿을 채운 메일을 email_outbox에 넣습니다.
+    """
+    __tablename__ = "mail_jobs"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)  # 작업 이름 (관리 화면 표시용)
+    audience = Column(String, nullable=False)  # 대상: all / submitted / not_submitted / ranked
+    subject_template = Column(String, nullable=False)
+    contents_template = Column(Text, nullable=False)
+    status = Column(String, nullable=False, default="expanding")  # expanding(outbox 생성 중) / queued / cancelled
+    last_account_id = Column(Integer, nullable=False, default=0)  # outbox 생성을 마친 마지막 계정 id (재시작 시 이어서 진행)
+    total = Column(Integer, nullable=False, default=0)  # outbox에 넣은 메일 수
+    # 템플릿이 순위 항목을 쓰면 작업을 만들 때의 순위 {계정 id: {rank, total_avg, evaluation_count}} (batch마다 같은 순위로 채움)
+    rankings = Column(JSON, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expanded_at = Column(DateTime(timezone=True), nullable=True)
+
+class EmailOutbox(Base):
+    """발송 대기 메일 (mailer.Mailer가 꺼내서 메일 서버로 전달)"""
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # 발송할 메일 조회: status IN (pending, sending) AND next_attempt_at <= now
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+        # 단체 메일 진행 현황: job_id별 status 집계
+        Index("ix_email_outbox_job_status", "job_id", "status"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    message_id = Column(String, unique=True, nullable=False)  # 중복 요청 방지용 ID (같은 ID는 한 번만 발송)
+    recipients = Column(JSON, nullable=False)  # 받는 사람 메일 주소 목록
+    subject = Column(String, nullable=False)
+    contents = Column(Text, nullable=False)
+    status = Column(String, nullable=False, default="pending")  # pending / sending / sent / failed / cancelled
+    attempts = Column(Integer, nullable=False, default=0)  # 발송 시도 횟수
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False)  # 다음 시도 시각 (sending이면 점유 만료 시각)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    job_id = Column(Integer, ForeignKey("mail_jobs.id"), nullable=True)  # 단체 메일 작업 (개별 발송은 NULL)
@@ -0,0 +1,93 @@
+"""
+관리자 목록 API의 keyset(커서) 페이지네이션 도구
+
+OFFSET 방식은 뒤 페이지로 갈수록 앞의 행을 모두 건너뛰어야 하므로,
+마지막 행의 (정렬값, id)를 커서로 넘겨 "그 다음 행부터" 조회합니다.
+커서는 클라이언트에게 불투명한 base64 문자열입니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import String, and_, or_, type_coerce
+from sqlalchemy.orm import Query
+
+class InvalidCursorError(ValueError):
+    """커서 문자열을 해석할 수 없을 때 발생합니다."""
+
+def parse_sort(sort: str, allowed: Dict[str, Any]) -> Tuple[Any, bool]:
+    """
+    "created_at" / "-created_at" 형태의 정렬 파라미터를 (컬럼, 내림차순 여부)로 변환합니다.
+    """
+    descending = sort.startswith("-")
+    key = sort[1:] if descending else sort
+    if key not in allowed:
+        raise ValueError(f"지원하지 않는 정렬 기준입니다: {key} (가능: {', '.join(allowed)})")
+    return allowed[key], descending
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    if isinstance(sort_value, datetime):
+        payload = {"t": "dt", "v": sort_value.isoformat(), "id": row_id}
+    else:
+        payload = {"v": sort_value, "id": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value = payload["v"]
+        if payload.get("t") == "dt":
+            value = datetime.fromisoformat(value)
+        return value, int(payload["id"])
+    except Exception:
+        raise InvalidCursorError("잘못된 커서입니다.")
+
+def _comparable(column, value, dialect_name: str):
+    # SQLite는 DateTime을 문자열로 저장하므로 바인딩 시 포맷이 달라지지 않도록 문자열로 비교
+    # (server_default의 CURRENT_TIMESTAMP 형식 "YYYY-MM-DD HH:MM:SS"와 str(datetime)이 일치)
+    if isinstance(value, datetime) and dialect_name == "sqlite":
+        return type_coerce(column, String), str(value)
+    return column, value
+
+def paginate(
+    query: Query,
+    sort_column,
+    id_column,
+    descending: bool = False,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    (정렬 컬럼, id) 기준 keyset 페이지네이션을 적용합니다.
+    limit이 없으면 커서 이후의 모든 행을 반환합니다.
+
+    Returns:
+        (행 목록, 다음 페이지 커서 또는 None)
+    """
+    if cursor:
+        value, last_id = decode_cursor(cursor)
+        column, value = _comparable(sort_column, value, query.session.get_bind().dialect.name)
+        if descending:
+            condition = or_(column < value, and_(column == value, id_column < last_id))
+        else:
+            condition = or_(column > value, and_(column == value, id_column > last_id))
+        query = query.filter(condition)
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    if limit is None:
+        return query.all(), None
+
+    # 다음 페이지 존재 여부를 알기 위해 한 행 더 조회
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
@@ -0,0 +1,193 @@
+"""
+SQL 쿼리 프로파일러 (N+1 감지, 느린 쿼리 로그)
+
+QUERY_PROFILER=true일 때만 동작합니다. (운영 기본값은 꺼짐)
+- 요청마다 실행한 SQL을 지문(fingerprint: 리터럴/바인드 값/IN 목록 길이를 정규화한 문장)별로
+  횟수와 시간을 모으고, 같은 지문이 N_PLUS_ONE_THRESHOLD번 이상 반복되면 N+1로 경고합니다.
+  응답에는 Server-Timing(db;dur=..;desc="N queries") 헤더를 붙입니다.
+- SLOW_QUERY_MS를 넘긴 쿼리는 EXPLAIN QUERY PLAN(PostgreSQL은 EXPLAIN) 결과와 함께
+  slow_query 로거로 남깁니다. SLOW_QUERY_LOG에 파일 경로를 주면 JSON lines로 기록합니다.
+테스트에서는 profile_queries()로 직접 구간을 감싸거나 conftest의 query_budget 픽스처를 사용합니다.
+"""
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+
+QUERY_PROFILER_ENABLED = os.getenv("QUERY_PROFILER", "false").lower() == "true"
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "100"))
+SLOW_QUERY_LOG = os.getenv("SLOW_QUERY_LOG")
+# 한 요청에서 같은 지문이 이 횟수 이상 실행되면 N+1로 봄
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "3"))
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("slow_query")
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_NAMED_PARAM = re.compile(r"%\(\w+\)s|\$\d+|:\w+")
+# IN (?, ?, ?) / VALUES (?, ?), (?, ?) 처럼 길이만 다른 목록은 하나로
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*")
+
+def fingerprint(statement: str) -> str:
+    """리터럴과 바인드 값을 ?로 바꾸고 공백을 정리해 같은 모양의 쿼리를 하나로 묶습니다."""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING.sub("?", normalized)
+    normalized = _NAMED_PARAM.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    return _PARAM_LIST.sub("(?+)", normalized)
+
+class QueryProfile:
+    """한 구간(요청, 테스트 블록)에서 실행된 쿼리 기록"""
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.queries: List[dict] = []
+
+    def record(self, statement: str, seconds: float, engine: str) -> None:
+        self.queries.append({"fingerprint": fingerprint(statement), "ms": seconds * 1000, "engine": engine})
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(query["ms"] for query in self.queries)
+
+    def by_fingerprint(self) -> "OrderedDict[str, dict]":
+        """지문별 실행 횟수와 총 시간 (처음 실행된 순서)"""
+        groups: "OrderedDict[str, dict]" = OrderedDict()
+        for query in self.queries:
+            group = groups.setdefault(query["fingerprint"], {"count": 0, "total_ms": 0.0})
+            group["count"] += 1
+            group["total_ms"] += query["ms"]
+        return groups
+
+    def repeated(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> Dict[str, int]:
+        """threshold번 이상 반복된 지문(N+1 의심)과 횟수"""
+        return {fp: group["count"] for fp, group in self.by_fingerprint().items() if group["count"] >= threshold}
+
+    def summary(self) -> str:
+        lines = [f"{self.label or 'profile'}: 쿼리 {self.count}개, {self.total_ms:.2f}ms"]
+        for fp, group in self.by_fingerprint().items():
+            lines.append(f"  {group['count']:>4}x {group['total_ms']:8.2f}ms  {fp[:200]}")
+        return "\n".join(lines)
+
+_current_profile: ContextVar[Optional[QueryProfile]] = ContextVar("query_profile", default=None)
+
+@contextmanager
+def profile_queries(label: str = ""):
+    """with 블록 안에서(같은 컨텍스트의 스레드풀 작업 포함) 실행된 쿼리를 모읍니다."""
+    profile = QueryProfile(label)
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+def _explain(conn, statement: str, parameters) -> List[str]:
+    """같은 연결에서 실행 계획을 조회합니다. (실패하면 오류 메시지를 돌려줌)"""
+    dialect = conn.dialect.name
+    prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        rows = cursor.fetchall()
+    except Exception as e:
+        return [f"EXPLAIN 실패: {e}"]
+    finally:
+        cursor.close()
+    # SQLite: (id, parent, notused, detail) / PostgreSQL: (QUERY PLAN,)
+    return [str(row[-1]) for row in rows]
+
+def _log_slow_query(conn, statement: str, parameters, seconds: float, engine: str, executemany: bool) -> None:
+    explainable = not executemany and statement.lstrip()[:6].upper() in ("SELECT", "UPDATE", "DELETE", "WITH")
+    profile = _current_profile.get()
+    entry = {
+        "at": datetime.now().isoformat(timespec="milliseconds"),
+        "ms": round(seconds * 1000, 3),
+        "engine": engine,
+        "request": profile.label if profile else None,
+        "fingerprint": fingerprint(statement),
+        # 바인드 값에는 비밀번호 해시 등이 들어 있을 수 있어 개수만 기록
+        "parameters": len(parameters) if hasattr(parameters, "__len__") else None,
+        "plan": _explain(conn, statement, parameters) if explainable else [],
+    }
+    slow_query_logger.warning(json.dumps(entry, ensure_ascii=False))
+
+_attached = set()
+
+def attach_profiler(engine, name: str, slow_query_ms: Optional[float] = None) -> None:
+    """
+    엔진에 프로파일러 이벤트를 붙입니다. (같은 엔진에 여러 번 호출해도 한 번만 붙음)
+    비동기 엔진은 sync_engine을 넘깁니다. slow_query_ms가 None이면 SLOW_QUERY_MS를 사용합니다.
+    """
+    if id(engine) in _attached:
+        return
+    _attached.add(id(engine))
+    threshold = (SLOW_QUERY_MS if slow_query_ms is None else slow_query_ms) / 1000
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._profiler_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_profiler_start", None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.record(statement, elapsed, name)
+        if elapsed >= threshold:
+            _log_slow_query(conn, statement, parameters, elapsed, name, executemany)
+
+def configure_slow_query_log(path: Optional[str] = SLOW_QUERY_LOG) -> None:
+    """SLOW_QUERY_LOG 파일로 느린 쿼리를 JSON lines로 남깁니다. (경로가 없으면 기본 로깅 설정을 따름)"""
+    if not path:
+        return
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    slow_query_logger.addHandler(handler)
+    slow_query_logger.setLevel(logging.WARNING)
+    slow_query_logger.propagate = False
+
+class QueryProfilerMiddleware:
+    """
+    요청마다 쿼리를 모아 Server-Timing 헤더를 붙이고, N+1 의심 패턴을 경고 로그로 남깁니다.
+    스트리밍 응답은 헤더를 보낸 뒤에도 쿼리가 이어지므로 헤더에는 그 시점까지의 값이 들어갑니다.
+    """
+
+    def __init__(self, app, threshold: int = N_PLUS_ONE_THRESHOLD):
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries(f"{scope['method']} {scope['path']}") as profile:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    timing = f'db;dur={profile.total_ms:.2f};desc="{profile.count} queries"'
+                    message["headers"] = list(message.get("headers", [])) + [(b"server-timing", timing.encode())]
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        repeated = profile.repeated(self.threshold)
+        if repeated:
+            logger.warning("N+1 의심 쿼리 (%s):\n%s", profile.label, profile.summary())
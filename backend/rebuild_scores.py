@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+aidea_score_summary 집계 테이블을 검증/재구성하는 스크립트
+사용법:
+    python rebuild_scores.py           # 전체 재집계 결과와 비교만 수행 (불일치 시 종료 코드 1)
+    python rebuild_scores.py --rebuild # 전체 재집계 결과로 집계 테이블을 다시 생성
+"""
+
+import argparse
+import sys
+
+from database import get_db, engine
+from migrate import ensure_schema
+from crud import verify_score_summaries, rebuild_score_summaries
+
+def main():
+    parser = argparse.ArgumentParser(description="평가 점수 집계 테이블 검증/재구성")
+    parser.add_argument("--rebuild", action="store_true", help="집계 테이블을 전체 재집계 결과로 다시 생성")
+    args = parser.parse_args()
+
+    ensure_schema(engine)
+    db = next(get_db())
+
+    try:
+        if args.rebuild:
+            count = rebuild_score_summaries(db)
+            print(f"✅ 집계 테이블 재구성 완료: aidea {count}건")
+
+        mismatches = verify_score_summaries(db)
+        if mismatches:
+            print(f"❌ 집계 불일치 {len(mismatches)}건 (평가 수, 혁신성, 실현 가능성, 효과성, 총점)")
+            for item in mismatches:
+                print(f"  aidea_id={item['aidea_id']}: 기대값={item['expected']} 실제값={item['actual']}")
+            sys.exit(1)
+        print("✅ 집계 테이블이 전체 재집계 결과와 일치합니다.")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -49,6 +49,25 @@ class AideaUpdate(BaseModel):
     workflow: Optional[str] = None
     benefit: Optional[str] = None
 
+class AideaPatch(AideaUpdate):
+    """자동 저장용 부분 수정: 보낸 필드만 반영"""
+    account_knox_id: str  # 소유 계정 확인용
+    version: Optional[int] = None  # 마지막으로 받은 버전 (지정하면 다른 곳에서 먼저 저장된 경우 409)
+
+class TeamMemberPatch(BaseModel):
+    account_knox_id: str
+    version: Optional[int] = None
+    name: Optional[str] = None
+    knox_id: Optional[str] = None
+
+class VersionedResponse(BaseModel):
+    """부분 수정 결과: 본문을 다시 보내지 않고 새 버전만 반환"""
+    id: int
+    version: int
+
+    class Config:
+        from_attributes = True
+
 class AideaResponse(BaseModel):
     id: int
     account_id: int
@@ -61,15 +80,21 @@ class AideaResponse(BaseModel):
     workflow: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
+    version: Optional[int] = None  # 낙관적 잠금 버전 (PATCH 시 함께 전송)
 
     class Config:
         from_attributes = True
 
+class AideaDetailResponse(AideaResponse):
+    """목록에서 빠지는 긴 텍스트까지 모두 포함한 Aidea 상세"""
+    benefit: Optional[str] = None
+
 class TeamMemberResponse(BaseModel):
     id: int
     name: str
     knox_id: str
     created_at: datetime
+    version: Optional[int] = None
 
     class Config:
         from_attributes = True
@@ -100,6 +125,7 @@ class AdminResponse(BaseModel):
 class AccountListResponse(BaseModel):
     accounts: List[AccountResponse]
     total: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
 # Judge 스키마
 class JudgeCreate(BaseModel):
@@ -121,9 +147,20 @@ class JudgeResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class JudgeBulkError(BaseModel):
+    row: int  # 파일 내 위치 (1부터)
+    judge_id: Optional[str] = None
+    error: str
+
+class JudgeBulkResult(BaseModel):
+    created: List[JudgeResponse]
+    errors: List[JudgeBulkError]
+    total: int  # 파일의 전체 행 수
+
 class JudgeListResponse(BaseModel):
     judges: List[JudgeResponse]
     total: int
+    next_cursor: Optional[str] = None
 
 class ProjectWithAccount(BaseModel):
     account: AccountResponse
@@ -157,8 +194,83 @@ class EvaluationResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class EvaluationBatchItem(BaseModel):
+    index: int  # 요청 목록에서의 위치 (0부터)
+    evaluation: Optional[EvaluationResponse] = None
+    error: Optional[str] = None
+
+class EvaluationBatchResponse(BaseModel):
+    results: List[EvaluationBatchItem]
+    saved: int
+    failed: int
+
 class AccountWithEvaluations(AccountResponse):
     evaluations: List[EvaluationResponse] = []
 
     class Config:
         from_attributes = True
+
+# 순위 스키마
+class RankingEntry(BaseModel):
+    rank: int
+    tied: bool = False  # 동점(모든 기준이 같음) 여부
+    aidea_id: int
+    project: str
+    account_id: int
+    team_name: Optional[str] = None
+    department: Optional[str] = None
+    evaluation_count: int
+    total_sum: int
+    total_avg: float
+    innovation_avg: float
+    feasibility_avg: float
+    effectiveness_avg: float
+
+class RankingListResponse(BaseModel):
+    rankings: List[RankingEntry]
+    total: int
+
+# 메일 발송 스키마
+class EmailRequest(BaseModel):
+    recipients: List[str]
+    subject: str
+    contents: str
+    message_id: Optional[str] = None  # 같은 ID로 다시 요청하면 새로 발송하지 않음 (Idempotency-Key 헤더로도 지정 가능)
+
+class EmailStatusResponse(BaseModel):
+    message_id: str
+    status: str  # pending / sending / sent / failed / cancelled
+    attempts: int
+    last_error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    sent_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+# 관리자 단체 메일 작업 스키마
+class MailJobCreate(BaseModel):
+    name: str
+    audience: str  # all / submitted(Aidea 제출) / not_submitted(미제출) / ranked(심사 결과가 있는 팀)
+    subject: str  # 템플릿: {name}, {team_name}, {project}, {rank} 등 (crud.MAIL_TEMPLATE_FIELDS)
+    contents: str
+    dry_run: bool = False  # true면 작업을 만들지 않고 대상 수와 첫 메일 미리보기만 반환
+
+class MailJobPreview(BaseModel):
+    audience: str
+    recipient_count: int  # 대상 계정(팀) 수
+    sample: Optional[dict] = None  # 첫 대상에게 갈 메일 {recipients, subject, contents}
+
+class MailJobResponse(BaseModel):
+    id: int
+    name: str
+    audience: str
+    status: str  # expanding / queued / cancelled
+    total: int  # outbox에 넣은 메일 수
+    progress: dict = {}  # 메일 상태별 개수 {pending, sending, sent, failed, cancelled}
+    done: bool = False  # outbox 생성이 끝났고 대기/발송 중인 메일이 없음
+    created_at: Optional[datetime] = None
+    expanded_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
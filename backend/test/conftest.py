@@ -0,0 +1,33 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Optional
+
+# 앱 기본 엔진(database.py)이 작업 트리에 ssai_aidea_dev.db를 만들지 않도록 임시 디렉터리 사용
+os.environ.setdefault("DATABASE_PATH", os.path.join(tempfile.mkdtemp(prefix="test_app_db_"), "app.db"))
+
+import pytest
+
+import profiler
+
+@pytest.fixture
+def query_budget():
+    """
+    블록 안에서 실행된 쿼리 수가 예산을 넘거나 같은 지문이 max_repeats번을 넘게 반복(N+1)되면 실패시킵니다.
+
+        def test_list(query_budget):
+            with query_budget(engine, max_queries=3, max_repeats=1) as profile:
+                client.get("/api/admin/judges", headers=HEADERS)
+    """
+    @contextmanager
+    def budget(*engines, max_queries: int, max_repeats: Optional[int] = None):
+        for engine in engines:
+            profiler.attach_profiler(engine, "test")
+        with profiler.profile_queries("query_budget") as profile:
+            yield profile
+        assert profile.count <= max_queries, f"쿼리 예산 {max_queries}개 초과\n{profile.summary()}"
+        if max_repeats is not None:
+            repeated = profile.repeated(max_repeats + 1)
+            assert not repeated, f"같은 쿼리가 {max_repeats}번 넘게 반복됨 (N+1 의심)\n{profile.summary()}"
+
+    return budget
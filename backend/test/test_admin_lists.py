@@ -0,0 +1,161 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from main import app, create_access_token, ADMIN_USERNAME
+from database import get_db, get_read_db
+from testing_db import create_test_engine, sync_sequences
+from models import Base, Account, TeamMember, Aidea, Judge, Evaluation
+
+# 테스트용 데이터베이스 설정 (기본: 인메모리 SQLite, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+engine = create_test_engine()
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+Base.metadata.create_all(bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+OVERRIDES = {get_db: override_get_db, get_read_db: override_get_db}
+
+client = TestClient(app)
+HEADERS = {"Authorization": f"Bearer {create_access_token(data={'sub': ADMIN_USERNAME})}"}
+
+def seed():
+    """계정 25개(짝수 번째만 Aidea 보유, 부서 2종)와 심사위원 2명의 평가를 생성합니다."""
+    db = TestingSessionLocal()
+    for model in (Evaluation, TeamMember, Aidea, Account, Judge):
+        db.query(model).delete()
+    judges = [Judge(id=i, judge_id=f"judge{i}", hashed_password="x", name=f"심사위원{i}") for i in (1, 2)]
+    db.add_all(judges)
+    for i in range(25):
+        account = Account(
+            knox_id=f"user{i:02d}", hashed_password="x", team_name=f"팀{i:02d}",
+            department="개발" if i % 3 else "기획"
+        )
+        if i % 2 == 0:
+            account.aideas = [Aidea(project=f"프로젝트{i}")]
+        db.add(account)
+        db.flush()
+        for judge in judges:
+            if account.aideas:
+                score = 6 * (i % 5 + 1)
+                db.add(Evaluation(
+                    aidea_id=account.aideas[0].id, judge_id=judge.id,
+                    innovation_score=score, feasibility_score=6, effectiveness_score=8,
+                    total_score=score + 14
+                ))
+    db.commit()
+    db.close()
+    sync_sequences(engine)
+
+def collect_pages(url: str, key: str = "accounts", limit: int = 7):
+    """next_cursor를 따라가며 모든 페이지를 모읍니다."""
+    items, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        data = client.get(url, params=params, headers=HEADERS).json()
+        items.extend(data[key])
+        pages += 1
+        cursor = data["next_cursor"]
+        if not cursor:
+            return items, data["total"], pages
+
+class TestAdminLists:
+    """관리자 목록 페이지네이션/필터/정렬 테스트 클래스"""
+
+    def setup_method(self):
+        self._previous_overrides = {dep: app.dependency_overrides.get(dep) for dep in OVERRIDES}
+        app.dependency_overrides.update(OVERRIDES)
+        seed()
+
+    def teardown_method(self):
+        for dep, previous in self._previous_overrides.items():
+            if previous is None:
+                app.dependency_overrides.pop(dep, None)
+            else:
+                app.dependency_overrides[dep] = previous
+
+    def test_without_limit_returns_everything(self):
+        """limit이 없으면 기존처럼 전체 목록을 반환하는지 테스트"""
+        data = client.get("/api/admin/accounts", headers=HEADERS).json()
+
+        assert data["total"] == 25
+        assert len(data["accounts"]) == 25
+        assert data["next_cursor"] is None
+
+    def test_cursor_pages_cover_all_rows_once(self):
+        """커서를 따라가면 모든 계정을 중복 없이 한 번씩 조회하는지 테스트"""
+        accounts, total, pages = collect_pages("/api/admin/accounts")
+
+        assert total == 25
+        assert pages == 4
+        assert [a["knox_id"] for a in accounts] == [f"user{i:02d}" for i in range(25)]
+
+    def test_created_at_sort_with_ties(self):
+        """created_at이 같은 행이 많아도 id로 순서가 이어지는지 테스트"""
+        accounts, _, _ = collect_pages("/api/admin/accounts?sort=-created_at", limit=4)
+
+        ids = [a["id"] for a in accounts]
+        assert len(ids) == 25
+        assert len(set(ids)) == 25
+
+    def test_summary_view_with_cursor(self):
+        """view=summary로 Aidea 목록을 페이지 단위로 조회할 수 있는지 테스트"""
+        rows, total, pages = collect_pages("/api/admin/aideas?view=summary&sort=-created_at", limit=5)
+
+        assert total == 13
+        assert pages == 3
+        assert len({r["aidea_id"] for r in rows}) == 13
+        assert set(rows[0]) == {"account_id", "knox_id", "team_name", "department", "aidea_id", "project"}
+
+        data = client.get("/api/admin/accounts?fields=knox_id,project&limit=2", headers=HEADERS).json()
+        assert data["accounts"] == [{"knox_id": "user00", "project": "프로젝트0"}, {"knox_id": "user01", "project": None}]
+
+    def test_filters(self):
+        """부서/팀명/Aidea 여부 필터와 COUNT 기반 total 테스트"""
+        data = client.get(
+            "/api/admin/accounts", params={"department": "기획", "has_aidea": "true", "limit": 2}, headers=HEADERS
+        ).json()
+        assert data["total"] == 5  # i = 0, 6, 12, 18, 24
+        assert [a["knox_id"] for a in data["accounts"]] == ["user00", "user06"]
+
+        data = client.get("/api/admin/accounts", params={"team_name": "팀1"}, headers=HEADERS).json()
+        assert data["total"] == 10
+
+        data = client.get("/api/admin/aideas", params={"sort": "-id", "limit": 3}, headers=HEADERS).json()
+        assert data["total"] == 13
+        assert [a["knox_id"] for a in data["accounts"]] == ["user24", "user22", "user20"]
+
+    def test_evaluations_filters_and_headers(self):
+        """평가 목록의 심사위원/점수 필터와 페이지네이션 헤더 테스트"""
+        response = client.get(
+            "/api/admin/evaluations",
+            params={"judge_id": 1, "min_score": 32, "sort": "-total_score", "limit": 2},
+            headers=HEADERS,
+        )
+        data = response.json()
+
+        assert response.headers["X-Total-Count"] == "8"  # 총점 32, 38, 44
+        assert [e["total_score"] for e in data] == [44, 44]
+        assert all(e["judge"]["judge_id"] == "judge1" for e in data)
+
+        next_page = client.get(
+            "/api/admin/evaluations",
+            params={"judge_id": 1, "min_score": 32, "sort": "-total_score", "limit": 10,
+                    "cursor": response.headers["X-Next-Cursor"]},
+            headers=HEADERS,
+        ).json()
+        assert [e["total_score"] for e in next_page] == [44, 38, 38, 32, 32, 32]
+        assert "X-Next-Cursor" not in client.get(
+            "/api/admin/evaluations", params={"judge_id": 1, "limit": 100}, headers=HEADERS
+        ).headers
+
+    def test_invalid_sort_and_cursor(self):
+        """잘못된 정렬 기준과 커서는 400을 반환하는지 테스트"""
+        assert client.get("/api/admin/judges", params={"sort": "name"}, headers=HEADERS).status_code == 400
+        assert client.get("/api/admin/judges", params={"cursor": "garbage"}, headers=HEADERS).status_code == 400
@@ -0,0 +1,139 @@
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from main import app
+from database import get_db
+from testing_db import create_test_engine
+from models import Base, Account, TeamMember, Aidea
+
+# 테스트용 데이터베이스 설정 (기본: 인메모리 SQLite, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+engine = create_test_engine()
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+Base.metadata.create_all(bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+client = TestClient(app)
+LONG_TEXT = "긴 텍스트 " * 500
+
+class StatementRecorder:
+    """테스트 엔진에서 실행된 SQL 문을 기록합니다."""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self)
+
+class TestPartialPatch:
+    """Aidea/팀원 부분 수정(PATCH)과 버전 충돌 테스트 클래스"""
+
+    def setup_method(self):
+        self._previous_override = app.dependency_overrides.get(get_db)
+        app.dependency_overrides[get_db] = override_get_db
+        # 제출 기간과 무관하게 테스트
+        self._period = patch("main._check_registration_period")
+        self._period.start()
+
+        db = TestingSessionLocal()
+        for model in (TeamMember, Aidea, Account):
+            db.query(model).delete()
+        account = Account(knox_id="leader", hashed_password="x", team_name="슬슬팀")
+        account.team_members = [TeamMember(name="팀원A", knox_id="a"), TeamMember(name="팀원B", knox_id="b")]
+        account.aideas = [Aidea(project="프로젝트", problem=LONG_TEXT, solution=LONG_TEXT, scenario=LONG_TEXT)]
+        db.add(account)
+        db.commit()
+        self.aidea_id = account.aideas[0].id
+        self.member_ids = {m.knox_id: m.id for m in account.team_members}
+        db.close()
+
+    def teardown_method(self):
+        self._period.stop()
+        if self._previous_override is None:
+            app.dependency_overrides.pop(get_db, None)
+        else:
+            app.dependency_overrides[get_db] = self._previous_override
+
+    def _patch_aidea(self, **body):
+        return client.patch(f"/api/aideas/{self.aidea_id}", json={"account_knox_id": "leader", **body})
+
+    def test_patch_only_touches_sent_fields(self):
+        """보낸 필드만 읽고 쓰며 새 버전을 반환하는지 테스트"""
+        with StatementRecorder() as recorder:
+            response = self._patch_aidea(workflow="새 워크플로우", version=1)
+
+        assert response.status_code == 200
+        assert response.json() == {"id": self.aidea_id, "version": 2}
+        sql = " ".join(recorder.statements)
+        assert "aideas.problem" not in sql and "aideas.scenario" not in sql
+        update = next(s for s in recorder.statements if s.startswith("UPDATE"))
+        assert "workflow" in update and "problem" not in update and "version" in update
+
+        db = TestingSessionLocal()
+        aidea = db.get(Aidea, self.aidea_id)
+        assert (aidea.workflow, aidea.problem, aidea.version) == ("새 워크플로우", LONG_TEXT, 2)
+        db.close()
+
+    def test_unchanged_patch_keeps_version(self):
+        """값이 같으면 쓰지 않고 버전도 그대로인지 테스트"""
+        response = self._patch_aidea(project="프로젝트")
+
+        assert response.json()["version"] == 1
+
+    def test_stale_version_conflict(self):
+        """다른 곳에서 먼저 저장했다면 409와 현재 버전을 반환하는지 테스트"""
+        assert self._patch_aidea(problem="첫 번째 저장", version=1).status_code == 200
+
+        response = self._patch_aidea(problem="오래된 화면에서 저장", version=1)
+
+        assert response.status_code == 409
+        assert response.json()["detail"]["current_version"] == 2
+
+    def test_ownership_and_validation(self):
+        """소유 계정 불일치 403, 없는 Aidea 404, 빈 프로젝트명 400 테스트"""
+        assert client.patch(
+            f"/api/aideas/{self.aidea_id}", json={"account_knox_id": "other", "problem": "x"}
+        ).status_code == 403
+        assert client.patch("/api/aideas/999999", json={"account_knox_id": "leader"}).status_code == 404
+        assert self._patch_aidea(project="  ").status_code == 400
+
+    def test_patch_team_member(self):
+        """팀원 이름 변경과 중복 Knox ID 검사 테스트"""
+        member_id = self.member_ids["a"]
+        url = f"/api/team-members/{member_id}"
+
+        response = client.patch(url, json={"account_knox_id": "leader", "name": "팀원A2", "version": 1})
+        assert response.json() == {"id": member_id, "version": 2}
+
+        assert client.patch(url, json={"account_knox_id": "leader", "knox_id": "b"}).status_code == 400
+        assert client.patch(url, json={"account_knox_id": "leader", "knox_id": "leader"}).status_code == 400
+        assert client.patch(url, json={"account_knox_id": "leader", "name": "x", "version": 1}).status_code == 409
+
+    def test_database_error_returns_500(self):
+        """DB 오류(쓰기 락 대기 초과 등)는 처리된 500 응답으로 반환되는지 테스트"""
+        locked = OperationalError("UPDATE aideas", {}, Exception("database is locked"))
+        with patch("main.patch_aidea", side_effect=locked):
+            response = self._patch_aidea(problem="수정")
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Aidea 저장 중 오류가 발생했습니다."
+
+        with patch("main.patch_team_member", side_effect=locked):
+            response = client.patch(f"/api/team-members/{self.member_ids['a']}", json={"account_knox_id": "leader", "name": "수정"})
+        assert response.status_code == 500
+        assert response.json()["detail"] == "팀원 정보 저장 중 오류가 발생했습니다."
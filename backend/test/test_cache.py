@@ -0,0 +1,59 @@
+from cache import ResponseCache, bump_data_version, current_data_version
+
+class TestResponseCache:
+    """ResponseCache 테스트 클래스"""
+
+    def test_hit_and_version_invalidation(self):
+        """같은 데이터 버전에서는 히트, 버전이 오르면 무효화되는지 테스트"""
+        cache = ResponseCache(max_bytes=1024)
+        cache.set("key", b"body", current_data_version())
+
+        assert cache.get("key").body == b"body"
+
+        bump_data_version()
+        assert cache.get("key") is None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["invalidations"]) == (1, 1, 1)
+        assert stats["entries"] == 0
+
+    def test_entry_stored_with_stale_version_is_never_served(self):
+        """읽는 도중 쓰기가 커밋되면 그 결과는 캐시에서 제공되지 않는지 테스트"""
+        cache = ResponseCache(max_bytes=1024)
+        version_before_read = current_data_version()
+        bump_data_version()  # 조회 중 다른 요청이 커밋
+
+        cache.set("key", b"old", version_before_read)
+
+        assert cache.get("key") is None
+
+    def test_lru_eviction_under_memory_cap(self):
+        """메모리 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거하는지 테스트"""
+        cache = ResponseCache(max_bytes=10)
+        version = current_data_version()
+        cache.set("a", b"aaaa", version)
+        cache.set("b", b"bbbb", version)
+        cache.get("a")                     # a를 최근 사용으로 갱신
+        cache.set("c", b"cccc", version)   # 12바이트 > 10 → b 제거
+        cache.set("huge", b"x" * 11, version)  # 상한보다 큰 응답은 저장하지 않음
+
+        assert cache.get("b") is None
+        assert cache.get("a").body == b"aaaa"
+        assert cache.get("c").body == b"cccc"
+        assert cache.get("huge") is None
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["size_bytes"] == 8
+
+    def test_entries_expire_after_ttl(self):
+        """데이터 버전이 그대로여도(다른 워커의 쓰기) TTL이 지나면 만료되는지 테스트"""
+        now = [100.0]
+        cache = ResponseCache(max_bytes=1024, ttl=5)
+        cache.clock = lambda: now[0]
+        cache.set("key", b"body", current_data_version())
+
+        now[0] += 4.9
+        assert cache.get("key").body == b"body"
+        now[0] += 0.1
+        assert cache.get("key") is None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["expirations"], stats["entries"]) == (1, 1, 1, 0)
@@ -0,0 +1,103 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from main import app
+from database import get_db
+from testing_db import create_test_engine, sync_sequences
+from models import Base, Account, Aidea, Judge, Evaluation, AideaScoreSummary
+from crud import verify_score_summaries
+
+# 테스트용 데이터베이스 설정 (기본: 인메모리 SQLite, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+engine = create_test_engine()
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+Base.metadata.create_all(bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+client = TestClient(app)
+
+def item(aidea_id: int, judge_id: int = 1, innovation: int = 12, feasibility: int = 18, effectiveness: int = 24):
+    return {
+        "aidea_id": aidea_id, "judge_id": judge_id,
+        "innovation_score": innovation, "feasibility_score": feasibility, "effectiveness_score": effectiveness,
+    }
+
+class TestEvaluationBatch:
+    """평가 일괄 제출 API 테스트 클래스"""
+
+    def setup_method(self):
+        self._previous_override = app.dependency_overrides.get(get_db)
+        app.dependency_overrides[get_db] = override_get_db
+        db = TestingSessionLocal()
+        for model in (AideaScoreSummary, Evaluation, Aidea, Account, Judge):
+            db.query(model).delete()
+        db.add(Judge(id=1, judge_id="judge1", hashed_password="x", name="심사위원1"))
+        for i in range(1, 4):
+            db.add(Account(id=i, knox_id=f"user{i}", hashed_password="x", team_name=f"팀{i}"))
+            db.add(Aidea(id=i, account_id=i, project=f"프로젝트{i}"))
+        db.commit()
+        db.close()
+        sync_sequences(engine)
+
+    def teardown_method(self):
+        if self._previous_override is None:
+            app.dependency_overrides.pop(get_db, None)
+        else:
+            app.dependency_overrides[get_db] = self._previous_override
+
+    def test_saves_valid_items_in_one_commit_and_reports_failures(self):
+        """유효한 항목은 커밋 한 번으로 저장하고, 실패 항목은 항목별 오류로 돌려주는지 테스트"""
+        commits = []
+
+        def record_commit(conn):
+            commits.append(conn)
+
+        event.listen(engine, "commit", record_commit)
+        try:
+            response = client.post("/api/evaluations/batch", json=[
+                item(1),
+                item(2, innovation=7),
+                item(99),
+                item(3, judge_id=42),
+                item(1, innovation=30),
+                item(3),
+            ])
+        finally:
+            event.remove(engine, "commit", record_commit)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["saved"], body["failed"]) == (3, 3)
+        results = body["results"]
+        assert [result["index"] for result in results] == list(range(6))
+        assert "혁신성" in results[1]["error"]
+        assert results[2]["error"] == "해당 아이디어를 찾을 수 없습니다."
+        assert results[3]["error"] == "해당 심사위원을 찾을 수 없습니다."
+        # 같은 (aidea, 심사위원)은 뒤의 점수가 남음
+        assert results[0]["evaluation"]["id"] == results[4]["evaluation"]["id"]
+        assert results[4]["evaluation"]["total_score"] == 30 + 18 + 24
+        assert results[5]["evaluation"]["judge"]["judge_id"] == "judge1"
+        assert len(commits) == 1
+
+        db = TestingSessionLocal()
+        assert db.query(Evaluation).count() == 2
+        assert db.get(AideaScoreSummary, 1).total_sum == 72
+        assert not verify_score_summaries(db)
+        db.close()
+
+    def test_rejects_empty_batch(self):
+        """빈 목록은 400으로 거부하는지 테스트"""
+        assert client.post("/api/evaluations/batch", json=[]).status_code == 400
+
+    def test_single_submission_keeps_rubric_messages(self):
+        """단건 제출도 같은 배점 검증 메시지를 사용하는지 테스트"""
+        response = client.post("/api/evaluations", json=item(1, effectiveness=10))
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "업무 효과성 점수는 8, 16, 24, 32, 40 중 하나여야 합니다."
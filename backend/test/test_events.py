@@ -0,0 +1,229 @@
+import asyncio
+import os
+import tempfile
+import threading
+
+import httpx
+import orjson
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+import crud
+import events
+from main import app
+from events import EventHub, EventHubBusyError, queue_event
+from testing_db import create_test_engine
+from models import Base, Account, TeamMember, Aidea, Judge, Evaluation, AideaScoreSummary
+from schemas import AccountRegister, TeamMemberCreate
+from write_queue import WriteQueue, create_writer_engine
+
+# 테스트용 데이터베이스 설정 (기본: 인메모리 SQLite, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+engine = create_test_engine()
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+Base.metadata.create_all(bind=engine)
+
+def parse(frame: bytes) -> dict:
+    """SSE 프레임 하나를 필드 dict로 바꿉니다."""
+    fields = dict(line.split(": ", 1) for line in frame.decode().strip().split("\n") if not line.startswith(":"))
+    if "data" in fields:
+        fields["data"] = orjson.loads(fields["data"])
+    return fields
+
+async def drain(subscription) -> list:
+    """이미 전달된(다른 스레드에서 예약된 것 포함) 이벤트를 모두 꺼냅니다."""
+    await asyncio.sleep(0.05)
+    frames = []
+    while not subscription.queue.empty():
+        frames.append(subscription.queue.get_nowait())
+    return frames
+
+class TestEventHub:
+    """브로드캐스트 허브 테스트 클래스"""
+
+    def test_fan_out_filter_and_cross_thread_publish(self):
+        """다른 스레드의 발행이 종류 필터에 맞는 구독자에게만 전달되는지 테스트"""
+        hub = EventHub(client_buffer=8)
+
+        async def scenario():
+            everything = hub.subscribe()
+            evaluations = hub.subscribe(["evaluation"])
+            thread = threading.Thread(target=hub.publish, args=([
+                {"type": "aidea.submitted", "aidea_id": 1},
+                {"type": "evaluation.created", "aidea_id": 1, "judge_id": 2},
+            ],))
+            thread.start()
+            thread.join()
+            return await drain(everything), await drain(evaluations)
+
+        everything, evaluations = asyncio.run(scenario())
+
+        assert [parse(f)["event"] for f in everything] == ["aidea.submitted", "evaluation.created"]
+        assert [parse(f)["id"] for f in everything] == ["1", "2"]
+        assert evaluations == everything[1:]  # 같은 프레임(bytes)을 공유
+        assert parse(evaluations[0])["data"] == {"type": "evaluation.created", "aidea_id": 1, "judge_id": 2}
+
+    def test_slow_consumer_is_dropped(self):
+        """버퍼가 가득 찬 구독자만 끊기고 다른 구독자는 계속 받는지 테스트"""
+        hub = EventHub(client_buffer=2)
+
+        async def scenario():
+            slow, fast = hub.subscribe(), hub.subscribe()
+            for i in range(3):
+                hub.publish([{"type": "aidea.updated", "aidea_id": i}])
+                fast.queue.get_nowait()
+            return [frame async for frame in slow.frames()], slow, fast
+
+        slow_frames, slow, fast = asyncio.run(scenario())
+
+        assert slow_frames == [] and slow.dropped
+        assert not fast.dropped
+        assert hub.stats()["dropped_clients"] == 1
+
+    def test_replay_after_reconnect(self):
+        """Last-Event-ID 이후 이벤트를 이어 보내고, 기록 범위를 벗어나면 reset을 보내는지 테스트"""
+        hub = EventHub(history=3)
+        hub.publish([{"type": "aidea.updated", "aidea_id": i} for i in range(5)])
+
+        async def scenario(last_event_id):
+            return await drain(hub.subscribe(last_event_id=last_event_id))
+
+        assert [parse(f)["id"] for f in asyncio.run(scenario("3"))] == ["4", "5"]
+        assert asyncio.run(scenario("5")) == []
+        assert asyncio.run(scenario("1")) == [events.RESET_FRAME]
+        assert asyncio.run(scenario("99")) == [events.RESET_FRAME]  # 서버 재시작 후
+
+    def test_max_clients(self):
+        """구독자 수 상한을 넘으면 거절하는지 테스트"""
+        hub = EventHub(max_clients=1)
+
+        async def scenario():
+            hub.subscribe()
+            with pytest.raises(EventHubBusyError):
+                hub.subscribe()
+
+        asyncio.run(scenario())
+
+class TestCommitEvents:
+    """crud 쓰기 경로의 커밋 후 발행 테스트 클래스"""
+
+    def setup_method(self):
+        db = TestingSessionLocal()
+        for model in (AideaScoreSummary, Evaluation, TeamMember, Aidea, Account, Judge):
+            db.query(model).delete()
+        self.judge = Judge(judge_id="judge1", hashed_password="x", name="심사위원1")
+        self.account = Account(knox_id="user1", hashed_password="x", name="홍길동", team_name="팀1")
+        db.add_all([self.judge, self.account])
+        db.commit()
+        db.close()
+
+    def _run(self, write):
+        """전역 허브를 구독한 상태에서 write(db)를 실행하고 받은 이벤트를 돌려줍니다."""
+        async def scenario():
+            subscription = events.hub.subscribe()
+            db = TestingSessionLocal()
+            try:
+                write(db)
+            finally:
+                db.close()
+            frames = await drain(subscription)
+            events.hub.unsubscribe(subscription)
+            return [parse(frame)["data"] for frame in frames]
+        return asyncio.run(scenario())
+
+    def test_registration_and_evaluation_events(self):
+        """Aidea 제출과 평가 생성/수정이 커밋 후 id만 담긴 이벤트로 발행되는지 테스트"""
+        registration = AccountRegister(
+            id=self.account.id, knox_id="user1", name="홍길동", team_name="팀1",
+            team_members=[TeamMemberCreate(name="김철수", knox_id="member1")], project="프로젝트",
+        )
+        submitted = self._run(lambda db: crud.update_account_registration(db, registration))
+        aidea_id = submitted[-1]["aidea_id"]
+
+        def evaluate(db):
+            for score in (6, 12):
+                crud.create_evaluation(db, aidea_id, self.judge.id, score, 6, 8)
+        evaluated = self._run(evaluate)
+
+        assert [(e["type"], e.get("account_id")) for e in submitted] == [
+            ("team.updated", self.account.id), ("aidea.submitted", self.account.id),
+        ]
+        assert [e["type"] for e in evaluated] == ["evaluation.created", "evaluation.updated"]
+        assert evaluated[0]["aidea_id"] == aidea_id and evaluated[0]["judge_id"] == self.judge.id
+        assert "total_score" not in evaluated[0] and evaluated[0]["version"] > submitted[0]["version"]
+        # 변경 없는 재제출은 이벤트 없음
+        assert self._run(lambda db: crud.update_account_registration(db, registration)) == []
+
+    def test_rolled_back_changes_are_not_published(self):
+        """롤백된 트랜잭션과 쓰기 대기열에서 실패한 작업의 이벤트는 버려지는지 테스트"""
+        def rolled_back(db):
+            db.add(Account(knox_id="rolled_back", hashed_password="x"))
+            db.flush()
+            queue_event(db, "team.updated", account_id=1)
+            db.rollback()
+            db.commit()
+        assert self._run(rolled_back) == []
+
+        writer = create_writer_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='test_events_'), 'test.db')}")
+        Base.metadata.create_all(bind=writer)
+        # 두 작업이 한 배치로 묶이도록 잠시 모아서 실행 (실패한 작업만 되돌리고 성공한 작업의 알림은 유지)
+        queue = WriteQueue(engine=writer, max_wait_ms=200)
+
+        def succeed(db):
+            db.add(Account(knox_id="queued", hashed_password="x"))
+            queue_event(db, "team.updated", account_id=1)
+            db.commit()
+
+        def fail(db):
+            queue_event(db, "team.updated", account_id=2)
+            raise ValueError("작업 실패")
+
+        async def scenario():
+            subscription = events.hub.subscribe()
+            results = await asyncio.gather(queue.run(succeed), queue.run(fail), return_exceptions=True)
+            frames = await drain(subscription)
+            events.hub.unsubscribe(subscription)
+            return results, [parse(frame)["data"]["account_id"] for frame in frames]
+
+        try:
+            results, account_ids = asyncio.run(scenario())
+        finally:
+            queue.stop()
+            writer.dispose()
+        assert isinstance(results[1], ValueError)
+        assert account_ids == [1]
+
+class TestEventsEndpoint:
+    """GET /api/events 스트림 테스트 클래스"""
+
+    def test_stream(self):
+        """ready 이후 선택한 종류의 이벤트가 SSE로 전달되고, 허브를 닫으면 스트림이 끝나는지 테스트"""
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                request = asyncio.create_task(client.get("/api/events?types=evaluation"))
+                while not events.hub._subscribers:
+                    await asyncio.sleep(0.01)
+                events.hub.publish([
+                    {"type": "aidea.updated", "aidea_id": 1},
+                    {"type": "evaluation.created", "aidea_id": 1, "judge_id": 1},
+                ])
+                await asyncio.sleep(0.01)
+                events.hub.close()
+                return await request
+
+        response = asyncio.run(scenario())
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = [parse(frame.encode()) for frame in response.text.split("\n\n") if frame.strip()]
+        assert [frame["event"] for frame in frames] == ["ready", "evaluation.created"]
+        assert int(frames[1]["id"]) == int(frames[0]["id"]) + 2
+
+    def test_invalid_types(self):
+        """알 수 없는 종류는 400으로 거절하는지 테스트"""
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get("/api/events?types=judge")
+
+        assert asyncio.run(scenario()).status_code == 400
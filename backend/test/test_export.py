@@ -0,0 +1,124 @@
+import csv
+import io
+import json
+import zipfile
+from xml.etree import ElementTree
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+import export
+from main import app, create_access_token, ADMIN_USERNAME
+from database import get_db, get_read_db
+from testing_db import create_test_engine
+from models import Base, Account, TeamMember, Aidea, Judge, Evaluation
+
+# 테스트용 데이터베이스 설정 (기본: 인메모리 SQLite, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+engine = create_test_engine()
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+Base.metadata.create_all(bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+OVERRIDES = {get_db: override_get_db, get_read_db: override_get_db}
+
+client = TestClient(app)
+HEADERS = {"Authorization": f"Bearer {create_access_token(data={'sub': ADMIN_USERNAME})}"}
+SHEET_NS = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+def seed(n: int = 3):
+    """팀원 1명과 Aidea를 가진 계정 n개, 각 Aidea에 대한 심사위원 2명의 평가를 생성합니다."""
+    db = TestingSessionLocal()
+    for model in (Evaluation, TeamMember, Aidea, Account, Judge):
+        db.query(model).delete()
+    judges = [Judge(judge_id=f"judge{i}", hashed_password="x", name=f"심사위원{i}") for i in (1, 2)]
+    db.add_all(judges)
+    for i in range(n):
+        account = Account(knox_id=f"user{i}", hashed_password="x", team_name=f"팀{i}", department="개발")
+        account.team_members = [TeamMember(name=f"팀원{i}", knox_id=f"member{i}")]
+        account.aideas = [Aidea(project=f"프로젝트{i}", problem="줄바꿈,\n쉼표 \"따옴표\" <태그> & 기호")]
+        db.add(account)
+        db.flush()
+        for judge in judges:
+            db.add(Evaluation(
+                aidea_id=account.aideas[0].id, judge_id=judge.id,
+                innovation_score=6, feasibility_score=12, effectiveness_score=16, total_score=34
+            ))
+    db.commit()
+    db.close()
+
+def read_xlsx(content: bytes):
+    """시트 XML의 inline 문자열/숫자 셀을 행 목록으로 읽습니다."""
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        assert "xl/workbook.xml" in archive.namelist()
+        root = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    rows = []
+    for row in root.iter(f"{{{SHEET_NS['s']}}}row"):
+        values = []
+        for cell in row:
+            text = cell.find("s:is/s:t", SHEET_NS)
+            number = cell.find("s:v", SHEET_NS)
+            values.append(text.text if text is not None else (number.text if number is not None else None))
+        rows.append(values)
+    return rows
+
+class TestExport:
+    """관리자 데이터 내보내기 테스트 클래스"""
+
+    def setup_method(self):
+        self._previous_overrides = {dep: app.dependency_overrides.get(dep) for dep in OVERRIDES}
+        app.dependency_overrides.update(OVERRIDES)
+        seed()
+
+    def teardown_method(self):
+        for dep, previous in self._previous_overrides.items():
+            if previous is None:
+                app.dependency_overrides.pop(dep, None)
+            else:
+                app.dependency_overrides[dep] = previous
+
+    def test_csv_with_selected_columns(self):
+        """선택한 컬럼만 CSV로 내보내고 특수문자를 올바르게 이스케이프하는지 테스트"""
+        response = client.get("/api/admin/export/aideas?columns=team_name,project,problem", headers=HEADERS)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        rows = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))
+        assert rows[0] == ["team_name", "project", "problem"]
+        assert rows[1] == ["팀0", "프로젝트0", "줄바꿈,\n쉼표 \"따옴표\" <태그> & 기호"]
+        assert len(rows) == 4
+
+    def test_ndjson_evaluation_details(self):
+        """평가 1건당 1행으로 팀/프로젝트/심사위원 정보를 펼쳐 내보내는지 테스트"""
+        response = client.get("/api/admin/export/evaluation_details?format=ndjson", headers=HEADERS)
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert len(records) == 6
+        assert records[0]["project"] == "프로젝트0"
+        assert records[0]["team_name"] == "팀0"
+        assert records[0]["judge_name"] == "심사위원1"
+        assert records[0]["total_score"] == 34
+        assert set(records[0]) == set(export.EXPORT_COLUMNS["evaluation_details"])
+
+    def test_xlsx_is_valid_workbook(self, monkeypatch):
+        """여러 청크로 나뉘어 스트리밍되어도 올바른 XLSX가 만들어지는지 테스트"""
+        monkeypatch.setattr(export, "YIELD_PER", 2)
+
+        response = client.get("/api/admin/export/team_members?format=xlsx&columns=team_name,knox_id,id", headers=HEADERS)
+
+        rows = read_xlsx(response.content)
+        assert rows[0] == ["team_name", "knox_id", "id"]
+        assert rows[1:] == [["팀0", "member0", "1"], ["팀1", "member1", "2"], ["팀2", "member2", "3"]]
+
+    def test_invalid_requests(self):
+        """지원하지 않는 대상/형식/컬럼은 400, 인증이 없으면 거부되는지 테스트"""
+        assert client.get("/api/admin/export/secrets", headers=HEADERS).status_code == 400
+        assert client.get("/api/admin/export/accounts?format=pdf", headers=HEADERS).status_code == 400
+        assert client.get("/api/admin/export/accounts?columns=hashed_password", headers=HEADERS).status_code == 400
+        assert client.get("/api/admin/export/accounts").status_code == 403
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+from passlib.hash import bcrypt
+
+from hashing import HashingService, HashingBusyError
+
+class TestHashingService:
+    """HashingService 테스트 클래스"""
+
+    def setup_method(self):
+        self.service = HashingService(max_workers=1, max_queue=1)
+
+    def teardown_method(self):
+        self.service.shutdown()
+
+    def test_hash_and_verify_roundtrip(self):
+        """프로세스 풀에서 만든 해시가 passlib bcrypt와 호환되는지 테스트"""
+        async def scenario():
+            hashed = await self.service.hash("password123")
+            return hashed, await self.service.verify("password123", hashed), await self.service.verify("wrong", hashed)
+
+        hashed, ok, wrong = asyncio.run(scenario())
+
+        assert bcrypt.verify("password123", hashed)
+        assert ok is True
+        assert wrong is False
+        stats = self.service.stats()
+        assert stats["hash_count"] == 1
+        assert stats["verify_count"] == 2
+        assert stats["queue_depth"] == 0
+        assert stats["hash_latency_max_ms"] > 0
+
+    def test_rejects_when_queue_is_full(self):
+        """대기열이 가득 차면 즉시 HashingBusyError를 발생시키는지 테스트"""
+        async def scenario():
+            return await asyncio.gather(
+                self.service.hash("first"),
+                self.service.hash("second"),
+                return_exceptions=True,
+            )
+
+        first, second = asyncio.run(scenario())
+
+        assert bcrypt.verify("first", first)
+        assert isinstance(second, HashingBusyError)
+        assert self.service.stats()["rejected_count"] == 1
+
+    def test_hash_many_uses_one_queue_slot_per_chunk(self):
+        """여러 비밀번호를 묶어서 해시하고, 자리가 모자라면 작업 없이 거절하는지 테스트"""
+        service = HashingService(max_workers=2, max_queue=2)
+        try:
+            async def scenario():
+                hashes = await service.hash_many(["a", "b", "c"])
+                busy = await asyncio.gather(service.hash("d"), service.hash_many(["e", "f"]), return_exceptions=True)
+                return hashes, busy
+
+            hashes, (single, rejected) = asyncio.run(scenario())
+        finally:
+            service.shutdown()
+
+        assert [bcrypt.verify(p, h) for p, h in zip("abc", hashes)] == [True] * 3
+        assert bcrypt.verify("d", single)
+        assert isinstance(rejected, HashingBusyError)
+        assert service.stats()["hash_count"] == 4
@@ -0,0 +1,100 @@
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+import http_cache
+from http_cache import ETagCompressionMiddleware, make_etag
+
+LARGE = [{"id": i, "problem": "긴 텍스트 " * 20} for i in range(50)]
+
+def build_client():
+    app = FastAPI()
+    app.add_middleware(ETagCompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    async def large():
+        return LARGE
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/tagged")
+    async def tagged():
+        return Response(content=b'{"tagged": true}', media_type="application/json", headers={"ETag": '"fixed"'})
+
+    @app.get("/text")
+    async def text():
+        return PlainTextResponse("x" * 5000)
+
+    @app.post("/large")
+    async def post_large():
+        return LARGE
+
+    return TestClient(app)
+
+client = build_client()
+
+class TestETagCompressionMiddleware:
+    """ETag / 304 / 압축 미들웨어 테스트 클래스"""
+
+    def test_etag_and_not_modified(self):
+        """JSON 응답에 ETag를 붙이고 If-None-Match가 일치하면 본문 없는 304를 반환하는지 테스트"""
+        first = client.get("/large", headers={"Accept-Encoding": "identity"})
+        etag = first.headers["etag"]
+        assert etag == make_etag(first.content)
+
+        second = client.get("/large", headers={"If-None-Match": etag, "Accept-Encoding": "identity"})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+        assert client.get("/large", headers={"If-None-Match": '"other"'}).status_code == 200
+
+    def test_existing_etag_is_kept(self):
+        """엔드포인트가 정한 ETag(캐시 버전 기반)는 그대로 사용하는지 테스트"""
+        response = client.get("/tagged")
+        assert response.headers["etag"] == '"fixed"'
+        assert client.get("/tagged", headers={"If-None-Match": 'W/"fixed"'}).status_code == 304
+
+    def test_gzip_for_large_json(self):
+        """임계값 이상의 JSON은 gzip으로 압축하고 인코딩별 ETag로도 304가 되는지 테스트"""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json() == LARGE
+        # httpx가 자동으로 압축을 풀기 때문에 content는 원본, content-length는 전송 크기
+        assert int(response.headers["content-length"]) < len(response.content) / 5
+        assert response.headers["etag"].endswith('-gzip"')
+
+        revalidated = client.get("/large", headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]})
+        assert revalidated.status_code == 304
+
+    @pytest.mark.skipif(http_cache.brotli is None, reason="brotli 미설치")
+    def test_brotli_preferred_when_accepted(self):
+        """brotli를 받을 수 있으면 brotli를 우선 사용하는지 테스트"""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.headers["content-encoding"] == "br"
+        assert int(response.headers["content-length"]) < len(response.content) / 5
+        assert response.json() == LARGE
+
+    def test_small_and_non_json_responses_untouched(self):
+        """작은 JSON은 압축하지 않고, JSON이 아닌 응답은 그대로 통과하는지 테스트"""
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in small.headers
+        assert "etag" in small.headers
+
+        text = client.get("/text", headers={"Accept-Encoding": "gzip"})
+        assert "etag" not in text.headers
+        assert "content-encoding" not in text.headers
+
+    def test_post_is_compressed_but_never_304(self):
+        """GET이 아닌 요청은 If-None-Match로 304가 되지 않는지 테스트"""
+        etag = client.get("/large").headers["etag"]
+        response = client.post("/large", headers={"If-None-Match": etag, "Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.json() == LARGE
@@ -0,0 +1,188 @@
+import json
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from passlib.hash import bcrypt
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from main import app, create_access_token, ADMIN_USERNAME
+from database import get_db
+from testing_db import create_test_engine
+from models import Base, Judge
+from hashing import hash_passwords
+from judge_import import parse_judges, validate_judges
+import create_judge
+
+# 테스트용 데이터베이스 설정 (기본: 인메모리 SQLite, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+engine = create_test_engine()
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+Base.metadata.create_all(bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+client = TestClient(app)
+HEADERS = {"Authorization": f"Bearer {create_access_token(data={'sub': ADMIN_USERNAME})}"}
+
+CSV_CONTENT = (
+    "judge_id,password,name\n"
+    "judge1,pw1,심사위원1\n"
+    "existing,pw2,이미있음\n"
+    "judge1,pw3,중복\n"
+    "judge2,,비밀번호없음\n"
+    "judge3,pw4,심사위원3\n"
+)
+
+class TestJudgeImportParsing:
+    """CSV/JSON 파싱과 행 검증 테스트 클래스"""
+
+    def test_csv_and_json_produce_same_rows(self):
+        """CSV와 JSON이 같은 행 목록으로 변환되는지 테스트"""
+        records = [{"judge_id": " judge1 ", "password": "pw1", "name": "심사위원1"}]
+        from_csv = parse_judges("﻿judge_id,password,name\n judge1 ,pw1,심사위원1\n".encode(), "csv")
+        from_json = parse_judges(json.dumps({"judges": records}), "json")
+
+        assert from_csv == from_json == [{"row": 1, "judge_id": "judge1", "password": "pw1", "name": "심사위원1"}]
+
+    def test_rejects_malformed_files(self):
+        """필수 컬럼 누락이나 잘못된 JSON은 파일 전체를 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            parse_judges("judge_id,name\njudge1,심사위원1\n", "csv")
+        with pytest.raises(ValueError):
+            parse_judges("{not json", "json")
+        with pytest.raises(ValueError):
+            parse_judges('{"judges": "judge1"}', "json")
+
+    def test_validate_reports_missing_and_duplicate_rows(self):
+        """필수값 누락과 파일 내 중복을 행 단위 오류로 돌려주는지 테스트"""
+        valid, errors = validate_judges(parse_judges(CSV_CONTENT, "csv"))
+
+        assert [row["judge_id"] for row in valid] == ["judge1", "existing", "judge3"]
+        assert [(error["row"], error["judge_id"]) for error in errors] == [(3, "judge1"), (4, "judge2")]
+
+    def test_hash_passwords_keeps_order(self):
+        """병렬 해시 결과가 입력 순서와 일치하는지 테스트"""
+        passwords = ["a", "b", "c"]
+        hashes = hash_passwords(passwords, max_workers=2)
+
+        assert [bcrypt.verify(password, hashed) for password, hashed in zip(passwords, hashes)] == [True] * 3
+
+class TestBulkJudgeEndpoint:
+    """심사위원 일괄 등록 API 테스트 클래스"""
+
+    def setup_method(self):
+        self._previous_override = app.dependency_overrides.get(get_db)
+        app.dependency_overrides[get_db] = override_get_db
+        db = TestingSessionLocal()
+        db.query(Judge).delete()
+        db.add(Judge(judge_id="existing", hashed_password="x", name="기존"))
+        db.commit()
+        db.close()
+
+    def teardown_method(self):
+        if self._previous_override is None:
+            app.dependency_overrides.pop(get_db, None)
+        else:
+            app.dependency_overrides[get_db] = self._previous_override
+
+    def test_csv_upload_reports_row_errors_without_aborting(self):
+        """중복/누락 행은 오류로 보고하고 나머지는 한 번의 INSERT로 등록하는지 테스트"""
+        inserts = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT"):
+                inserts.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.post(
+                "/api/admin/judges/bulk",
+                files={"file": ("judges.csv", CSV_CONTENT.encode(), "text/csv")},
+                headers=HEADERS,
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 5
+        assert [judge["judge_id"] for judge in body["created"]] == ["judge1", "judge3"]
+        assert all(judge["created_at"] for judge in body["created"])
+        assert [(error["row"], error["judge_id"]) for error in body["errors"]] == [
+            (2, "existing"), (3, "judge1"), (4, "judge2")
+        ]
+        assert len(inserts) == 1
+
+        db = TestingSessionLocal()
+        judge = db.query(Judge).filter(Judge.judge_id == "judge1").one()
+        assert judge.verify_password("pw1")
+        assert judge.name == "심사위원1"
+        db.close()
+
+    def test_json_body(self):
+        """JSON 배열 본문으로도 등록할 수 있는지 테스트"""
+        response = client.post(
+            "/api/admin/judges/bulk",
+            json=[{"judge_id": "judge9", "password": "pw", "name": "심사위원9"}],
+            headers=HEADERS,
+        )
+
+        assert response.status_code == 200
+        assert [judge["judge_id"] for judge in response.json()["created"]] == ["judge9"]
+
+    def test_invalid_file_and_auth(self):
+        """형식 오류는 400, 인증 없이 호출하면 거부되는지 테스트"""
+        bad = client.post(
+            "/api/admin/judges/bulk",
+            content=b"judge_id\njudge1\n",
+            headers={**HEADERS, "Content-Type": "text/csv"},
+        )
+        assert bad.status_code == 400
+        assert client.post("/api/admin/judges/bulk", json=[]).status_code in (401, 403)
+
+    def test_connection_released_while_hashing(self):
+        """bcrypt 해시를 기다리는 동안 요청 세션이 트랜잭션(커넥션)을 잡고 있지 않은지 테스트"""
+        sessions = []
+
+        def capture_get_db():
+            session = TestingSessionLocal()
+            sessions.append(session)
+            try:
+                yield session
+            finally:
+                session.close()
+
+        in_transaction = []
+
+        async def hash_many(passwords):
+            in_transaction.append(sessions[-1].in_transaction())
+            return [bcrypt.hash(password) for password in passwords]
+
+        async def hash_one(password):
+            return (await hash_many([password]))[0]
+
+        app.dependency_overrides[get_db] = capture_get_db
+        with patch("main.hasher.hash_many", side_effect=hash_many), patch("main.hasher.hash", side_effect=hash_one):
+            bulk = client.post("/api/admin/judges/bulk", json=[{"judge_id": "judge7", "password": "pw", "name": "심사위원7"}],
+                               headers=HEADERS)
+            single = client.post("/api/admin/judges", json={"judge_id": "judge8", "password": "pw", "name": "심사위원8"},
+                                 headers=HEADERS)
+
+        assert bulk.status_code == single.status_code == 200
+        assert in_transaction == [False, False]
+
+    def test_cli_import_uses_same_rules(self):
+        """CLI도 같은 규칙으로 행 단위 오류를 보고하고 나머지를 등록하는지 테스트"""
+        db = TestingSessionLocal()
+        created, errors = create_judge.import_judges(db, parse_judges(CSV_CONTENT, "csv"), workers=2)
+        db.close()
+
+        assert [judge.judge_id for judge in created] == ["judge1", "judge3"]
+        assert [error["row"] for error in errors] == [2, 3, 4]
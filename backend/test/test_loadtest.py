@@ -0,0 +1,123 @@
+import asyncio
+import os
+import tempfile
+from unittest.mock import patch
+
+import httpx
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from main import app
+from database import get_db, get_read_db, get_async_db, get_async_read_db
+from testing_db import create_test_engine, create_test_async_engine
+from models import Base, Account, Aidea, Judge, Evaluation, TeamMember
+from loadtest import LoadConfig, Recorder, compare_reports, run_load
+
+# 부하 시나리오는 동기/비동기 엔진을 모두 거치므로 같은 파일 DB를 공유
+DB_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='test_loadtest_'), 'test.db')}"
+engine = create_test_engine(DB_URL)
+async_engine = create_test_async_engine(DB_URL)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+Base.metadata.create_all(bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+OVERRIDES = {get_db: override_get_db, get_read_db: override_get_db, get_async_db: override_get_async_db,
+             get_async_read_db: override_get_async_db}
+
+class TestRecorder:
+    """경로별 통계 계산 테스트 클래스"""
+
+    def test_report_percentiles_and_error_rate(self):
+        """경로별 p50/p95/p99와 오류율(4xx/5xx/연결 오류, 304 제외)을 계산하는지 테스트"""
+        recorder = Recorder()
+        for i in range(1, 101):
+            recorder.record("GET /api/projects", i / 1000, 304 if i % 2 else 200)
+        recorder.record("POST /api/login", 0.5, 503)
+        recorder.record("POST /api/login", 0.1, "ReadTimeout")
+        recorder.record("POST /api/login", 0.2, 200)
+        recorder.finish()
+        report = recorder.report()
+
+        projects = report["routes"]["GET /api/projects"]
+        assert projects["latency_ms"]["p50"] == 51.0
+        assert projects["latency_ms"]["p99"] == 100.0
+        assert projects["error_rate"] == 0.0
+        login = report["routes"]["POST /api/login"]
+        assert login["errors"] == 2
+        assert login["statuses"] == {"200": 1, "503": 1, "ReadTimeout": 1}
+        assert report["requests"] == 103
+        assert report["error_breakdown"] == {"POST /api/login 503": 1, "POST /api/login ReadTimeout": 1}
+
+    def test_compare_reports(self):
+        """두 보고서의 공통 경로 변화율을 계산하는지 테스트"""
+        def report(rps, p50):
+            latency = {"p50": p50, "p95": p50, "p99": p50}
+            return {
+                "throughput_rps": rps, "error_rate": 0.0,
+                "routes": {"POST /api/login": {"throughput_rps": rps, "latency_ms": latency, "error_rate": 0.0}},
+            }
+
+        diff = compare_reports(report(100, 20), report(150, 10))
+        assert diff["throughput_rps"]["change_pct"] == 50.0
+        assert diff["routes"]["POST /api/login"]["p50_ms"]["change_pct"] == -50.0
+
+class TestLoadScenarios:
+    """ASGI transport로 앱에 직접 시나리오를 실행하는 테스트 클래스"""
+
+    def setup_method(self):
+        self._previous_overrides = {dependency: app.dependency_overrides.get(dependency) for dependency in OVERRIDES}
+        app.dependency_overrides.update(OVERRIDES)
+        db = TestingSessionLocal()
+        for model in (Evaluation, TeamMember, Aidea, Account, Judge):
+            db.query(model).delete()
+        db.commit()
+        db.close()
+
+    def teardown_method(self):
+        for dependency, previous in self._previous_overrides.items():
+            if previous is None:
+                app.dependency_overrides.pop(dependency, None)
+            else:
+                app.dependency_overrides[dependency] = previous
+
+    def test_all_scenarios_report_per_route(self):
+        """참가자 등록 → 심사위원 조회/평가 → 관리자 내보내기가 모두 오류 없이 기록되는지 테스트"""
+        config = LoadConfig(
+            base_url="http://loadtest", participants=3, judges=1, admins=1,
+            judge_rounds=2, evaluations_per_round=2, admin_rounds=1, poll_interval=0, seed=0,
+        )
+        transport = httpx.ASGITransport(app=app)
+        with patch("main._check_registration_period"):
+            # 심사위원이 평가할 프로젝트가 있도록 참가자 시나리오를 먼저 실행
+            config.scenarios = ["participant"]
+            registration = asyncio.run(run_load(config, transport=transport))
+            config.scenarios = ["judge", "admin"]
+            judging = asyncio.run(run_load(config, transport=transport))
+
+        assert registration["error_rate"] == judging["error_rate"] == 0.0
+        assert set(registration["routes"]) == {"POST /api/login", "POST /api/register"}
+        assert registration["routes"]["POST /api/register"]["requests"] == 3
+        assert set(registration["routes"]["POST /api/login"]["latency_ms"]) == {"p50", "p95", "p99", "max", "mean"}
+        assert set(judging["routes"]) == {
+            "POST /api/judge/login", "GET /api/projects", "POST /api/evaluations",
+            "POST /api/admin/login", "GET /api/admin/export/{entity}",
+        }
+        # 라운드당 2건씩 두 라운드 → 3개 모두 평가, 두 번째 조회는 평가 후라 200
+        assert judging["routes"]["POST /api/evaluations"]["requests"] == 3
+        assert "admin_password" not in judging["config"]
+
+        db = TestingSessionLocal()
+        assert db.query(Aidea).count() == 3
+        assert db.query(Evaluation).count() == 3
+        db.close()
@@ -1,23 +1,21 @@
+import os
+import tempfile
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 from unittest.mock import patch, MagicMock
 from passlib.hash import bcrypt
 
+import main
 from main import app
 from database import get_db
-from models import Base, Account
+from testing_db import create_test_engine
+from models import Base, Account, Judge
 from schemas import AccountLogin, AccountResponse
 
-# 테스트용 인메모리 SQLite 데이터베이스 설정
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
+# 테스트용 데이터베이스 설정 (기본: 임시 디렉터리의 SQLite 파일, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+engine = create_test_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='test_login_'), 'test.db')}")
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # 테스트 데이터베이스 테이블 생성
@@ -218,3 +216,87 @@ class TestLoginOrRegisterAccount:
         assert account.verify_password("old_password")
         assert not account.verify_password("new_password")
         db.close()
+
+    def _login_released_connection(self, url: str, payload: dict) -> bool:
+        """해시 검증 시점에 요청 세션이 트랜잭션(커넥션)을 잡고 있지 않았는지 확인하며 로그인합니다."""
+        sessions = []
+
+        def capture_get_db():
+            # 운영 SessionLocal과 같이 커밋 후에도 속성을 만료시키지 않는 세션
+            session = TestingSessionLocal(expire_on_commit=False)
+            sessions.append(session)
+            try:
+                yield session
+            finally:
+                session.close()
+
+        async def verify(password, hashed_password):
+            return not sessions[0].in_transaction()
+
+        app.dependency_overrides[get_db] = capture_get_db
+        try:
+            with patch("main.hasher.verify", side_effect=verify):
+                response = client.post(url, json=payload)
+        finally:
+            app.dependency_overrides[get_db] = override_get_db
+        # verify가 False를 반환하면 401
+        return response.status_code == 200
+
+    def test_connection_released_while_hashing(self):
+        """bcrypt 검증을 기다리는 동안 세션이 커넥션(트랜잭션)을 잡고 있지 않은지 테스트"""
+        # Given: 기존 계정
+        db = TestingSessionLocal()
+        db.add(Account(knox_id="test_user", hashed_password=bcrypt.hash("password123")))
+        db.commit()
+        db.close()
+
+        # When/Then: 트랜잭션이 끝난 상태에서 검증되어 로그인 성공
+        assert self._login_released_connection("/api/login", {"knox_id": "test_user", "password": "password123"})
+
+    def test_judge_login_connection_released_while_hashing(self):
+        """심사위원 로그인도 bcrypt 검증 전에 커넥션을 반환하는지 테스트"""
+        # Given: 기존 심사위원
+        db = TestingSessionLocal()
+        db.query(Judge).filter(Judge.judge_id == "judge_hash").delete()
+        db.add(Judge(judge_id="judge_hash", hashed_password=bcrypt.hash("password123"), name="심사위원"))
+        db.commit()
+        db.close()
+
+        # When/Then
+        assert self._login_released_connection("/api/judge/login", {"judge_id": "judge_hash", "password": "password123"})
+
+    def test_concurrent_registration_verifies_outside_write(self):
+        """동시에 같은 knox_id로 먼저 생성된 경우, 쓰기 작업 밖에서(hasher) 비밀번호를 확인하는지 테스트"""
+        # Given: 조회 시점에는 없었지만 INSERT 전에 다른 요청이 만든 계정
+        db = TestingSessionLocal()
+        db.add(Account(knox_id="race_user", hashed_password=bcrypt.hash("password123")))
+        db.commit()
+        db.close()
+        real_lookup = main.get_account_by_knox_id
+        lookups = []
+
+        def lookup(session, knox_id):
+            lookups.append(knox_id)
+            # 엔드포인트와 crud의 사전 조회(2번)에서는 아직 없던 것으로 보임
+            return None if len(lookups) <= 2 else real_lookup(session, knox_id)
+
+        verified = []
+
+        async def verify(password, hashed_password):
+            verified.append(password)
+            return bcrypt.verify(password, hashed_password)
+
+        # When: 쓰기 작업 안의 동기 bcrypt 검증은 쓰이면 안 됨
+        with patch("main.get_account_by_knox_id", side_effect=lookup), \
+                patch("crud.get_account_by_knox_id", side_effect=lookup), \
+                patch("main.hasher.verify", side_effect=verify), \
+                patch.object(Account, "verify_password", side_effect=AssertionError("쓰기 작업 안에서 bcrypt 검증")):
+            ok = client.post("/api/login", json={"knox_id": "race_user", "password": "password123"})
+            lookups.clear()
+            wrong = client.post("/api/login", json={"knox_id": "race_user", "password": "other"})
+
+        # Then
+        assert ok.status_code == 200
+        assert ok.json()["knox_id"] == "race_user"
+        assert wrong.status_code == 401
+        assert verified == ["password123", "other"]
@@ -0,0 +1,486 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from main import app, create_access_token, ADMIN_USERNAME
+import crud
+from crud import cancel_mail_job, create_evaluation, expand_mail_job
+from database import get_db, get_read_db
+from mailer import Mailer, RateLimiter
+from testing_db import create_test_engine
+from models import Base, EmailOutbox, MailJob, Account, TeamMember, Aidea, Judge, Evaluation, AideaScoreSummary
+
+# 테스트용 데이터베이스 설정 (기본: 인메모리 SQLite, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+engine = create_test_engine()
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+Base.metadata.create_all(bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+OVERRIDES = {get_db: override_get_db, get_read_db: override_get_db}
+
+client = TestClient(app)
+HEADERS = {"Authorization": f"Bearer {create_access_token(data={'sub': ADMIN_USERNAME})}"}
+
+class StubMailServer:
+    """Knox 메일 서버 대역: 받은 요청과 연결을 기록하고, 정해 둔 상태 코드를 차례로 돌려줍니다."""
+
+    def __init__(self):
+        self.requests = []
+        self.connections = set()
+        self.statuses = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.requests.append({"body": body, "message_id": self.headers.get("Idempotency-Key")})
+                stub.connections.add(self.client_address)
+                status, headers = stub.statuses.pop(0) if stub.statuses else (200, {})
+                payload = json.dumps({"result": "ok" if status == 200 else "error"}).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/knox_api"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+def outbox(message_id: str) -> EmailOutbox:
+    db = TestingSessionLocal()
+    try:
+        return db.query(EmailOutbox).filter(EmailOutbox.message_id == message_id).one()
+    finally:
+        db.close()
+
+def outbox_by_id(outbox_id: int) -> str:
+    db = TestingSessionLocal()
+    try:
+        return db.get(EmailOutbox, outbox_id).message_id
+    finally:
+        db.close()
+
+class TestSendEmailEndpoint:
+    """메일 발송 요청(outbox 저장) API 테스트 클래스"""
+
+    def setup_method(self):
+        self._previous_overrides = {dependency: app.dependency_overrides.get(dependency) for dependency in OVERRIDES}
+        app.dependency_overrides.update(OVERRIDES)
+        db = TestingSessionLocal()
+        db.query(EmailOutbox).delete()
+        db.commit()
+        db.close()
+
+    def teardown_method(self):
+        for dependency, previous in self._previous_overrides.items():
+            if previous is None:
+                app.dependency_overrides.pop(dependency, None)
+            else:
+                app.dependency_overrides[dependency] = previous
+
+    def test_enqueue_returns_immediately_and_is_idempotent(self):
+        """메일 서버를 기다리지 않고 202와 message_id를 돌려주며, 같은 ID의 재요청은 한 번만 저장되는지 테스트"""
+        payload = {"recipients": ["user1@samsung.com", " "], "subject": "등록 완료", "contents": "내용"}
+
+        first = client.post("/api/send-email", json=payload, headers={"Idempotency-Key": "reg-1"})
+        again = client.post("/api/send-email", json=payload, headers={"Idempotency-Key": "reg-1"})
+        other = client.post("/api/send-email", json=payload)
+
+        assert first.status_code == again.status_code == other.status_code == 202
+        assert first.json()["message_id"] == again.json()["message_id"] == "reg-1"
+        assert first.json()["status"] == "pending"
+        assert other.json()["message_id"] not in ("reg-1", None)
+        db = TestingSessionLocal()
+        assert db.query(EmailOutbox).count() == 2
+        db.close()
+        assert outbox("reg-1").recipients == ["user1@samsung.com"]
+
+        status_response = client.get("/api/send-email/reg-1")
+        assert status_response.status_code == 200
+        assert status_response.json()["attempts"] == 0
+        assert client.get("/api/send-email/unknown").status_code == 404
+
+    def test_validation(self):
+        """받는 사람이나 제목이 비어 있으면 400인지 테스트"""
+        assert client.post("/api/send-email", json={"recipients": [], "subject": "제목", "contents": ""}).status_code == 400
+        assert client.post("/api/send-email", json={"recipients": ["a@b.c"], "subject": " ", "contents": ""}).status_code == 400
+
+class TestMailer:
+    """발송 워커 테스트 클래스 (로컬 대역 메일 서버)"""
+
+    def setup_method(self):
+        db = TestingSessionLocal()
+        db.query(EmailOutbox).delete()
+        db.commit()
+        db.close()
+        self.stub = StubMailServer()
+        self.mailer = Mailer(url=self.stub.url, session_factory=TestingSessionLocal, concurrency=2,
+                             max_attempts=3, backoff=10, timeout=5)
+
+    def teardown_method(self):
+        self.stub.close()
+
+    def enqueue(self, *message_ids):
+        from crud import enqueue_email
+        db = TestingSessionLocal()
+        for message_id in message_ids:
+            enqueue_email(db, message_id, [f"{message_id}@samsung.com"], f"제목 {message_id}", "내용")
+        db.close()
+
+    def run(self, scenario):
+        async def wrapped():
+            try:
+                return await scenario()
+            finally:
+                await self.mailer.close()
+        return asyncio.run(wrapped())
+
+    def test_delivers_over_shared_connections(self):
+        """대기 중인 메일을 모두 보내고, 연결을 메일마다 새로 맺지 않는지 테스트"""
+        self.enqueue(*[f"m{i}" for i in range(6)])
+
+        async def scenario():
+            sent = 0
+            while True:
+                count = await self.mailer.run_once()
+                if not count:
+                    return sent
+                sent += count
+
+        assert self.run(scenario) == 6
+        assert sorted(r["message_id"] for r in self.stub.requests) == [f"m{i}" for i in range(6)]
+        assert self.stub.requests[0]["body"].keys() == {"recipients", "subject", "contents"}
+        # 동시 발송 수(2)만큼의 keep-alive 연결만 사용
+        assert len(self.stub.connections) <= 2
+        assert all(outbox(f"m{i}").status == "sent" for i in range(6))
+        assert self.mailer.stats()["sent"] == 6
+
+    def test_retry_with_backoff_then_fail(self):
+        """5xx는 백오프(Retry-After 반영) 후 재시도하고, 4xx나 시도 횟수 초과는 failed로 남기는지 테스트"""
+        self.enqueue("retry", "reject")
+        self.stub.statuses = [(503, {"Retry-After": "60"}), (400, {})]
+        now = datetime.utcnow()
+
+        async def scenario():
+            first = await self.mailer.run_once(now)
+            # 재시도 시각 전에는 꺼내지 않음
+            early = await self.mailer.run_once(now + timedelta(seconds=30))
+            return first, early
+
+        assert self.run(scenario) == (2, 0)
+        retry, reject = outbox("retry"), outbox("reject")
+        if self.stub.requests[0]["message_id"] == "reject":
+            retry, reject = reject, retry  # 동시 발송이라 응답 순서는 정해지지 않음
+        assert reject.status == "failed" and reject.attempts == 1 and "400" in reject.last_error
+        assert retry.status == "pending" and "503" in retry.last_error
+        assert retry.next_attempt_at >= now + timedelta(seconds=60)
+
+        self.stub.statuses = [(500, {}), (502, {})]
+
+        async def retries():
+            later = now + timedelta(hours=1)
+            return [await self.mailer.run_once(later + timedelta(hours=i)) for i in range(3)]
+
+        assert self.run(retries) == [1, 1, 0]
+        failed = outbox(retry.message_id)
+        assert failed.status == "failed" and failed.attempts == 3 and "502" in failed.last_error
+
+    def test_stale_sending_is_reclaimed(self):
+        """발송 중 프로세스가 죽어 sending으로 남은 메일을 점유 만료 후 다시 보내는지 테스트"""
+        self.enqueue("stale")
+        now = datetime.utcnow()
+        claimed = self.mailer._claim(10, now)  # 꺼낸 뒤 발송 전에 죽은 상황
+        assert [m["message_id"] for m in claimed] == ["stale"] and outbox("stale").status == "sending"
+
+        async def scenario():
+            before = await self.mailer.run_once(now + timedelta(seconds=10))
+            after = await self.mailer.run_once(now + timedelta(seconds=self.mailer.lease + 1))
+            return before, after
+
+        assert self.run(scenario) == (0, 1)
+        assert outbox("stale").status == "sent" and outbox("stale").attempts == 2
+
+    def test_stale_sending_at_max_attempts_is_failed(self):
+        """최대 시도 횟수를 다 쓴 채 sending으로 남은 메일은 다시 보내지 않고 failed로 정리하는지 테스트"""
+        self.enqueue("exhausted")
+        now = datetime.utcnow()
+        for attempt in range(self.mailer.max_attempts):
+            # 매번 꺼낸 뒤 발송 전에 죽은 상황
+            self.mailer._claim(10, now + timedelta(seconds=(self.mailer.lease + 1) * attempt))
+
+        later = now + timedelta(seconds=(self.mailer.lease + 1) * self.mailer.max_attempts)
+        assert self.run(lambda: self.mailer.run_once(later)) == 0
+        assert self.stub.requests == []
+        exhausted = outbox("exhausted")
+        assert exhausted.status == "failed" and exhausted.attempts == self.mailer.max_attempts
+
+    def test_result_write_is_retried(self):
+        """발송 후 결과 저장이 실패하면 다시 시도하고, 끝내 실패해도 발송 task가 예외로 끝나지 않는지 테스트"""
+        self.enqueue("flaky", "down")
+        finish = self.mailer._finish
+        failures = {"flaky": 1, "down": 10}
+
+        def flaky_finish(message_id, values):
+            message = outbox_by_id(message_id)
+            if failures[message] > 0:
+                failures[message] -= 1
+                raise OperationalError("UPDATE email_outbox", {}, Exception("database is locked"))
+            finish(message_id, values)
+
+        with patch.object(self.mailer, "_finish", side_effect=flaky_finish), patch("mailer.RECORD_RETRY_SECONDS", 0):
+            assert self.run(self.mailer.run_once) == 2
+
+        assert outbox("flaky").status == "sent"
+        # 저장하지 못한 메일은 sending으로 남아 점유 만료 후 다시 처리됨
+        assert outbox("down").status == "sending"
+        assert len(self.stub.requests) == 2
+
+    def test_background_worker_wakes_on_notify(self):
+        """워커가 poll 간격을 기다리지 않고 notify로 바로 발송하는지 테스트"""
+        self.mailer.poll_interval = 60
+
+        async def scenario():
+            await self.mailer.start()
+            try:
+                await asyncio.sleep(0.05)
+                self.enqueue("live")
+                self.mailer.notify()
+                for _ in range(100):
+                    if self.stub.requests:
+                        break
+                    await asyncio.sleep(0.02)
+                await asyncio.sleep(0.05)
+            finally:
+                await self.mailer.stop()
+
+        self.run(scenario)
+        assert outbox("live").status == "sent"
+
+class TestMailJobs:
+    """관리자 단체 메일 작업 테스트 클래스"""
+
+    def setup_method(self):
+        self._previous_overrides = {dependency: app.dependency_overrides.get(dependency) for dependency in OVERRIDES}
+        app.dependency_overrides.update(OVERRIDES)
+        db = TestingSessionLocal()
+        for model in (EmailOutbox, MailJob, Evaluation, AideaScoreSummary, Judge, Aidea, TeamMember, Account):
+            db.query(model).delete()
+        # 계정 5개: 짝수 번째만 Aidea 제출, 첫 계정은 팀원 2명
+        for i in range(5):
+            account = Account(knox_id=f"user{i}", hashed_password="x", name=f"참가자{i}", team_name=f"팀{i}")
+            if i == 0:
+                account.team_members = [TeamMember(name="팀원A", knox_id="memberA"), TeamMember(name="팀원B", knox_id="memberB")]
+            if i % 2 == 0:
+                account.aideas = [Aidea(project=f"프로젝트{i}")]
+            db.add(account)
+        judge = Judge(judge_id="judge1", hashed_password="x", name="심사위원")
+        db.add(judge)
+        db.commit()
+        self.account_ids = [a.id for a in db.query(Account).order_by(Account.id)]
+        aidea = db.query(Aidea).filter(Aidea.project == "프로젝트2").one()
+        create_evaluation(db, aidea.id, judge.id, 30, 30, 30)
+        db.close()
+        self.stub = StubMailServer()
+        self.mailer = Mailer(url=self.stub.url, session_factory=TestingSessionLocal, concurrency=4,
+                             max_attempts=3, timeout=5, rate=0, job_batch=2)
+
+    def teardown_method(self):
+        self.stub.close()
+        for dependency, previous in self._previous_overrides.items():
+            if previous is None:
+                app.dependency_overrides.pop(dependency, None)
+            else:
+                app.dependency_overrides[dependency] = previous
+
+    def create_job(self, **fields):
+        payload = {"name": "심사 결과 안내", "audience": "submitted",
+                   "subject": "[AIdea] {team_name} 심사 결과", "contents": "{name}님, {project} 순위: {rank}", **fields}
+        return client.post("/api/admin/mail-jobs", json=payload, headers=HEADERS)
+
+    def drain(self):
+        async def scenario():
+            try:
+                while await self.mailer.run_once():
+                    pass
+            finally:
+                await self.mailer.close()
+        asyncio.run(scenario())
+
+    def test_validation_and_dry_run(self):
+        """템플릿/대상 검증, 관리자 인증, dry run 미리보기 테스트"""
+        assert self.create_job(subject="{password}").status_code == 400
+        assert self.create_job(contents="{name.__class__}").status_code == 400
+        assert self.create_job(contents="{rank:>5}").status_code == 400
+        assert self.create_job(audience="everyone").status_code == 400
+        assert client.post("/api/admin/mail-jobs", json={"name": "x", "audience": "all", "subject": "s", "contents": ""}).status_code in (401, 403)
+
+        preview = self.create_job(dry_run=True)
+        assert preview.status_code == 200
+        assert preview.json() == {
+            "audience": "submitted",
+            "recipient_count": 3,
+            "sample": {
+                "recipients": ["user0@samsung.com", "memberA@samsung.com", "memberB@samsung.com"],
+                "subject": "[AIdea] 팀0 심사 결과",
+                "contents": "참가자0님, 프로젝트0 순위: ",
+            },
+        }
+        assert self.create_job(audience="not_submitted", dry_run=True).json()["recipient_count"] == 2
+        assert client.get("/api/admin/mail-jobs", headers=HEADERS).json() == []
+
+    def test_job_renders_and_delivers_with_progress(self):
+        """대상 계정별로 템플릿을 채워 보내고, 진행 현황이 상태별 개수로 집계되는지 테스트"""
+        response = self.create_job(audience="ranked")
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] == "expanding" and job["done"] is False
+
+        self.drain()
+
+        bodies = {tuple(r["body"]["recipients"]): r["body"] for r in self.stub.requests}
+        assert list(bodies) == [("user2@samsung.com",)]
+        assert bodies[("user2@samsung.com",)]["contents"] == "참가자2님, 프로젝트2 순위: 1"
+
+        progress = client.get(f"/api/admin/mail-jobs/{job['id']}", headers=HEADERS).json()
+        assert progress["status"] == "queued" and progress["total"] == 1
+        assert progress["progress"] == {"sent": 1} and progress["done"] is True
+        assert client.get("/api/admin/mail-jobs/9999", headers=HEADERS).status_code == 404
+
+    def test_expansion_resumes_without_duplicates(self):
+        """outbox 생성이 batch마다 커밋되어, 중간에 죽거나 다시 실행돼도 계정당 메일이 하나인지 테스트"""
+        job_id = self.create_job(audience="all").json()["id"]
+
+        db = TestingSessionLocal()
+        assert expand_mail_job(db, 2, "samsung.com") is True  # 첫 batch 후 프로세스가 죽은 상황
+        job = db.get(MailJob, job_id)
+        assert (job.status, job.total, job.last_account_id) == ("expanding", 2, self.account_ids[1])
+        # 진행 위치를 잃어 처음부터 다시 실행해도 이미 넣은 메일은 건너뜀
+        job.last_account_id = 0
+        db.commit()
+        db.close()
+
+        self.drain()
+
+        db = TestingSessionLocal()
+        job = db.get(MailJob, job_id)
+        assert (job.status, job.total) == ("queued", 5)
+        message_ids = sorted(m for (m,) in db.query(EmailOutbox.message_id).filter(EmailOutbox.job_id == job_id))
+        db.close()
+        assert message_ids == sorted(f"job-{job_id}-{account_id}" for account_id in self.account_ids)
+        assert len(self.stub.requests) == 5
+
+    def test_single_mail_goes_before_bulk_and_cancel(self):
+        """개별 메일이 쌓인 단체 메일보다 먼저 발송되고, 취소한 작업의 남은 메일은 보내지 않는지 테스트"""
+        job_id = self.create_job(audience="all").json()["id"]
+        db = TestingSessionLocal()
+        while expand_mail_job(db, 2, "samsung.com"):
+            pass
+        db.close()
+        client.post("/api/send-email", json={"recipients": ["admin@samsung.com"], "subject": "개별", "contents": ""})
+        self.mailer.concurrency = 1
+
+        async def first():
+            try:
+                return await self.mailer.run_once()
+            finally:
+                await self.mailer.close()
+
+        assert asyncio.run(first()) == 1
+        assert self.stub.requests[0]["body"]["subject"] == "개별"
+
+        cancelled = client.post(f"/api/admin/mail-jobs/{job_id}/cancel", headers=HEADERS).json()
+        assert cancelled["status"] == "cancelled"
+        assert cancelled["progress"] == {"cancelled": 5} and cancelled["done"] is True
+        self.drain()
+        assert len(self.stub.requests) == 1
+        assert client.post("/api/admin/mail-jobs/9999/cancel", headers=HEADERS).status_code == 404
+
+    def test_cancel_during_expansion_batch(self):
+        """outbox 생성 batch가 대상을 읽은 뒤 작업이 취소되면, 그 batch의 메일을 넣지 않는지 테스트"""
+        job_id = self.create_job(audience="all").json()["id"]
+        read_accounts = crud._mail_job_accounts
+
+        def cancel_after_read(*args):
+            accounts = read_accounts(*args)
+            other = TestingSessionLocal()
+            cancel_mail_job(other, job_id)  # 관리자가 batch 도중에 취소
+            other.close()
+            return accounts
+
+        db = TestingSessionLocal()
+        with patch("crud._mail_job_accounts", side_effect=cancel_after_read):
+            assert expand_mail_job(db, 2, "samsung.com") is True
+        assert expand_mail_job(db, 2, "samsung.com") is False
+        job = db.get(MailJob, job_id)
+        assert (job.status, job.total, job.last_account_id) == ("cancelled", 0, 0)
+        assert db.query(EmailOutbox).filter(EmailOutbox.job_id == job_id).count() == 0
+        db.close()
+
+        self.drain()
+        assert self.stub.requests == []
+
+    def test_rankings_snapshot_per_job(self):
+        """batch 사이에 평가가 들어와 순위가 바뀌어도, 작업을 만들 때의 순위로 모든 메일을 채우는지 테스트"""
+        job_id = self.create_job(audience="submitted").json()["id"]
+        db = TestingSessionLocal()
+        assert expand_mail_job(db, 1, "samsung.com") is True  # 첫 batch: user0
+
+        # 프로젝트4가 만점을 받고 프로젝트2에 낮은 평가가 추가되어 순위가 뒤바뀜
+        judge = Judge(judge_id="judge2", hashed_password="x", name="심사위원2")
+        db.add(judge)
+        db.commit()
+        aideas = {aidea.project: aidea.id for aidea in db.query(Aidea)}
+        create_evaluation(db, aideas["프로젝트2"], judge.id, 10, 10, 10)
+        create_evaluation(db, aideas["프로젝트4"], judge.id, 30, 30, 30)
+        while expand_mail_job(db, 1, "samsung.com"):
+            pass
+        contents = dict(
+            db.query(EmailOutbox.message_id, EmailOutbox.contents).filter(EmailOutbox.job_id == job_id)
+        )
+        db.close()
+
+        assert contents == {
+            f"job-{job_id}-{self.account_ids[0]}": "참가자0님, 프로젝트0 순위: ",
+            f"job-{job_id}-{self.account_ids[2]}": "참가자2님, 프로젝트2 순위: 1",
+            f"job-{job_id}-{self.account_ids[4]}": "참가자4님, 프로젝트4 순위: ",
+        }
+
+    def test_rate_limiter(self):
+        """초당 발송 수 제한: 1초 분량을 넘는 요청은 제한 속도로 기다리는지 테스트"""
+        limiter = RateLimiter(rate=100)
+
+        async def scenario():
+            start = time.monotonic()
+            for _ in range(120):
+                await limiter.acquire()
+            return time.monotonic() - start
+
+        # 처음 100건은 바로, 나머지 20건은 100건/초 → 약 0.2초
+        assert 0.15 <= asyncio.run(scenario()) < 1.0
@@ -0,0 +1,170 @@
+import asyncio
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from passlib.hash import bcrypt
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+import metrics
+from main import app, create_access_token, ADMIN_USERNAME, _service_busy
+from database import get_read_db
+from hashing import HashingService, HashingBusyError
+from testing_db import create_test_engine
+from models import Base, Judge
+
+# 테스트용 데이터베이스 설정 (기본: 인메모리 SQLite, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+engine = create_test_engine()
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+Base.metadata.create_all(bind=engine)
+metrics.instrument_engine(engine, "test")
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+client = TestClient(app)
+HEADERS = {"Authorization": f"Bearer {create_access_token(data={'sub': ADMIN_USERNAME})}"}
+
+def sample(text_body: str, line_prefix: str) -> float:
+    """메트릭 텍스트에서 line_prefix로 시작하는 샘플 값을 찾습니다."""
+    for line in text_body.splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{line_prefix} 샘플이 없습니다.")
+
+class TestRegistry:
+    """메트릭 자료구조와 Prometheus 텍스트 형식 테스트 클래스"""
+
+    def test_histogram_renders_cumulative_buckets(self):
+        """히스토그램 버킷이 누적 개수로, 합계/개수와 함께 출력되는지 테스트"""
+        histogram = metrics.Histogram("test_histogram_seconds", "테스트", ("route",), buckets=(0.1, 1))
+        metrics.REGISTRY.remove(histogram)
+        for value in (0.05, 0.5, 5):
+            histogram.observe(value, '/a"b')
+
+        lines = histogram.render()
+        assert lines[:2] == ["# HELP test_histogram_seconds 테스트", "# TYPE test_histogram_seconds histogram"]
+        assert lines[2:] == [
+            'test_histogram_seconds_bucket{route="/a\\"b",le="0.1"} 1',
+            'test_histogram_seconds_bucket{route="/a\\"b",le="1"} 2',
+            'test_histogram_seconds_bucket{route="/a\\"b",le="+Inf"} 3',
+            'test_histogram_seconds_sum{route="/a\\"b"} 5.55',
+            'test_histogram_seconds_count{route="/a\\"b"} 3',
+        ]
+
+    def test_counter_and_gauge(self):
+        """카운터는 누적, 게이지는 설정/증감 값이 출력되는지 테스트"""
+        counter = metrics.Counter("test_total", "테스트", ("kind",))
+        gauge = metrics.Gauge("test_gauge", "테스트")
+        for metric in (counter, gauge):
+            metrics.REGISTRY.remove(metric)
+        counter.inc("a")
+        counter.inc("a", amount=2)
+        gauge.set(5)
+        gauge.dec()
+
+        assert counter.render()[2:] == ['test_total{kind="a"} 3']
+        assert gauge.render()[2:] == ["test_gauge 4"]
+
+class TestMetricsEndpoint:
+    """미들웨어/엔진 이벤트로 모은 메트릭 노출 테스트 클래스"""
+
+    def setup_method(self):
+        self._previous_override = app.dependency_overrides.get(get_read_db)
+        app.dependency_overrides[get_read_db] = override_get_db
+        db = TestingSessionLocal()
+        db.query(Judge).delete()
+        db.add(Judge(judge_id="judge1", hashed_password="x", name="심사위원1"))
+        db.commit()
+        db.close()
+
+    def teardown_method(self):
+        if self._previous_override is None:
+            app.dependency_overrides.pop(get_read_db, None)
+        else:
+            app.dependency_overrides[get_read_db] = self._previous_override
+
+    def test_per_route_requests_latency_and_db_queries(self):
+        """라우트 템플릿별 요청 수/상태/지연 시간과 요청당 DB 쿼리 수가 기록되는지 테스트"""
+        route = 'method="GET",route="/api/admin/judges"'
+        before = metrics.HTTP_DB_QUERIES.count("GET", "/api/admin/judges")
+        queries_before = metrics.DB_QUERIES.value("test")
+
+        assert client.get("/api/admin/judges", headers=HEADERS).status_code == 200
+        assert client.get("/api/admin/judges").status_code in (401, 403)
+        body = client.get("/api/metrics").text
+
+        assert sample(body, f'http_requests_total{{{route},status="200"}}') >= 1
+        assert sample(body, f"http_request_duration_seconds_count{{{route}}}") >= 2
+        assert sample(body, f'http_request_duration_seconds_bucket{{{route},le="+Inf"}}') >= 2
+        assert metrics.HTTP_DB_QUERIES.count("GET", "/api/admin/judges") == before + 2
+        assert sample(body, f"http_request_db_queries_sum{{{route}}}") >= 1
+        assert metrics.DB_QUERIES.value("test") > queries_before
+        assert "http_requests_in_flight 1" in body
+
+    def test_raw_paths_are_not_labels(self):
+        """실제 경로 대신 라우트 템플릿(매칭 실패 시 unmatched)만 라벨로 쓰는지 테스트"""
+        client.get("/api/admin/export/entity123456", headers=HEADERS)
+        client.post("/api/does-not-exist-1")
+        client.post("/api/does-not-exist-2")
+
+        routes = {labels[1] for labels in metrics.HTTP_REQUESTS._values}
+        assert "/api/admin/export/{entity}" in routes
+        assert not any("123456" in route or "does-not-exist" in route for route in routes)
+
+    def test_metrics_token(self):
+        """METRICS_TOKEN을 설정하면 토큰 없이 조회할 수 없는지 테스트"""
+        with patch("main.METRICS_TOKEN", "secret"):
+            assert client.get("/api/metrics").status_code == 401
+            response = client.get("/api/metrics", headers={"Authorization": "Bearer secret"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+
+class TestHotPathCounters:
+    """bcrypt / SQLite busy / 503 카운터 테스트 클래스"""
+
+    def test_bcrypt_timings(self):
+        """해시 검증 시간이 op별 히스토그램에 기록되는지 테스트"""
+        service = HashingService(max_workers=1)
+        before = metrics.BCRYPT_SECONDS.count("verify")
+        try:
+            assert asyncio.run(service.verify("pw", bcrypt.hash("pw")))
+        finally:
+            service.shutdown()
+
+        assert metrics.BCRYPT_SECONDS.count("verify") == before + 1
+
+    def test_sqlite_busy_errors(self):
+        """busy timeout을 넘긴 'database is locked' 오류를 센다는 것을 테스트"""
+        path = os.path.join(tempfile.mkdtemp(prefix="test_metrics_"), "busy.db")
+        holder = create_engine(f"sqlite:///{path}")
+        waiter = create_engine(f"sqlite:///{path}", connect_args={"timeout": 0.05})
+        metrics.instrument_engine(waiter, "busy_test")
+        with holder.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+
+        with holder.connect() as conn:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            with pytest.raises(OperationalError):
+                with waiter.begin() as blocked:
+                    blocked.execute(text("INSERT INTO items DEFAULT VALUES"))
+            conn.exec_driver_sql("ROLLBACK")
+        holder.dispose()
+        waiter.dispose()
+
+        assert metrics.SQLITE_BUSY.value("busy_test") == 1
+        assert metrics.DB_ERRORS.value("busy_test") == 1
+
+    def test_service_busy(self):
+        """503으로 거절할 때 원인별로 세는지 테스트"""
+        before = metrics.SERVICE_BUSY.value("hashing")
+        assert _service_busy(HashingBusyError("busy")).status_code == 503
+        assert metrics.SERVICE_BUSY.value("hashing") == before + 1
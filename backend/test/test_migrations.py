@@ -0,0 +1,101 @@
+import threading
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import IntegrityError
+
+from migrate import SCHEMA_HEAD, SchemaOutdatedError, _alembic_config, current_revision, ensure_schema
+from models import Base
+
+# alembic 도입 전 create_all로 만든 DB (benefit 컬럼, 집계 테이블, 인덱스/유니크 제약 없음)
+LEGACY_SCHEMA = [
+    "CREATE TABLE accounts (id INTEGER PRIMARY KEY, knox_id VARCHAR NOT NULL UNIQUE, hashed_password VARCHAR NOT NULL, "
+    "name VARCHAR, team_name VARCHAR, department VARCHAR, created_at DATETIME DEFAULT CURRENT_TIMESTAMP, updated_at DATETIME)",
+    "CREATE TABLE team_members (id INTEGER PRIMARY KEY, account_id INTEGER NOT NULL REFERENCES accounts(id), "
+    "name VARCHAR NOT NULL, knox_id VARCHAR NOT NULL, created_at DATETIME DEFAULT CURRENT_TIMESTAMP)",
+    "CREATE TABLE aideas (id INTEGER PRIMARY KEY, account_id INTEGER NOT NULL REFERENCES accounts(id), project VARCHAR NOT NULL, "
+    "target_user TEXT, problem TEXT, solution TEXT, data_sources TEXT, scenario TEXT, workflow TEXT, "
+    "created_at DATETIME DEFAULT CURRENT_TIMESTAMP, updated_at DATETIME)",
+    "CREATE TABLE judges (id INTEGER PRIMARY KEY, judge_id VARCHAR NOT NULL UNIQUE, hashed_password VARCHAR NOT NULL, "
+    "name VARCHAR NOT NULL, created_at DATETIME DEFAULT CURRENT_TIMESTAMP, updated_at DATETIME)",
+    "CREATE TABLE evaluations (id INTEGER PRIMARY KEY, aidea_id INTEGER NOT NULL REFERENCES aideas(id), "
+    "judge_id INTEGER NOT NULL REFERENCES judges(id), innovation_score INTEGER NOT NULL, feasibility_score INTEGER NOT NULL, "
+    "effectiveness_score INTEGER NOT NULL, total_score INTEGER NOT NULL, created_at DATETIME DEFAULT CURRENT_TIMESTAMP, updated_at DATETIME)",
+]
+
+@pytest.fixture
+def db_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+    yield engine
+    engine.dispose()
+
+def test_schema_head_matches_alembic_head():
+    """SCHEMA_HEAD가 migrations/versions의 최신 revision과 같은지 테스트"""
+    assert ScriptDirectory.from_config(_alembic_config()).get_current_head() == SCHEMA_HEAD
+
+def test_fresh_database_matches_models(db_engine):
+    """빈 DB를 마이그레이션하면 모델 정의와 스키마가 일치하는지 테스트"""
+    assert current_revision(db_engine) is None
+
+    assert ensure_schema(db_engine) == SCHEMA_HEAD
+
+    assert current_revision(db_engine) == SCHEMA_HEAD
+    with db_engine.connect() as conn:
+        assert compare_metadata(MigrationContext.configure(conn), Base.metadata) == []
+
+def test_legacy_database_is_upgraded(db_engine):
+    """기존 DB에 benefit 컬럼, 집계 테이블, 인덱스를 추가하고 중복 평가를 정리하는지 테스트"""
+    with db_engine.begin() as conn:
+        for ddl in LEGACY_SCHEMA:
+            conn.execute(text(ddl))
+        conn.execute(text("INSERT INTO accounts (id, knox_id, hashed_password) VALUES (1, 'user', 'x')"))
+        conn.execute(text("INSERT INTO aideas (id, account_id, project) VALUES (1, 1, '프로젝트')"))
+        conn.execute(text("INSERT INTO judges (id, judge_id, hashed_password, name) VALUES (1, 'judge', 'x', '심사위원')"))
+        # 동시 제출로 생긴 중복 평가: 마지막 행(30점)만 남아야 함
+        for i, score in enumerate((20, 26, 30), 1):
+            conn.execute(text(
+                "INSERT INTO evaluations (id, aidea_id, judge_id, innovation_score, feasibility_score, effectiveness_score, total_score) "
+                f"VALUES ({i}, 1, 1, {score - 14}, 6, 8, {score})"
+            ))
+
+    ensure_schema(db_engine)
+
+    with db_engine.connect() as conn:
+        assert conn.execute(text("SELECT id, total_score FROM evaluations")).all() == [(3, 30)]
+        assert conn.execute(text("SELECT evaluation_count, total_sum FROM aidea_score_summary")).all() == [(1, 30)]
+        assert conn.execute(text("SELECT benefit FROM aideas")).all() == [(None,)]
+        with pytest.raises(IntegrityError):
+            conn.execute(text(
+                "INSERT INTO evaluations (aidea_id, judge_id, innovation_score, feasibility_score, effectiveness_score, total_score) "
+                "VALUES (1, 1, 6, 6, 8, 20)"
+            ))
+
+def test_outdated_schema_without_auto_upgrade(db_engine):
+    """자동 마이그레이션을 끄면 최신이 아닌 DB에서 시작하지 않는지 테스트"""
+    with pytest.raises(SchemaOutdatedError):
+        ensure_schema(db_engine, auto_upgrade=False)
+
+def test_concurrent_startup_migrates_once(db_engine):
+    """여러 워커가 동시에 시작해도 DDL 충돌 없이 한 번만 마이그레이션하는지 테스트"""
+    errors = []
+
+    def start_worker():
+        engine = create_engine(db_engine.url)
+        try:
+            ensure_schema(engine)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            engine.dispose()
+
+    workers = [threading.Thread(target=start_worker) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert errors == []
+    assert current_revision(db_engine) == SCHEMA_HEAD
@@ -0,0 +1,165 @@
+import json
+import logging
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+import profiler
+from main import app, create_access_token, ADMIN_USERNAME
+from database import get_db, get_read_db
+from testing_db import create_test_engine
+from models import Base, Account, TeamMember, Aidea, Judge, Evaluation, AideaScoreSummary
+
+# 테스트용 데이터베이스 설정 (기본: 인메모리 SQLite, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+engine = create_test_engine()
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+Base.metadata.create_all(bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+OVERRIDES = {get_db: override_get_db, get_read_db: override_get_db}
+
+client = TestClient(app)
+HEADERS = {"Authorization": f"Bearer {create_access_token(data={'sub': ADMIN_USERNAME})}"}
+
+class TestFingerprint:
+    """쿼리 지문 정규화와 N+1 판정 테스트 클래스"""
+
+    def test_literals_and_param_lists_are_normalized(self):
+        """리터럴/바인드 값/IN 목록 길이가 달라도 같은 지문이 되는지 테스트"""
+        a = profiler.fingerprint("SELECT * FROM judges WHERE id IN (?, ?, ?) AND name = 'a'")
+        b = profiler.fingerprint("SELECT *\n  FROM judges WHERE id IN (?) AND name = 'it''s'")
+        c = profiler.fingerprint("SELECT * FROM judges WHERE id IN (%(id_1)s, %(id_2)s) AND name = %(name)s")
+        assert a == b == c == "SELECT * FROM judges WHERE id IN (?+) AND name = ?"
+        assert profiler.fingerprint("SELECT * FROM t2 LIMIT 10") == "SELECT * FROM t2 LIMIT ?"
+
+    def test_repeated_fingerprints(self):
+        """같은 모양의 쿼리가 threshold번 이상이면 N+1로 보고하는지 테스트"""
+        profile = profiler.QueryProfile("GET /api/x")
+        profile.record("SELECT * FROM aideas", 0.001, "test")
+        for i in range(3):
+            profile.record(f"SELECT * FROM judges WHERE id = {i}", 0.001, "test")
+
+        assert profile.count == 4
+        assert profile.repeated(3) == {"SELECT * FROM judges WHERE id = ?": 3}
+        assert profile.repeated(4) == {}
+        assert "3x" in profile.summary()
+
+class TestSlowQueryLog:
+    """느린 쿼리 로그 테스트 클래스"""
+
+    def test_slow_query_logged_with_plan(self, caplog):
+        """임계값을 넘긴 쿼리가 실행 계획과 함께(바인드 값 없이) 기록되는지 테스트"""
+        slow_engine = create_test_engine()
+        profiler.attach_profiler(slow_engine, "slow_test", slow_query_ms=0)
+        with slow_engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+            with caplog.at_level(logging.WARNING, logger="slow_query"):
+                conn.execute(text("SELECT * FROM items WHERE name = :name"), {"name": "비밀"})
+        slow_engine.dispose()
+
+        entries = [json.loads(record.getMessage()) for record in caplog.records if record.name == "slow_query"]
+        entry = next(entry for entry in entries if entry["fingerprint"].startswith("SELECT"))
+        assert entry["engine"] == "slow_test"
+        assert entry["fingerprint"] == "SELECT * FROM items WHERE name = ?"
+        assert entry["plan"] and "items" in entry["plan"][0]
+        assert "비밀" not in json.dumps(entry, ensure_ascii=False)
+
+class TestQueryBudgets:
+    """엔드포인트별 쿼리 예산 테스트 클래스 (데이터가 늘어도 쿼리 수가 일정해야 함)"""
+
+    def setup_method(self):
+        self._previous_overrides = {dependency: app.dependency_overrides.get(dependency) for dependency in OVERRIDES}
+        app.dependency_overrides.update(OVERRIDES)
+        db = TestingSessionLocal()
+        for model in (AideaScoreSummary, Evaluation, TeamMember, Aidea, Account, Judge):
+            db.query(model).delete()
+        judges = [Judge(judge_id=f"judge{i}", hashed_password="x", name=f"심사위원{i}") for i in range(3)]
+        db.add_all(judges)
+        for i in range(10):
+            account = Account(knox_id=f"user{i}", hashed_password="x", team_name=f"팀{i}", department="개발")
+            account.team_members = [TeamMember(knox_id=f"member{i}{k}", name=f"팀원{k}") for k in range(2)]
+            account.aideas = [Aidea(project=f"프로젝트{i}")]
+            db.add(account)
+        db.flush()
+        db.add_all(
+            Evaluation(aidea_id=aidea.id, judge_id=judge.id, innovation_score=6, feasibility_score=6,
+                       effectiveness_score=8, total_score=20)
+            for aidea in db.query(Aidea) for judge in judges
+        )
+        db.commit()
+        self.aidea_ids = [aidea_id for (aidea_id,) in db.query(Aidea.id).order_by(Aidea.id)]
+        self.judge_id = judges[0].id
+        db.close()
+
+    def teardown_method(self):
+        for dependency, previous in self._previous_overrides.items():
+            if previous is None:
+                app.dependency_overrides.pop(dependency, None)
+            else:
+                app.dependency_overrides[dependency] = previous
+
+    def test_admin_lists(self, query_budget):
+        """관리자 목록은 건수 조회 + 본문 + 관계별 selectin 한 번씩만 실행하는지 테스트"""
+        budgets = {
+            "/api/admin/accounts": 4,
+            "/api/admin/aideas": 4,
+            "/api/admin/evaluations": 2,
+            "/api/admin/judges": 2,
+            "/api/admin/rankings": 1,
+        }
+        for url, max_queries in budgets.items():
+            with query_budget(engine, max_queries=max_queries, max_repeats=1):
+                assert client.get(url, headers=HEADERS).status_code == 200
+
+    def test_exports_single_query(self, query_budget):
+        """내보내기는 엔터티마다 쿼리 하나로 스트리밍하는지 테스트"""
+        for entity in ("accounts", "aideas", "evaluations"):
+            with query_budget(engine, max_queries=1):
+                assert client.get(f"/api/admin/export/{entity}", headers=HEADERS).status_code == 200
+
+    def test_evaluation_batch_refreshes_summaries_once(self, query_budget):
+        """일괄 평가는 항목별 UPSERT 외에 존재 확인/집계를 한 번씩만 실행하는지 테스트"""
+        payload = [
+            {"aidea_id": aidea_id, "judge_id": self.judge_id, "innovation_score": 12,
+             "feasibility_score": 12, "effectiveness_score": 16}
+            for aidea_id in self.aidea_ids[:6]
+        ]
+        with query_budget(engine, max_queries=len(payload) + 4) as profile:
+            response = client.post("/api/evaluations/batch", json=payload)
+
+        assert response.status_code == 200
+        assert all(result["error"] is None for result in response.json()["results"])
+        summary_refreshes = [fp for fp in profile.by_fingerprint() if fp.startswith("INSERT INTO aidea_score_summary")]
+        assert len(summary_refreshes) == 1
+        assert profile.by_fingerprint()[summary_refreshes[0]]["count"] == 1
+
+        db = TestingSessionLocal()
+        summary = db.get(AideaScoreSummary, self.aidea_ids[0])
+        assert (summary.evaluation_count, summary.total_sum) == (3, 80)
+        db.close()
+
+class TestProfilerMiddleware:
+    """요청별 프로파일 미들웨어 테스트 클래스"""
+
+    def test_server_timing_and_n_plus_one_warning(self, caplog):
+        """Server-Timing 헤더에 쿼리 수가 들어가고 반복 쿼리는 경고로 남는지 테스트"""
+        async def endpoint(scope, receive, send):
+            profile = profiler._current_profile.get()
+            for i in range(3):
+                profile.record(f"SELECT * FROM judges WHERE id = {i}", 0.001, "test")
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"{}"})
+
+        test_client = TestClient(profiler.QueryProfilerMiddleware(endpoint, threshold=3))
+        with caplog.at_level(logging.WARNING, logger="profiler"):
+            response = test_client.get("/api/x")
+
+        assert response.headers["server-timing"].endswith('desc="3 queries"')
+        assert any("N+1" in record.getMessage() and "GET /api/x" in record.getMessage() for record in caplog.records)
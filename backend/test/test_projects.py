@@ -0,0 +1,241 @@
+import os
+import subprocess
+import sys
+import tempfile
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from passlib.hash import bcrypt
+
+from main import app
+from cache import response_cache
+from database import get_db, get_async_db, get_async_read_db
+from testing_db import create_test_engine, create_test_async_engine, sync_sequences
+from models import Base, Account, TeamMember, Aidea, Judge, Evaluation
+
+# 테스트용 데이터베이스 설정 (동기/비동기 엔진이 같은 DB를 공유, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+# (작업 트리에 DB 파일이 남지 않도록 임시 디렉터리의 파일 DB 사용)
+DB_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='test_projects_'), 'test.db')}"
+engine = create_test_engine(DB_URL)
+async_engine = create_test_async_engine(DB_URL)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+Base.metadata.create_all(bind=engine)
+
+# 해시 비용을 줄이기 위해 한 번만 계산
+HASHED_PASSWORD = bcrypt.hash("password")
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+OVERRIDES = {get_db: override_get_db, get_async_db: override_get_async_db, get_async_read_db: override_get_async_db}
+
+client = TestClient(app)
+
+class QueryCounter:
+    """테스트 엔진에서 실행된 SQL 문 수를 셉니다."""
+
+    def __init__(self):
+        self.count = 0
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self):
+        for target in (engine, async_engine.sync_engine):
+            event.listen(target, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc):
+        for target in (engine, async_engine.sync_engine):
+            event.remove(target, "before_cursor_execute", self)
+
+def reset_data():
+    """모든 테이블을 비우고 심사위원 1명을 생성합니다."""
+    db = TestingSessionLocal()
+    for model in (Evaluation, TeamMember, Aidea, Account, Judge):
+        db.query(model).delete()
+    db.add(Judge(id=1, judge_id="judge", hashed_password=HASHED_PASSWORD, name="심사위원"))
+    db.commit()
+    db.close()
+    sync_sequences(engine)
+
+def seed_projects(n: int, judge_id: int = None):
+    """팀원 2명과 Aidea 1개를 가진 계정 n개를 생성하고, 절반은 평가를 남깁니다."""
+    db = TestingSessionLocal()
+    for i in range(n):
+        account = Account(knox_id=f"user{i}", hashed_password=HASHED_PASSWORD, name=f"사용자{i}", team_name=f"팀{i}")
+        account.team_members = [
+            TeamMember(name=f"팀원{i}-{j}", knox_id=f"member{i}-{j}") for j in range(2)
+        ]
+        account.aideas = [Aidea(project=f"프로젝트{i}", problem="문제", solution="솔루션")]
+        db.add(account)
+        db.flush()
+        if judge_id and i % 2 == 0:
+            db.add(Evaluation(
+                aidea_id=account.aideas[0].id, judge_id=judge_id,
+                innovation_score=6, feasibility_score=6, effectiveness_score=8, total_score=20
+            ))
+    # Aidea가 없는 계정은 목록에서 제외되어야 함
+    db.add(Account(knox_id="no_aidea", hashed_password=HASHED_PASSWORD))
+    db.commit()
+    db.close()
+
+class TestGetProjects:
+    """get_projects 엔드포인트 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 전에 테스트 DB로 교체하고 데이터를 초기화합니다."""
+        self._previous_overrides = {dep: app.dependency_overrides.get(dep) for dep in OVERRIDES}
+        app.dependency_overrides.update(OVERRIDES)
+        response_cache.clear()
+        reset_data()
+
+    def teardown_method(self):
+        for dep, previous in self._previous_overrides.items():
+            if previous is None:
+                app.dependency_overrides.pop(dep, None)
+            else:
+                app.dependency_overrides[dep] = previous
+
+    def _count_queries(self, url: str):
+        response_cache.clear()
+        with QueryCounter() as counter:
+            response = client.get(url)
+        assert response.status_code == 200
+        return response.json(), counter.count
+
+    def test_lists_only_accounts_with_aidea(self):
+        """Aidea가 있는 계정만 팀원 정보와 함께 반환하는지 테스트"""
+        seed_projects(3)
+
+        data = client.get("/api/projects").json()
+
+        assert [p["aidea"]["project"] for p in data] == ["프로젝트0", "프로젝트1", "프로젝트2"]
+        assert all(len(p["team_members"]) == 2 for p in data)
+        assert all(len(p["account"]["aideas"]) == 1 for p in data)
+        assert not any(p["is_evaluated"] for p in data)
+
+    def test_is_evaluated_for_judge(self):
+        """judge_id가 주어지면 평가 여부가 올바르게 표시되는지 테스트"""
+        seed_projects(4, judge_id=1)
+
+        data = client.get("/api/projects?judge_id=1").json()
+
+        assert [p["is_evaluated"] for p in data] == [True, False, True, False]
+
+    def test_query_count_does_not_grow_with_projects(self):
+        """프로젝트 수가 늘어나도 쿼리 수가 일정한지 테스트 (N+1 회귀 방지)"""
+        seed_projects(3, judge_id=1)
+        _, small_count = self._count_queries("/api/projects?judge_id=1")
+
+        reset_data()
+        seed_projects(30, judge_id=1)
+        data, large_count = self._count_queries("/api/projects?judge_id=1")
+
+        assert len(data) == 30
+        assert large_count == small_count
+        assert large_count <= 4
+
+    def test_response_cache_hit_and_invalidation(self):
+        """두 번째 조회는 DB 없이 캐시에서 응답하고, 평가 제출 후에는 새로 조회하는지 테스트"""
+        seed_projects(2, judge_id=1)
+        first, first_count = self._count_queries("/api/projects?judge_id=1")
+        assert first_count > 0
+
+        with QueryCounter() as counter:
+            response = client.get("/api/projects?judge_id=1")
+        assert response.headers["X-Cache"] == "HIT"
+        assert response.json() == first
+        assert counter.count == 0
+
+        # 다른 심사위원은 별도 캐시 키
+        assert client.get("/api/projects?judge_id=2").headers["X-Cache"] == "MISS"
+
+        aidea_id = first[1]["aidea"]["id"]
+        client.post("/api/evaluations", json={
+            "aidea_id": aidea_id, "judge_id": 1,
+            "innovation_score": 6, "feasibility_score": 6, "effectiveness_score": 8,
+        })
+        response = client.get("/api/projects?judge_id=1")
+        assert response.headers["X-Cache"] == "MISS"
+        assert [p["is_evaluated"] for p in response.json()] == [True, True]
+
+    def test_response_cache_expires_after_write_from_another_process(self):
+        """다른 프로세스(워커)의 쓰기는 데이터 버전을 올리지 않으므로 캐시 TTL이 지나면 반영되는지 테스트"""
+        seed_projects(1, judge_id=1)
+        response_cache.clear()
+        assert client.get("/api/projects?judge_id=1").headers["X-Cache"] == "MISS"
+
+        # 다른 프로세스에서 같은 DB에 직접 쓰기
+        script = (
+            "import sys; from sqlalchemy import create_engine, text; "
+            "engine = create_engine(sys.argv[1]); "
+            "conn = engine.connect(); conn.execute(text(\"UPDATE aideas SET project = '다른 워커가 수정'\")); conn.commit()"
+        )
+        subprocess.run([sys.executable, "-c", script, engine.url.render_as_string(hide_password=False)], check=True)
+
+        # TTL 전에는 캐시된 응답
+        response = client.get("/api/projects?judge_id=1")
+        assert response.headers["X-Cache"] == "HIT"
+        assert response.json()[0]["aidea"]["project"] == "프로젝트0"
+
+        # TTL이 지나면 다시 조회
+        expired = response_cache.clock() + response_cache.ttl
+        with patch.object(response_cache, "clock", lambda: expired):
+            response = client.get("/api/projects?judge_id=1")
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.json()[0]["aidea"]["project"] == "다른 워커가 수정"
+
+    def test_summary_view_skips_long_text(self):
+        """view=summary는 목록용 필드만 반환하고 긴 텍스트 컬럼은 SELECT하지 않는지 테스트"""
+        seed_projects(3, judge_id=1)
+        response_cache.clear()
+
+        with QueryCounter() as counter:
+            data = client.get("/api/projects?judge_id=1&view=summary").json()
+
+        assert [p["project"] for p in data] == ["프로젝트0", "프로젝트1", "프로젝트2"]
+        assert set(data[0]) == {"account_id", "knox_id", "team_name", "department", "aidea_id", "project", "is_evaluated"}
+        assert [p["is_evaluated"] for p in data] == [True, False, True]
+        sql = " ".join(counter.statements)
+        assert "aideas.problem" not in sql and "aideas.solution" not in sql
+        assert "team_members" not in sql
+
+    def test_fields_selection(self):
+        """fields로 고른 필드만 반환하고 잘못된 필드는 400을 반환하는지 테스트"""
+        seed_projects(2)
+
+        data = client.get("/api/projects?fields=project,problem").json()
+        assert data == [
+            {"project": "프로젝트0", "problem": "문제", "is_evaluated": False},
+            {"project": "프로젝트1", "problem": "문제", "is_evaluated": False},
+        ]
+
+        assert client.get("/api/projects?fields=project,password").status_code == 400
+        assert client.get("/api/projects?view=compact").status_code == 400
+
+    def test_aidea_detail(self):
+        """상세 조회는 benefit을 포함한 전체 내용을 반환하는지 테스트"""
+        seed_projects(1)
+        aidea_id = client.get("/api/projects?view=summary").json()[0]["aidea_id"]
+
+        data = client.get(f"/api/aideas/{aidea_id}").json()
+        assert data["project"] == "프로젝트0"
+        assert data["problem"] == "문제"
+        assert "benefit" in data
+
+        assert client.get("/api/aideas/999999").status_code == 404
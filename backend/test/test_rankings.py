@@ -0,0 +1,117 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from main import app, create_access_token, ADMIN_USERNAME
+from database import get_db, get_read_db
+from testing_db import create_test_engine, sync_sequences
+from models import Base, Account, Aidea, Judge, Evaluation, AideaScoreSummary
+from crud import verify_score_summaries, rebuild_score_summaries
+
+# 테스트용 데이터베이스 설정 (기본: 인메모리 SQLite, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+engine = create_test_engine()
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+Base.metadata.create_all(bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+OVERRIDES = {get_db: override_get_db, get_read_db: override_get_db}
+
+client = TestClient(app)
+HEADERS = {"Authorization": f"Bearer {create_access_token(data={'sub': ADMIN_USERNAME})}"}
+
+def seed(n_aideas: int = 4, n_judges: int = 3):
+    db = TestingSessionLocal()
+    for model in (AideaScoreSummary, Evaluation, Aidea, Account, Judge):
+        db.query(model).delete()
+    for i in range(1, n_judges + 1):
+        db.add(Judge(id=i, judge_id=f"judge{i}", hashed_password="x", name=f"심사위원{i}"))
+    for i in range(1, n_aideas + 1):
+        db.add(Account(id=i, knox_id=f"user{i}", hashed_password="x", team_name=f"팀{i}"))
+        db.add(Aidea(id=i, account_id=i, project=f"프로젝트{i}"))
+    db.commit()
+    db.close()
+    sync_sequences(engine)
+
+def evaluate(aidea_id: int, judge_id: int, innovation: int, feasibility: int, effectiveness: int):
+    response = client.post("/api/evaluations", json={
+        "aidea_id": aidea_id, "judge_id": judge_id,
+        "innovation_score": innovation, "feasibility_score": feasibility, "effectiveness_score": effectiveness,
+    })
+    assert response.status_code == 200
+
+def summary_of(aidea_id: int):
+    db = TestingSessionLocal()
+    summary = db.get(AideaScoreSummary, aidea_id)
+    db.close()
+    return summary
+
+class TestScoreSummaryAndRankings:
+    """점수 집계 테이블과 순위 API 테스트 클래스"""
+
+    def setup_method(self):
+        self._previous_overrides = {dep: app.dependency_overrides.get(dep) for dep in OVERRIDES}
+        app.dependency_overrides.update(OVERRIDES)
+        seed()
+
+    def teardown_method(self):
+        for dep, previous in self._previous_overrides.items():
+            if previous is None:
+                app.dependency_overrides.pop(dep, None)
+            else:
+                app.dependency_overrides[dep] = previous
+
+    def test_summary_tracks_insert_and_overwrite(self):
+        """새 평가와 덮어쓰기 모두 집계에 반영되는지 테스트"""
+        evaluate(1, 1, 30, 30, 40)
+        evaluate(1, 2, 6, 6, 8)
+        evaluate(1, 1, 12, 18, 24)  # 심사위원 1이 점수를 수정
+
+        summary = summary_of(1)
+        assert summary.evaluation_count == 2
+        assert (summary.innovation_sum, summary.feasibility_sum, summary.effectiveness_sum) == (18, 24, 32)
+        assert summary.total_sum == 74
+
+        db = TestingSessionLocal()
+        assert verify_score_summaries(db) == []
+        db.close()
+
+    def test_rankings_with_tiebreak_and_ties(self):
+        """평균 총점 → 동점 처리 기준 순으로 정렬하고 완전 동점은 같은 순위인지 테스트"""
+        evaluate(1, 1, 30, 6, 8)    # 총점 44, 효과성 8
+        evaluate(2, 1, 6, 30, 8)    # 총점 44, 효과성 8, 실현 가능성 30
+        evaluate(3, 1, 6, 6, 32)    # 총점 44, 효과성 32
+        evaluate(4, 1, 12, 12, 40)  # 총점 64
+        evaluate(4, 2, 6, 6, 8)     # 평균 총점 42
+
+        rankings = client.get("/api/admin/rankings", headers=HEADERS).json()["rankings"]
+        assert [(r["rank"], r["aidea_id"]) for r in rankings] == [(1, 3), (2, 2), (3, 1), (4, 4)]
+        assert rankings[3]["total_avg"] == 42.0
+        assert rankings[3]["evaluation_count"] == 2
+
+        rankings = client.get("/api/admin/rankings?tiebreak=innovation", headers=HEADERS).json()["rankings"]
+        assert [(r["rank"], r["aidea_id"]) for r in rankings] == [(1, 1), (2, 2), (2, 3), (4, 4)]
+        assert [r["tied"] for r in rankings] == [False, True, True, False]
+
+        limited = client.get("/api/admin/rankings?limit=2", headers=HEADERS).json()
+        assert limited["total"] == 2
+
+        assert client.get("/api/admin/rankings?tiebreak=speed", headers=HEADERS).status_code == 400
+
+    def test_rebuild_matches_full_recompute(self):
+        """집계가 어긋나면 검증에서 발견되고 재구성으로 복구되는지 테스트"""
+        evaluate(1, 1, 30, 30, 40)
+        evaluate(2, 1, 6, 6, 8)
+        db = TestingSessionLocal()
+        db.get(AideaScoreSummary, 1).total_sum = 0
+        db.delete(db.get(AideaScoreSummary, 2))
+        db.commit()
+
+        assert [m["aidea_id"] for m in verify_score_summaries(db)] == [1, 2]
+        assert rebuild_score_summaries(db) == 2
+        assert verify_score_summaries(db) == []
+        db.close()
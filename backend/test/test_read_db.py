@@ -0,0 +1,51 @@
+import os
+import tempfile
+import time
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+
+from database import _set_sqlite_pragma, _set_sqlite_read_pragma, READ_MMAP_SIZE
+
+class TestReadOnlyEngine:
+    """조회 전용 SQLite 연결 테스트 클래스"""
+
+    def setup_method(self):
+        path = os.path.join(tempfile.mkdtemp(prefix="test_read_db_"), "test.db")
+        self.write_engine = create_engine(f"sqlite:///{path}", connect_args={"timeout": 5})
+        event.listen(self.write_engine, "connect", _set_sqlite_pragma)
+        self.read_engine = create_engine(f"sqlite:///{path}", connect_args={"timeout": 5})
+        event.listen(self.read_engine, "connect", _set_sqlite_read_pragma)
+        with self.write_engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+            conn.execute(text("INSERT INTO items (name) VALUES ('before')"))
+
+    def teardown_method(self):
+        self.read_engine.dispose()
+        self.write_engine.dispose()
+
+    def test_pragmas_and_write_rejected(self):
+        """조회 PRAGMA가 적용되고 쓰기는 거부되는지 테스트"""
+        with self.read_engine.connect() as conn:
+            assert conn.execute(text("PRAGMA query_only")).scalar() == 1
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+            assert conn.execute(text("PRAGMA cache_size")).scalar() < 0
+            assert conn.execute(text("PRAGMA mmap_size")).scalar() in (0, READ_MMAP_SIZE)  # mmap 미지원 빌드는 0
+            with pytest.raises(OperationalError):
+                conn.execute(text("INSERT INTO items (name) VALUES ('x')"))
+
+    def test_reads_do_not_wait_for_open_write_transaction(self):
+        """쓰기 트랜잭션이 열려 있어도 조회가 기다리지 않고 커밋된 스냅샷을 읽는지 테스트"""
+        with self.write_engine.connect() as writer:
+            writer.exec_driver_sql("BEGIN IMMEDIATE")
+            writer.execute(text("INSERT INTO items (name) VALUES ('pending')"))
+
+            start = time.perf_counter()
+            with self.read_engine.connect() as reader:
+                names = reader.execute(text("SELECT name FROM items")).scalars().all()
+            elapsed = time.perf_counter() - start
+            writer.exec_driver_sql("ROLLBACK")
+
+        assert names == ["before"]
+        assert elapsed < 1
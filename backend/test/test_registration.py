@@ -0,0 +1,127 @@
+import os
+import subprocess
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+import main
+from cache import current_data_version
+from crud import update_account_registration
+from models import Base, Account, TeamMember, Aidea
+from schemas import AccountRegister
+from testing_db import create_test_engine
+
+# 테스트용 데이터베이스 설정 (기본: 인메모리 SQLite, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+engine = create_test_engine()
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+Base.metadata.create_all(bind=engine)
+
+class WriteRecorder:
+    """테스트 엔진에서 실행된 INSERT/UPDATE/DELETE 문을 기록합니다."""
+
+    def __init__(self):
+        self.writes = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().split(" ", 1)[0] in ("INSERT", "UPDATE", "DELETE"):
+            self.writes.append(" ".join(statement.split()[:3]))
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self)
+
+def registration(account_id: int, members=(("팀원A", "a"), ("팀원B", "b")), **aidea):
+    return AccountRegister(
+        id=account_id, knox_id="leader", name="팀장", team_name="슬슬팀", department="개발",
+        team_members=[{"name": name, "knox_id": knox_id} for name, knox_id in members],
+        project=aidea.pop("project", "프로젝트"), problem=aidea.pop("problem", "문제"), solution="솔루션",
+    )
+
+class TestUpdateAccountRegistration:
+    """등록 정보 변경분만 반영하는지 테스트 클래스"""
+
+    def setup_method(self):
+        self.db = TestingSessionLocal()
+        for model in (TeamMember, Aidea, Account):
+            self.db.query(model).delete()
+        account = Account(knox_id="leader", hashed_password="x")
+        self.db.add(account)
+        self.db.commit()
+        self.account_id = account.id
+        update_account_registration(self.db, registration(self.account_id))
+
+    def teardown_method(self):
+        self.db.close()
+
+    def _member_ids(self):
+        return {m.knox_id: m.id for m in self.db.query(TeamMember).all()}
+
+    def test_unchanged_resubmission_writes_nothing(self):
+        """같은 내용을 다시 제출하면 쓰기 문이 없고 데이터 버전도 그대로인지 테스트"""
+        version = current_data_version()
+
+        with WriteRecorder() as recorder:
+            account = update_account_registration(self.db, registration(self.account_id))
+
+        assert recorder.writes == []
+        assert current_data_version() == version
+        assert [m.knox_id for m in account.team_members] == ["a", "b"]
+
+    def test_member_diff_by_knox_id(self):
+        """팀원 이름 변경/삭제/추가만 반영하고 그대로인 팀원의 행은 유지하는지 테스트"""
+        before = self._member_ids()
+
+        with WriteRecorder() as recorder:
+            account = update_account_registration(
+                self.db, registration(self.account_id, members=(("팀원A2", "a"), ("팀원C", "c")))
+            )
+
+        assert sorted(recorder.writes) == [
+            "DELETE FROM team_members", "INSERT INTO team_members", "UPDATE team_members SET"
+        ]
+        after = self._member_ids()
+        assert after["a"] == before["a"]
+        assert set(after) == {"a", "c"}
+        assert {m.name for m in account.team_members} == {"팀원A2", "팀원C"}
+
+    def test_aidea_updates_only_changed_columns(self):
+        """Aidea는 바뀐 컬럼만 UPDATE하고, project를 비우면 삭제하는지 테스트"""
+        with WriteRecorder() as recorder:
+            update_account_registration(self.db, registration(self.account_id, problem="새 문제"))
+
+        assert recorder.writes == ["UPDATE aideas SET"]
+        aidea = self.db.query(Aidea).one()
+        assert (aidea.problem, aidea.solution) == ("새 문제", "솔루션")
+
+        update_account_registration(self.db, registration(self.account_id, project=""))
+        assert self.db.query(Aidea).count() == 0
+
+class TestRegistrationDeadline:
+    """서류제출 마감일 설정 테스트 클래스"""
+
+    def test_deadline_from_environment(self, tmp_path):
+        """REGISTRATION_DEADLINE 환경 변수로 마감일을 바꿀 수 있는지 테스트 (기본값은 2025-12-31T23:59:59)"""
+        script = "import main; print(main.REGISTRATION_DEADLINE.isoformat())"
+        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = {**os.environ, "REGISTRATION_DEADLINE": "2999-01-02T03:04:05", "DATABASE_PATH": str(tmp_path / "deadline.db")}
+        output = subprocess.run([sys.executable, "-c", script], cwd=backend_dir, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        assert output.strip().splitlines()[-1] == "2999-01-02T03:04:05"
+
+    def test_check_uses_configured_deadline(self):
+        """마감일이 지나면 400, 지나지 않았으면 통과하는지 테스트"""
+        with patch("main.REGISTRATION_DEADLINE", datetime(2000, 1, 1)):
+            with pytest.raises(HTTPException) as error:
+                main._check_registration_period()
+        assert error.value.status_code == 400
+
+        with patch("main.REGISTRATION_DEADLINE", datetime(2999, 12, 31, 23, 59, 59)):
+            main._check_registration_period()
@@ -0,0 +1,202 @@
+import os
+import tempfile
+import threading
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+import main
+from main import app, create_access_token, ADMIN_USERNAME
+from database import get_db
+from models import Base, Account, TeamMember, Aidea, Judge
+from write_queue import WriteQueue, WriteQueueBusyError, create_writer_engine
+
+# writer 엔진은 SAVEPOINT/BEGIN IMMEDIATE 설정이 필요하므로 임시 파일 DB 사용
+DB_PATH = os.path.join(tempfile.mkdtemp(prefix="test_write_queue_"), "test.db")
+engine = create_writer_engine(f"sqlite:///{DB_PATH}")
+Base.metadata.create_all(bind=engine)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+client = TestClient(app)
+
+def add_account(knox_id: str):
+    def op(db):
+        db.add(Account(knox_id=knox_id, hashed_password="x"))
+        db.commit()
+        return knox_id
+    return op
+
+def fail(db):
+    db.add(Account(knox_id="failed", hashed_password="x"))
+    db.flush()
+    raise ValueError("작업 실패")
+
+class TestWriteQueue:
+    """그룹 커밋 쓰기 대기열 테스트 클래스"""
+
+    def setup_method(self):
+        db = TestingSessionLocal()
+        for model in (TeamMember, Aidea, Account):
+            db.query(model).delete()
+        db.commit()
+        db.close()
+        self.queue = WriteQueue(engine=engine, max_batch=64)
+        self.commits = []
+        event.listen(engine, "commit", self._record_commit)
+
+    def teardown_method(self):
+        event.remove(engine, "commit", self._record_commit)
+        self.queue.stop()
+
+    def _record_commit(self, conn):
+        self.commits.append(conn)
+
+    def _blocked(self):
+        """writer 스레드를 잠시 붙잡아 뒤의 작업들이 한 배치로 모이게 합니다."""
+        release = threading.Event()
+        started = threading.Event()
+
+        def op(db):
+            started.set()
+            release.wait(5)
+            return "first"
+
+        future = self.queue.submit(op)
+        started.wait(5)
+        return future, release
+
+    def test_groups_operations_into_one_commit_and_isolates_errors(self):
+        """쌓인 작업을 커밋 한 번으로 반영하고, 실패한 작업만 되돌리는지 테스트"""
+        first, release = self._blocked()
+        futures = [self.queue.submit(add_account(f"user{i}")) for i in range(5)]
+        failed = self.queue.submit(fail)
+        last = self.queue.submit(add_account("user5"))
+        self.commits.clear()
+        release.set()
+
+        assert [future.result(5) for future in futures + [last]] == [f"user{i}" for i in range(6)]
+        with pytest.raises(ValueError):
+            failed.result(5)
+        assert first.result(5) == "first"
+        # 첫 작업 배치 + 나머지 7건이 한 배치
+        assert len(self.commits) == 1
+        stats = self.queue.stats()
+        assert stats["batches"] == 2
+        assert stats["failed_operations"] == 1
+
+        db = TestingSessionLocal()
+        assert sorted(knox_id for (knox_id,) in db.query(Account.knox_id)) == [f"user{i}" for i in range(6)]
+        db.close()
+
+    def test_rollback_inside_operation_keeps_other_operations(self):
+        """작업 안의 db.rollback()이 같은 배치의 다른 작업을 되돌리지 않는지 테스트"""
+        first, release = self._blocked()
+        created = self.queue.submit(add_account("existing"))
+
+        def duplicate_then_recover(db):
+            # crud의 IntegrityError 처리처럼 rollback 후 작업을 이어감
+            db.add(Account(knox_id="existing", hashed_password="y"))
+            try:
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+            return add_account("recovered")(db)
+
+        recovered = self.queue.submit(duplicate_then_recover)
+        release.set()
+
+        assert created.result(5) == "existing"
+        assert recovered.result(5) == "recovered"
+        db = TestingSessionLocal()
+        assert sorted(knox_id for (knox_id,) in db.query(Account.knox_id)) == ["existing", "recovered"]
+        db.close()
+
+    def test_rejects_when_full(self):
+        """대기열이 가득 차면 WriteQueueBusyError를 발생시키는지 테스트"""
+        self.queue = WriteQueue(engine=engine, max_pending=1)
+        first, release = self._blocked()
+        self.queue.submit(add_account("queued"))
+        with pytest.raises(WriteQueueBusyError):
+            self.queue.submit(add_account("rejected"))
+        release.set()
+
+class TestRegisterThroughQueue:
+    """WRITE_QUEUE가 켜졌을 때 등록 API 테스트 클래스"""
+
+    def setup_method(self):
+        self._previous_override = app.dependency_overrides.get(get_db)
+        app.dependency_overrides[get_db] = override_get_db
+        self.queue = WriteQueue(engine=engine)
+        self._patches = [
+            patch("main._check_registration_period"),
+            patch.object(main, "WRITE_QUEUE_ENABLED", True),
+            patch.object(main, "write_queue", self.queue),
+        ]
+        for p in self._patches:
+            p.start()
+        db = TestingSessionLocal()
+        for model in (TeamMember, Aidea, Account):
+            db.query(model).delete()
+        db.add(Account(id=1, knox_id="leader", hashed_password="x"))
+        db.commit()
+        db.close()
+
+    def teardown_method(self):
+        for p in self._patches:
+            p.stop()
+        self.queue.stop()
+        if self._previous_override is None:
+            app.dependency_overrides.pop(get_db, None)
+        else:
+            app.dependency_overrides[get_db] = self._previous_override
+
+    def test_register_response_and_errors(self):
+        """대기열을 거친 등록도 같은 응답과 오류 코드를 돌려주는지 테스트"""
+        payload = {
+            "id": 1, "knox_id": "leader", "name": "리더", "team_name": "슬슬팀", "department": "개발",
+            "team_members": [{"name": "팀원", "knox_id": "member1"}],
+            "project": "프로젝트",
+        }
+        response = client.post("/api/register", json=payload)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["team_name"] == "슬슬팀"
+        assert [member["knox_id"] for member in body["team_members"]] == ["member1"]
+        assert body["aideas"][0]["project"] == "프로젝트"
+        assert self.queue.stats()["operations"] == 1
+
+        missing = client.post("/api/register", json={**payload, "id": 999})
+        assert missing.status_code == 404
+
+    def test_judge_admin_endpoints_use_queue(self):
+        """심사위원 생성(단건/일괄)도 요청 세션이 아니라 대기열로 저장하는지 테스트"""
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': ADMIN_USERNAME})}"}
+        db = TestingSessionLocal()
+        db.query(Judge).delete()
+        db.commit()
+        db.close()
+
+        single = client.post("/api/admin/judges", json={"judge_id": "judge1", "password": "pw", "name": "심사위원1"},
+                             headers=headers)
+        bulk = client.post("/api/admin/judges/bulk", headers=headers, json=[
+            {"judge_id": "judge2", "password": "pw", "name": "심사위원2"},
+            {"judge_id": "judge3", "password": "pw", "name": "심사위원3"},
+        ])
+
+        assert single.status_code == 200
+        assert single.json()["judge_id"] == "judge1"
+        assert bulk.status_code == 200
+        assert [judge["judge_id"] for judge in bulk.json()["created"]] == ["judge2", "judge3"]
+        assert self.queue.stats()["operations"] == 2
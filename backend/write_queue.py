@@ -0,0 +1,224 @@
+"""
+SQLite 단일 writer 그룹 커밋 대기열
+
+마감 직전처럼 쓰기 요청이 몰리면 여러 연결이 SQLite의 단일 writer 잠금을 두고 경쟁하다가
+"database is locked"로 실패합니다. 이 모듈은 쓰기 작업(Session을 받는 함수)을 대기열에 넣고,
+전용 스레드 하나가 쌓인 작업을 한 트랜잭션으로 묶어 실행한 뒤 커밋 한 번으로 반영합니다.(group commit)
+
+- 작업마다 SAVEPOINT를 두므로 한 작업의 오류는 그 작업만 되돌리고 호출자에게 그대로 전달됩니다.
+- 작업 안의 db.commit()은 flush로, db.rollback()은 해당 SAVEPOINT 롤백으로 바뀌므로 crud 함수를 수정 없이 사용합니다.
+- 결과는 배치가 실제로 커밋된 뒤에 호출자에게 전달됩니다. 세션은 배치가 끝나면 닫히므로
+  응답 직렬화처럼 관계 로딩이 필요한 작업은 작업 함수 안에서 끝내야 합니다.
+
+WRITE_QUEUE=true일 때만 main에서 사용하며, 기본값은 기존처럼 요청 세션에서 바로 커밋합니다.
+"""
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from events import pending_event_count, discard_events_since
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class WriteQueueBusyError(Exception):
+    """쓰기 대기열이 가득 차서 요청을 받을 수 없을 때 발생합니다."""
+
+def create_writer_engine(url: str) -> Engine:
+    """
+    writer 전용 엔진을 만듭니다.
+    pysqlite의 자체 트랜잭션 처리를 끄고 BEGIN IMMEDIATE로 시작해 SAVEPOINT가 바깥 트랜잭션 안에서 동작하고,
+    트랜잭션 시작 시점에 쓰기 잠금을 잡아 도중에 잠금 승격이 실패하지 않도록 합니다.
+    """
+    from database import _set_sqlite_pragma
+
+    engine = create_engine(url, connect_args={"check_same_thread": False, "timeout": 30}, pool_size=1, max_overflow=0)
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        _set_sqlite_pragma(dbapi_connection, connection_record)
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+class _GroupSession(Session):
+    """배치 안에서 commit은 flush로, rollback은 현재 작업의 SAVEPOINT 롤백으로 처리하는 세션"""
+
+    _savepoint = None
+
+    def commit(self):
+        if self._savepoint is None:
+            return super().commit()
+        self.flush()
+
+    def rollback(self):
+        if self._savepoint is None:
+            return super().rollback()
+        # flush 실패로 비활성화된 SAVEPOINT도 명시적으로 롤백해야 세션을 계속 쓸 수 있음
+        if self.get_nested_transaction() is not None:
+            self.get_nested_transaction().rollback()
+        # 롤백 뒤에도 작업이 계속될 수 있으므로 새 SAVEPOINT에서 이어서 실행
+        self._savepoint = self.begin_nested()
+
+class WriteQueue:
+    """쓰기 작업을 모아 전용 스레드에서 그룹 커밋으로 실행합니다."""
+
+    def __init__(self, engine: Optional[Engine] = None, max_batch: int = 64, max_wait_ms: float = 0.0,
+                 max_pending: int = 2048):
+        self._engine = engine
+        self.max_batch = max_batch
+        # 첫 작업을 꺼낸 뒤 더 모으기 위해 기다리는 시간 (0이면 이미 쌓인 작업만 묶음)
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "queue.Queue[Optional[Tuple[Callable, Future]]]" = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._session_factory = None
+        self._counters = {"operations": 0, "batches": 0, "failed_operations": 0, "failed_batches": 0,
+                          "rejected": 0, "max_batch_size": 0}
+
+    def start(self):
+        """writer 스레드를 시작합니다. (첫 submit에서도 자동으로 시작)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            if self._engine is None:
+                from database import IS_SQLITE, SQLALCHEMY_DATABASE_URL, engine
+                # PostgreSQL은 SAVEPOINT와 행 잠금이 기본 동작하므로 기존 엔진을 그대로 사용
+                self._engine = create_writer_engine(SQLALCHEMY_DATABASE_URL) if IS_SQLITE else engine
+            self._session_factory = sessionmaker(
+                bind=self._engine, class_=_GroupSession, autoflush=False, expire_on_commit=False
+            )
+            self._thread = threading.Thread(target=self._worker, name="write-queue", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """대기 중인 작업을 모두 처리한 뒤 writer 스레드를 종료합니다."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+
+    def submit(self, op: Callable[[Session], T]) -> "Future[T]":
+        """쓰기 작업을 대기열에 넣고 Future를 반환합니다. 가득 찼으면 WriteQueueBusyError를 발생시킵니다."""
+        if self._thread is None:
+            self.start()
+        future: Future = Future()
+        try:
+            self._queue.put_nowait((op, future))
+        except queue.Full:
+            self._counters["rejected"] += 1
+            raise WriteQueueBusyError("저장 요청이 많아 잠시 후 다시 시도해주세요.")
+        return future
+
+    async def run(self, op: Callable[[Session], T]) -> T:
+        """쓰기 작업을 대기열에 넣고, 배치가 커밋된 뒤 결과(또는 예외)를 돌려받습니다."""
+        return await asyncio.wrap_future(self.submit(op))
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> dict:
+        """처리한 작업/배치 수와 평균 배치 크기를 반환합니다."""
+        result = dict(self._counters)
+        result["pending"] = self.pending
+        batches = self._counters["batches"]
+        result["avg_batch_size"] = round(self._counters["operations"] / batches, 2) if batches else 0.0
+        return result
+
+    def _collect(self, first) -> Tuple[List[Tuple[Callable, Future]], bool]:
+        """첫 작업 뒤로 대기 중인 작업을 max_batch개까지 모읍니다. (종료 신호를 만나면 stop=True)"""
+        batch, stop = [first], False
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            try:
+                remaining = deadline - time.monotonic()
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                stop = True
+                break
+            batch.append(item)
+        return batch, stop
+
+    def _worker(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch, stop = self._collect(first)
+            self._apply(batch)
+            if stop:
+                return
+
+    def _apply(self, batch: List[Tuple[Callable, Future]]):
+        """배치를 한 트랜잭션으로 실행하고, 커밋이 끝난 뒤 각 Future에 결과를 전달합니다."""
+        outcomes = []
+        db = self._session_factory()
+        try:
+            for op, future in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue  # 호출자가 이미 취소함
+                db._savepoint = db.begin_nested()
+                event_mark = pending_event_count(db)
+                try:
+                    result = op(db)
+                    db.get_nested_transaction().commit()
+                    outcomes.append((future, result, None))
+                except Exception as e:
+                    if db.get_nested_transaction() is not None:
+                        db.get_nested_transaction().rollback()
+                    # 되돌린 작업의 실시간 알림은 배치 커밋 후에 발행되지 않도록 버림
+                    discard_events_since(db, event_mark)
+                    outcomes.append((future, None, e))
+                finally:
+                    db._savepoint = None
+            db.commit()
+        except Exception as e:
+            logger.error(f"쓰기 대기열 배치 커밋 실패 ({len(batch)}건): {e}")
+            db.rollback()
+            self._counters["failed_batches"] += 1
+            # 커밋이 실패하면 배치 전체가 반영되지 않았으므로 모든 호출자에게 오류 전달 (작업 자체의 오류는 유지)
+            errors = {id(future): error for future, _, error in outcomes}
+            outcomes = [(future, None, errors.get(id(future)) or e) for _, future in batch if not future.cancelled()]
+        finally:
+            db.close()
+
+        self._counters["batches"] += 1
+        self._counters["operations"] += len(outcomes)
+        self._counters["max_batch_size"] = max(self._counters["max_batch_size"], len(outcomes))
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                self._counters["failed_operations"] += 1
+                future.set_exception(error)
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+WRITE_QUEUE_ENABLED = os.getenv("WRITE_QUEUE", "false").lower() == "true"
+
+write_queue = WriteQueue(
+    max_batch=_env_int("WRITE_QUEUE_MAX_BATCH", 64),
+    max_wait_ms=float(os.getenv("WRITE_QUEUE_MAX_WAIT_MS", "0")),
+    max_pending=_env_int("WRITE_QUEUE_MAX_PENDING", 2048),
+)